@@ -0,0 +1,195 @@
+import base64
+import random
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict
+
+COMPANIES = [
+    "Trendyol", "Getir", "Insider", "Peak Games", "Papara", "Hepsiburada", "Aselsan",
+    "Google", "Microsoft", "Amazon", "Spotify", "Zalando", "Booking", "Delivery Hero"
+]
+
+POSITIONS_TR = ["Backend Geliştirici", "Frontend Geliştirici", "Veri Bilimci", "Yazılım Mühendisi", "Stajyer Yazılım Mühendisi"]
+POSITIONS_EN = ["Backend Developer", "Frontend Engineer", "Data Scientist", "Software Engineer", "Machine Learning Intern"]
+PLATFORMS = ["Zoom", "Google Meet", "Microsoft Teams", "HackerRank", "Codility"]
+EVENTS = ["Ideathon", "Hackathon", "Case Study", "Workshop", "Webinar"]
+
+# (kategori, dil) -> (konu, gövde) şablonları
+TEMPLATES = {
+    ("basvuru_onayi", "tr"): (
+        "Başvurunuz alındı - {company}",
+        "Merhaba {name},\n\n{company} bünyesindeki {position} pozisyonu için başvurunuz alındı. "
+        "Başvurunuz için teşekkür ederiz. Ekibimiz başvurunuzu inceledikten sonra sizinle iletişime geçecektir.\n\n"
+        "Saygılarımızla,\n{company} İnsan Kaynakları"
+    ),
+    ("basvuru_onayi", "en"): (
+        "Application received - {position}",
+        "Hi {name},\n\nThank you for applying to {company}. Your application for the {position} role has been received "
+        "and our recruiting team will review it shortly.\n\nBest regards,\n{company} Talent Team"
+    ),
+    ("mulakat_daveti", "tr"): (
+        "Mülakat daveti - {company}",
+        "Merhaba {name},\n\n{position} pozisyonu için sizi mülakata davet etmek istiyoruz. Görüşme {date} tarihinde "
+        "saat {time}'da {platform} üzerinden gerçekleştirilecektir. Lütfen katılımınızı onaylayın.\n\n{company}"
+    ),
+    ("mulakat_daveti", "en"): (
+        "Interview invitation - {position} at {company}",
+        "Dear {name},\n\nWe would like to invite you to an interview for the {position} position. The interview is "
+        "scheduled for {date_en} at {time} on {platform}. Please confirm your availability.\n\nKind regards,\n{company}"
+    ),
+    ("teknik_test", "tr"): (
+        "Teknik test daveti - {company}",
+        "Merhaba {name},\n\nBaşvuru sürecinin bir sonraki adımı olarak teknik test linki aşağıdadır. Kodlama testini "
+        "{date} tarihine kadar {platform} üzerinden tamamlamanızı rica ederiz.\n\n{company}"
+    ),
+    ("teknik_test", "en"): (
+        "Technical test - {company} coding challenge",
+        "Hello {name},\n\nAs the next step, please complete the coding challenge on {platform}. The technical test "
+        "link expires on {date_en}. Good luck!\n\n{company} Engineering"
+    ),
+    ("etkinlik_daveti", "tr"): (
+        "{company} {event} davetiyesi",
+        "Merhaba {name},\n\n\"{company} {event} 2024\" etkinliğimize davetlisiniz! Etkinlik {date} tarihinde saat "
+        "{time}'da {platform} üzerinden online olarak gerçekleşecek. Katılım için kayıt olmayı unutmayın."
+    ),
+    ("etkinlik_daveti", "en"): (
+        "You're invited: {company} {event}",
+        "Hi {name},\n\nJoin us for the \"{company} {event}\" event on {date_en} at {time}. The event is fully remote "
+        "and hosted on {platform}. Spots are limited, register today!"
+    ),
+    ("red_bildirimi", "tr"): (
+        "{company} başvurunuz hakkında",
+        "Merhaba {name},\n\n{position} pozisyonuna gösterdiğiniz ilgi için teşekkür ederiz. Maalesef bu aşamada "
+        "başvurunuzla ilerleyemiyoruz. Gelecekteki fırsatlarda tekrar görüşmek dileğiyle.\n\n{company}"
+    ),
+    ("red_bildirimi", "en"): (
+        "Your application to {company}",
+        "Dear {name},\n\nThank you for your interest in the {position} role. Unfortunately, we have decided to move "
+        "forward with other candidates. We wish you the best in your search.\n\n{company} Recruiting"
+    ),
+    ("is_teklifi", "tr"): (
+        "İş teklifi - {company}",
+        "Merhaba {name},\n\nTebrikler! {position} pozisyonu için size iş teklifi sunmaktan mutluluk duyuyoruz. "
+        "Teklif mektubu ektedir, lütfen {date} tarihine kadar yanıtlayın.\n\n{company}"
+    ),
+    ("is_teklifi", "en"): (
+        "Job offer - {position}",
+        "Dear {name},\n\nCongratulations! We are pleased to offer you the {position} position at {company}. "
+        "Please find the offer letter attached and reply by {date_en}.\n\n{company} HR"
+    ),
+    ("spam_reklam", "tr"): (
+        "{company} bülten: bu haftanın kampanyaları",
+        "Bu hafta tüm eğitimlerde %50 indirim! Kampanya detayları için sitemizi ziyaret edin. "
+        "Bülten aboneliğinden çıkmak için tıklayın."
+    ),
+    ("spam_reklam", "en"): (
+        "{company} newsletter - this week's deals",
+        "Don't miss our biggest sale of the year. Follow us for more updates. "
+        "To unsubscribe from this newsletter click here."
+    ),
+}
+
+NAMES = ["Ayşe", "Mehmet", "Elif", "Can", "Zeynep", "Alex", "Maria", "John", "Deniz", "Ece"]
+TR_MONTHS = ["Ocak", "Şubat", "Mart", "Nisan", "Mayıs", "Haziran", "Temmuz", "Ağustos", "Eylül", "Ekim", "Kasım", "Aralık"]
+
+# Gmail payload biçimleri ve ağırlıkları
+PAYLOAD_FORMATS = [("plain", 3), ("html", 3), ("alternative", 3), ("mixed", 1)]
+
+
+def _b64(text: str) -> str:
+    return base64.urlsafe_b64encode(text.encode("utf-8")).decode("ascii")
+
+
+def _to_html(body: str, company: str) -> str:
+    paragraphs = "".join(f"<p>{line}</p>" for line in body.split("\n") if line.strip())
+    return (
+        "<html><head><style>p { font-family: Arial; }</style></head><body>"
+        f"<table width=\"100%\"><tr><td><h2>{company}</h2>{paragraphs}</td></tr></table>"
+        "<div style=\"font-size:10px\">Bu e-posta otomatik olarak gönderilmiştir.</div>"
+        "</body></html>"
+    )
+
+
+def _build_payload(fmt: str, headers: List[Dict], body: str, html: str) -> Dict:
+    plain_part = {"mimeType": "text/plain", "body": {"data": _b64(body), "size": len(body)}}
+    html_part = {"mimeType": "text/html", "body": {"data": _b64(html), "size": len(html)}}
+
+    if fmt == "plain":
+        return {**plain_part, "headers": headers}
+    if fmt == "html":
+        return {**html_part, "headers": headers}
+    if fmt == "alternative":
+        return {"mimeType": "multipart/alternative", "headers": headers, "body": {"size": 0},
+                "parts": [plain_part, html_part]}
+    # multipart/mixed: alternative gövde + ek (ekler data taşımaz, attachmentId ile gelir)
+    return {
+        "mimeType": "multipart/mixed", "headers": headers, "body": {"size": 0},
+        "parts": [
+            {"mimeType": "multipart/alternative", "body": {"size": 0}, "parts": [html_part, plain_part]},
+            {"mimeType": "application/pdf", "filename": "detaylar.pdf",
+             "body": {"attachmentId": "att-1", "size": 48213}}
+        ]
+    }
+
+
+def generate_corpus(size: int, seed: int = 42) -> List[Dict]:
+    """
+    Tekrarlanabilir sentetik TR/EN iş e-postası korpusu üret
+
+    Her kayıt Gmail API `messages.get` yanıtı biçimindedir; `_category` ve `_language`
+    alanları sadece raporlama içindir.
+    """
+    rng = random.Random(seed)
+    keys = list(TEMPLATES)
+    formats = [fmt for fmt, weight in PAYLOAD_FORMATS for _ in range(weight)]
+    start = datetime(2024, 1, 8, 9, 0, tzinfo=timezone.utc)
+
+    messages = []
+    for index in range(size):
+        category, language = keys[rng.randrange(len(keys))]
+        subject_tpl, body_tpl = TEMPLATES[(category, language)]
+        company = rng.choice(COMPANIES)
+        event_day = start + timedelta(days=rng.randint(3, 60))
+        values = {
+            "company": company,
+            "name": rng.choice(NAMES),
+            "position": rng.choice(POSITIONS_TR if language == "tr" else POSITIONS_EN),
+            "platform": rng.choice(PLATFORMS),
+            "event": rng.choice(EVENTS),
+            "date": f"{event_day.day} {TR_MONTHS[event_day.month - 1]} {event_day.year}",
+            "date_en": event_day.strftime("%d %B %Y"),
+            "time": f"{rng.randint(9, 18)}:{rng.choice(['00', '15', '30', '45'])}",
+        }
+        subject = subject_tpl.format(**values)
+        body = body_tpl.format(**values)
+        # Alıntılanmış önceki yazışmalar ile gövde uzunluğu çeşitlendirilir
+        if rng.random() < 0.3:
+            body += "\n\n> " + "\n> ".join(body.split("\n")) * rng.randint(1, 3)
+
+        sent_at = start + timedelta(minutes=index * 37)
+        domain = company.lower().replace(" ", "") + ".com"
+        headers = [
+            {"name": "Subject", "value": subject},
+            {"name": "From", "value": f"{company} <careers@{domain}>"},
+            {"name": "Date", "value": format_datetime(sent_at)},
+        ]
+        fmt = formats[rng.randrange(len(formats))]
+        message_id = f"{seed:x}{index:08x}"
+        messages.append({
+            "id": message_id,
+            "threadId": message_id,
+            "snippet": body[:100],
+            "payload": _build_payload(fmt, headers, body, _to_html(body, company)),
+            "_category": category,
+            "_language": language,
+            "_format": fmt,
+        })
+    return messages
+
+
+def split_mailboxes(messages: List[Dict], mailbox_size: int) -> Dict[str, List[Dict]]:
+    """Korpusu kullanıcı posta kutularına böl"""
+    mailboxes = {}
+    for start in range(0, len(messages), mailbox_size):
+        mailboxes[f"bench-user-{start // mailbox_size:03d}@jobsy.test"] = messages[start:start + mailbox_size]
+    return mailboxes
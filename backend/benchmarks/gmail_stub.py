@@ -0,0 +1,85 @@
+import re
+import asyncio
+from contextlib import contextmanager
+from typing import Dict, List
+from unittest import mock
+import httpx
+
+_QUERY_TERMS = re.compile(r"subject:\((.*)\)")
+
+
+class GmailStub:
+    """
+    Gmail REST API'sini taklit eden httpx MockTransport
+
+    Her kullanıcının posta kutusu bearer token ile seçilir. `messages.list` sorgularındaki
+    `subject:(a OR b)` terimleri konu satırında aranır, `messages.get` tam payload döndürür.
+    """
+
+    def __init__(self, mailboxes: Dict[str, List[Dict]], latency_ms: float = 0.0):
+        self.mailboxes = mailboxes
+        self.latency_ms = latency_ms
+        self.tokens = {f"token-{index}": user for index, user in enumerate(mailboxes)}
+        self.messages = {
+            message["id"]: message
+            for messages in mailboxes.values()
+            for message in messages
+        }
+        self.request_count = 0
+
+    def token_for(self, user_id: str) -> str:
+        return next(token for token, user in self.tokens.items() if user == user_id)
+
+    def _subject(self, message: Dict) -> str:
+        headers = message["payload"].get("headers", [])
+        return next((h["value"] for h in headers if h["name"] == "Subject"), "").lower()
+
+    def _list(self, user_id: str, query: str, max_results: int) -> Dict:
+        match = _QUERY_TERMS.search(query)
+        terms = [term.strip().lower() for term in match.group(1).split(" OR ")] if match else []
+        found = [
+            {"id": message["id"], "threadId": message["threadId"]}
+            for message in self.mailboxes.get(user_id, [])
+            if not terms or any(term in self._subject(message) for term in terms)
+        ]
+        return {"messages": found[:max_results], "resultSizeEstimate": len(found)}
+
+    def _get(self, message_id: str) -> Dict:
+        message = self.messages[message_id]
+        return {key: value for key, value in message.items() if not key.startswith("_")}
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.request_count += 1
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+
+        if request.url.host == "oauth2.googleapis.com":
+            return httpx.Response(200, json={"access_token": "refreshed", "expires_in": 3600})
+
+        token = request.headers.get("Authorization", "").replace("Bearer ", "")
+        user_id = self.tokens.get(token)
+        if user_id is None:
+            return httpx.Response(401, json={"error": {"code": 401, "message": "Invalid Credentials"}})
+
+        path = request.url.path
+        if path.endswith("/messages"):
+            max_results = int(request.url.params.get("maxResults", 100))
+            return httpx.Response(200, json=self._list(user_id, request.url.params.get("q", ""), max_results))
+
+        message_id = path.rsplit("/", 1)[-1]
+        if message_id in self.messages:
+            return httpx.Response(200, json=self._get(message_id))
+        return httpx.Response(404, json={"error": {"code": 404, "message": "Not Found"}})
+
+    @contextmanager
+    def patched(self):
+        """httpx.AsyncClient'ları bu transport ile çalışacak şekilde yamala"""
+        transport = httpx.MockTransport(self.handler)
+        original = httpx.AsyncClient
+
+        def client_factory(*args, **kwargs):
+            kwargs["transport"] = transport
+            return original(*args, **kwargs)
+
+        with mock.patch.object(httpx, "AsyncClient", client_factory):
+            yield self
@@ -0,0 +1,107 @@
+"""
+Uygulama açılışının import profili
+
+Ayrı bir süreçte `python -X importtime` ile uygulama açılışı (import + route yükleme)
+çalıştırılır; modül bazında kendi süresi ve kümülatif süresi en yüksek olanlar ile
+üst seviye paket toplamları raporlanır.
+
+Kullanım (backend dizininde):
+    python -m benchmarks.importtime --top 25
+    python -m benchmarks.importtime --module src.services.email_analyzer_service --json
+"""
+import os
+import sys
+import json
+import argparse
+import subprocess
+from typing import Any, Dict, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Uvicorn worker'ının yaptığı iş: uygulamayı import et, lifespan'deki route yüklemesini çalıştır
+BOOT_CODE = "import src.main as m; m.setup_routes(m.app)"
+
+
+def run_python(code: str, importtime: bool = False) -> subprocess.CompletedProcess:
+    """Kodu backend dizininde temiz bir yorumlayıcıda çalıştır"""
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", code]
+    return subprocess.run(command, cwd=BACKEND_DIR, capture_output=True, text=True, env=os.environ.copy())
+
+
+def parse_importtime(output: str) -> List[Dict[str, Any]]:
+    """`-X importtime` çıktısını kayıtlara çevir (süreler milisaniye)"""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # başlık satırı
+        name = parts[2].rstrip()
+        records.append({
+            "module": name.strip(),
+            "self_ms": int(parts[0]) / 1000,
+            "cumulative_ms": int(parts[1]) / 1000,
+            "depth": (len(name) - len(name.lstrip())) // 2
+        })
+    return records
+
+
+def profile_imports(module: str = "src.main") -> List[Dict[str, Any]]:
+    """Modülün (src.main için tüm açılışın) import kayıtlarını döndür"""
+    code = BOOT_CODE if module == "src.main" else f"import {module}"
+    result = run_python(code, importtime=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} import edilemedi:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def summarize(records: List[Dict[str, Any]], top: int = 20) -> Dict[str, Any]:
+    """En pahalı modüller ve üst seviye paket toplamları"""
+    packages: Dict[str, float] = {}
+    for record in records:
+        package = record["module"].split(".")[0]
+        packages[package] = packages.get(package, 0.0) + record["self_ms"]
+
+    roots = [record for record in records if record["depth"] == 0]
+    return {
+        "total_ms": round(sum(record["cumulative_ms"] for record in roots), 1),
+        "modules": len(records),
+        "top_cumulative": sorted(records, key=lambda r: r["cumulative_ms"], reverse=True)[:top],
+        "top_self": sorted(records, key=lambda r: r["self_ms"], reverse=True)[:top],
+        "packages": dict(sorted(
+            ((name, round(ms, 1)) for name, ms in packages.items()),
+            key=lambda item: item[1], reverse=True
+        )[:top])
+    }
+
+
+def print_summary(summary: Dict[str, Any]):
+    print(f"\n⏱️  Toplam import süresi: {summary['total_ms']:.1f} ms ({summary['modules']} modül)")
+    print("\nKümülatif süreye göre:")
+    for record in summary["top_cumulative"]:
+        print(f"  {record['cumulative_ms']:9.1f} ms  {'  ' * record['depth']}{record['module']}")
+    print("\nPaket bazında (kendi süresi):")
+    for package, ms in summary["packages"].items():
+        print(f"  {ms:9.1f} ms  {package}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Açılış import profili (python -X importtime)")
+    parser.add_argument("--module", default="src.main", help="Profil çıkarılacak modül (varsayılan: tüm açılış)")
+    parser.add_argument("--top", type=int, default=20, help="Listelenecek modül sayısı")
+    parser.add_argument("--json", action="store_true", help="Sonucu JSON olarak yazdır")
+    args = parser.parse_args()
+
+    summary = summarize(profile_imports(args.module), args.top)
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+    else:
+        print_summary(summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Dil tespiti karşılaştırması
+
+Sentetik TR/EN korpusu (ya da etiketli bir JSONL dosyası) üzerinde LanguageDetector,
+eski karakter sayma yöntemi ve kuruluysa langdetect çalıştırılır; her yöntem için
+doğruluk, TR/EN karışıklığı ve e-posta başına süre raporlanır. LanguageDetector ayrıca
+sonuç cache'i dolu halde (ikinci geçiş) ölçülür.
+
+Kullanım (backend dizininde):
+    python -m benchmarks.language_id --size 2000
+    python -m benchmarks.language_id --data data/labeled_languages.jsonl --output language_id.json
+"""
+import os
+import re
+import sys
+import json
+import time
+import base64
+import argparse
+from typing import Callable, Dict, List, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from benchmarks.corpus import generate_corpus
+from src.services.language_detector import LanguageDetector
+
+LANGUAGE_NAMES = {"tr": "Turkish", "en": "English"}
+
+
+def _payload_text(payload: Dict) -> str:
+    """Gmail payload'ındaki ilk metin gövdesini çöz"""
+    data = payload.get("body", {}).get("data")
+    if data and payload.get("mimeType") in ("text/plain", "text/html"):
+        text = base64.urlsafe_b64decode(data).decode("utf-8", errors="ignore")
+        return re.sub(r"<[^>]+>", " ", text) if payload["mimeType"] == "text/html" else text
+    for part in payload.get("parts", []):
+        text = _payload_text(part)
+        if text:
+            return text
+    return ""
+
+
+def load_samples(size: int, seed: int, data_path: str = None) -> List[Tuple[str, str]]:
+    """(metin, beklenen dil) çiftleri"""
+    if data_path:
+        with open(data_path, "r", encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+        return [(row["text"], LANGUAGE_NAMES.get(row["language"], row["language"])) for row in rows]
+
+    samples = []
+    for message in generate_corpus(size, seed=seed):
+        subject = next((h["value"] for h in message["payload"]["headers"] if h["name"] == "Subject"), "")
+        samples.append((f"{subject} {_payload_text(message['payload'])}", LANGUAGE_NAMES[message["_language"]]))
+    return samples
+
+
+def legacy_charset_detect(text: str) -> str:
+    """Önceki yöntem: tüm metinde Türkçe karakter oranı"""
+    turkish_chars = set('çğıöşüğÇĞIÖŞÜ')
+    english_chars = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')
+    turkish_count = sum(1 for char in text if char in turkish_chars)
+    english_count = sum(1 for char in text if char in english_chars)
+    if turkish_count > english_count * 0.1:
+        return "Turkish"
+    elif english_count > 0:
+        return "English"
+    return "Unknown"
+
+
+def langdetect_detector() -> Callable[[str], str]:
+    """Tohumlanmış langdetect; kurulu değilse None"""
+    try:
+        from langdetect import DetectorFactory, detect
+    except ImportError:
+        return None
+    DetectorFactory.seed = 0
+
+    def run(text: str) -> str:
+        try:
+            return LANGUAGE_NAMES.get(detect(text), "Unknown")
+        except Exception:
+            return "Unknown"
+    return run
+
+
+def evaluate(detect: Callable[[str], str], samples: List[Tuple[str, str]]) -> Dict:
+    """Doğruluk, karışıklık ve e-posta başına süre"""
+    confusion: Dict[str, Dict[str, int]] = {}
+    correct = 0
+    started = time.perf_counter()
+    for text, expected in samples:
+        predicted = detect(text)
+        correct += predicted == expected
+        row = confusion.setdefault(expected, {})
+        row[predicted] = row.get(predicted, 0) + 1
+    elapsed = time.perf_counter() - started
+    return {
+        "accuracy": round(correct / len(samples), 4) if samples else None,
+        "us_per_email": round(elapsed * 1e6 / len(samples), 2) if samples else None,
+        "total_seconds": round(elapsed, 4),
+        "confusion": confusion
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dil tespiti doğruluk ve hız karşılaştırması")
+    parser.add_argument("--size", type=int, default=1000, help="Sentetik korpus boyutu")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--data", help='Etiketli JSONL ({"text", "language": "tr"|"en"}), verilirse korpus yerine kullanılır')
+    parser.add_argument("--output", help="Sonucun yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    samples = load_samples(args.size, args.seed, args.data)
+    detector = LanguageDetector(cache_size=0)
+    cached = LanguageDetector(cache_size=len(samples))
+
+    report = {
+        "samples": len(samples),
+        "methods": {
+            "language_detector": evaluate(detector.detect, samples),
+            "language_detector_cold_cache": evaluate(cached.detect, samples),
+            "language_detector_warm_cache": evaluate(cached.detect, samples),
+            "legacy_charset": evaluate(legacy_charset_detect, samples)
+        }
+    }
+    langdetect = langdetect_detector()
+    if langdetect:
+        report["methods"]["langdetect"] = evaluate(langdetect, samples)
+    else:
+        report["langdetect"] = "kurulu değil, karşılaştırma atlandı"
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""
+Jobsy uçtan uca performans ölçümü
+
+Sentetik posta kutuları stub'lanmış Gmail API'sinden taranır, ardından
+EnhancedEmailAnalyzer.analyze_emails → ApplicationService.save_applications → listeleme ve
+arama akışından geçirilir. JSON depolama ile ChromaDB çağrıları ayrı aşamalarda ölçülür. Her
+aşama için throughput, p50/p95/p99 gecikme ve aşamaya ait bellek değerleri JSON olarak yazılır.
+
+Kullanım (backend dizininde):
+    python -m benchmarks.run --size 500 --output bench.json
+    python -m benchmarks.run --size 500 --compare bench.json
+"""
+import os
+import sys
+import json
+import math
+import time
+import shutil
+import asyncio
+import argparse
+import platform
+import tempfile
+import tracemalloc
+import contextlib
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Callable, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from benchmarks.corpus import generate_corpus, split_mailboxes
+from benchmarks.gmail_stub import GmailStub
+
+SEARCH_QUERIES = ["backend developer", "mülakat", "hackathon", "Trendyol", "technical test", "staj"]
+COMPARED_METRICS = [("throughput", 1), ("p95_ms", -1)]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank yüzdelik"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def current_rss_mb() -> Optional[float]:
+    """Sürecin şu anki RSS değeri (MB); /proc olmayan sistemlerde None"""
+    # ru_maxrss sürecin ömür boyu tepe değeridir, önceki aşamaların tepesi sonrakilere yazılırdı
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return round(resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024), 2)
+
+
+class StageRecorder:
+    """Tek bir aşamanın çağrı gecikmelerini ve bellek kullanımını toplar"""
+
+    def __init__(self, name: str, trace_memory: bool):
+        self.name = name
+        self.trace_memory = trace_memory
+        self.latencies: List[float] = []
+        self.items = 0
+        self.elapsed = 0.0
+        self.rss_before = None
+        self.rss_after = None
+        self.rss_peak = None
+        self.tracemalloc_peak = None
+
+    def _sample_rss(self) -> Optional[float]:
+        rss = current_rss_mb()
+        if rss is not None and (self.rss_peak is None or rss > self.rss_peak):
+            self.rss_peak = rss
+        return rss
+
+    def __enter__(self):
+        self.rss_before = self._sample_rss()
+        if self.trace_memory:
+            tracemalloc.start()
+            tracemalloc.reset_peak()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.elapsed = time.perf_counter() - self._started
+        self.rss_after = self._sample_rss()
+        if self.trace_memory:
+            self.tracemalloc_peak = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 2)
+            tracemalloc.stop()
+        return False
+
+    async def measure(self, func: Callable, *args, items: int = 1, **kwargs):
+        started = time.perf_counter()
+        result = func(*args, **kwargs)
+        if asyncio.iscoroutine(result):
+            result = await result
+        self.latencies.append((time.perf_counter() - started) * 1000)
+        self.items += items
+        # Aşama içi tepe RSS, çağrı aralarında örneklenir
+        self._sample_rss()
+        return result
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "calls": len(self.latencies),
+            "items": self.items,
+            "elapsed_s": round(self.elapsed, 4),
+            "throughput": round(self.items / self.elapsed, 2) if self.elapsed else 0.0,
+            "p50_ms": round(percentile(self.latencies, 50), 3),
+            "p95_ms": round(percentile(self.latencies, 95), 3),
+            "p99_ms": round(percentile(self.latencies, 99), 3),
+            "max_ms": round(max(self.latencies), 3) if self.latencies else 0.0,
+            "peak_rss_mb": self.rss_peak,
+            "rss_growth_mb": round(self.rss_after - self.rss_before, 2) if self.rss_before is not None else None,
+            "tracemalloc_peak_mb": self.tracemalloc_peak
+        }
+
+
+async def run_pipeline(args) -> Dict[str, Any]:
+    """Tüm aşamaları çalıştır ve raporu döndür"""
+    # Servisler import edilmeden önce ortam hazırlanır: OAuth ayarları ve geçici veri dizini
+    os.environ.setdefault("GOOGLE_CLIENT_ID", "benchmark-client")
+    os.environ.setdefault("GOOGLE_CLIENT_SECRET", "benchmark-secret")
+    os.environ.setdefault("GEMINI_API_KEY", "")
+    os.environ.setdefault("TOKEN_STORE_BACKEND", "memory")
+    os.environ.setdefault("CHROMA_PERSIST_DIRECTORY", os.path.join(args.workdir, "data", "chroma"))
+    os.chdir(args.workdir)
+
+    messages = generate_corpus(args.size, seed=args.seed)
+    mailboxes = split_mailboxes(messages, args.mailbox_size)
+    stub = GmailStub(mailboxes, latency_ms=args.gmail_latency_ms)
+
+    quiet = open(os.devnull, "w") if not args.verbose else None
+    output = contextlib.redirect_stdout(quiet) if quiet else contextlib.nullcontext()
+
+    stages: Dict[str, StageRecorder] = {}
+    with output:
+        import_started = time.perf_counter()
+        from src.services.gmail_service import gmail_service
+        from src.services.enhanced_email_analyzer import enhanced_email_analyzer
+        from src.services.application_service import application_service
+        import_seconds = time.perf_counter() - import_started
+
+        for user_id in mailboxes:
+            gmail_service.token_store.set(user_id, {
+                "access_token": stub.token_for(user_id),
+                "refresh_token": "benchmark-refresh",
+                "expires_at": datetime.utcnow() + timedelta(days=365)
+            })
+
+        # 1. Gmail tarama
+        scanned: Dict[str, List[Dict]] = {}
+        with stub.patched(), StageRecorder("gmail_scan", args.tracemalloc) as stage:
+            for user_id, box in mailboxes.items():
+                result = await stage.measure(gmail_service.scan_emails, user_id, items=len(box))
+                scanned[user_id] = result["emails"]
+        stages["gmail_scan"] = stage
+
+        # 2. Analiz
+        analyzed: Dict[str, List[Dict]] = {}
+        with StageRecorder("analyze", args.tracemalloc) as stage:
+            for user_id, emails in scanned.items():
+                analyzed[user_id] = []
+                for start in range(0, len(emails), args.batch_size):
+                    batch = emails[start:start + args.batch_size]
+                    result = await stage.measure(enhanced_email_analyzer.analyze_emails, batch, items=len(batch))
+                    analyzed[user_id].extend(result["applications"])
+        stages["analyze"] = stage
+
+        # 3. Kaydetme (JSON depolama + indeks outbox'ı)
+        with StageRecorder("save", args.tracemalloc) as stage:
+            for user_id, applications in analyzed.items():
+                for application in applications:
+                    application["is_job_application"] = True
+                    application.setdefault("application_status", application.get("status", ""))
+                await stage.measure(application_service.save_applications, applications, user_id,
+                                    items=len(applications))
+        stages["save"] = stage
+
+        # 4. ChromaDB indeksleme (sunucuda arka plan indeksleyicinin yaptığı iş)
+        if args.with_chroma:
+            from src.services.vector_indexer import vector_indexer
+            with StageRecorder("chroma_index", args.tracemalloc) as stage:
+                while True:
+                    result = await stage.measure(vector_indexer.drain_once, items=0)
+                    if not result["claimed"]:
+                        # Kuyruğun boş olduğunu gösteren son tur ölçüme katılmaz
+                        stage.latencies.pop()
+                        break
+                    stage.items += result["indexed"]
+            stages["chroma_index"] = stage
+
+        # 5. Listeleme (JSON depolama)
+        with StageRecorder("list", args.tracemalloc) as stage:
+            for user_id in analyzed:
+                await stage.measure(application_service.get_user_applications, user_id)
+        stages["list"] = stage
+
+        # 6. Semantik arama (ChromaDB)
+        with StageRecorder("chroma_search", args.tracemalloc) as stage:
+            for user_id in analyzed:
+                for query in SEARCH_QUERIES:
+                    await stage.measure(application_service.search_applications_in_chroma, query, user_id)
+        stages["chroma_search"] = stage
+
+    if quiet:
+        quiet.close()
+
+    categories: Dict[str, int] = {}
+    for message in messages:
+        categories[message["_category"]] = categories.get(message["_category"], 0) + 1
+
+    return {
+        "meta": {
+            "created_at": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "size": args.size,
+            "mailboxes": len(mailboxes),
+            "batch_size": args.batch_size,
+            "gmail_latency_ms": args.gmail_latency_ms,
+            "gmail_requests": stub.request_count,
+            "service_import_s": round(import_seconds, 3),
+            "corpus_categories": categories
+        },
+        "stages": {name: stage.summary() for name, stage in stages.items()}
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> bool:
+    """Önceki çalıştırmayla karşılaştır, eşiği aşan gerileme varsa False döndür"""
+    ok = True
+    print(f"{'aşama':<12} {'metrik':<12} {'baseline':>12} {'şimdi':>12} {'değişim':>9}")
+    for name, stage in current["stages"].items():
+        base = baseline.get("stages", {}).get(name)
+        if not base:
+            print(f"{name:<12} (baseline'da yok)")
+            continue
+        for metric, direction in COMPARED_METRICS:
+            old, new = base.get(metric) or 0, stage.get(metric) or 0
+            change = ((new - old) / old * 100) if old else 0.0
+            regressed = change * direction < -max_regression
+            ok = ok and not regressed
+            flag = "  ⚠️" if regressed else ""
+            print(f"{name:<12} {metric:<12} {old:>12} {new:>12} {change:>8.1f}%{flag}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Jobsy uçtan uca performans ölçümü")
+    parser.add_argument("--size", type=int, default=200, help="Sentetik e-posta sayısı")
+    parser.add_argument("--seed", type=int, default=42, help="Korpus tohumu")
+    parser.add_argument("--mailbox-size", type=int, default=50, help="Kullanıcı başına e-posta (Gmail taraması en fazla 50 işler)")
+    parser.add_argument("--batch-size", type=int, default=10, help="analyze_emails çağrısı başına e-posta")
+    parser.add_argument("--gmail-latency-ms", type=float, default=0.0, help="Stub Gmail isteklerine eklenecek gecikme")
+    parser.add_argument("--with-chroma", action="store_true", help="Outbox'taki başvuruları ChromaDB'ye indeksleme aşamasını da ölç")
+    parser.add_argument("--tracemalloc", action="store_true", help="Aşama başına Python bellek tepe değerini ölç (yavaşlatır)")
+    parser.add_argument("--workdir", help="Veri dizini (varsayılan: geçici dizin)")
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--compare", help="Karşılaştırılacak önceki sonuç dosyası")
+    parser.add_argument("--max-regression", type=float, default=10.0, help="İzin verilen gerileme yüzdesi")
+    parser.add_argument("--verbose", action="store_true", help="Servis çıktılarını gizleme")
+    args = parser.parse_args()
+
+    output_path = os.path.abspath(args.output) if args.output else None
+    compare_path = os.path.abspath(args.compare) if args.compare else None
+    cleanup = args.workdir is None
+    args.workdir = os.path.abspath(args.workdir or tempfile.mkdtemp(prefix="jobsy-bench-"))
+    os.makedirs(args.workdir, exist_ok=True)
+
+    try:
+        report = asyncio.run(run_pipeline(args))
+    finally:
+        os.chdir(BACKEND_DIR)
+        if cleanup:
+            shutil.rmtree(args.workdir, ignore_errors=True)
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if output_path:
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(text)
+    print(text)
+
+    if compare_path:
+        with open(compare_path, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if not compare(report, baseline, args.max_regression):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
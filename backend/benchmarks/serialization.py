@@ -0,0 +1,176 @@
+"""
+Başvuru listeleri için serileştirme ve payload ölçümü
+
+Sentetik korpustan tek kullanıcıya ait başvuru kayıtları (e-posta gövdesi ve HTML dahil)
+üretilir; `/applications/{user_id}` ve `/applications/debug/{user_id}` yanıt biçimleri
+FastAPI'nin varsayılan yolu (jsonable_encoder + json), FastJSONResponse (orjson) ile
+serileştirilir. Her yöntem için süre, ham boyut ve gzip/brotli sıkıştırılmış boyut yazılır.
+
+Kullanım (backend dizininde):
+    python -m benchmarks.serialization --applications 1000 --output serialization.json
+"""
+import os
+import sys
+import json
+import time
+import base64
+import argparse
+import platform
+import statistics
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from benchmarks.corpus import generate_corpus
+from src.config.settings import settings
+from src.api.responses import dumps as fast_dumps, ORJSON_AVAILABLE
+from src.api.middleware.compression import BROTLI_AVAILABLE, compress
+
+STATUSES = ["Başvuruldu", "Mülakat", "Teknik Test", "Değerlendirme", "Kabul", "Red"]
+
+
+def _decode(data: str) -> str:
+    return base64.urlsafe_b64decode(data.encode("ascii")).decode("utf-8")
+
+
+def _bodies(payload: Dict) -> Dict[str, str]:
+    """Payload ağacındaki text/plain ve text/html gövdelerini topla"""
+    found = {}
+    stack = [payload]
+    while stack:
+        part = stack.pop()
+        mime = part.get("mimeType", "")
+        data = part.get("body", {}).get("data")
+        if data and mime in ("text/plain", "text/html"):
+            found.setdefault(mime, _decode(data))
+        stack.extend(part.get("parts", []))
+    return found
+
+
+def build_applications(count: int, seed: int) -> List[Dict]:
+    """Depodaki biçimde başvuru kayıtları üret"""
+    applications = []
+    for index, message in enumerate(generate_corpus(count, seed=seed)):
+        headers = {h["name"]: h["value"] for h in message["payload"]["headers"]}
+        bodies = _bodies(message["payload"])
+        company = headers["From"].split(" <")[0]
+        created_at = datetime(2024, 1, 1).replace(minute=index % 60).isoformat()
+        applications.append({
+            "id": index + 1,
+            "email_id": message["id"],
+            "company_name": company,
+            "position": message["snippet"][:40],
+            "application_status": STATUSES[index % len(STATUSES)],
+            "application_type": "job",
+            "email_subject": headers["Subject"],
+            "email_sender": headers["From"],
+            "email_date": headers["Date"],
+            "email_content": bodies.get("text/plain", ""),
+            "email_html": bodies.get("text/html", ""),
+            "next_action": "Mülakata hazırlan",
+            "confidence": 0.87,
+            "category": message["_category"],
+            "created_at": created_at,
+            "updated_at": created_at
+        })
+    return applications
+
+
+def listing_payloads(applications: List[Dict], user_id: str) -> Dict[str, Any]:
+    """Listeleme endpoint'lerinin döndürdüğü yanıt biçimleri"""
+    finished = [app for app in applications if app["application_status"] in ("Kabul", "Red")]
+    active = [app for app in applications if app["application_status"] not in ("Kabul", "Red")]
+    return {
+        "applications": {
+            "success": True,
+            "data": {"active_applications": active, "finished_applications": finished}
+        },
+        "debug": {"raw_applications": applications, "total_count": len(applications), "user_id": user_id}
+    }
+
+
+def _fastapi_default(content: Any) -> bytes:
+    # FastAPI varsayılan yolu: jsonable_encoder + starlette JSONResponse.render
+    from fastapi.encoders import jsonable_encoder
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _timed(func: Callable[[], bytes], repeat: int) -> Dict[str, Any]:
+    timings = []
+    result = b""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "max_ms": round(max(timings), 3),
+        "bytes": len(result),
+        "_body": result
+    }
+
+
+def measure(content: Any, repeat: int) -> Dict[str, Any]:
+    """Tek yanıt biçimi için serileştirici ve sıkıştırma sonuçları"""
+    serializers = {
+        "fastapi_default": lambda: _fastapi_default(content),
+        "fast_json": lambda: fast_dumps(content)
+    }
+    report = {"serializers": {}, "compression": {}}
+    body = b""
+    for name, func in serializers.items():
+        result = _timed(func, repeat)
+        body = result.pop("_body")
+        report["serializers"][name] = result
+
+    encodings = ["gzip"] + (["br"] if BROTLI_AVAILABLE else [])
+    for encoding in encodings:
+        result = _timed(lambda: compress(body, encoding), repeat)
+        compressed = result.pop("_body")
+        result["ratio"] = round(len(compressed) / len(body), 4) if body else 0.0
+        report["compression"][encoding] = result
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Başvuru listesi serileştirme ve payload ölçümü")
+    parser.add_argument("--applications", type=int, default=1000, help="Kullanıcının başvuru sayısı")
+    parser.add_argument("--seed", type=int, default=42, help="Korpus tohumu")
+    parser.add_argument("--repeat", type=int, default=20, help="Ölçüm tekrarı")
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    user_id = "bench-user@jobsy.test"
+    applications = build_applications(args.applications, args.seed)
+    payloads = listing_payloads(applications, user_id)
+
+    report = {
+        "meta": {
+            "created_at": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "applications": args.applications,
+            "repeat": args.repeat,
+            "orjson": ORJSON_AVAILABLE,
+            "brotli": BROTLI_AVAILABLE,
+            "gzip_level": settings.GZIP_LEVEL,
+            "brotli_quality": settings.BROTLI_QUALITY
+        },
+        "endpoints": {name: measure(content, args.repeat) for name, content in payloads.items()}
+    }
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Açılış süresi bütçesi
+
+Uygulama açılışı (import + route yükleme) temiz süreçlerde birkaç kez ölçülür. Medyan
+süre bütçeyi aşarsa ya da ML/ağır paketlerden biri açılışta import edilmişse komut
+1 ile çıkar ve en pahalı import'ları listeler.
+
+Kullanım (backend dizininde):
+    python -m benchmarks.startup
+    python -m benchmarks.startup --budget 0.8 --runs 7 --output startup.json
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+from typing import Any, Dict
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from benchmarks.importtime import BOOT_CODE, profile_imports, run_python, summarize, print_summary
+
+DEFAULT_BUDGET_SECONDS = float(os.getenv("STARTUP_BUDGET_SECONDS", "1.0"))
+
+# Sadece ilgili özellik ilk kullanıldığında yüklenmesi gereken paketler
+HEAVY_MODULES = (
+    "torch", "transformers", "sklearn", "scipy", "pandas", "numpy", "chromadb",
+    "sentence_transformers", "onnxruntime", "langdetect", "bs4", "joblib"
+)
+
+RESULT_MARKER = "STARTUP_RESULT "
+
+MEASURE_CODE = f"""
+import sys, time, json
+started = time.perf_counter()
+{BOOT_CODE}
+elapsed = time.perf_counter() - started
+heavy = sorted(name for name in {HEAVY_MODULES!r} if name in sys.modules)
+print({RESULT_MARKER!r} + json.dumps({{"seconds": elapsed, "heavy_modules": heavy}}))
+"""
+
+
+def measure_startup(runs: int) -> Dict[str, Any]:
+    """Açılışı `runs` kez ayrı süreçlerde ölç"""
+    samples = []
+    heavy_modules = set()
+    for _ in range(runs):
+        result = run_python(MEASURE_CODE)
+        if result.returncode != 0:
+            raise RuntimeError(f"Uygulama açılamadı:\n{result.stderr[-2000:]}")
+        line = next(line for line in reversed(result.stdout.splitlines()) if line.startswith(RESULT_MARKER))
+        measurement = json.loads(line[len(RESULT_MARKER):])
+        samples.append(measurement["seconds"])
+        heavy_modules.update(measurement["heavy_modules"])
+
+    return {
+        "runs": runs,
+        "median_seconds": round(statistics.median(samples), 4),
+        "min_seconds": round(min(samples), 4),
+        "max_seconds": round(max(samples), 4),
+        "heavy_modules": sorted(heavy_modules)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Açılış süresi bütçe kontrolü")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_SECONDS, help="İzin verilen medyan açılış süresi (sn)")
+    parser.add_argument("--runs", type=int, default=5, help="Ölçüm sayısı")
+    parser.add_argument("--top", type=int, default=15, help="Bütçe aşılırsa listelenecek import sayısı")
+    parser.add_argument("--output", help="Sonucun yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    report = measure_startup(args.runs)
+    report["budget_seconds"] = args.budget
+    failures = []
+    if report["median_seconds"] > args.budget:
+        failures.append(f"medyan açılış {report['median_seconds']:.3f} sn > bütçe {args.budget:.3f} sn")
+    if report["heavy_modules"]:
+        failures.append(f"açılışta yüklenen ağır paketler: {', '.join(report['heavy_modules'])}")
+    report["passed"] = not failures
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        print_summary(summarize(profile_imports(), args.top))
+        sys.exit(1)
+    print(f"✅ Açılış bütçe içinde: {report['median_seconds']:.3f} sn ≤ {args.budget:.3f} sn")
+
+
+if __name__ == "__main__":
+    main()
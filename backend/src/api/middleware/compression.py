@@ -0,0 +1,121 @@
+import gzip
+from ...config.settings import settings
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Zaten sıkıştırılmış içerikler (resim, arşiv vb.) tekrar sıkıştırılmaz
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "application/xml")
+
+
+def _parse_accept_encoding(header: str) -> dict:
+    """Accept-Encoding başlığını {encoding: q} sözlüğüne çevir"""
+    encodings = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        encodings[name.strip().lower()] = quality
+    return encodings
+
+
+def choose_encoding(accept_encoding: str) -> str:
+    """İstemcinin kabul ettiği en iyi kodlamayı seç: br > gzip > identity"""
+    encodings = _parse_accept_encoding(accept_encoding)
+    if BROTLI_AVAILABLE and encodings.get("br", 0) > 0:
+        return "br"
+    if encodings.get("gzip", 0) > 0:
+        return "gzip"
+    return "identity"
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.GZIP_LEVEL)
+
+
+class CompressionMiddleware:
+    """
+    Eşik boyutunu aşan response'ları brotli veya gzip ile sıkıştıran ASGI middleware'i
+
+    Tek parça gönderilen response'lar (JSON endpoint'leri) tamamen sıkıştırılır;
+    streaming response'lar olduğu gibi iletilir.
+    """
+
+    def __init__(self, app, minimum_size: int = None):
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MINIMUM_SIZE if minimum_size is None else minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        encoding = choose_encoding(headers.get(b"accept-encoding", b"").decode("latin-1"))
+        if encoding == "identity":
+            await self.app(scope, receive, send)
+            return
+
+        state = {"start": None, "passthrough": False}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                # Gövde gelene kadar başlıklar bekletilir
+                state["start"] = message
+                return
+
+            if message["type"] != "http.response.body" or state["passthrough"]:
+                await send(message)
+                return
+
+            start = state["start"]
+            body = message.get("body", b"")
+            response_headers = list(start.get("headers", []))
+            names = {name.lower(): value for name, value in response_headers}
+            content_type = names.get(b"content-type", b"").decode("latin-1")
+
+            skip = (
+                message.get("more_body", False)
+                or b"content-encoding" in names
+                or len(body) < self.minimum_size
+                or not content_type.startswith(COMPRESSIBLE_TYPES)
+            )
+            if skip:
+                state["passthrough"] = True
+                await send(start)
+                await send(message)
+                return
+
+            compressed = compress(body, encoding)
+            response_headers = [
+                (name, value) for name, value in response_headers
+                if name.lower() not in (b"content-length", b"etag")
+            ]
+            response_headers.append((b"content-encoding", encoding.encode("latin-1")))
+            response_headers.append((b"content-length", str(len(compressed)).encode("latin-1")))
+            response_headers.append((b"vary", b"Accept-Encoding"))
+            if b"etag" in names:
+                # Sıkıştırılmış gövde farklı bir temsil olduğundan ETag zayıflatılır
+                etag = names[b"etag"]
+                response_headers.append((b"etag", etag if etag.startswith(b"W/") else b"W/" + etag))
+            await send({**start, "headers": response_headers})
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def setup_compression(app):
+    """Sıkıştırma middleware'ini ayarlar"""
+    app.add_middleware(CompressionMiddleware)
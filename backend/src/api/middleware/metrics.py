@@ -0,0 +1,54 @@
+import time
+from starlette.routing import Match
+from ...utils.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_FLIGHT
+
+
+class MetricsMiddleware:
+    """Her HTTP isteğinin süresini route şablonu bazında ölçen ASGI middleware'i"""
+
+    def __init__(self, app):
+        self.app = app
+
+    def _route_template(self, scope) -> str:
+        # Ham path yerine şablon kullanılır (/applications/{user_id}), etiket sayısı sınırlı kalır
+        route = scope.get("route")
+        if route is not None:
+            return route.path
+        app = scope.get("app")
+        router = getattr(app, "router", None)
+        for candidate in getattr(router, "routes", []):
+            match, _ = candidate.matches(scope)
+            if match == Match.FULL:
+                return getattr(candidate, "path", "unmatched")
+        return "unmatched"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope.get("method", "GET")
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        HTTP_REQUESTS_IN_FLIGHT.inc(method=method)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec(method=method)
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started,
+                method=method,
+                route=self._route_template(scope),
+                status=str(status["code"])
+            )
+
+
+def setup_metrics(app):
+    """Metrik middleware'ini ayarlar"""
+    app.add_middleware(MetricsMiddleware)
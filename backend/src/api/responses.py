@@ -0,0 +1,80 @@
+import json
+from datetime import date, datetime
+from typing import Any, Callable
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    print("⚠️ orjson bulunamadı, standart json kullanılacak")
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(value: Any) -> Any:
+    """orjson/json'un doğrudan desteklemediği tipleri dönüştür"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    if hasattr(value, "dict"):
+        return value.dict()
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} JSON'a çevrilemiyor")
+
+
+def dumps(content: Any) -> bytes:
+    """İçeriği JSON byte'larına çevir (orjson varsa onunla)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+    return json.dumps(
+        content, default=_default, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    orjson ile serileştiren JSON response
+
+    Endpoint'ler bu sınıfı doğrudan döndürdüğünde FastAPI'nin jsonable_encoder adımı
+    atlanır; büyük başvuru listelerinde serileştirme süresinin çoğu bu adımdadır.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def _strip_weak(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match başlığı verilen ETag'i içeriyor mu (zayıf karşılaştırma)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Sıkıştırılmış yanıtlar ETag'i W/ ile zayıflatır, karşılaştırmada önek yok sayılır
+    target = _strip_weak(etag)
+    return any(_strip_weak(tag.strip()) == target for tag in header.split(","))
+
+
+def conditional_response(request: Request, etag: str, build: Callable[[], Any]) -> Response:
+    """
+    ETag'li listeleme yanıtı
+
+    İstemcinin elindeki ETag güncelse içerik hiç oluşturulmadan 304 döner;
+    aksi halde build() çağrılır ve sonuç ETag ile birlikte gönderilir.
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return FastJSONResponse(build(), headers=headers)
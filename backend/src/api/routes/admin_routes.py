@@ -0,0 +1,51 @@
+import asyncio
+from typing import Optional
+from fastapi import APIRouter
+from ...services.application_service import application_service
+from ...services.page_fetcher import page_fetcher
+from ...services.language_detector import language_detector
+from ...services.index_outbox import index_outbox
+from ...services.vector_indexer import vector_indexer
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+@router.get("/caches")
+async def cache_stats():
+    """Cache isabet, ıskalama ve çıkarma istatistikleri"""
+    return {
+        "success": True,
+        "caches": {
+            "job_analysis": application_service.analysis_cache.stats(),
+            "page_fetch": dict(page_fetcher.stats),
+            "language_detection": {**language_detector.stats, "size": len(language_detector._cache)}
+        }
+    }
+
+@router.delete("/caches/job-analysis")
+async def clear_analysis_cache():
+    """İlan analiz cache'ini temizle"""
+    application_service.analysis_cache.clear()
+    return {"success": True, "message": "İlan analiz cache'i temizlendi"}
+
+@router.get("/index")
+async def index_status():
+    """Vektör indeksi outbox gecikmesi ve indeksleyici durumu"""
+    return {"success": True, "index": await asyncio.to_thread(vector_indexer.status)}
+
+@router.post("/index/rebuild")
+async def rebuild_index(user_id: Optional[str] = None, reset: bool = True):
+    """Vektör indeksini birincil depodan yeniden oluştur (olaylar arka planda indekslenir)"""
+    try:
+        report = await asyncio.to_thread(vector_indexer.rebuild, user_id, reset)
+        return {"success": True, "rebuild": report, "message": "Yeniden indeksleme kuyruğa alındı"}
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Yeniden indeksleme hatası: {str(e)}",
+            "message": "Vektör indeksi yeniden oluşturulamadı"
+        }
+
+@router.post("/index/retry-dead")
+async def retry_dead_index_events():
+    """Deneme hakkı biten indeks olaylarını tekrar kuyruğa al"""
+    return {"success": True, "requeued": await asyncio.to_thread(index_outbox.retry_dead)}
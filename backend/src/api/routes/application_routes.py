@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Body
+from fastapi import APIRouter, Body, Request
 from typing import Dict
 from ...services.application_service import application_service
+from ..responses import conditional_response
 
 router = APIRouter()
 
@@ -21,20 +22,29 @@ async def create_manual_application(application_data: Dict = Body(...)):
 # async def analyze_job_posting(job_data: Dict = Body(...)):
 #     """AI ile iş ilanını analiz et ve bilgileri çıkar"""
 #     try:
-#         result = application_service.analyze_job_posting(job_data)
+#         result = await application_service.analyze_job_posting(job_data)
 #         return result
 #     except Exception as e:
 #         raise
 
 @router.get("/{user_id}")
-async def get_applications(user_id: str):
+async def get_applications(user_id: str, request: Request):
     """Kullanıcının başvurularını getir"""
-    return application_service.get_applications(user_id)
+    # Veri değişmediyse 304 döner; aksi halde liste jsonable_encoder atlanarak serileştirilir
+    return conditional_response(
+        request,
+        application_service.get_etag(user_id, "applications"),
+        lambda: application_service.get_applications(user_id)
+    )
 
 @router.get("/debug/{user_id}")
-async def debug_user_applications(user_id: str):
+async def debug_user_applications(user_id: str, request: Request):
     """Debug için kullanıcının tüm başvurularını getir"""
-    return application_service.debug_user_applications(user_id)
+    return conditional_response(
+        request,
+        application_service.get_etag(user_id, "debug"),
+        lambda: application_service.debug_user_applications(user_id)
+    )
 
 @router.delete("/{user_id}/{application_id}")
 async def delete_application(user_id: str, application_id: int):
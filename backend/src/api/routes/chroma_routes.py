@@ -1,5 +1,5 @@
-from fastapi import APIRouter, Depends
-from typing import List, Dict, Any
+from fastapi import APIRouter, Depends, Request
+from typing import List, Dict, Any, Optional
 from ...models.schemas import (
     ApplicationData, 
     ApplicationUpdateData, 
@@ -7,6 +7,7 @@ from ...models.schemas import (
     TextData
 )
 from ...services.application_service import application_service
+from ..responses import conditional_response
 
 router = APIRouter()
 
@@ -95,16 +96,18 @@ async def delete_application(
         }
 
 @router.get("/applications")
-async def get_applications(user_id: str):
+async def get_applications(user_id: str, request: Request):
     """ChromaDB'den kullanıcının tüm başvurularını getir"""
     try:
-        applications = application_service.get_applications_from_chroma(user_id)
+        def build():
+            applications = application_service.get_applications_from_chroma(user_id)
+            return {
+                "success": True,
+                "data": applications,
+                "count": len(applications)
+            }
         
-        return {
-            "success": True,
-            "data": applications,
-            "count": len(applications)
-        }
+        return conditional_response(request, application_service.get_index_etag(user_id), build)
     except Exception as e:
         return {
             "success": False,
@@ -141,14 +144,20 @@ async def search_applications(
 @router.post("/search/emails")
 async def search_email_analysis(
     search_data: ModelSearchData,
-    user_id: str
+    user_id: str,
+    category: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None
 ):
-    """ChromaDB'de e-posta analizlerinde semantik arama yap"""
+    """ChromaDB'de e-posta analizlerinde kategori (virgülle ayrılmış) ve tarih filtreli semantik arama yap"""
     try:
         results = application_service.search_email_analysis_in_chroma(
             search_data.query, 
             user_id, 
-            search_data.limit
+            search_data.limit,
+            category=[item.strip() for item in category.split(",") if item.strip()] if category else None,
+            date_from=date_from,
+            date_to=date_to
         )
         
         return {
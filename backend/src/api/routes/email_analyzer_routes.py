@@ -1,15 +1,33 @@
+import asyncio
 from fastapi import APIRouter
 from typing import List, Dict
 from ...services.email_analyzer_service import email_analyzer_service
+from ...services.application_service import application_service
 from ...models.schemas import EmailAnalysisRequest
 
 router = APIRouter(prefix="/analyze", tags=["Email Analysis"])
 
+async def _index_analyses(request: EmailAnalysisRequest, result: Dict):
+    """Kullanıcı verildiyse analiz sonuçlarını tek toplu yazma ile e-posta indeksi kuyruğuna al"""
+    applications = result.get("applications") if isinstance(result, dict) else None
+    if not request.userId or not applications:
+        return
+    try:
+        analysis_ids = await asyncio.to_thread(
+            application_service.save_email_analyses_to_chroma, applications, request.userId, request.emails
+        )
+        result["indexed"] = len(analysis_ids)
+    except Exception as e:
+        # İndeksleme hatası analiz yanıtını bozmaz
+        print(f"⚠️ E-posta analizleri indekslenemedi: {e}")
+        result["indexed"] = 0
+
 @router.post("/emails")
 async def analyze_emails(request: EmailAnalysisRequest):
     """E-postaları analiz et ve iş başvurusu bilgilerini çıkar"""
     try:
         result = await email_analyzer_service.analyze_emails(request.emails)
+        await _index_analyses(request, result)
         return result
     except Exception as e:
         return {
@@ -23,6 +41,7 @@ async def scan_emails(request: EmailAnalysisRequest):
     """E-postaları tara ve analiz et (Frontend uyumluluğu için)"""
     try:
         result = await email_analyzer_service.analyze_emails(request.emails)
+        await _index_analyses(request, result)
         return result
     except Exception as e:
         return {
@@ -30,3 +49,19 @@ async def scan_emails(request: EmailAnalysisRequest):
             "error": f"E-posta tarama hatası: {str(e)}",
             "message": "E-postalar taranırken hata oluştu"
         }
+
+@router.get("/classifier/stats")
+async def get_classifier_stats():
+    """Sınıflandırma kaskadının aşama istatistiklerini getir"""
+    try:
+        from ...services.advanced_email_classifier import advanced_email_classifier
+        return {
+            "success": True,
+            "stats": advanced_email_classifier.get_cascade_stats()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Sınıflandırıcı istatistik hatası: {str(e)}",
+            "message": "Sınıflandırıcı istatistikleri alınamadı"
+        }
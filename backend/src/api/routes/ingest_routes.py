@@ -0,0 +1,72 @@
+import os
+import re
+import shutil
+import asyncio
+from typing import Optional
+from fastapi import APIRouter, File, Form, UploadFile
+from ...config.settings import settings
+from ...services.mbox_ingest import mbox_ingest_service
+
+router = APIRouter(prefix="/ingest", tags=["Ingestion"])
+
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+
+def _upload_path(user_id: str, filename: str) -> str:
+    # Aynı dosya tekrar yüklendiğinde aynı yola yazılır, böylece içe aktarma kaldığı yerden sürer
+    safe_user = re.sub(r"[^A-Za-z0-9_.-]", "_", user_id)
+    safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", os.path.basename(filename or "")) or "mailbox.mbox"
+    return os.path.join(settings.MBOX_UPLOAD_DIR, f"{safe_user}__{safe_name}")
+
+
+def _store_upload(file: UploadFile, target: str):
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    temp_path = f"{target}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as out:
+        shutil.copyfileobj(file.file, out, UPLOAD_CHUNK_BYTES)
+    os.replace(temp_path, target)
+
+
+@router.post("/mbox")
+async def ingest_mbox(
+    file: UploadFile = File(...),
+    userId: str = Form(...),
+    chunkSize: Optional[int] = Form(None),
+    resume: bool = Form(True)
+):
+    """mbox/EML dosyasını yükle ve arka planda içe aktarmaya başla"""
+    if not userId:
+        return {
+            "success": False,
+            "error": "User ID gerekli",
+            "message": "Lütfen userId alanını doldurun"
+        }
+    try:
+        target = _upload_path(userId, file.filename)
+        # Dosya parça parça diske yazılır, belleğe alınmaz
+        await asyncio.to_thread(_store_upload, file, target)
+        job = mbox_ingest_service.start_job(target, userId, chunk_size=chunkSize, resume=resume)
+        return {
+            "success": True,
+            "job": job,
+            "message": "İçe aktarma başlatıldı"
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"İçe aktarma hatası: {str(e)}",
+            "message": "E-posta arşivi içe aktarılamadı"
+        }
+
+
+@router.get("/jobs/{job_id}")
+async def get_ingest_job(job_id: str):
+    """İçe aktarma işinin durumu ve ilerlemesi"""
+    job = mbox_ingest_service.get_job(job_id)
+    if not job:
+        return {
+            "success": False,
+            "error": "İş bulunamadı",
+            "message": f"{job_id} numaralı içe aktarma işi yok"
+        }
+    return {"success": True, "job": job}
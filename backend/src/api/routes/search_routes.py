@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Query
 from typing import List, Dict, Any, Optional
-from ...services.search_service import SearchService
-from ...services.application_service import ApplicationService
-from ...models.schemas import ApplicationData as Application
+from ...services.search_service import search_service
+from ...services.application_service import application_service
+from ...services.analytics_service import analytics_service
+from ...services.recommendation_store import recommendation_store
 
 router = APIRouter(prefix="/search", tags=["search"])
 
@@ -20,12 +21,8 @@ async def search_applications(
     """Başvuruları arama ve filtreleme"""
     
     try:
-        # Servisleri başlat
-        search_service = SearchService()
-        app_service = ApplicationService()
-        
         # Kullanıcının başvurularını al
-        user_applications = await app_service.get_user_applications(user_email)
+        user_applications = application_service.get_application_records(user_email)
         
         # Filtreleri hazırla
         filters = {}
@@ -71,13 +68,6 @@ async def get_recommendations(
     """AI tabanlı kişiselleştirilmiş öneriler"""
     
     try:
-        # Servisleri başlat
-        search_service = SearchService()
-        app_service = ApplicationService()
-        
-        # Kullanıcının başvurularını al
-        user_applications = await app_service.get_user_applications(user_email)
-        
         # Kullanıcı profili (gerçek uygulamada veritabanından alınır)
         user_profile = {
             "skills": ["JavaScript", "React", "Node.js", "Python"],
@@ -85,18 +75,19 @@ async def get_recommendations(
             "preferred_companies": ["Google", "Microsoft", "Apple"]
         }
         
-        # Önerileri oluştur
-        recommendations = await search_service.generate_ai_recommendations(
-            user_applications, 
-            user_profile
-        )
+        # Öneriler cache'ten gelir; veri değiştiyse arka planda yenilenir, istek beklemez
+        result = await recommendation_store.get(user_email, user_profile)
+        recommendations = result["recommendations"]
         
         return {
             "success": True,
             "data": {
                 "recommendations": recommendations,
                 "total": len(recommendations),
-                "generated_at": search_service._get_current_timestamp()
+                "generated_at": result["generated_at"],
+                "personalized": result["personalized"],
+                "stale": result["stale"],
+                "refreshing": result["refreshing"]
             },
             "message": f"{len(recommendations)} öneri oluşturuldu"
         }
@@ -115,47 +106,12 @@ async def get_search_analytics(
     """Arama ve öneri analitikleri"""
     
     try:
-        # Servisleri başlat
-        search_service = SearchService()
-        app_service = ApplicationService()
-        
-        # Kullanıcının başvurularını al
-        user_applications = await app_service.get_user_applications(user_email)
-        
-        # Analitik verileri hesapla
-        total_applications = len(user_applications)
-        active_applications = len([app for app in user_applications if app.status in ['active', 'pending']])
-        finished_applications = len([app for app in user_applications if app.status in ['finished', 'rejected', 'accepted']])
-        
-        # Başarı oranı
-        success_rate = 0
-        if finished_applications > 0:
-            accepted = len([app for app in user_applications if app.status == 'accepted'])
-            success_rate = (accepted / finished_applications) * 100
-        
-        # Aşama dağılımı
-        stage_distribution = {}
-        for app in user_applications:
-            stage = app.stage
-            stage_distribution[stage] = stage_distribution.get(stage, 0) + 1
-        
-        # Şirket dağılımı
-        company_distribution = {}
-        for app in user_applications:
-            company = app.company
-            company_distribution[company] = company_distribution.get(company, 0) + 1
+        # Analitik özet veri versiyonu değişene kadar cache'ten gelir
+        analytics = analytics_service.get_user_analytics(user_email)
         
         return {
             "success": True,
-            "data": {
-                "total_applications": total_applications,
-                "active_applications": active_applications,
-                "finished_applications": finished_applications,
-                "success_rate": round(success_rate, 2),
-                "stage_distribution": stage_distribution,
-                "company_distribution": company_distribution,
-                "last_updated": search_service._get_current_timestamp()
-            },
+            "data": analytics,
             "message": "Analitik veriler başarıyla oluşturuldu"
         }
         
@@ -174,12 +130,8 @@ async def smart_filter_applications(
     """Akıllı filtreleme ile başvuru arama"""
     
     try:
-        # Servisleri başlat
-        search_service = SearchService()
-        app_service = ApplicationService()
-        
         # Kullanıcının başvurularını al
-        user_applications = await app_service.get_user_applications(user_email)
+        user_applications = application_service.get_application_records(user_email)
         
         # Akıllı filtreleme
         search_results = await search_service.search_applications(
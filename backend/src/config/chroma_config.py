@@ -31,6 +31,12 @@ class ChromaConfig:
     # Maksimum arama sonuç limiti
     MAX_SEARCH_LIMIT: int = int(os.getenv("MAX_SEARCH_LIMIT", "100"))
     
+    # Toplu yazmalarda tek upsert çağrısındaki kayıt sayısı
+    INDEX_BATCH_SIZE: int = int(os.getenv("CHROMA_INDEX_BATCH_SIZE", "64"))
+    
+    # E-posta analizi dokümanına alınacak azami gövde uzunluğu (karakter)
+    EMAIL_DOCUMENT_MAX_CHARS: int = int(os.getenv("CHROMA_EMAIL_DOCUMENT_MAX_CHARS", "2000"))
+    
     # ChromaDB collection metadata
     APPLICATIONS_COLLECTION_NAME: str = "job_applications"
     EMAIL_ANALYSIS_COLLECTION_NAME: str = "email_analysis"
@@ -0,0 +1,45 @@
+import os
+
+class ClassifierConfig:
+    """E-posta sınıflandırıcı konfigürasyon ayarları"""
+    
+    # Kural tabanlı sınıflandırıcının kural dosyası
+    RULES_PATH: str = os.getenv(
+        "EMAIL_RULES_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "email_rules.json")
+    )
+    
+    # Softmax sıcaklığı (boş bırakılırsa kural dosyasındaki değer kullanılır)
+    RULES_TEMPERATURE: float = float(os.getenv("EMAIL_RULES_TEMPERATURE", "0") or 0)
+    
+    # Lineer (TF-IDF + lojistik regresyon) modelin kayıt yolu
+    LINEAR_MODEL_PATH: str = os.getenv("EMAIL_LINEAR_MODEL_PATH", "data/models/linear_email_classifier.joblib")
+    
+    # Kaskad: kurallar → lineer model → BERT
+    CASCADE_ENABLED: bool = os.getenv("EMAIL_CASCADE_ENABLED", "true").lower() == "true"
+    CASCADE_RULE_THRESHOLD: float = float(os.getenv("EMAIL_CASCADE_RULE_THRESHOLD", "0.85"))
+    CASCADE_LINEAR_THRESHOLD: float = float(os.getenv("EMAIL_CASCADE_LINEAR_THRESHOLD", "0.80"))
+    
+    # Distilled (hashing + lojistik regresyon) model versiyonlarının dizini
+    DISTILLED_MODEL_DIR: str = os.getenv("EMAIL_DISTILLED_MODEL_DIR", "data/models/distilled")
+    
+    # classify_email için varsayılan backend: cascade, bert veya distilled
+    CLASSIFIER_BACKEND: str = os.getenv(
+        "EMAIL_CLASSIFIER_BACKEND",
+        "cascade" if CASCADE_ENABLED else "bert"
+    ).lower()
+    
+    # BERT aşaması: kapalıysa torch/transformers hiç yüklenmez, kaskad kurallar ve lineer modelle çalışır
+    BERT_ENABLED: bool = os.getenv("EMAIL_BERT_ENABLED", "true").lower() == "true"
+    
+    # BERT fine-tuning: model/checkpoint dizini, tokenize edilmiş veri cache'i ve azami token sayısı
+    BERT_MODEL_DIR: str = os.getenv("EMAIL_BERT_MODEL_DIR", "./email_classifier_model")
+    BERT_TOKENIZED_CACHE_DIR: str = os.getenv("EMAIL_BERT_TOKENIZED_CACHE_DIR", "data/cache/tokenized")
+    BERT_TRAIN_MAX_LENGTH: int = int(os.getenv("EMAIL_BERT_TRAIN_MAX_LENGTH", "256"))
+    
+    # Değerlendirmede karşılaştırılacak, dışa aktarılmış BERT ONNX modeli
+    BERT_ONNX_PATH: str = os.getenv("EMAIL_BERT_ONNX_PATH", "data/models/bert_email_classifier.onnx")
+    
+    # Dil tespiti: incelenen önek uzunluğu ve sonuç cache'inin kapasitesi (0 ise cache kapalı)
+    LANGUAGE_PREFIX_CHARS: int = int(os.getenv("EMAIL_LANGUAGE_PREFIX_CHARS", "400"))
+    LANGUAGE_CACHE_SIZE: int = int(os.getenv("EMAIL_LANGUAGE_CACHE_SIZE", "4096"))
@@ -40,6 +40,62 @@ class Settings:
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "info")
     
+    # Response sıkıştırma
+    COMPRESSION_MINIMUM_SIZE: int = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))  # byte
+    GZIP_LEVEL: int = int(os.getenv("GZIP_LEVEL", "6"))
+    BROTLI_QUALITY: int = int(os.getenv("BROTLI_QUALITY", "4"))
+    
+    # Gmail token deposu: "sqlite" (worker'lar arası paylaşımlı, şifreli) veya "memory"
+    TOKEN_STORE_BACKEND: str = os.getenv("TOKEN_STORE_BACKEND", "sqlite")
+    TOKEN_STORE_PATH: str = os.getenv("TOKEN_STORE_PATH", "data/tokens.db")
+    TOKEN_ENCRYPTION_KEY: Optional[str] = os.getenv("TOKEN_ENCRYPTION_KEY")  # Fernet anahtarı
+    TOKEN_REFRESH_MARGIN_SECONDS: int = int(os.getenv("TOKEN_REFRESH_MARGIN_SECONDS", "300"))  # süre dolmadan ne kadar önce yenilensin
+    TOKEN_REFRESH_CHECK_INTERVAL: int = int(os.getenv("TOKEN_REFRESH_CHECK_INTERVAL", "60"))
+    
+    # Öneriler: son değişiklikten sonra yeniden hesaplamadan önce beklenecek süre
+    RECOMMENDATION_DEBOUNCE_SECONDS: float = float(os.getenv("RECOMMENDATION_DEBOUNCE_SECONDS", "2.0"))
+    
+    # İş ilanı sayfası indirme ve disk cache'i
+    PAGE_CACHE_DIR: str = os.getenv("PAGE_CACHE_DIR", "data/page_cache")
+    PAGE_CACHE_FRESH_SECONDS: int = int(os.getenv("PAGE_CACHE_FRESH_SECONDS", "600"))  # bu süre içinde koşullu istek bile atılmaz
+    PAGE_FETCH_MAX_BYTES: int = int(os.getenv("PAGE_FETCH_MAX_BYTES", "1048576"))  # byte, fazlası okunmaz
+    PAGE_FETCH_PER_HOST: int = int(os.getenv("PAGE_FETCH_PER_HOST", "4"))  # host başına eşzamanlı istek
+    PAGE_FETCH_TIMEOUT: float = float(os.getenv("PAGE_FETCH_TIMEOUT", "5.0"))
+    
+    # İlan analiz cache'i: bellek katmanı sınırı, süre ve (boş değilse) worker'lar arası disk katmanı
+    ANALYSIS_CACHE_MAX_ENTRIES: int = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "1000"))
+    ANALYSIS_CACHE_TTL_SECONDS: int = int(os.getenv("ANALYSIS_CACHE_TTL_SECONDS", "86400"))
+    ANALYSIS_CACHE_DISK_PATH: str = os.getenv("ANALYSIS_CACHE_DISK_PATH", "data/analysis_cache.db")
+    
+    # E-posta öğrenme sayaçları: worker'lar arası paylaşımlı SQLite, farklar toplu yazılır
+    LEARNING_STORE_PATH: str = os.getenv("LEARNING_STORE_PATH", "data/learning.db")
+    LEARNING_FLUSH_EVERY: int = int(os.getenv("LEARNING_FLUSH_EVERY", "100"))  # olay
+    LEARNING_FLUSH_INTERVAL_SECONDS: float = float(os.getenv("LEARNING_FLUSH_INTERVAL_SECONDS", "5.0"))
+    LEARNING_MAX_PENDING_KEYS: int = int(os.getenv("LEARNING_MAX_PENDING_KEYS", "1000"))
+
+    # Çevrimdışı mbox/EML içe aktarma: parça boyutu, devam noktası dosyaları ve yüklemeler
+    MBOX_INGEST_CHUNK_SIZE: int = int(os.getenv("MBOX_INGEST_CHUNK_SIZE", "64"))  # e-posta
+    MBOX_INGEST_STATE_DIR: str = os.getenv("MBOX_INGEST_STATE_DIR", "data/ingest")
+    MBOX_UPLOAD_DIR: str = os.getenv("MBOX_UPLOAD_DIR", "data/uploads")
+    MBOX_MAX_BODY_CHARS: int = int(os.getenv("MBOX_MAX_BODY_CHARS", "20000"))  # fazlası sınıflandırmaya girmez
+
+    # Vektör indeksi: başvuru değişiklikleri outbox'a yazılır, arka plan indeksleyici ChromaDB'ye toplu aktarır
+    INDEX_OUTBOX_PATH: str = os.getenv("INDEX_OUTBOX_PATH", "data/index_outbox.db")
+    INDEXER_ENABLED: bool = os.getenv("INDEXER_ENABLED", "true").lower() == "true"
+    INDEXER_BATCH_SIZE: int = int(os.getenv("INDEXER_BATCH_SIZE", "256"))  # tek turda alınan olay
+    INDEXER_POLL_INTERVAL_SECONDS: float = float(os.getenv("INDEXER_POLL_INTERVAL_SECONDS", "5.0"))
+    INDEXER_MAX_ATTEMPTS: int = int(os.getenv("INDEXER_MAX_ATTEMPTS", "8"))  # sonrasında olay "dead" işaretlenir
+    INDEXER_RETRY_BASE_SECONDS: float = float(os.getenv("INDEXER_RETRY_BASE_SECONDS", "2.0"))  # üstel geri çekilme tabanı
+    INDEXER_RETRY_MAX_SECONDS: float = float(os.getenv("INDEXER_RETRY_MAX_SECONDS", "300.0"))
+    INDEXER_LEASE_SECONDS: float = float(os.getenv("INDEXER_LEASE_SECONDS", "120.0"))  # alınan olay bu süre başka worker'a verilmez
+
+    # Yakın kopya başvuru tespiti: aynı başvurunun onay/hatırlatma/davet e-postaları tek kayıtta birleşir
+    DUPLICATE_DETECTION_ENABLED: bool = os.getenv("DUPLICATE_DETECTION_ENABLED", "true").lower() == "true"
+    DUPLICATE_WINDOW_DAYS: int = int(os.getenv("DUPLICATE_WINDOW_DAYS", "180"))  # daha uzak tarihli e-postalar yeni başvuru sayılır
+    DUPLICATE_COMPANY_THRESHOLD: float = float(os.getenv("DUPLICATE_COMPANY_THRESHOLD", "0.8"))  # şirket 3-gram Jaccard
+    DUPLICATE_POSITION_THRESHOLD: float = float(os.getenv("DUPLICATE_POSITION_THRESHOLD", "0.8"))  # pozisyon 3-gram Jaccard ("Senior X" ile "X" ~0.7)
+    DUPLICATE_BODY_MAX_DISTANCE: int = int(os.getenv("DUPLICATE_BODY_MAX_DISTANCE", "8"))  # 64 bitlik SimHash Hamming mesafesi
+
     @property
     def headers(self) -> dict:
         """Hugging Face API headers"""
@@ -1,7 +1,19 @@
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from contextlib import asynccontextmanager
 from .config.settings import settings
 from .api.middleware.cors import setup_cors
+from .api.middleware.metrics import setup_metrics
+from .api.middleware.compression import setup_compression
+from .api.responses import FastJSONResponse
+from .utils.metrics import metrics_registry
+from .utils.logger import setup_logging, shutdown_logging
+
+# Log seviyesi LOG_LEVEL'dan okunur; bilinen gizli değerler loglarda maskelenir
+setup_logging(
+    settings.LOG_LEVEL,
+    secrets=[settings.GEMINI_API_KEY, settings.GOOGLE_CLIENT_SECRET, settings.HF_TOKEN]
+)
 
 def setup_routes(app: FastAPI):
     """Route'ları lazy loading ile dahil et"""
@@ -52,6 +64,22 @@ def setup_routes(app: FastAPI):
         print("✅ ChromaDB routes yüklendi")
     except Exception as e:
         print(f"⚠️ ChromaDB routes yüklenemedi: {e}")
+    
+    try:
+        # Admin routes
+        from .api.routes import admin_routes
+        app.include_router(admin_routes.router)
+        print("✅ Admin routes yüklendi")
+    except Exception as e:
+        print(f"⚠️ Admin routes yüklenemedi: {e}")
+    
+    try:
+        # mbox/EML içe aktarma routes
+        from .api.routes import ingest_routes
+        app.include_router(ingest_routes.router)
+        print("✅ Ingest routes yüklendi")
+    except Exception as e:
+        print(f"⚠️ Ingest routes yüklenemedi: {e}")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -61,22 +89,68 @@ async def lifespan(app: FastAPI):
     setup_routes(app)
     print("✅ Tüm route'lar yüklendi")
     
+    # Gmail token'larını süreleri dolmadan arka planda yenile
+    token_manager = None
+    try:
+        from .services.gmail_service import gmail_service
+        token_manager = gmail_service.token_manager
+        token_manager.start()
+        print("✅ Token yenileme zamanlayıcısı başlatıldı")
+    except Exception as e:
+        print(f"⚠️ Token yenileme zamanlayıcısı başlatılamadı: {e}")
+    
+    # Başvuru değişikliklerini outbox'tan ChromaDB'ye aktaran indeksleyici
+    indexer = None
+    if settings.INDEXER_ENABLED:
+        try:
+            from .services.vector_indexer import vector_indexer
+            indexer = vector_indexer
+            indexer.start()
+            print("✅ Vektör indeksleyici başlatıldı")
+        except Exception as e:
+            print(f"⚠️ Vektör indeksleyici başlatılamadı: {e}")
+    
+    # BERT modelleri ilk isteği bekletmemek için arka planda yüklenir; yüklenene kadar kaskad kurallarla yanıt verir
+    try:
+        from .services.advanced_email_classifier import advanced_email_classifier
+        if advanced_email_classifier.warmup():
+            print("🔄 BERT modelleri arka planda yükleniyor")
+    except Exception as e:
+        print(f"⚠️ BERT ön yüklemesi başlatılamadı: {e}")
+    
     yield
     
     # Shutdown
     print("🔄 Uygulama kapatılıyor...")
+    if token_manager is not None:
+        await token_manager.stop()
+    if indexer is not None:
+        await indexer.stop()
+    try:
+        from .services.page_fetcher import page_fetcher
+        await page_fetcher.aclose()
+    except Exception as e:
+        print(f"⚠️ Sayfa indirici kapatılamadı: {e}")
+    shutdown_logging()
 
 # FastAPI uygulamasını oluştur
 app = FastAPI(
     title="Jobsy AI API", 
     description="Hugging Face ve Gemini API entegrasyonu ile iş başvuru takip sistemi - ChromaDB vektör veritabanı desteği ile",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
 # CORS middleware'ini ayarla
 setup_cors(app)
 
+# Response sıkıştırma middleware'ini ayarla
+setup_compression(app)
+
+# Metrik middleware'ini ayarla
+setup_metrics(app)
+
 # Ana endpoint
 @app.get("/")
 def root():
@@ -91,7 +165,10 @@ def root():
             "applications": "/applications/*",
             "ai": "/ai/*",
             "search": "/search/*",
-            "chroma": "/chroma/*"
+            "chroma": "/chroma/*",
+            "admin": "/admin/*",
+            "ingest": "/ingest/*",
+            "metrics": "/metrics"
         },
         "docs": "/docs",
         "redoc": "/redoc"
@@ -107,6 +184,12 @@ def health_check():
         "version": "1.0.0"
     }
 
+# Prometheus metrikleri
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Metrikleri Prometheus text formatında döner"""
+    return PlainTextResponse(metrics_registry.render(), media_type=metrics_registry.CONTENT_TYPE)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
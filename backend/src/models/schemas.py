@@ -87,6 +87,7 @@ class GmailDisconnectRequest(BaseModel):
 
 class EmailAnalysisRequest(BaseModel):
     emails: List[Dict]
+    userId: Optional[str] = None  # verilirse analiz sonuçları e-posta indeksine yazılır
 
 class ApplicationSaveRequest(BaseModel):
     userId: str
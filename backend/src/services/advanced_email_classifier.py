@@ -1,21 +1,18 @@
+import os
 import re
 import json
-import torch
-import numpy as np
-import pandas as pd
+import time
+import threading
 from typing import List, Dict, Optional, Tuple, Any
 from datetime import datetime
 from dataclasses import dataclass
-from transformers import (
-    AutoTokenizer, 
-    AutoModelForSequenceClassification,
-    AutoModelForTokenClassification,
-    pipeline,
-    TrainingArguments,
-    Trainer
-)
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import classification_report, accuracy_score
+from .extraction_engine import email_extraction_engine, ExtractionResult
+from .rule_classifier import rule_classifier
+from .linear_classifier import linear_email_classifier
+from .distillation import distilled_email_classifier
+from .language_detector import language_detector
+from ..config.classifier_config import ClassifierConfig
+from ..utils.metrics import CLASSIFIER_INFERENCE_DURATION, CLASSIFIER_STAGE_TOTAL
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -37,13 +34,20 @@ class AdvancedEmailClassifier:
     2. Yapılandırılmış bilgi çıkarır
     3. Dinamik olarak yeni terimleri yorumlar
     4. Transfer learning ile sürekli öğrenir
+    
+    torch/transformers ve BERT ağırlıkları import sırasında değil, BERT'e ilk ihtiyaç
+    duyulduğunda yüklenir; kaskad çoğu e-postayı kurallar ve lineer modelle çözer.
     """
     
     def __init__(self, model_name: str = "dbmdz/bert-base-turkish-cased"):
         self.model_name = model_name
-        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        self.device = None
         
-        # Model ve tokenizer'ları yükle
+        # Model ve tokenizer'lar ilk kullanımda yüklenir
+        self.bert_enabled = ClassifierConfig.BERT_ENABLED
+        self._models_loaded = False
+        self._models_lock = threading.Lock()
+        self._warmup_thread: Optional[threading.Thread] = None
         self.tokenizer = None
         self.classification_model = None
         self.ner_model = None
@@ -61,33 +65,68 @@ class AdvancedEmailClassifier:
             "spam_reklam": "Spam ve reklam e-postaları"
         }
         
-        # Bilgi çıkarım pattern'ları
+        # Bilgi çıkarım pattern'ları - ortak motor tüm kuralları tek seferde compile eder
+        self.extraction_engine = email_extraction_engine
         self.extraction_patterns = {
-            "tarih": [
-                r"\b(\d{1,2}[./-]\d{1,2}[./-]\d{2,4})\b",
-                r"\b(\d{1,2}\s+(?:Ocak|Şubat|Mart|Nisan|Mayıs|Haziran|Temmuz|Ağustos|Eylül|Ekim|Kasım|Aralık)\s+\d{2,4})\b",
-                r"\b(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{2,4})\b"
-            ],
-            "saat": [
-                r"\b(\d{1,2}:\d{2})\s*(?:AM|PM|am|pm)?\b",
-                r"\b(\d{1,2}:\d{2})\b"
-            ],
-            "platform": [
-                r"\b(?:Zoom|Teams|Meet|Skype|Discord|Slack|Webex|BlueJeans|GoToMeeting)\b",
-                r"\b(?:online|çevrimiçi|uzaktan|remote)\b"
-            ],
-            "etkinlik_turu": [
-                r"\b(?:Ideathon|Hackathon|Case Study|Workshop|Webinar|Seminer|Konferans|Buluşma|Toplantı)\b",
-                r"\b(?:ideathon|hackathon|case study|workshop|webinar|seminer|konferans|buluşma|toplantı)\b"
-            ]
+            field: [pattern.pattern for pattern in self.extraction_engine.patterns(field)]
+            for field in ["tarih", "saat", "platform", "etkinlik_turu"]
+        }
+        
+        # Kural tabanlı hızlı sınıflandırıcı
+        self.rule_classifier = rule_classifier
+        
+        # Kaskad: kurallar → lineer model → BERT (eşik altında kalan bir sonraki aşamaya geçer)
+        self.linear_classifier = linear_email_classifier
+        self.cascade_enabled = ClassifierConfig.CASCADE_ENABLED
+        self.cascade_thresholds = {
+            "rules": ClassifierConfig.CASCADE_RULE_THRESHOLD,
+            "linear": ClassifierConfig.CASCADE_LINEAR_THRESHOLD
         }
+        self.cascade_stats = {"rules": 0, "linear": 0, "bert": 0, "below_threshold": 0}
+        
+        # BERT etiketleriyle eğitilmiş kompakt model ve seçili backend
+        self.distilled_classifier = distilled_email_classifier
+        self.backends = ["cascade", "bert", "distilled"]
+        self.backend = ClassifierConfig.CLASSIFIER_BACKEND if ClassifierConfig.CLASSIFIER_BACKEND in self.backends else "cascade"
         
-        # Model yükleme
-        self._load_models()
+        # Dışa aktarılmış ONNX modeli (sadece değerlendirmede, ilk kullanımda yüklenir)
+        self._onnx_session = None
+        self._onnx_tokenizer = None
+    
+    def _ensure_models(self) -> bool:
+        """BERT modellerini ilk çağrıda yükle (devre dışıysa hiç yüklenmez)"""
+        if not self._models_loaded and self.bert_enabled:
+            with self._models_lock:
+                if not self._models_loaded:
+                    self._load_models()
+                    self._models_loaded = True
+        return self.tokenizer is not None and self.classification_model is not None
+    
+    def warmup(self) -> bool:
+        """BERT modellerini arka plan thread'inde yüklemeye başlat; yükleme başlatıldıysa True"""
+        if not self.bert_enabled or self._models_loaded or self._warmup_thread is not None:
+            return False
+        self._warmup_thread = threading.Thread(target=self._ensure_models, name="bert-warmup", daemon=True)
+        self._warmup_thread.start()
+        return True
+    
+    @property
+    def bert_loading(self) -> bool:
+        """Arka planda BERT yüklemesi sürüyor mu"""
+        return self._warmup_thread is not None and self._warmup_thread.is_alive()
     
     def _load_models(self):
         """BERT modellerini yükle"""
         try:
+            import torch
+            from transformers import (
+                AutoTokenizer,
+                AutoModelForSequenceClassification,
+                AutoModelForTokenClassification,
+                pipeline
+            )
+            
+            self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
             print(f"Modeller yükleniyor... Cihaz: {self.device}")
             
             # Tokenizer yükle
@@ -124,6 +163,8 @@ class AdvancedEmailClassifier:
     def _load_fallback_models(self):
         """Fallback modeller yükle"""
         try:
+            from transformers import AutoTokenizer, AutoModelForSequenceClassification
+            
             print("Fallback modeller yükleniyor...")
             self.tokenizer = AutoTokenizer.from_pretrained("bert-base-multilingual-cased")
             self.classification_model = AutoModelForSequenceClassification.from_pretrained(
@@ -134,7 +175,8 @@ class AdvancedEmailClassifier:
         except Exception as e:
             print(f"Fallback model yükleme hatası: {e}")
     
-    def classify_email(self, email_content: str, email_subject: str = "", email_sender: str = "") -> EmailClassificationResult:
+    def classify_email(self, email_content: str, email_subject: str = "", email_sender: str = "",
+                       backend: Optional[str] = None) -> EmailClassificationResult:
         """
         E-postayı sınıflandır ve detaylı bilgi çıkar
         
@@ -142,6 +184,7 @@ class AdvancedEmailClassifier:
             email_content: E-posta içeriği
             email_subject: E-posta konusu
             email_sender: E-posta göndereni
+            backend: cascade, bert veya distilled (verilmezse varsayılan backend)
             
         Returns:
             EmailClassificationResult: Sınıflandırma sonucu ve çıkarılan bilgiler
@@ -150,8 +193,14 @@ class AdvancedEmailClassifier:
             # E-posta metnini birleştir
             full_text = f"{email_subject} {email_content}".strip()
             
-            # 1. BERT ile sınıflandırma
-            classification_result = self._classify_with_bert(full_text)
+            # 1. Sınıflandırma
+            selected_backend = backend or self.backend
+            started = time.perf_counter()
+            classification_result = self._classify_with_backend(full_text, selected_backend)
+            # Her backend sonucu hangi aşamanın ürettiğini açıkça taşır; kurala düşen BERT çağrısı "rules" sayılır
+            stage = classification_result["stage"]
+            CLASSIFIER_INFERENCE_DURATION.observe(time.perf_counter() - started, backend=selected_backend, stage=stage)
+            CLASSIFIER_STAGE_TOTAL.inc(stage=stage)
             
             # 2. Bilgi çıkarımı
             extracted_info = self._extract_structured_info(full_text, email_sender)
@@ -166,10 +215,12 @@ class AdvancedEmailClassifier:
                 extracted_info=extracted_info,
                 reasoning=reasoning,
                 metadata={
-                    "model_used": self.model_name,
+                    "model_used": classification_result.get("model", self.model_name),
                     "classification_timestamp": datetime.now().isoformat(),
                     "text_length": len(full_text),
-                    "language": self._detect_language(full_text)
+                    "language": self._detect_language(full_text),
+                    "category_distribution": classification_result.get("distribution", {}),
+                    "classification_stage": stage
                 }
             )
             
@@ -179,15 +230,129 @@ class AdvancedEmailClassifier:
             print(f"E-posta sınıflandırma hatası: {e}")
             return self._fallback_classification(email_content, email_subject, email_sender)
     
+    def _classify_with_backend(self, text: str, backend: str) -> Dict[str, Any]:
+        """Seçili backend ile sınıflandır"""
+        if backend == "distilled":
+            result = self.distilled_classifier.classify(text)
+            if result is not None:
+                return {**result, "stage": "distilled", "model": f"distilled-v{self.distilled_classifier.version}"}
+            # Distilled model yoksa varsayılan yola düş
+            backend = "cascade" if self.cascade_enabled else "bert"
+        
+        if backend == "bert":
+            return self._classify_with_bert(text)
+        return self._classify_cascade(text)
+    
+    def set_backend(self, backend: str):
+        """Varsayılan sınıflandırma backend'ini değiştir"""
+        if backend not in self.backends:
+            raise ValueError(f"Bilinmeyen backend: {backend}")
+        self.backend = backend
+    
+    def _bert_available(self) -> bool:
+        """BERT kullanıma hazır mı; modelleri yüklemez, yükleme sürerken False döner"""
+        return self.bert_enabled and self._models_loaded and (
+            self.classifier_pipeline is not None
+            or (self.tokenizer is not None and self.classification_model is not None)
+        )
+    
+    def _classify_cascade(self, text: str) -> Dict[str, Any]:
+        """Kurallar → lineer model → BERT kaskadı ile sınıflandır"""
+        # 1. Derlenmiş kural katmanı
+        rule_result = self.rule_classifier.classify(text)
+        if rule_result["matched_rules"] and rule_result["score"] >= self.cascade_thresholds["rules"]:
+            self.cascade_stats["rules"] += 1
+            return {**rule_result, "stage": "rules"}
+        
+        best_result = {**rule_result, "stage": "rules"}
+        
+        # 2. TF-IDF + lineer model
+        linear_result = self.linear_classifier.classify(text)
+        if linear_result is not None:
+            if linear_result["score"] >= self.cascade_thresholds["linear"]:
+                self.cascade_stats["linear"] += 1
+                return {**linear_result, "stage": "linear"}
+            if linear_result["score"] > best_result["score"]:
+                best_result = {**linear_result, "stage": "linear"}
+        
+        # 3. BERT sadece önceki aşamalar emin değilse
+        if self._bert_available():
+            bert_result = self._classify_with_bert(text)
+            self.cascade_stats[bert_result["stage"]] += 1
+            return bert_result
+        # Model henüz yüklenmediyse istek beklemez, yükleme arka planda başlar
+        self.warmup()
+        
+        # BERT yoksa eşik altında kalan en iyi sonuç kullanılır
+        self.cascade_stats["below_threshold"] += 1
+        self.cascade_stats[best_result["stage"]] += 1
+        return best_result
+    
+    def set_cascade_thresholds(self, rules: Optional[float] = None, linear: Optional[float] = None):
+        """Kaskad eşiklerini güncelle"""
+        if rules is not None:
+            self.cascade_thresholds["rules"] = float(rules)
+        if linear is not None:
+            self.cascade_thresholds["linear"] = float(linear)
+    
+    def get_cascade_stats(self) -> Dict[str, Any]:
+        """Her aşamanın kaç e-posta işlediğini döndür"""
+        handled = {stage: self.cascade_stats[stage] for stage in ["rules", "linear", "bert"]}
+        total = sum(handled.values())
+        return {
+            "enabled": self.cascade_enabled,
+            "thresholds": dict(self.cascade_thresholds),
+            "total": total,
+            "handled": handled,
+            "ratios": {
+                stage: round(count / total, 4) if total else 0.0
+                for stage, count in handled.items()
+            },
+            "below_threshold": self.cascade_stats["below_threshold"],
+            "linear_model_ready": self.linear_classifier.is_ready,
+            "bert_available": self._bert_available(),
+            "bert_loading": self.bert_loading
+        }
+    
+    def reset_cascade_stats(self):
+        """Kaskad istatistiklerini sıfırla"""
+        for stage in self.cascade_stats:
+            self.cascade_stats[stage] = 0
+    
+    def train_linear_model(self, training_data: List[Dict[str, Any]], save: bool = True) -> Dict[str, Any]:
+        """
+        Kaskadın lineer aşamasını eğit
+        
+        Args:
+            training_data: Eğitim verisi [{"text": "...", "label": "category"}]
+            save: Eğitilen model diske kaydedilsin mi
+        """
+        try:
+            texts = [item["text"] for item in training_data]
+            labels = [item["label"] for item in training_data]
+            self.linear_classifier.fit(texts, labels)
+            path = self.linear_classifier.save() if save else None
+            print(f"Lineer model eğitildi: {len(texts)} örnek")
+            return {"success": True, "samples": len(texts), "model_path": path}
+        except Exception as e:
+            print(f"Lineer model eğitimi hatası: {e}")
+            return {"success": False, "error": str(e)}
+    
     def _classify_with_bert(self, text: str) -> Dict[str, Any]:
         """BERT ile e-posta sınıflandırma"""
         try:
+            if not self._bert_available():
+                # Model yok ya da hâlâ yükleniyor: yükleme arka planda başlar, kural tabanlı hızlı yol
+                self.warmup()
+                return self._rule_based_classification(text)
+            
             if self.classifier_pipeline:
                 # Pipeline kullanarak sınıflandır
                 result = self.classifier_pipeline(text[:512])  # BERT limiti
                 return {
                     "label": result[0]["label"],
-                    "score": result[0]["score"]
+                    "score": result[0]["score"],
+                    "stage": "bert"
                 }
             else:
                 # Manuel tokenization ve inference
@@ -200,6 +365,8 @@ class AdvancedEmailClassifier:
     def _manual_bert_classification(self, text: str) -> Dict[str, Any]:
         """Manuel BERT sınıflandırma"""
         try:
+            import torch
+            
             # Tokenize
             inputs = self.tokenizer(
                 text[:512],
@@ -222,7 +389,8 @@ class AdvancedEmailClassifier:
             
             return {
                 "label": predicted_label,
-                "score": confidence
+                "score": confidence,
+                "stage": "bert"
             }
             
         except Exception as e:
@@ -231,52 +399,8 @@ class AdvancedEmailClassifier:
     
     def _rule_based_classification(self, text: str) -> Dict[str, Any]:
         """Kural tabanlı fallback sınıflandırma"""
-        text_lower = text.lower()
-        
-        # Etkinlik daveti pattern'ları
-        event_patterns = [
-            r"\b(?:ideathon|hackathon|case study|workshop|webinar|seminer|konferans|buluşma|toplantı)\b",
-            r"\b(?:davet|invitation|katılım|participation|etkinlik|event)\b",
-            r"\b(?:yarışma|competition|challenge|müsabaka|contest)\b"
-        ]
-        
-        # Mülakat pattern'ları
-        interview_patterns = [
-            r"\b(?:mülakat|interview|görüşme|meeting|söyleşi)\b",
-            r"\b(?:davet|invitation|planlandı|scheduled|arranged)\b"
-        ]
-        
-        # Teknik test pattern'ları
-        test_patterns = [
-            r"\b(?:teknik test|technical test|coding challenge|kodlama testi)\b",
-            r"\b(?:assessment|değerlendirme|evaluation|test link)\b"
-        ]
-        
-        # Başvuru onay pattern'ları
-        application_patterns = [
-            r"\b(?:başvurunuz alındı|application received|your application)\b",
-            r"\b(?:başvuru başarılı|application successful|başvuru iletildi)\b"
-        ]
-        
-        # Spam pattern'ları
-        spam_patterns = [
-            r"\b(?:newsletter|bülten|promosyon|kampanya|indirim|satış)\b",
-            r"\b(?:unsubscribe|abone|follow us|like & share)\b"
-        ]
-        
-        # Pattern eşleştirme
-        if any(re.search(pattern, text_lower) for pattern in event_patterns):
-            return {"label": "etkinlik_daveti", "score": 0.85}
-        elif any(re.search(pattern, text_lower) for pattern in interview_patterns):
-            return {"label": "mulakat_daveti", "score": 0.80}
-        elif any(re.search(pattern, text_lower) for pattern in test_patterns):
-            return {"label": "teknik_test", "score": 0.75}
-        elif any(re.search(pattern, text_lower) for pattern in application_patterns):
-            return {"label": "basvuru_onayi", "score": 0.90}
-        elif any(re.search(pattern, text_lower) for pattern in spam_patterns):
-            return {"label": "spam_reklam", "score": 0.70}
-        else:
-            return {"label": "genel_bilgilendirme", "score": 0.60}
+        # Kurallar config/email_rules.json'dan bir kez yüklenip derlenir, tüm kategoriler tek geçişte skorlanır
+        return {**self.rule_classifier.classify(text), "stage": "rules"}
     
     def _extract_structured_info(self, text: str, sender: str) -> Dict[str, Any]:
         """Yapılandırılmış bilgi çıkarımı"""
@@ -294,28 +418,31 @@ class AdvancedEmailClassifier:
         }
         
         try:
+            # Metin tek geçişte taranır, tüm alanlar aynı eşleşme akışından doldurulur
+            scan = self.extraction_engine.scan(text)
+            
             # Şirket adı çıkarımı
-            extracted_info["sirket"] = self._extract_company_name(sender, text)
+            extracted_info["sirket"] = self._extract_company_name(sender, text, scan)
             extracted_info["sirket_adi"] = extracted_info["sirket"]
             
             # Etkinlik adı çıkarımı
-            extracted_info["etkinlik_adi"] = self._extract_event_name(text)
+            extracted_info["etkinlik_adi"] = self._extract_event_name(text, scan)
             
             # Tarih çıkarımı
-            extracted_info["tarih"] = self._extract_date(text)
+            extracted_info["tarih"] = self._extract_date(text, scan)
             
             # Saat çıkarımı
-            extracted_info["saat"] = self._extract_time(text)
+            extracted_info["saat"] = self._extract_time(text, scan)
             
             # Platform çıkarımı
-            extracted_info["platform"] = self._extract_platform(text)
+            extracted_info["platform"] = self._extract_platform(text, scan)
             extracted_info["platform_bilgisi"] = extracted_info["platform"]
             
             # Etkinlik türü çıkarımı
-            extracted_info["etkinlik_turu"] = self._extract_event_type(text)
+            extracted_info["etkinlik_turu"] = self._extract_event_type(text, scan)
             
             # Pozisyon çıkarımı
-            extracted_info["pozisyon"] = self._extract_position(text)
+            extracted_info["pozisyon"] = self._extract_position(text, scan)
             
             # Genel bilgi çıkarımı
             extracted_info["bilgi"] = self._extract_general_info(text)
@@ -325,7 +452,7 @@ class AdvancedEmailClassifier:
         
         return extracted_info
     
-    def _extract_company_name(self, sender: str, text: str) -> str:
+    def _extract_company_name(self, sender: str, text: str, scan: Optional[ExtractionResult] = None) -> str:
         """Şirket adı çıkarımı"""
         try:
             # E-posta adresinden şirket adı
@@ -335,16 +462,10 @@ class AdvancedEmailClassifier:
                     return domain.title()
             
             # Metin içinden şirket adı arama
-            company_patterns = [
-                r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:Yazılım|Software|Teknoloji|Technology|Şirketi|Company|Ltd|Inc)\b",
-                r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:Grup|Group|Holding|Corporation|Corp)\b",
-                r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:A\.Ş\.|Şirketi|Company)\b"
-            ]
-            
-            for pattern in company_patterns:
-                match = re.search(pattern, text)
-                if match:
-                    return match.group(1).strip()
+            scan = scan or self.extraction_engine.scan(text)
+            match = scan.first("sirket")
+            if match:
+                return match.value.strip()
             
             # Footer'dan şirket adı
             lines = text.split('\n')
@@ -360,34 +481,24 @@ class AdvancedEmailClassifier:
             print(f"Şirket adı çıkarım hatası: {e}")
             return "Şirket Adı Belirlenemedi"
     
-    def _extract_event_name(self, text: str) -> str:
+    def _extract_event_name(self, text: str, scan: Optional[ExtractionResult] = None) -> str:
         """Etkinlik adı çıkarımı"""
         try:
-            # Tırnak içindeki etkinlik adları
-            quote_patterns = [
-                r'"([^"]+)"',
-                r"'([^']+)'",
-                r'"([^"]+)"',
-                r"'([^']+)'"
-            ]
+            scan = scan or self.extraction_engine.scan(text)
+            event_keywords = ['ideathon', 'hackathon', 'workshop', 'webinar', 'seminer']
             
-            for pattern in quote_patterns:
-                match = re.search(pattern, text)
-                if match:
-                    event_name = match.group(1)
-                    if any(keyword in event_name.lower() for keyword in ['ideathon', 'hackathon', 'workshop', 'webinar', 'seminer']):
-                        return event_name
+            # Tırnak içindeki etkinlik adları - her tırnak türünün sadece ilk eşleşmesine bakılır
+            match = scan.first(
+                "etkinlik_adi_tirnak",
+                lambda m: any(keyword in m.value.lower() for keyword in event_keywords)
+            )
+            if match:
+                return match.value
             
             # Başlık formatındaki etkinlik adları
-            title_patterns = [
-                r"\b([A-Z][a-zA-Z\s]+(?:Ideathon|Hackathon|Case Study|Workshop|Webinar|Seminer|Konferans))\b",
-                r"\b([A-Z][a-zA-Z\s]+(?:Yarışması|Competition|Challenge|Contest))\b"
-            ]
-            
-            for pattern in title_patterns:
-                match = re.search(pattern, text)
-                if match:
-                    return match.group(1).strip()
+            match = scan.first("etkinlik_adi_baslik")
+            if match:
+                return match.value.strip()
             
             return "Etkinlik Adı Belirlenemedi"
             
@@ -395,67 +506,61 @@ class AdvancedEmailClassifier:
             print(f"Etkinlik adı çıkarım hatası: {e}")
             return "Etkinlik Adı Belirlenemedi"
     
-    def _extract_date(self, text: str) -> str:
+    def _extract_date(self, text: str, scan: Optional[ExtractionResult] = None) -> str:
         """Tarih çıkarımı"""
         try:
-            for pattern in self.extraction_patterns["tarih"]:
-                match = re.search(pattern, text)
-                if match:
-                    return match.group(1).strip()
+            scan = scan or self.extraction_engine.scan(text)
+            match = scan.first("tarih")
+            if match:
+                return match.value.strip()
             return "Tarih Belirlenemedi"
         except Exception as e:
             print(f"Tarih çıkarım hatası: {e}")
             return "Tarih Belirlenemedi"
     
-    def _extract_time(self, text: str) -> str:
+    def _extract_time(self, text: str, scan: Optional[ExtractionResult] = None) -> str:
         """Saat çıkarımı"""
         try:
-            for pattern in self.extraction_patterns["saat"]:
-                match = re.search(pattern, text)
-                if match:
-                    return match.group(1).strip()
+            scan = scan or self.extraction_engine.scan(text)
+            match = scan.first("saat")
+            if match:
+                return match.value.strip()
             return "Saat Belirlenemedi"
         except Exception as e:
             print(f"Saat çıkarım hatası: {e}")
             return "Saat Belirlenemedi"
     
-    def _extract_platform(self, text: str) -> str:
+    def _extract_platform(self, text: str, scan: Optional[ExtractionResult] = None) -> str:
         """Platform çıkarımı"""
         try:
-            for pattern in self.extraction_patterns["platform"]:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    return match.group(0).strip()
+            scan = scan or self.extraction_engine.scan(text)
+            match = scan.first("platform")
+            if match:
+                return match.text.strip()
             return "Platform Belirlenemedi"
         except Exception as e:
             print(f"Platform çıkarım hatası: {e}")
             return "Platform Belirlenemedi"
     
-    def _extract_event_type(self, text: str) -> str:
+    def _extract_event_type(self, text: str, scan: Optional[ExtractionResult] = None) -> str:
         """Etkinlik türü çıkarımı"""
         try:
-            for pattern in self.extraction_patterns["etkinlik_turu"]:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    return match.group(0).strip()
+            scan = scan or self.extraction_engine.scan(text)
+            match = scan.first("etkinlik_turu")
+            if match:
+                return match.text.strip()
             return "Etkinlik Türü Belirlenemedi"
         except Exception as e:
             print(f"Etkinlik türü çıkarım hatası: {e}")
             return "Etkinlik Türü Belirlenemedi"
     
-    def _extract_position(self, text: str) -> str:
+    def _extract_position(self, text: str, scan: Optional[ExtractionResult] = None) -> str:
         """Pozisyon çıkarımı"""
         try:
-            position_patterns = [
-                r"\b(?:pozisyonu|position|role|job|iş|görev)\s+(?:olarak|as|for|in)\s+([a-zA-ZçğıöşüğÇĞIÖŞÜ\s]+)\b",
-                r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:Developer|Engineer|Designer|Analyst|Manager|Specialist)\b",
-                r"\b(?:senior|junior|lead|principal)?\s*(?:software|backend|frontend|full.?stack|data|devops|mobile|web|ui|ux|qa|test|product|project|business|sales|marketing|hr|finance|legal|admin|support|customer|technical|system|network|security|cloud|ai|ml|machine.?learning|artificial.?intelligence|blockchain|game|embedded|firmware|hardware|robotics|automation|analytics|scientist|engineer|developer|architect|consultant|specialist|analyst|manager|director|coordinator|assistant|designer|researcher|instructor|trainer|writer|editor|translator|interpreter|accountant|auditor|lawyer|attorney|paralegal|nurse|doctor|physician|dentist|pharmacist|teacher|professor|lecturer|student|intern|trainee|apprentice|volunteer|freelancer|contractor|consultant|advisor|mentor|coach|counselor|therapist|psychologist|social.?worker|case.?worker|advocate|mediator|arbitrator|judge|magistrate|prosecutor|defense|attorney|public.?defender|district.?attorney|assistant.?district.?attorney|assistant.?attorney.?general|solicitor.?general|attorney.?general|chief.?justice|associate.?justice|justice|judge|magistrate|commissioner|referee|hearing.?officer|administrative.?law.?judge|tax.?court.?judge|bankruptcy.?judge|federal.?judge|state.?judge|county.?judge|municipal.?judge|justice.?of.?the.?peace|notary.?public|commissioner.?of.?oaths|justice.?of.?the.?peace|magistrate|judge|justice|commissioner|referee|hearing.?officer|administrative.?law.?judge|tax.?court.?judge|bankruptcy.?judge|federal.?judge|eyalet|yargıcı|ilçe|yargıcı|belediye|yargıcı|barış|yargıcı|noter|halk|komiseri|barış|yargıcı|komiser|yargıç|yargıç|komiser|hakem|dinleme|memuru|idari|hukuk|yargıcı|vergi|mahkemesi|yargıcı|iflas|yargıcı|federal|yargıç|eyalet|yargıcı|ilçe|yargıcı|belediye|yargıcı|barış|yargıcı|noter|halk|komiseri)\b"
-            ]
-            
-            for pattern in position_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    return match.group(0).strip().title()
+            scan = scan or self.extraction_engine.scan(text)
+            match = scan.first("pozisyon")
+            if match:
+                return match.text.strip().title()
             
             return "Pozisyon Belirlenemedi"
             
@@ -521,20 +626,7 @@ class AdvancedEmailClassifier:
     def _detect_language(self, text: str) -> str:
         """Metin dilini tespit et"""
         try:
-            # Basit dil tespiti
-            turkish_chars = set('çğıöşüğÇĞIÖŞÜ')
-            english_chars = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')
-            
-            turkish_count = sum(1 for char in text if char in turkish_chars)
-            english_count = sum(1 for char in text if char in english_chars)
-            
-            if turkish_count > english_count * 0.1:
-                return "Turkish"
-            elif english_count > 0:
-                return "English"
-            else:
-                return "Unknown"
-                
+            return language_detector.detect(text)
         except Exception as e:
             print(f"Dil tespit hatası: {e}")
             return "Unknown"
@@ -565,117 +657,132 @@ class AdvancedEmailClassifier:
             }
         )
     
-    def train_model(self, training_data: List[Dict[str, Any]], validation_split: float = 0.2):
+    def train_model(self, training_data: List[Dict[str, Any]], validation_split: float = 0.2,
+                    options: Optional[Any] = None) -> Dict[str, Any]:
         """
         Modeli fine-tuning ile eğit
         
         Args:
             training_data: Eğitim verisi [{"text": "...", "label": "category"}]
             validation_split: Doğrulama verisi oranı
+            options: bert_training.TrainingOptions (gradient birikimi, katman dondurma, checkpoint vb.)
         """
         try:
+            from .bert_training import TrainingOptions, train_classifier
+            
             print("Model eğitimi başlatılıyor...")
+            if not self._ensure_models():
+                raise ValueError("BERT modeli yüklenmedi")
             
             # Veriyi hazırla
-            texts = [item["text"] for item in training_data]
-            labels = [list(self.categories.keys()).index(item["label"]) for item in training_data]
-            
-            # Train/validation split
-            train_texts, val_texts, train_labels, val_labels = train_test_split(
-                texts, labels, test_size=validation_split, random_state=42
-            )
-            
-            # Dataset sınıfları
-            class EmailDataset(torch.utils.data.Dataset):
-                def __init__(self, texts, labels, tokenizer, max_length=512):
-                    self.texts = texts
-                    self.labels = labels
-                    self.tokenizer = tokenizer
-                    self.max_length = max_length
-                
-                def __len__(self):
-                    return len(self.texts)
-                
-                def __getitem__(self, idx):
-                    text = str(self.texts[idx])
-                    label = self.labels[idx]
-                    
-                    encoding = self.tokenizer(
-                        text,
-                        truncation=True,
-                        padding='max_length',
-                        max_length=self.max_length,
-                        return_tensors='pt'
-                    )
-                    
-                    return {
-                        'input_ids': encoding['input_ids'].flatten(),
-                        'attention_mask': encoding['attention_mask'].flatten(),
-                        'labels': torch.tensor(label, dtype=torch.long)
-                    }
-            
-            # Dataset'leri oluştur
-            train_dataset = EmailDataset(train_texts, train_labels, self.tokenizer)
-            val_dataset = EmailDataset(val_texts, val_labels, self.tokenizer)
-            
-            # Training arguments
-            training_args = TrainingArguments(
-                output_dir="./email_classifier_model",
-                num_train_epochs=3,
-                per_device_train_batch_size=8,
-                per_device_eval_batch_size=8,
-                warmup_steps=500,
-                weight_decay=0.01,
-                logging_dir="./logs",
-                logging_steps=10,
-                evaluation_strategy="epoch",
-                save_strategy="epoch",
-                load_best_model_at_end=True,
-                metric_for_best_model="accuracy"
-            )
-            
-            # Trainer
-            trainer = Trainer(
-                model=self.classification_model,
-                args=training_args,
-                train_dataset=train_dataset,
-                eval_dataset=val_dataset
-            )
-            
-            # Eğitim
-            trainer.train()
+            category_names = list(self.categories.keys())
+            texts = [str(item["text"]) for item in training_data]
+            labels = [category_names.index(item["label"]) for item in training_data]
             
-            # Modeli kaydet
-            trainer.save_model("./email_classifier_model")
-            self.tokenizer.save_pretrained("./email_classifier_model")
+            options = options or TrainingOptions(validation_split=validation_split)
+            report = train_classifier(self.classification_model, self.tokenizer, texts, labels, options)
             
             print("Model eğitimi tamamlandı ve kaydedildi!")
+            return {"success": True, **report}
             
         except Exception as e:
             print(f"Model eğitimi hatası: {e}")
+            return {"success": False, "error": str(e)}
+    
+    def _predict_bert_batch(self, texts: List[str]) -> List[str]:
+        """Sadece sınıflandırma başlığı ile toplu BERT tahmini (çıkarım/dil tespiti yok)"""
+        import torch
+        
+        inputs = self.tokenizer(
+            texts,
+            return_tensors="pt",
+            truncation=True,
+            padding=True,
+            max_length=512
+        ).to(self.device or "cpu")
+        with torch.inference_mode():
+            logits = self.classification_model(**inputs).logits
+        category_names = list(self.categories.keys())
+        return [category_names[index] for index in logits.argmax(dim=-1).tolist()]
+    
+    def _load_onnx_session(self):
+        """ONNX modelini (varsa) ve tokenizer'ı yükle; torch modeli yüklenmez"""
+        if self._onnx_session is None and os.path.exists(ClassifierConfig.BERT_ONNX_PATH):
+            try:
+                import onnxruntime as ort
+                from transformers import AutoTokenizer
+            except ImportError:
+                return None
+            self._onnx_tokenizer = self.tokenizer or AutoTokenizer.from_pretrained(self.model_name)
+            self._onnx_session = ort.InferenceSession(
+                ClassifierConfig.BERT_ONNX_PATH, providers=["CPUExecutionProvider"]
+            )
+        return self._onnx_session
+    
+    def _predict_onnx_batch(self, texts: List[str]) -> List[str]:
+        """Dışa aktarılmış ONNX modeli ile toplu tahmin"""
+        import numpy as np
+        
+        session = self._load_onnx_session()
+        encoded = self._onnx_tokenizer(texts, return_tensors="np", truncation=True, padding=True, max_length=512)
+        input_names = {item.name for item in session.get_inputs()}
+        feed = {name: value.astype(np.int64) for name, value in encoded.items() if name in input_names}
+        logits = session.run(None, feed)[0]
+        category_names = list(self.categories.keys())
+        return [category_names[index] for index in logits.argmax(axis=-1).tolist()]
+    
+    BATCH_BACKENDS = ("torch", "onnx", "distilled", "linear", "rules")
+
+    def _batch_predictors(self, backends: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        İstenen backend'lerin toplu tahmin fonksiyonları
+
+        Sadece `backends` içindekiler kurulur; torch/ONNX modelleri yalnızca istendiklerinde yüklenir.
+        Kullanılamayan backend'ler sonuçta yer almaz.
+        """
+        requested = set(backends or self.BATCH_BACKENDS)
+        predictors = {}
+        if "torch" in requested and self._ensure_models():
+            predictors["torch"] = self._predict_bert_batch
+        if "onnx" in requested and self._load_onnx_session() is not None:
+            predictors["onnx"] = self._predict_onnx_batch
+        if "distilled" in requested and self.distilled_classifier.is_ready:
+            predictors["distilled"] = self.distilled_classifier.predict
+        if "linear" in requested and self.linear_classifier.is_ready:
+            predictors["linear"] = lambda texts: [
+                result["label"] for result in self.linear_classifier.classify_many(texts)
+            ]
+        if "rules" in requested:
+            predictors["rules"] = lambda texts: [self.rule_classifier.classify(text)["label"] for text in texts]
+        return predictors
     
-    def evaluate_model(self, test_data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Model performansını değerlendir"""
+    def evaluate_model(self, test_data: List[Dict[str, Any]], backends: Optional[List[str]] = None,
+                       batch_size: int = 32) -> Dict[str, Any]:
+        """
+        Model performansını backend bazında toplu değerlendir
+        
+        Args:
+            test_data: Test verisi [{"text": "...", "label": "category"}]
+            backends: Değerlendirilecek backend'ler (torch, onnx, distilled, linear, rules); varsayılan hepsi
+            batch_size: Batch boyutu
+        """
         try:
-            texts = [item["text"] for item in test_data]
-            true_labels = [item["label"] for item in test_data]
+            from .classifier_evaluation import evaluate_backends
             
-            # Tahminler
-            predictions = []
-            for text in texts:
-                result = self.classify_email(text)
-                predictions.append(result.category)
+            texts = [str(item["text"]) for item in test_data]
+            true_labels = [item["label"] for item in test_data]
             
-            # Metrikler
-            accuracy = accuracy_score(true_labels, predictions)
-            report = classification_report(true_labels, predictions, output_dict=True)
+            predictors = self._batch_predictors(backends)
+            if backends:
+                missing = [name for name in backends if name not in predictors]
+                if missing:
+                    print(f"⚠️ Kullanılamayan backend'ler atlandı: {', '.join(missing)}")
+                predictors = {name: predictors[name] for name in backends if name in predictors}
             
-            return {
-                "accuracy": accuracy,
-                "classification_report": report,
-                "predictions": predictions,
-                "true_labels": true_labels
-            }
+            return evaluate_backends(
+                predictors, texts, true_labels, batch_size=batch_size,
+                labels=list(self.categories.keys())
+            )
             
         except Exception as e:
             print(f"Model değerlendirme hatası: {e}")
@@ -1,7 +1,12 @@
+import time
 import requests
 from typing import Dict, Any
 from ..config.settings import settings
 from ..utils.helpers import make_api_request
+from ..utils.metrics import record_upstream
+from ..utils.logger import get_logger, lazy
+
+logger = get_logger(__name__)
 
 class AIService:
     """AI entegrasyonu için servis sınıfı"""
@@ -11,6 +16,14 @@ class AIService:
         self.gemini_api_url = "https://generativelanguage.googleapis.com/v1/models/gemini-1.5-flash:generateContent"
         self.hf_base_url = "https://api-inference.huggingface.co"
     
+    def _gemini_request(self, url: str, data: Dict[str, Any], operation: str) -> Dict[str, Any]:
+        """Gemini isteği yap, süre ve hata oranını metriklere yaz"""
+        started = time.perf_counter()
+        response = make_api_request(url, method="POST", json_data=data)
+        success = isinstance(response, dict) and response.get("success", True) is not False
+        record_upstream("gemini", operation, time.perf_counter() - started, success)
+        return response
+    
     def generate_ai_response(self, prompt: str) -> Dict[str, Any]:
         """AI prompt'u işler ve yanıt döner"""
         try:
@@ -28,7 +41,7 @@ class AIService:
                 ]
             }
             
-            response = make_api_request(url, method="POST", json_data=data)
+            response = self._gemini_request(url, data, "generate")
             return response
             
         except Exception as e:
@@ -61,7 +74,7 @@ class AIService:
                 ]
             }
             
-            response = make_api_request(url, method="POST", json_data=data)
+            response = self._gemini_request(url, data, "classify_email")
             return response
             
         except Exception as e:
@@ -136,7 +149,7 @@ JSON Formatı (sadece bu formatı kullan):
                 ]
             }
             
-            response = make_api_request(url, method="POST", json_data=data)
+            response = self._gemini_request(url, data, "categorize_job_posting")
             return response
             
         except Exception as e:
@@ -149,11 +162,11 @@ JSON Formatı (sadece bu formatı kullan):
     def analyze_job_posting_with_gemini(self, job_text: str) -> Dict[str, Any]:
         """İş ilanını Gemini ile detaylı analiz eder"""
         try:
-            print(f"🔍 Gemini analizi başlatılıyor... Job text length: {len(job_text)}")
-            print(f"📝 Job text preview: {job_text[:100]}...")
+            logger.info("Gemini analizi başlatılıyor, ilan uzunluğu: %d", len(job_text))
+            logger.debug("İlan önizleme: %s", lazy(lambda: job_text[:100]))
             
             if not settings.GEMINI_API_KEY:
-                print("⚠️ GEMINI_API_KEY bulunamadı")
+                logger.warning("GEMINI_API_KEY bulunamadı")
                 # API key yoksa mock response döndür
                 return {
                     "success": False,
@@ -173,8 +186,7 @@ JSON Formatı (sadece bu formatı kullan):
                     }
                 }
             
-            print(f"✅ GEMINI_API_KEY bulundu: {settings.GEMINI_API_KEY[:10]}...")
-            print(f"🌐 Gemini API URL: {self.gemini_api_url}")
+            logger.debug("Gemini API URL: %s", self.gemini_api_url)
             
             prompt = f"""Aşağıdaki iş ilanını analiz et ve aşağıdaki bilgileri JSON formatında çıkar:
 
@@ -219,7 +231,7 @@ Lütfen sadece JSON formatında yanıt ver, başka açıklama ekleme. Eğer bilg
   "application_status": "active"
 }}"""
             
-            print(f"📝 Prompt hazırlandı, length: {len(prompt)}")
+            logger.debug("Prompt hazırlandı, uzunluk: %d", len(prompt))
             
             url = f"{self.gemini_api_url}?key={settings.GEMINI_API_KEY}"
             data = {
@@ -232,17 +244,12 @@ Lütfen sadece JSON formatında yanıt ver, başka açıklama ekleme. Eğer bilg
                 ]
             }
             
-            print(f"📤 Gemini API'ye istek gönderiliyor...")
-            print(f"📝 Request data keys: {list(data.keys())}")
-            print(f"🔗 Request URL: {url}")
-            
-            response = make_api_request(url, method="POST", json_data=data)
-            print(f"📥 Gemini API response alındı: {type(response)}")
-            print(f"📊 Response keys: {list(response.keys()) if isinstance(response, dict) else 'Not a dict'}")
+            response = self._gemini_request(url, data, "analyze_job_posting")
+            logger.debug("Gemini yanıt anahtarları: %s", lazy(lambda: list(response.keys()) if isinstance(response, dict) else type(response)))
             
             # make_api_request'ten hata response'u geldiyse
             if response and not response.get("success", True):
-                print(f"❌ make_api_request'ten hata: {response}")
+                logger.error("Gemini API isteği başarısız: %s", response.get("error"))
                 return {
                     "success": False,
                     "error": response.get("error", "Bilinmeyen API hatası"),
@@ -250,12 +257,8 @@ Lütfen sadece JSON formatında yanıt ver, başka açıklama ekleme. Eğer bilg
                     "details": response
                 }
             
-            print(f"🔍 Response validation başlıyor...")
-            
             # Gemini response'unu parse et
             if response and 'candidates' in response:
-                print(f"✅ Gemini response'unda 'candidates' bulundu")
-                
                 # Response structure validation
                 try:
                     candidates = response['candidates']
@@ -271,11 +274,10 @@ Lütfen sadece JSON formatında yanıt ver, başka açıklama ekleme. Eğer bilg
                         raise ValueError("Content'da 'parts' bulunamadı")
                     
                     text_response = content['parts'][0]['text']
-                    print(f"📝 Raw text response: {text_response[:200]}...")
-                    print(f"📏 Text length: {len(text_response)}")
+                    logger.debug("Ham yanıt (%d karakter): %s", len(text_response), lazy(lambda: text_response[:200]))
                     
                 except (KeyError, IndexError, ValueError) as structure_error:
-                    print(f"❌ Response structure hatası: {structure_error}")
+                    logger.error("Gemini yanıt yapısı hatası: %s", structure_error)
                     return {
                         "success": False,
                         "error": "Gemini response yapısı beklenen formatta değil",
@@ -294,21 +296,21 @@ Lütfen sadece JSON formatında yanıt ver, başka açıklama ekleme. Eğer bilg
                     cleaned_response = cleaned_response[:-3]  # ``` kaldır
                 
                 cleaned_response = cleaned_response.strip()
-                print(f"🧹 Temizlenmiş response: {cleaned_response[:200]}...")
+                logger.debug("Temizlenmiş yanıt: %s", lazy(lambda: cleaned_response[:200]))
                 
                 # JSON response'u parse et
                 try:
                     import json
                     parsed_data = json.loads(cleaned_response)
-                    print(f"✅ JSON parse başarılı")
+                    logger.info("Gemini ilan analizi tamamlandı")
                     return {
                         "success": True,
                         "data": parsed_data,
                         "message": "İlan Gemini ile başarıyla analiz edildi"
                     }
                 except json.JSONDecodeError as json_error:
-                    print(f"❌ JSON parse hatası: {json_error}")
-                    print(f"🔍 Temizlenmiş response: {repr(cleaned_response)}")
+                    logger.error("Gemini yanıtı JSON değil: %s", json_error)
+                    logger.debug("Temizlenmiş yanıt: %r", cleaned_response)
                     # JSON parse hatası durumunda fallback
                     return {
                         "success": False,
@@ -319,7 +321,8 @@ Lütfen sadece JSON formatında yanıt ver, başka açıklama ekleme. Eğer bilg
                     }
             
             # Beklenmeyen response formatı
-            print(f"⚠️ Beklenmeyen response formatı: {response}")
+            logger.warning("Beklenmeyen Gemini yanıt formatı")
+            logger.debug("Yanıt: %s", response)
             return {
                 "success": False,
                 "error": "Beklenmeyen Gemini response formatı",
@@ -328,9 +331,7 @@ Lütfen sadece JSON formatında yanıt ver, başka açıklama ekleme. Eğer bilg
             }
             
         except Exception as e:
-            print(f"💥 Beklenmeyen exception: {type(e).__name__}: {str(e)}")
-            import traceback
-            print(f"📚 Traceback: {traceback.format_exc()}")
+            logger.exception("Gemini ilan analizi hatası: %s: %s", type(e).__name__, e)
             
             # Error message'ı güçlendir
             error_msg = str(e) if str(e) else f"{type(e).__name__} exception occurred"
@@ -342,8 +343,7 @@ Lütfen sadece JSON formatında yanıt ver, başka açıklama ekleme. Eğer bilg
                 "error": f"Gemini iş ilanı analiz hatası: {error_msg}",
                 "message": "Analiz sırasında beklenmeyen bir hata oluştu",
                 "exception_type": type(e).__name__,
-                "exception_details": error_msg,
-                "traceback": traceback.format_exc()
+                "exception_details": error_msg
             }
     
     def summarize_text_with_hf(self, text: str) -> Dict[str, Any]:
@@ -0,0 +1,191 @@
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from ..config.settings import settings
+from ..utils.metrics import record_cache, record_cache_eviction
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def content_key(*parts: str) -> str:
+    """Süreçten bağımsız cache anahtarı: boşlukları normalize edilmiş parçaların blake2b özeti"""
+    digest = hashlib.blake2b(digest_size=20)
+    for part in parts:
+        digest.update(WHITESPACE_PATTERN.sub(" ", part or "").strip().encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """
+    Boyut ve süre sınırlı analiz cache'i
+
+    Bellek katmanı LRU sırasıyla en fazla `max_entries` kayıt tutar; `ttl_seconds`
+    geçen kayıtlar okunurken düşürülür. `disk_path` verilirse sonuçlar SQLite'ta da
+    saklanır, böylece worker'lar ve yeniden başlatmalar aynı analizleri paylaşır.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS analysis_cache (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            expires_at REAL NOT NULL
+        )
+    """
+    # Bu kadar diske yazmada bir süresi dolmuş kayıtlar temizlenir
+    PRUNE_EVERY = 200
+
+    def __init__(self, name: str, max_entries: int = None, ttl_seconds: float = None,
+                 disk_path: Optional[str] = None):
+        self.name = name
+        self.max_entries = settings.ANALYSIS_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self.ttl_seconds = settings.ANALYSIS_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.disk_path = disk_path
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._writes = 0
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+        # Disk katmanı ilk kullanımda açılır; servisi import etmek diske dosya yazmaz
+        self._disk_ready = False
+        self._open_lock = threading.Lock()
+
+    def _disk(self) -> Optional[sqlite3.Connection]:
+        """Disk katmanı bağlantısı; katman yoksa ya da açılamadıysa None"""
+        if self.disk_path and not self._disk_ready:
+            with self._open_lock:
+                if self.disk_path and not self._disk_ready:
+                    try:
+                        os.makedirs(os.path.dirname(os.path.abspath(self.disk_path)), exist_ok=True)
+                        connection = self._connect()
+                        connection.execute("PRAGMA journal_mode=WAL")
+                        connection.execute(self.SCHEMA)
+                        self._disk_ready = True
+                    except (OSError, sqlite3.Error) as e:
+                        logger.warning("Analiz cache disk katmanı açılamadı, sadece bellek kullanılacak: %s", e)
+                        self.disk_path = None
+        return self._connect() if self.disk_path else None
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.disk_path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA busy_timeout=5000")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Optional[Any]:
+        """Kaydı döndür; yoksa veya süresi dolmuşsa None"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    record_cache(self.name, True)
+                    return entry[1]
+                del self._entries[key]
+                self._stats["expired"] += 1
+                record_cache_eviction(self.name, "expired")
+
+        value = self._disk_get(key, now)
+        with self._lock:
+            if value is not None:
+                self._stats["disk_hits"] += 1
+            else:
+                self._stats["misses"] += 1
+        record_cache(self.name, value is not None)
+        return value
+
+    def set(self, key: str, value: Any):
+        """Kaydı bellek (ve varsa disk) katmanına yaz"""
+        expires_at = time.time() + self.ttl_seconds
+        self._memory_set(key, value, expires_at)
+        self._disk_set(key, value, expires_at)
+
+    def _memory_set(self, key: str, value: Any, expires_at: float):
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+            if evicted:
+                self._stats["evictions"] += evicted
+                record_cache_eviction(self.name, "size", evicted)
+
+    def _disk_get(self, key: str, now: float) -> Optional[Any]:
+        try:
+            connection = self._disk()
+            if connection is None:
+                return None
+            row = connection.execute(
+                "SELECT value, expires_at FROM analysis_cache WHERE key = ? AND expires_at > ?",
+                (key, now)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Analiz cache diskten okunamadı: %s", e)
+            return None
+        if row is None:
+            return None
+        value = json.loads(row[0])
+        # Diskten okunan kayıt bellek katmanına alınır (kalan süresiyle)
+        self._memory_set(key, value, row[1])
+        return value
+
+    def _disk_set(self, key: str, value: Any, expires_at: float):
+        try:
+            connection = self._disk()
+            if connection is None:
+                return
+            connection.execute(
+                "INSERT OR REPLACE INTO analysis_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False, default=str), expires_at)
+            )
+            self._writes += 1
+            if self._writes % self.PRUNE_EVERY == 0:
+                pruned = connection.execute(
+                    "DELETE FROM analysis_cache WHERE expires_at <= ?", (time.time(),)
+                ).rowcount
+                if pruned:
+                    record_cache_eviction(self.name, "expired", pruned)
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning("Analiz cache diske yazılamadı: %s", e)
+
+    def clear(self):
+        """Tüm kayıtları sil"""
+        with self._lock:
+            self._entries.clear()
+        connection = self._disk()
+        if connection is not None:
+            connection.execute("DELETE FROM analysis_cache")
+
+    def stats(self) -> Dict[str, Any]:
+        """İsabet, ıskalama ve çıkarma istatistikleri"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+        lookups = stats["hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_ratio"] = round((stats["hits"] + stats["disk_hits"]) / lookups, 4) if lookups else 0.0
+        stats["max_entries"] = self.max_entries
+        stats["ttl_seconds"] = self.ttl_seconds
+        connection = self._disk()
+        stats["disk_tier"] = self.disk_path
+        if connection is not None:
+            try:
+                stats["disk_size"] = connection.execute("SELECT COUNT(*) FROM analysis_cache").fetchone()[0]
+            except sqlite3.Error:
+                stats["disk_size"] = None
+        return stats
@@ -0,0 +1,146 @@
+import threading
+from datetime import datetime, date, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from .application_service import application_service
+from ..utils.metrics import record_cache
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Durum metni eşleşmeleri (görünümlerdeki active/finished ayrımıyla aynı anahtar kelimeler)
+FINISHED_PATTERN = r"red|kabul|accepted|rejected"
+ACCEPTED_PATTERN = r"kabul|accepted"
+TREND_DAYS = 30
+OUTCOMES = ["active", "accepted", "rejected"]
+
+
+def build_frame(applications: List[Dict]) -> "pd.DataFrame":
+    """Başvuru kayıtlarından analitik için kolon tabanlı frame oluştur"""
+    # pandas ilk analitik isteğinde yüklenir, uygulama açılışını yavaşlatmaz
+    import numpy as np
+    import pandas as pd
+
+    frame = pd.DataFrame.from_records(
+        [
+            (
+                app.get("company_name") or "Bilinmiyor",
+                app.get("application_status") or "Bilinmiyor",
+                app.get("next_action") or "Bilinmiyor",
+                app.get("email_date") or app.get("created_at") or ""
+            )
+            for app in applications
+        ],
+        columns=["company", "stage", "next_action", "date"]
+    )
+
+    status = frame["stage"].str.lower()
+    finished = status.str.contains(FINISHED_PATTERN, regex=True)
+    accepted = finished & status.str.contains(ACCEPTED_PATTERN, regex=True)
+    frame["outcome"] = np.select([accepted, finished], ["accepted", "rejected"], default="active")
+    # ISO ve RFC 2822 tarihler birlikte bulunur; okunamayanlar NaT olur
+    frame["date"] = pd.to_datetime(frame["date"], errors="coerce", utc=True, format="mixed")
+    return frame
+
+
+def _int_dict(series: "pd.Series") -> Dict[str, int]:
+    return {str(key): int(value) for key, value in series.items()}
+
+
+def compute_analytics(frame: "pd.DataFrame", now: Optional[datetime] = None) -> Dict[str, Any]:
+    """Aşama dağılımı, şirket bazlı sonuçlar, başarı oranı ve 30 günlük trend"""
+    import pandas as pd
+
+    now = pd.Timestamp(now or datetime.now(timezone.utc))
+    now = now.tz_localize("UTC") if now.tzinfo is None else now.tz_convert("UTC")
+    start = (now - pd.Timedelta(days=TREND_DAYS - 1)).floor("D")
+    days = pd.date_range(start, now.floor("D"), freq="D")
+
+    outcome_counts = frame["outcome"].value_counts()
+    accepted = int(outcome_counts.get("accepted", 0))
+    rejected = int(outcome_counts.get("rejected", 0))
+    finished = accepted + rejected
+
+    if frame.empty:
+        company_stats = pd.DataFrame(columns=[*OUTCOMES, "total"], dtype="int64")
+    else:
+        company_stats = (
+            pd.crosstab(frame["company"], frame["outcome"])
+            .reindex(columns=OUTCOMES, fill_value=0)
+            .assign(total=lambda table: table.sum(axis=1))
+            .sort_values("total", ascending=False)
+        )
+
+    recent = frame["date"] >= start
+    daily = (
+        frame.loc[recent, "date"].dt.floor("D").value_counts()
+        .reindex(days, fill_value=0)
+    )
+
+    active_actions = frame.loc[frame["outcome"] == "active", "next_action"].value_counts()
+
+    return {
+        "total_applications": len(frame),
+        "active_applications": len(frame) - finished,
+        "finished_applications": finished,
+        "accepted_applications": accepted,
+        "rejected_applications": rejected,
+        "success_rate": round(accepted / finished * 100, 2) if finished else 0.0,
+        "stage_distribution": _int_dict(frame["stage"].value_counts()),
+        "company_distribution": _int_dict(company_stats["total"]),
+        "company_stats": {
+            str(company): {column: int(row[column]) for column in ["total", *OUTCOMES]}
+            for company, row in company_stats.iterrows()
+        },
+        "active_next_actions": _int_dict(active_actions),
+        "recent_applications": int(recent.sum()),
+        "trend_30d": {day.strftime("%Y-%m-%d"): int(count) for day, count in daily.items()}
+    }
+
+
+class AnalyticsService:
+    """
+    Kullanıcı başına analitik özetleri
+
+    Frame ve özet, kullanıcının veri versiyonu değişene kadar (ve gün dönene kadar,
+    trend bugüne göre hesaplandığından) cache'te tutulur.
+    """
+
+    def __init__(self):
+        self._cache: Dict[str, Tuple[Tuple[int, date], Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def get_user_analytics(self, user_id: str) -> Dict[str, Any]:
+        """Kullanıcının analitik özetini döndür"""
+        cache_key = (application_service.get_data_version(user_id), date.today())
+        cached = self._cache.get(user_id)
+        if cached is not None and cached[0] == cache_key:
+            record_cache("analytics", True)
+            return cached[1]
+
+        record_cache("analytics", False)
+        with self._lock:
+            cached = self._cache.get(user_id)
+            if cached is not None and cached[0] == cache_key:
+                return cached[1]
+
+            frame = build_frame(application_service.get_application_records(user_id))
+            analytics = compute_analytics(frame)
+            analytics["data_version"] = cache_key[0]
+            analytics["last_updated"] = datetime.now().isoformat()
+            self._cache[user_id] = (cache_key, analytics)
+            logger.debug("Analitik yeniden hesaplandı: %s (versiyon %d)", user_id, cache_key[0])
+            return analytics
+
+    def invalidate(self, user_id: str = None):
+        """Cache'i temizle"""
+        if user_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(user_id, None)
+
+
+# Global servis instance'ı
+analytics_service = AnalyticsService()
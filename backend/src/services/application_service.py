@@ -1,11 +1,23 @@
 import json
 import re
 import os
+import time
+import uuid
 from datetime import datetime
-from typing import Dict, List, Optional
-import requests
-from bs4 import BeautifulSoup
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, List, Optional, Tuple
+import asyncio
 from .chroma_service import ChromaService
+from .extraction_engine import job_posting_extraction_engine, ExtractionResult
+from .application_views import ApplicationViews
+from .duplicate_detector import DuplicateIndex, duplicate_detector, is_placeholder
+from .page_fetcher import page_fetcher
+from .analysis_cache import AnalysisCache, content_key
+from .index_outbox import index_outbox, APPLICATION, EMAIL_ANALYSIS, UPSERT, DELETE
+from ..config.settings import settings
+from ..utils.logger import get_logger, lazy
+
+logger = get_logger(__name__)
 
 class ApplicationService:
     """Başvuru yönetimi için servis sınıfı"""
@@ -16,14 +28,31 @@ class ApplicationService:
         if not os.path.exists(self.data_dir):
             os.makedirs(self.data_dir)
         
-        # ChromaDB servisini başlat
-        self.chroma_service = ChromaService()
+        # ChromaDB servisi ilk kullanımda başlatılır (chromadb importu ve bağlantı açılışı geciktirilir)
+        self._chroma_service: Optional[ChromaService] = None
         
         # In-memory storage for applications (in production, this would be a database)
         self.applications_storage: Dict[str, List[Dict]] = {}
         
-        # Cache sistemi - aynı metin için tekrar analiz yapılmasını önler
-        self.analysis_cache: Dict[str, Dict] = {}
+        # Kullanıcı başına veri versiyonu - her değişiklikte artar, listeleme ETag'leri bundan üretilir
+        self.data_versions: Dict[str, int] = {}
+        # Süreç yeniden başladığında sayaçlar sıfırlanır; eski ETag'lerle çakışmaması için epoch eklenir
+        self._version_epoch = format(int(time.time()), "x")
+        # Veri değiştiğinde user_id ile çağrılacak dinleyiciler (öneri cache'i vb.)
+        self._change_listeners: List[Callable[[str], None]] = []
+        
+        # Kullanıcı başına materyalize aktif/tamamlanmış görünümler (ilk okumada oluşturulur)
+        self.application_views: Dict[str, ApplicationViews] = {}
+        # Kullanıcı başına yakın kopya LSH indeksi (ilk kayıtta oluşturulur, görünümlerle birlikte güncellenir)
+        self.duplicate_indexes: Dict[str, DuplicateIndex] = {}
+        # Kullanıcı başına verilen en büyük sayısal başvuru ID'si; silinen kayıtların ID'leri tekrar verilmez
+        self.last_application_ids: Dict[str, int] = {}
+        
+        # Cache sistemi - aynı metin için tekrar analiz yapılmasını önler (LRU + TTL, disk katmanı opsiyonel)
+        self.analysis_cache = AnalysisCache(
+            "job_analysis",
+            disk_path=settings.ANALYSIS_CACHE_DISK_PATH or None
+        )
         
         # Compile edilmiş regex pattern'ları (performans için)
         self._compile_regex_patterns()
@@ -47,9 +76,9 @@ class ApplicationService:
                         # User ID'yi dosya adından çıkar
                         user_id = filename.replace("applications_", "").replace(".json", "").replace("_at_", "@").replace("_dot_", ".")
                         self.applications_storage[user_id] = user_data
-                        print(f"Kullanıcı verileri yüklendi: {user_id} - {len(user_data)} başvuru")
+                        logger.info("Kullanıcı verileri yüklendi: %s - %d başvuru", user_id, len(user_data))
         except Exception as e:
-            print(f"Veri yükleme hatası: {e}")
+            logger.error("Veri yükleme hatası: %s", e)
     
     def _save_user_applications(self, user_id: str):
         """Kullanıcının başvurularını JSON dosyasına kaydet"""
@@ -57,52 +86,136 @@ class ApplicationService:
             file_path = self._get_user_data_file(user_id)
             with open(file_path, 'w', encoding='utf-8') as f:
                 json.dump(self.applications_storage.get(user_id, []), f, ensure_ascii=False, indent=2)
-            print(f"Kullanıcı verileri kaydedildi: {user_id}")
+            logger.debug("Kullanıcı verileri kaydedildi: %s", user_id)
         except Exception as e:
-            print(f"Veri kaydetme hatası: {e}")
+            logger.error("Veri kaydetme hatası: %s", e)
             raise Exception(status_code=500, detail="Veriler kaydedilemedi")
     
-    def _compile_regex_patterns(self):
-        """Regex pattern'ları compile et - performans optimizasyonu"""
-        # Company patterns
-        self.company_patterns = [
-            re.compile(r'(?:Google|Microsoft|Apple|Amazon|Meta|Netflix|Uber|Airbnb|Spotify|Slack|Zoom|Notion|Figma|Adobe|Oracle|IBM|Intel|AMD|NVIDIA|Tesla|SpaceX)', re.IGNORECASE),
-            re.compile(r'(?:şirket|company|firma|kurum)\s*[:\-]?\s*([A-ZÇĞIİÖŞÜ][a-zçğıiöşü\s&]+)', re.IGNORECASE),
-            re.compile(r'([A-ZÇĞIİÖŞÜ][a-zçğıiöşü\s&]+)\s*(?:arayan|aranıyor|istihdam)', re.IGNORECASE)
-        ]
-        
-        # Position patterns
-        self.position_patterns = [
-            re.compile(r'(?:Frontend|Backend|Full Stack|DevOps|Data|AI|ML|UI|UX|Product|Project|QA|Test|Security|Cloud|Mobile|React|Angular|Vue|Node\.js|Python|Java|C\+\+|TypeScript|JavaScript)\s*(?:Developer|Engineer|Designer|Manager|Lead|Architect)?', re.IGNORECASE),
-            re.compile(r'(?:Senior|Junior|Lead|Principal|Staff)\s+([A-ZÇĞIİÖŞÜ][a-zçğıiöşü\s&]+)', re.IGNORECASE),
-            re.compile(r'(?:pozisyon|position|rol|role)\s*[:\-]?\s*([A-ZÇĞIİÖŞÜ][a-zçğıiöşü\s&]+)', re.IGNORECASE)
-        ]
-        
-        # Location patterns
-        self.location_patterns = [
-            re.compile(r'(?:Remote|remote|Hibrit|hibrit|On-site|on-site|onsite)', re.IGNORECASE),
-            re.compile(r'(?:İstanbul|Ankara|İzmir|Bursa|Antalya)', re.IGNORECASE),
-            re.compile(r'(?:lokasyon|location|şehir|city)\s*[:\-]?\s*([A-ZÇĞIİÖŞÜ][a-zçğıiöşü\s&,]+)', re.IGNORECASE)
-        ]
-        
-        # Salary patterns
-        self.salary_patterns = [
-            re.compile(r'(\d{1,3}(?:\.\d{3})*\s*[-–]\s*\d{1,3}(?:\.\d{3})*\s*(?:TL|USD|EUR|₺|\$|€))', re.IGNORECASE),
-            re.compile(r'(\d{1,3}(?:\.\d{3})*\s*(?:TL|USD|EUR|₺|\$|€))', re.IGNORECASE),
-            re.compile(r'(\d{1,3}(?:\.\d{3})*\s*[-–]\s*\d{1,3}(?:\.\d{3})*\s*(?:bin|k|milyon|million))', re.IGNORECASE)
+    def _bump_version(self, user_id: str):
+        """Kullanıcının verisi değişti, versiyonu artır"""
+        self.data_versions[user_id] = self.data_versions.get(user_id, 0) + 1
+        for listener in self._change_listeners:
+            try:
+                listener(user_id)
+            except Exception as e:
+                logger.error("Değişiklik dinleyicisi hatası: %s", e)
+    
+    def _next_application_id(self, user_id: str) -> int:
+        """
+        Kullanıcı için yeni sayısal başvuru ID'si
+
+        Liste uzunluğu silmeden sonra mevcut bir ID'yi tekrar üretir ve iki kayıt aynı indeks
+        dokümanını paylaşırdı; ID'ler en büyük mevcut ID'den devam eder.
+        """
+        last_id = self.last_application_ids.get(user_id)
+        if last_id is None:
+            last_id = max(
+                (app["id"] for app in self.applications_storage.get(user_id, [])
+                 if isinstance(app.get("id"), int) and not isinstance(app.get("id"), bool)),
+                default=0
+            )
+        self.last_application_ids[user_id] = last_id + 1
+        return last_id + 1
+    
+    def _record_index_events(self, user_id: str, upserts: List[Dict] = (), deletes: List[Dict] = ()):
+        """Başvuru değişikliklerini vektör indeksi outbox'ına yaz; ChromaDB'ye arka plan indeksleyici aktarır"""
+        events = [
+            (APPLICATION, UPSERT, user_id, app.get("id"), ChromaService.application_index_payload(app))
+            for app in upserts
         ]
+        events.extend((APPLICATION, DELETE, user_id, app.get("id"), {"id": app.get("id")}) for app in deletes)
+        try:
+            index_outbox.record(events)
+        except Exception as e:
+            # Birincil kayıt yazıldı; indeks tam yeniden oluşturmayla (rebuild) tekrar yakalanır
+            logger.error("İndeks olayları kaydedilemedi (%d olay): %s", len(events), e)
+    
+    def add_change_listener(self, listener: Callable[[str], None]):
+        """Kullanıcı verisi her değiştiğinde çağrılacak fonksiyonu kaydet"""
+        self._change_listeners.append(listener)
+    
+    @property
+    def chroma_service(self) -> ChromaService:
+        """ChromaDB servisini ilk erişimde oluştur"""
+        if self._chroma_service is None:
+            self._chroma_service = ChromaService()
+        return self._chroma_service
+    
+    def get_data_version(self, user_id: str) -> int:
+        """Kullanıcının güncel veri versiyonu"""
+        return self.data_versions.get(user_id, 0)
+    
+    def get_etag(self, user_id: str, view: str) -> str:
+        """Listeleme görünümü için strong ETag"""
+        return f'"{view}-{self._version_epoch}-{self.get_data_version(user_id)}"'
+    
+    def get_index_etag(self, user_id: str) -> str:
+        """
+        Vektör indeksinden okunan görünüm için strong ETag
+
+        Yazma anında artan veri versiyonu yetmez, ChromaDB'yi arka plan indeksleyici sonradan
+        doldurur; indeksleyicinin kullanıcı için tamamladığı değişiklik sayacı da eklenir.
+        """
+        return f'"chroma-{self._version_epoch}-{self.get_data_version(user_id)}-{index_outbox.index_version(user_id)}"'
+    
+    def _views_for(self, user_id: str) -> ApplicationViews:
+        """Kullanıcının görünümlerini döndür, yoksa depodan oluştur"""
+        views = self.application_views.get(user_id)
+        if views is None:
+            views = ApplicationViews(self._project_application)
+            views.rebuild(self.applications_storage.get(user_id, []))
+            self.application_views[user_id] = views
+        return views
+    
+    def _duplicates_for(self, user_id: str) -> DuplicateIndex:
+        """Kullanıcının yakın kopya indeksini döndür, yoksa depodan oluştur"""
+        index = self.duplicate_indexes.get(user_id)
+        if index is None:
+            index = DuplicateIndex(duplicate_detector)
+            index.rebuild(self.applications_storage.get(user_id, []))
+            self.duplicate_indexes[user_id] = index
+        return index
+    
+    def _view_added(self, user_id: str, app: Dict):
+        views = self.application_views.get(user_id)
+        if views is not None:
+            views.add(app)
+        duplicates = self.duplicate_indexes.get(user_id)
+        if duplicates is not None:
+            duplicates.add(app)
+    
+    def _view_updated(self, user_id: str, app: Dict):
+        views = self.application_views.get(user_id)
+        if views is not None:
+            views.update(app)
+        duplicates = self.duplicate_indexes.get(user_id)
+        if duplicates is not None:
+            duplicates.update(app)
+    
+    def _view_removed(self, user_id: str, app: Dict):
+        views = self.application_views.get(user_id)
+        if views is not None:
+            views.remove(app)
+        duplicates = self.duplicate_indexes.get(user_id)
+        if duplicates is not None:
+            duplicates.remove(app)
+    
+    def _compile_regex_patterns(self):
+        """Regex pattern'larını ortak çıkarım motorundan al - performans optimizasyonu"""
+        # Tüm kurallar motor içinde bir kez compile edilir ve tek geçişte taranır
+        self.extraction_engine = job_posting_extraction_engine
         
-        # Requirements patterns
-        self.requirements_patterns = [
-            re.compile(r'(?:React|Angular|Vue|Node\.js|Python|Java|C\+\+|TypeScript|JavaScript|AWS|Azure|Docker|Kubernetes|MongoDB|PostgreSQL|MySQL|Redis|Elasticsearch|GraphQL|REST|API|Git|CI/CD|Agile|Scrum)', re.IGNORECASE),
-            re.compile(r'(\d+\s*\+\s*yıl\s*deneyim|\d+\s*\+\s*years?\s*experience)', re.IGNORECASE),
-            re.compile(r'(?:3\+|5\+|7\+)\s*(?:yıl|years?)\s*(?:deneyim|experience)', re.IGNORECASE)
-        ]
+        # Geriye uyumluluk için alan bazlı pattern listeleri
+        self.company_patterns = self.extraction_engine.patterns("company_name")
+        self.position_patterns = self.extraction_engine.patterns("position")
+        self.location_patterns = self.extraction_engine.patterns("location")
+        self.salary_patterns = self.extraction_engine.patterns("salary_info")
+        self.requirements_patterns = self.extraction_engine.patterns("requirements")
     
     def save_applications(self, applications: List[Dict], user_id: str) -> Dict:
         """Analiz edilen başvuruları kaydet"""
         try:
-            print(f"Kaydetme isteği alındı - User ID: {user_id}, Başvuru sayısı: {len(applications)}")
+            logger.info("Kaydetme isteği alındı - User ID: %s, Başvuru sayısı: %d", user_id, len(applications))
             
             if not user_id:
                 raise Exception(status_code=400, detail="User ID gerekli")
@@ -110,125 +223,121 @@ class ApplicationService:
             if user_id not in self.applications_storage:
                 self.applications_storage[user_id] = []
             
-            saved_count = 0
+            saved_applications = []
+            # Yakın kopyası bulunan başvurular mevcut kayda işlenir (id(kayıt) -> kayıt)
+            merged_applications: Dict[int, Dict] = {}
+            duplicates = self._duplicates_for(user_id) if settings.DUPLICATE_DETECTION_ENABLED else None
+            # Toplu kayıtlarda her başvuru için listeyi taramamak adına mevcut email_id'ler bir kez toplanır
+            known_email_ids = set()
+            for existing in self.applications_storage[user_id]:
+                known_email_ids.add(existing.get("email_id"))
+                known_email_ids.update(related.get("email_id") for related in existing.get("related_emails", []))
             # Her başvuru için benzersiz ID oluştur
             for app in applications:
-                print(f"İşlenen başvuru: {app}")
+                logger.debug("İşlenen başvuru: %s", app)
                 if app.get("is_job_application", False):
                     # Mevcut başvurularla karşılaştır (email_id ile)
-                    existing_app = next(
-                        (existing for existing in self.applications_storage[user_id] 
-                         if existing.get("email_id") == app.get("email_id")), 
-                        None
-                    )
+                    if app.get("email_id") in known_email_ids:
+                        logger.debug("Başvuru zaten mevcut: %s", app.get("email_id"))
+                        continue
+                    known_email_ids.add(app.get("email_id"))
                     
-                    if not existing_app:
-                        # Yeni başvuru ekle
-                        app["id"] = len(self.applications_storage[user_id]) + 1
-                        app["created_at"] = datetime.now().isoformat()
-                        app["updated_at"] = datetime.now().isoformat()
-                        
-                        # Application type belirle
-                        if "internship" in app.get("position", "").lower() or "staj" in app.get("position", "").lower():
-                            app["application_type"] = "internship"
-                        else:
-                            app["application_type"] = "job"
-                        
-                        # Email içeriğini de sakla
-                        if "email_content" not in app:
-                            app["email_content"] = app.get("email_body", "")
-                        
-                        self.applications_storage[user_id].append(app)
-                        saved_count += 1
-                        print(f"Yeni başvuru kaydedildi: {app.get('company_name')} - {app.get('position')}")
-                    else:
-                        print(f"Başvuru zaten mevcut: {app.get('email_id')}")
-            
-            print(f"Toplam kaydedilen: {saved_count}, Toplam başvuru sayısı: {len(self.applications_storage[user_id])}")
-            print(f"Kaydedilen başvurular: {self.applications_storage[user_id]}")
-            
-            # Verileri kalıcı olarak kaydet
-            self._save_user_applications(user_id)
+                    # Aynı başvurunun başka bir e-postası mı (onay, hatırlatma, davet...)
+                    existing = duplicates.find(app) if duplicates is not None else None
+                    if existing is not None:
+                        self._merge_duplicate(existing, app)
+                        self._view_updated(user_id, existing)
+                        merged_applications[id(existing)] = existing
+                        logger.debug("Başvuru mevcut kayda birleştirildi: %s -> %s", app.get("email_id"), existing.get("id"))
+                        continue
+                    
+                    # Yeni başvuru ekle
+                    app["id"] = self._next_application_id(user_id)
+                    app["created_at"] = datetime.now().isoformat()
+                    app["updated_at"] = datetime.now().isoformat()
+                    app["application_type"] = self._application_type(app)
+                    
+                    # Email içeriğini de sakla
+                    if "email_content" not in app:
+                        app["email_content"] = app.get("email_body", "")
+                    
+                    self.applications_storage[user_id].append(app)
+                    self._view_added(user_id, app)
+                    saved_applications.append(app)
+                    logger.debug("Yeni başvuru kaydedildi: %s - %s", app.get("company_name"), app.get("position"))
+            
+            saved_count = len(saved_applications)
+            merged_count = len(merged_applications)
+            logger.info("Toplam kaydedilen: %d, birleştirilen: %d, Toplam başvuru sayısı: %d",
+                        saved_count, merged_count, len(self.applications_storage[user_id]))
+            logger.debug("Kaydedilen başvurular: %s", self.applications_storage[user_id])
+            
+            # Verileri kalıcı olarak kaydet (değişiklik yoksa dosya yeniden yazılmaz)
+            if saved_count or merged_count:
+                self._save_user_applications(user_id)
+                self._record_index_events(user_id, upserts=saved_applications + list(merged_applications.values()))
+                self._bump_version(user_id)
             
             return {
                 "message": f"{len(applications)} adet başvuru işlendi",
                 "saved_count": saved_count,
+                "merged_count": merged_count,
                 "total_applications": len(self.applications_storage[user_id])
             }
         
         except Exception as e:
-            print(f"Kaydetme hatası: {str(e)}")
+            logger.error("Kaydetme hatası: %s", e)
             raise Exception(status_code=500, detail=f"Başvuru kaydetme hatası: {str(e)}")
     
+    @staticmethod
+    def _application_type(app: Dict) -> str:
+        """Pozisyon adına göre staj/iş ayrımı"""
+        position = str(app.get("position") or "").lower()
+        return "internship" if "internship" in position or "staj" in position else "job"
+    
+    @staticmethod
+    def _email_summary(app: Dict) -> Dict:
+        return {
+            "email_id": app.get("email_id"),
+            "email_subject": app.get("email_subject"),
+            "email_date": app.get("email_date"),
+            "application_status": app.get("application_status") or app.get("status")
+        }
+    
+    def _merge_duplicate(self, target: Dict, app: Dict):
+        """Aynı başvuruya ait e-postayı mevcut kayda işle: daha yeni e-posta durumu ve e-posta alanlarını günceller"""
+        related = target.setdefault("related_emails", [])
+        if not related:
+            # İlk birleştirmede kaydın kendi e-postası da geçmişe eklenir
+            related.append(self._email_summary(target))
+        related.append(self._email_summary(app))
+        
+        newer = self._date_sort_value(app.get("email_date") or "") >= self._date_sort_value(target.get("email_date") or "")
+        for key, value in app.items():
+            if key in ("id", "created_at", "updated_at", "related_emails", "is_manual") or is_placeholder(value):
+                continue
+            # Eski tarihli e-posta sadece boş alanları doldurur
+            if newer or is_placeholder(target.get(key)):
+                target[key] = value
+        if newer and "email_content" not in app and app.get("email_body"):
+            target["email_content"] = app["email_body"]
+        target["updated_at"] = datetime.now().isoformat()
+    
     def get_user_applications(self, user_id: str) -> Dict:
         """Kullanıcının kayıtlı başvurularını getir"""
         try:
-            print(f"Başvuru getirme isteği - User ID: {user_id}")
+            logger.debug("Başvuru getirme isteği - User ID: %s", user_id)
             user_applications = self.applications_storage.get(user_id, [])
-            print(f"Kullanıcının toplam başvuru sayısı: {len(user_applications)}")
+            logger.debug("Kullanıcının toplam başvuru sayısı: %d", len(user_applications))
             
-            # Aktif ve tamamlanmış başvuruları ayır
-            active_applications = []
-            finished_applications = []
+            # Görünümler kayıt/güncelleme/silmede güncellenir, burada sadece dilimlenir
+            views = self._views_for(user_id)
+            active_applications = views.active()
+            finished_applications = views.finished()
             
-            for app in user_applications:
-                print(f"İşlenen başvuru: {app.get('company_name')} - {app.get('position')} - {app.get('application_status')}")
-                status = app.get("application_status", "").lower()
-                
-                # Tamamlanmış başvurular
-                if any(keyword in status for keyword in ["red", "kabul", "accepted", "rejected"]):
-                    finished_app = {
-                        "id": app.get("id"),
-                        "company": app.get("company_name", "Bilinmeyen Şirket"),
-                        "position": app.get("position", "Bilinmeyen Pozisyon"),
-                        "date": app.get("email_date", app.get("created_at", "")),
-                        "result": "Kabul" if "kabul" in status or "accepted" in status else "Red",
-                        "reason": app.get("next_action", ""),
-                        "status": "finished",
-                        "stage": app.get("application_status", "Tamamlandı"),
-                        "application_type": app.get("application_type", "job"),
-                        "contact_person": app.get("contact_person", ""),
-                        "location": app.get("location", ""),
-                        "salary_info": app.get("salary_info", ""),
-                        "requirements": app.get("requirements", ""),
-                        "deadline": app.get("deadline", ""),
-                        "email_id": app.get("email_id"),
-                        "email_subject": app.get("email_subject"),
-                        "email_sender": app.get("email_sender"),
-                        "created_at": app.get("created_at"),
-                        "updated_at": app.get("updated_at")
-                    }
-                    finished_applications.append(finished_app)
-                    print(f"Tamamlanmış başvuru eklendi: {finished_app['company']}")
-                else:
-                    # Aktif başvurular
-                    active_app = {
-                        "id": app.get("id"),
-                        "company": app.get("company_name", "Bilinmeyen Şirket"),
-                        "position": app.get("position", "Bilinmeyen Pozisyon"),
-                        "date": app.get("email_date", app.get("created_at", "")),
-                        "stage": app.get("application_status", "Başvuruldu"),
-                        "tasks": [app.get("next_action", "Detaylı inceleme")] if app.get("next_action") else [],
-                        "status": "active" if "mülakat" in status or "interview" in status else "pending",
-                        "stageOrder": self._get_stage_order(app.get("application_status", "")),
-                        "application_type": app.get("application_type", "job"),
-                        "contact_person": app.get("contact_person", ""),
-                        "location": app.get("location", ""),
-                        "salary_info": app.get("salary_info", ""),
-                        "requirements": app.get("requirements", ""),
-                        "deadline": app.get("deadline", ""),
-                        "email_id": app.get("email_id"),
-                        "email_subject": app.get("email_subject"),
-                        "email_sender": app.get("email_sender"),
-                        "created_at": app.get("created_at"),
-                        "updated_at": app.get("updated_at")
-                    }
-                    active_applications.append(active_app)
-                    print(f"Aktif başvuru eklendi: {active_app['company']}")
-            
-            print(f"Toplam aktif: {len(active_applications)}, Toplam tamamlanmış: {len(finished_applications)}")
-            print(f"Döndürülen aktif başvurular: {active_applications}")
-            print(f"Döndürülen tamamlanmış başvurular: {finished_applications}")
+            logger.debug("Toplam aktif: %d, Toplam tamamlanmış: %d", len(active_applications), len(finished_applications))
+            logger.debug("Döndürülen aktif başvurular: %s", active_applications)
+            logger.debug("Döndürülen tamamlanmış başvurular: %s", finished_applications)
             
             return {
                 "active_applications": active_applications,
@@ -239,15 +348,19 @@ class ApplicationService:
             }
         
         except Exception as e:
-            print(f"Başvuru getirme hatası: {str(e)}")
+            logger.error("Başvuru getirme hatası: %s", e)
             raise Exception(status_code=500, detail=f"Başvuru getirme hatası: {str(e)}")
     
+    def get_application_records(self, user_id: str) -> List[Dict]:
+        """Kullanıcının ham başvuru kayıtları (salt okunur kullanım için)"""
+        return self.applications_storage.get(user_id, [])
+    
     def debug_user_applications(self, user_id: str) -> Dict:
         """Debug için kullanıcının tüm başvurularını getir"""
         try:
-            print(f"Debug başvuru getirme isteği - User ID: {user_id}")
+            logger.debug("Debug başvuru getirme isteği - User ID: %s", user_id)
             user_applications = self.applications_storage.get(user_id, [])
-            print(f"Kullanıcının ham başvuru verisi: {user_applications}")
+            logger.debug("Kullanıcının ham başvuru verisi: %s", user_applications)
             
             return {
                 "raw_applications": user_applications,
@@ -256,7 +369,7 @@ class ApplicationService:
             }
         
         except Exception as e:
-            print(f"Debug başvuru getirme hatası: {str(e)}")
+            logger.error("Debug başvuru getirme hatası: %s", e)
             raise Exception(status_code=500, detail=f"Debug başvuru getirme hatası: {str(e)}")
     
     def delete_application(self, user_id: str, application_id: int) -> Dict:
@@ -272,6 +385,12 @@ class ApplicationService:
                 raise Exception(status_code=404, detail="Başvuru bulunamadı")
             
             self.applications_storage[user_id] = [app for app in user_applications if app.get("id") != application_id]
+            for app in user_applications:
+                if app.get("id") == application_id:
+                    self._view_removed(user_id, app)
+            self._save_user_applications(user_id)
+            self._record_index_events(user_id, deletes=[application])
+            self._bump_version(user_id)
             
             return {"message": "Başvuru silindi"}
         
@@ -293,6 +412,10 @@ class ApplicationService:
             # Başvuru bilgilerini güncelle
             user_applications[application_index].update(application_data)
             user_applications[application_index]["updated_at"] = datetime.now().isoformat()
+            self._view_updated(user_id, user_applications[application_index])
+            self._save_user_applications(user_id)
+            self._record_index_events(user_id, upserts=[user_applications[application_index]])
+            self._bump_version(user_id)
             
             return {"message": "Başvuru güncellendi"}
         
@@ -302,34 +425,34 @@ class ApplicationService:
     def get_application_email(self, user_id: str, application_id: int) -> Dict:
         """Başvuruya ait email içeriğini getir"""
         try:
-            print(f"get_application_email çağrıldı - user_id: {user_id}, application_id: {application_id}")
-            print(f"application_id türü: {type(application_id)}")
-            print(f"Mevcut kullanıcılar: {list(self.applications_storage.keys())}")
+            logger.debug("get_application_email çağrıldı - user_id: %s, application_id: %s", user_id, application_id)
+            logger.debug("application_id türü: %s", type(application_id))
+            logger.debug("Mevcut kullanıcılar: %s", lazy(lambda: list(self.applications_storage.keys())))
             
             if user_id not in self.applications_storage:
-                print(f"Kullanıcı bulunamadı: {user_id}")
+                logger.warning("Kullanıcı bulunamadı: %s", user_id)
                 raise Exception(status_code=404, detail="Kullanıcı bulunamadı")
             
             user_applications = self.applications_storage[user_id]
-            print(f"Kullanıcı başvuruları: {len(user_applications)} adet")
-            print(f"Aranan application_id: {application_id}")
-            print(f"Mevcut ID'ler: {[app.get('id') for app in user_applications]}")
-            print(f"ID türleri: {[type(app.get('id')) for app in user_applications]}")
+            logger.debug("Kullanıcı başvuruları: %d adet", len(user_applications))
+            logger.debug("Aranan application_id: %s", application_id)
+            logger.debug("Mevcut ID'ler: %s", lazy(lambda: [app.get("id") for app in user_applications]))
+            logger.debug("ID türleri: %s", lazy(lambda: [type(app.get("id")) for app in user_applications]))
             
             # ID'yi int'e çevir
             try:
                 application_id_int = int(application_id)
             except (ValueError, TypeError):
-                print(f"application_id int'e çevrilemedi: {application_id}")
+                logger.warning("application_id int'e çevrilemedi: %s", application_id)
                 raise Exception(status_code=400, detail="Geçersiz application_id")
             
             application = next((app for app in user_applications if app.get("id") == application_id_int), None)
             
             if not application:
-                print(f"Başvuru bulunamadı: {application_id_int}")
+                logger.warning("Başvuru bulunamadı: %s", application_id_int)
                 raise Exception(status_code=404, detail="Başvuru bulunamadı")
             
-            print(f"Başvuru bulundu: {application}")
+            logger.debug("Başvuru bulundu: %s", application)
             
             # Email bilgisi var mı kontrol et
             has_email = any([
@@ -342,7 +465,7 @@ class ApplicationService:
             ])
             
             if not has_email:
-                print(f"Başvuru için email bilgisi bulunamadı: {application_id_int}")
+                logger.warning("Başvuru için email bilgisi bulunamadı: %s", application_id_int)
                 return {
                     "error": "no_email",
                     "message": "Bu başvuru için email bilgisi bulunamadı",
@@ -367,12 +490,11 @@ class ApplicationService:
                 "has_email": True
             }
             
-            print(f"Döndürülecek sonuç: {result}")
+            logger.debug("Döndürülecek sonuç: %s", result)
             return result
         
         except Exception as e:
-            print(f"get_application_email hatası: {str(e)}")
-            print(f"Hata türü: {type(e)}")
+            logger.error("get_application_email hatası: %s (%s)", e, type(e).__name__)
             import traceback
             traceback.print_exc()
             raise Exception(status_code=500, detail=f"Email getirme hatası: {str(e)}")
@@ -380,7 +502,7 @@ class ApplicationService:
     def create_manual_application(self, user_id: str, application_data: Dict) -> Dict:
         """Manuel olarak yeni başvuru oluştur"""
         try:
-            print(f"Manuel başvuru oluşturma isteği - User ID: {user_id}")
+            logger.info("Manuel başvuru oluşturma isteği - User ID: %s", user_id)
             
             if not user_id:
                 raise Exception(status_code=400, detail="User ID gerekli")
@@ -395,7 +517,7 @@ class ApplicationService:
                     raise Exception(status_code=400, detail=f"{field} alanı gerekli")
             
             # Yeni başvuru için benzersiz ID oluştur
-            new_id = len(self.applications_storage[user_id]) + 1
+            new_id = self._next_application_id(user_id)
             
             # Başvuru verisini hazırla
             new_application = {
@@ -426,11 +548,14 @@ class ApplicationService:
             
             # Başvuruyu kaydet
             self.applications_storage[user_id].append(new_application)
+            self._view_added(user_id, new_application)
+            self._bump_version(user_id)
             
             # Verileri kalıcı olarak kaydet
             self._save_user_applications(user_id)
+            self._record_index_events(user_id, upserts=[new_application])
             
-            print(f"Manuel başvuru oluşturuldu: {new_application['company_name']} - {new_application['position']}")
+            logger.info("Manuel başvuru oluşturuldu: %s - %s", new_application["company_name"], new_application["position"])
             
             return {
                 "message": "Manuel başvuru başarıyla oluşturuldu",
@@ -439,9 +564,70 @@ class ApplicationService:
             }
         
         except Exception as e:
-            print(f"Manuel başvuru oluşturma hatası: {str(e)}")
+            logger.error("Manuel başvuru oluşturma hatası: %s", e)
             raise Exception(status_code=500, detail=f"Manuel başvuru oluşturma hatası: {str(e)}")
     
+    def _date_sort_value(self, value: str) -> float:
+        """ISO veya RFC 2822 tarih metnini sıralama için timestamp'e çevir"""
+        if not value:
+            return 0.0
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except (TypeError, ValueError):
+            pass
+        try:
+            return parsedate_to_datetime(value).timestamp()
+        except (TypeError, ValueError, IndexError):
+            return 0.0
+    
+    def _project_application(self, app: Dict) -> Tuple[str, Tuple, Dict]:
+        """Başvuruyu aktif/tamamlanmış görünüm projeksiyonuna çevir"""
+        status = app.get("application_status", "").lower()
+        date = app.get("email_date", app.get("created_at", ""))
+        common = {
+            "application_type": app.get("application_type", "job"),
+            "contact_person": app.get("contact_person", ""),
+            "location": app.get("location", ""),
+            "salary_info": app.get("salary_info", ""),
+            "requirements": app.get("requirements", ""),
+            "deadline": app.get("deadline", ""),
+            "email_id": app.get("email_id"),
+            "email_subject": app.get("email_subject"),
+            "email_sender": app.get("email_sender"),
+            "created_at": app.get("created_at"),
+            "updated_at": app.get("updated_at")
+        }
+        
+        # Tamamlanmış başvurular
+        if any(keyword in status for keyword in ["red", "kabul", "accepted", "rejected"]):
+            projection = {
+                "id": app.get("id"),
+                "company": app.get("company_name", "Bilinmeyen Şirket"),
+                "position": app.get("position", "Bilinmeyen Pozisyon"),
+                "date": date,
+                "result": "Kabul" if "kabul" in status or "accepted" in status else "Red",
+                "reason": app.get("next_action", ""),
+                "status": "finished",
+                "stage": app.get("application_status", "Tamamlandı"),
+                **common
+            }
+            return "finished", (self._date_sort_value(date),), projection
+        
+        # Aktif başvurular
+        stage_order = self._get_stage_order(app.get("application_status", ""))
+        projection = {
+            "id": app.get("id"),
+            "company": app.get("company_name", "Bilinmeyen Şirket"),
+            "position": app.get("position", "Bilinmeyen Pozisyon"),
+            "date": date,
+            "stage": app.get("application_status", "Başvuruldu"),
+            "tasks": [app.get("next_action", "Detaylı inceleme")] if app.get("next_action") else [],
+            "status": "active" if "mülakat" in status or "interview" in status else "pending",
+            "stageOrder": stage_order,
+            **common
+        }
+        return "active", (stage_order,), projection
+    
     def _get_stage_order(self, stage: str) -> int:
         """Başvuru aşamasına göre sıralama değeri döndür"""
         stage_lower = stage.lower()
@@ -459,7 +645,21 @@ class ApplicationService:
         else:
             return 0
 
-    def analyze_job_posting(self, job_data: Dict) -> Dict:
+    @staticmethod
+    def _extract_page_text(content: bytes, encoding: Optional[str] = None) -> str:
+        """HTML içeriğinden ilan metnini çıkar"""
+        from bs4 import BeautifulSoup
+        
+        soup = BeautifulSoup(content, 'html.parser', from_encoding=encoding)
+        
+        # Sadece gerekli tag'lerden metin çıkar
+        text_elements = soup.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'div', 'span'])
+        job_text = ' '.join([elem.get_text() for elem in text_elements if elem.get_text().strip()])
+        
+        # Gereksiz boşlukları temizle
+        return re.sub(r'\s+', ' ', job_text).strip()
+
+    async def analyze_job_posting(self, job_data: Dict) -> Dict:
         """AI ile iş ilanını analiz et ve bilgileri çıkar - Gemini API ile"""
         try:
             job_url = job_data.get("job_posting_url", "")
@@ -469,41 +669,32 @@ class ApplicationService:
                 raise Exception(status_code=400, detail="İlan linki veya metni gerekli")
             
             # Cache kontrolü - aynı metin için tekrar analiz yapma
-            cache_key = f"{job_url}_{hash(job_text)}"
-            if cache_key in self.analysis_cache:
+            # (disk katmanı SQLite'a gider, meşgulse bekleyebilir; event loop'u bloklamamak için thread'de)
+            cache_key = content_key(job_url, job_text)
+            cached_analysis = await asyncio.to_thread(self.analysis_cache.get, cache_key)
+            if cached_analysis is not None:
                 return {
                     "success": True,
                     "message": "İlan cache'den alındı",
-                    "data": self.analysis_cache[cache_key],
+                    "data": cached_analysis,
                     "cached": True
                 }
             
-            # Eğer URL verilmişse, web sayfasından içeriği çek
+            # Eğer URL verilmişse, web sayfasından içeriği çek (disk cache'li, koşullu istekle)
             if job_url:
                 try:
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                    }
-                    response = requests.get(job_url, headers=headers, timeout=5)
-                    response.raise_for_status()
-                    
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # Sadece gerekli tag'lerden metin çıkar
-                    text_elements = soup.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'div', 'span'])
-                    job_text = ' '.join([elem.get_text() for elem in text_elements if elem.get_text().strip()])
-                    
-                    # Gereksiz boşlukları temizle
-                    job_text = re.sub(r'\s+', ' ', job_text).strip()
-                    
+                    page = await page_fetcher.fetch(job_url)
+                    page_text = await asyncio.to_thread(self._extract_page_text, page["content"], page.get("encoding"))
+                    if page_text:
+                        job_text = page_text
                 except Exception as e:
                     # URL çalışmazsa sadece mevcut metni kullan
-                    pass
+                    logger.warning("İlan sayfası alınamadı: %s", e)
             
             # Gemini API ile analiz yap
             try:
                 from src.services.ai_service import ai_service
-                gemini_result = ai_service.analyze_job_posting_with_gemini(job_text)
+                gemini_result = await asyncio.to_thread(ai_service.analyze_job_posting_with_gemini, job_text)
                 
                 if gemini_result.get("success"):
                     # Gemini başarılı oldu, sonucu kullan
@@ -522,7 +713,7 @@ class ApplicationService:
                 analysis_result["gemini_error"] = str(e)
             
             # Sonucu cache'e kaydet
-            self.analysis_cache[cache_key] = analysis_result
+            await asyncio.to_thread(self.analysis_cache.set, cache_key, analysis_result)
             
             response_data = {
                 "success": True,
@@ -547,12 +738,13 @@ class ApplicationService:
         cleaned_text = re.sub(r'\s+', ' ', job_text.strip())
         text_lower = cleaned_text.lower()
         
-        # Compile edilmiş pattern'ları kullan
-        company_name = self._extract_info(cleaned_text, self.company_patterns, "Bilinmeyen Şirket")
-        position = self._extract_info(cleaned_text, self.position_patterns, "Bilinmeyen Pozisyon")
-        location = self._extract_info(cleaned_text, self.location_patterns, "Belirtilmemiş")
-        salary_info = self._extract_info(cleaned_text, self.salary_patterns, "Belirtilmemiş")
-        requirements = self._extract_info(cleaned_text, self.requirements_patterns, "Belirtilmemiş")
+        # Metni tek geçişte tara, tüm alanları aynı eşleşme akışından doldur
+        scan = self.extraction_engine.scan(cleaned_text)
+        company_name = self._select_info(scan, "company_name", "Bilinmeyen Şirket")
+        position = self._select_info(scan, "position", "Bilinmeyen Pozisyon")
+        location = self._select_info(scan, "location", "Belirtilmemiş")
+        salary_info = self._select_info(scan, "salary_info", "Belirtilmemiş")
+        requirements = self._select_info(scan, "requirements", "Belirtilmemiş")
         
         # Pozisyon türünü hızlı belirle
         application_type = "job"  # Default
@@ -585,17 +777,33 @@ class ApplicationService:
                 match = pattern.search(cleaned_text)
                 if match:
                     extracted = match.group(1) if len(match.groups()) > 0 else match.group(0)
-                    if extracted and len(extracted.strip()) > 2:
-                        # Hızlı temizleme
-                        result = re.sub(r'[^\w\s\-&,\.]', '', extracted.strip())
-                        result = re.sub(r'\s+', ' ', result).strip()
-                        
-                        if len(result) > 2:
-                            return result
+                    result = self._clean_extracted(extracted)
+                    if result:
+                        return result
             except Exception:
                 continue
         
         return default
+    
+    def _select_info(self, scan: ExtractionResult, field: str, default: str) -> str:
+        """Tek geçişlik tarama sonucundan alan değerini pattern öncelik sırasıyla seç"""
+        for match in scan.candidates(field):
+            result = self._clean_extracted(match.value)
+            if result:
+                return result
+        
+        return default
+    
+    def _clean_extracted(self, extracted: Optional[str]) -> Optional[str]:
+        """Çıkarılan değeri temizle, çok kısa değerleri ele"""
+        if not extracted or len(extracted.strip()) <= 2:
+            return None
+        
+        # Hızlı temizleme
+        result = re.sub(r'[^\w\s\-&,\.]', '', extracted.strip())
+        result = re.sub(r'\s+', ' ', result).strip()
+        
+        return result if len(result) > 2 else None
 
     def get_applications(self, user_id: str) -> Dict:
         """Kullanıcının başvurularını getir"""
@@ -631,77 +839,84 @@ class ApplicationService:
             }
             
         except Exception as e:
-            print(f"Başvuru getirme hatası: {str(e)}")
+            logger.error("Başvuru getirme hatası: %s", e)
             return {
                 "success": False,
                 "error": f"Başvurular getirilemedi: {str(e)}"
             }
     
     # ChromaDB entegrasyonu için yeni metodlar
+    # Yazmalar önce JSON deposuna yapılır; vektör indeksi outbox üzerinden arka planda güncellenir
+    def _find_application(self, user_id: str, application_id) -> Optional[Dict]:
+        """Başvuruyu ID'siyle bul (route'lardan gelen string ID'ler sayısal ID'lerle de eşleşir)"""
+        application_id = str(application_id)
+        return next(
+            (app for app in self.applications_storage.get(user_id, []) if str(app.get("id")) == application_id),
+            None
+        )
+    
     def save_application_to_chroma(self, application_data: Dict, user_id: str) -> str:
-        """Başvuruyu ChromaDB'ye kaydet"""
+        """Başvuruyu kaydet ve vektör indeksine eklenmek üzere kuyruğa al"""
         try:
-            application_id = self.chroma_service.add_application(application_data, user_id)
-            
-            # Legacy storage'a da ekle (geriye uyumluluk için)
             if user_id not in self.applications_storage:
                 self.applications_storage[user_id] = []
             
-            # ChromaDB'den gelen ID'yi kullan
+            application_id = str(uuid.uuid4())
             application_data["id"] = application_id
+            application_data.setdefault("created_at", datetime.now().isoformat())
+            application_data.setdefault("updated_at", application_data["created_at"])
             self.applications_storage[user_id].append(application_data)
+            self._view_added(user_id, application_data)
             
-            # Legacy storage'ı güncelle
             self._save_user_applications(user_id)
+            self._record_index_events(user_id, upserts=[application_data])
+            self._bump_version(user_id)
             
             return application_id
             
         except Exception as e:
-            print(f"ChromaDB'ye başvuru kaydetme hatası: {e}")
+            logger.error("Başvuru kaydetme hatası: %s", e)
             raise Exception(status_code=500, detail="Başvuru kaydedilemedi")
     
     def update_application_in_chroma(self, application_id: str, application_data: Dict, user_id: str) -> bool:
-        """ChromaDB'deki başvuruyu güncelle"""
+        """Başvuruyu güncelle, indeks güncellemesini kuyruğa al"""
         try:
-            success = self.chroma_service.update_application(application_id, application_data, user_id)
-            
-            if success:
-                # Legacy storage'ı da güncelle
-                if user_id in self.applications_storage:
-                    for app in self.applications_storage[user_id]:
-                        if app.get("id") == application_id:
-                            app.update(application_data)
-                            break
-                    
-                    # Legacy storage'ı güncelle
-                    self._save_user_applications(user_id)
+            app = self._find_application(user_id, application_id)
+            if app is None:
+                return False
             
-            return success
+            app.update(application_data)
+            app["updated_at"] = datetime.now().isoformat()
+            self._view_updated(user_id, app)
+            
+            self._save_user_applications(user_id)
+            self._record_index_events(user_id, upserts=[app])
+            self._bump_version(user_id)
+            return True
             
         except Exception as e:
-            print(f"ChromaDB'de başvuru güncelleme hatası: {e}")
+            logger.error("Başvuru güncelleme hatası: %s", e)
             return False
     
     def delete_application_from_chroma(self, application_id: str, user_id: str) -> bool:
-        """ChromaDB'den başvuruyu sil"""
+        """Başvuruyu sil, indeksten silinmesini kuyruğa al"""
         try:
-            success = self.chroma_service.delete_application(application_id, user_id)
-            
-            if success:
-                # Legacy storage'dan da sil
-                if user_id in self.applications_storage:
-                    self.applications_storage[user_id] = [
-                        app for app in self.applications_storage[user_id] 
-                        if app.get("id") != application_id
-                    ]
-                    
-                    # Legacy storage'ı güncelle
-                    self._save_user_applications(user_id)
+            app = self._find_application(user_id, application_id)
+            if app is None:
+                return False
             
-            return success
+            self._view_removed(user_id, app)
+            self.applications_storage[user_id] = [
+                existing for existing in self.applications_storage[user_id] if existing is not app
+            ]
+            
+            self._save_user_applications(user_id)
+            self._record_index_events(user_id, deletes=[app])
+            self._bump_version(user_id)
+            return True
             
         except Exception as e:
-            print(f"ChromaDB'den başvuru silme hatası: {e}")
+            logger.error("Başvuru silme hatası: %s", e)
             return False
     
     def get_applications_from_chroma(self, user_id: str) -> List[Dict]:
@@ -709,7 +924,7 @@ class ApplicationService:
         try:
             return self.chroma_service.get_user_applications(user_id)
         except Exception as e:
-            print(f"ChromaDB'den başvuru getirme hatası: {e}")
+            logger.error("ChromaDB'den başvuru getirme hatası: %s", e)
             return []
     
     def search_applications_in_chroma(self, query: str, user_id: str, limit: int = 10) -> List[Dict]:
@@ -717,23 +932,49 @@ class ApplicationService:
         try:
             return self.chroma_service.search_applications(query, user_id, limit)
         except Exception as e:
-            print(f"ChromaDB'de başvuru arama hatası: {e}")
+            logger.error("ChromaDB'de başvuru arama hatası: %s", e)
             return []
     
+    def _queue_email_analyses(self, items: List[Tuple[Dict, Dict]], user_id: str) -> List[str]:
+        """(e-posta, analiz) çiftlerini tek outbox yazmasıyla e-posta indeksine kuyruğa al"""
+        analysis_ids = []
+        events = []
+        for email_data, analysis_result in items:
+            analysis_id, payload = ChromaService.email_analysis_index_payload(email_data or {}, analysis_result, user_id)
+            analysis_ids.append(analysis_id)
+            events.append((EMAIL_ANALYSIS, UPSERT, user_id, analysis_id, payload))
+        # Başvuru verisi değişmez; versiyon artırılırsa /applications ETag'leri, analitik ve öneri cache'leri boşa düşerdi
+        index_outbox.record(events)
+        return analysis_ids
+    
     def save_email_analysis_to_chroma(self, email_data: Dict, analysis_result: Dict, user_id: str) -> str:
-        """E-posta analiz sonucunu ChromaDB'ye kaydet"""
+        """E-posta analiz sonucunu indekslenmek üzere kuyruğa al, analiz ID'sini döndür"""
         try:
-            return self.chroma_service.add_email_analysis(email_data, analysis_result, user_id)
+            return self._queue_email_analyses([(email_data, analysis_result)], user_id)[0]
         except Exception as e:
-            print(f"ChromaDB'ye e-posta analizi kaydetme hatası: {e}")
+            logger.error("E-posta analizi kaydetme hatası: %s", e)
             raise Exception(status_code=500, detail="E-posta analizi kaydedilemedi")
     
-    def search_email_analysis_in_chroma(self, query: str, user_id: str, limit: int = 10) -> List[Dict]:
-        """ChromaDB'de e-posta analizlerinde semantik arama yap"""
+    def save_email_analyses_to_chroma(self, analyses: List[Dict], user_id: str,
+                                      emails: Optional[List[Dict]] = None) -> List[str]:
+        """Analiz pipeline'ının sonuçlarını toplu olarak e-posta indeksine kuyruğa al"""
+        if not analyses:
+            return []
+        emails_by_id = {email.get("id"): email for email in emails or []}
+        return self._queue_email_analyses(
+            [(emails_by_id.get(analysis.get("email_id"), {}), analysis) for analysis in analyses], user_id
+        )
+    
+    def search_email_analysis_in_chroma(self, query: str, user_id: str, limit: int = 10,
+                                        category: Optional[List[str]] = None,
+                                        date_from: Optional[str] = None, date_to: Optional[str] = None) -> List[Dict]:
+        """ChromaDB'de e-posta analizlerinde filtreli semantik arama yap"""
         try:
-            return self.chroma_service.search_email_analysis(query, user_id, limit)
+            return self.chroma_service.search_email_analysis(
+                query, user_id, limit, category=category, date_from=date_from, date_to=date_to
+            )
         except Exception as e:
-            print(f"ChromaDB'de e-posta analizi arama hatası: {e}")
+            logger.error("ChromaDB'de e-posta analizi arama hatası: %s", e)
             return []
     
     def get_chroma_stats(self) -> Dict:
@@ -741,7 +982,7 @@ class ApplicationService:
         try:
             return self.chroma_service.get_collection_stats()
         except Exception as e:
-            print(f"ChromaDB istatistik getirme hatası: {e}")
+            logger.error("ChromaDB istatistik getirme hatası: %s", e)
             return {}
 
 # Global servis instance'ı
@@ -0,0 +1,81 @@
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, List, Tuple
+
+# project(app) -> (görünüm adı: "active" | "finished", sıralama anahtarı, projeksiyon)
+Projector = Callable[[Dict], Tuple[str, Tuple, Dict]]
+
+
+class SortedView:
+    """Anahtara göre bisect ile sıralı tutulan projeksiyon listesi"""
+
+    def __init__(self):
+        self.keys: List[Tuple] = []
+        self.items: List[Dict] = []
+
+    def insert(self, key: Tuple, item: Dict):
+        index = bisect_right(self.keys, key)
+        self.keys.insert(index, key)
+        self.items.insert(index, item)
+
+    def remove(self, key: Tuple) -> bool:
+        index = bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            del self.keys[index]
+            del self.items[index]
+            return True
+        return False
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+class ApplicationViews:
+    """
+    Bir kullanıcının materyalize edilmiş aktif/tamamlanmış başvuru görünümleri
+
+    Aktif liste aşama sırasına, tamamlanmış liste tarihe göre sıralı tutulur. Kayıtlar
+    depodaki dict nesnesinin kimliğiyle izlenir; ekleme/güncelleme/silme sadece ilgili
+    projeksiyonu değiştirir, okuma hazır listelerin dilimidir.
+    """
+
+    def __init__(self, project: Projector):
+        self.project = project
+        self.views = {"active": SortedView(), "finished": SortedView()}
+        self._index: Dict[int, Tuple[str, Tuple]] = {}
+        self._sequence = 0
+
+    def add(self, app: Dict):
+        name, sort_key, projection = self.project(app)
+        # Aynı sıralama değerine sahip kayıtlar eklenme sırasını korur ve anahtarlar tekil kalır
+        key = (*sort_key, self._sequence)
+        self._sequence += 1
+        self.views[name].insert(key, projection)
+        self._index[id(app)] = (name, key)
+
+    def remove(self, app: Dict):
+        entry = self._index.pop(id(app), None)
+        if entry is not None:
+            name, key = entry
+            self.views[name].remove(key)
+
+    def update(self, app: Dict):
+        self.remove(app)
+        self.add(app)
+
+    def rebuild(self, applications: List[Dict]):
+        for view in self.views.values():
+            view.keys.clear()
+            view.items.clear()
+        self._index.clear()
+        for app in applications:
+            self.add(app)
+
+    def active(self) -> List[Dict]:
+        return self.views["active"].items[:]
+
+    def finished(self) -> List[Dict]:
+        # Tarihe göre artan tutulur, en yeni önce döner
+        return self.views["finished"].items[::-1]
+
+    def __contains__(self, app: Any) -> bool:
+        return id(app) in self._index
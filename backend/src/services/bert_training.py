@@ -0,0 +1,324 @@
+"""
+BERT e-posta sınıflandırıcısı için CPU dostu fine-tuning
+
+- Metinler bir kez tokenize edilip NumPy dizileri olarak diske yazılır; aynı veri ve
+  tokenizer ile tekrar eğitimde tokenizasyon atlanır.
+- Örnekler pad'lenmeden saklanır, batch'ler benzer uzunluktaki örneklerden kurulur ve
+  batch içindeki en uzun örneğe göre dinamik pad'lenir.
+- Gradient birikimi, alt katmanların dondurulması, veri boyutuna göre warmup ve
+  kaldığı yerden devam edebilen checkpoint'ler desteklenir.
+
+Kullanım:
+    python -m src.services.bert_training --data data/labeled_emails.jsonl --freeze-layers 8
+    python -m src.services.bert_training --data data/labeled_emails.jsonl --resume
+"""
+import os
+import json
+import time
+import hashlib
+import inspect
+import argparse
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence
+import numpy as np
+import torch
+from transformers import DataCollatorWithPadding, Trainer, TrainingArguments
+from transformers.trainer_utils import get_last_checkpoint
+from sklearn.model_selection import train_test_split
+from ..config.classifier_config import ClassifierConfig
+from ..utils.data_loading import load_json_records
+
+CACHE_FORMAT_VERSION = 1
+
+
+@dataclass
+class TrainingOptions:
+    """Fine-tuning ayarları (varsayılanlar ClassifierConfig'ten)"""
+    output_dir: str = ClassifierConfig.BERT_MODEL_DIR
+    cache_dir: str = ClassifierConfig.BERT_TOKENIZED_CACHE_DIR
+    max_length: int = ClassifierConfig.BERT_TRAIN_MAX_LENGTH
+    epochs: float = 3
+    batch_size: int = 16
+    gradient_accumulation_steps: int = 2
+    learning_rate: float = 5e-5
+    weight_decay: float = 0.01
+    warmup_ratio: float = 0.1
+    freeze_layers: int = 0
+    validation_split: float = 0.2
+    save_steps: int = 200
+    save_total_limit: int = 2
+    resume: bool = False
+    seed: int = 42
+
+
+class TokenizedDataset(torch.utils.data.Dataset):
+    """
+    Pad'lenmemiş token dizileri
+
+    Tüm token'lar tek bir düz dizide, örnek sınırları `offsets` ile tutulur.
+    Pad'leme DataCollatorWithPadding ile batch anında yapılır.
+    """
+
+    def __init__(self, input_ids: np.ndarray, offsets: np.ndarray, labels: np.ndarray, indices: Sequence[int]):
+        self.input_ids = input_ids
+        self.offsets = offsets
+        self.labels = labels
+        self.indices = np.asarray(indices, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, idx: int) -> Dict[str, Any]:
+        index = self.indices[idx]
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return {
+            "input_ids": self.input_ids[start:end].tolist(),
+            "labels": int(self.labels[index])
+        }
+
+
+def _cache_key(tokenizer, texts: Sequence[str], labels: Sequence[int], max_length: int) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{CACHE_FORMAT_VERSION}|{tokenizer.name_or_path}|{len(tokenizer)}|{max_length}".encode("utf-8"))
+    for text, label in zip(texts, labels):
+        digest.update(text.encode("utf-8"))
+        digest.update(f"\x00{label}\x00".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def pretokenize(texts: Sequence[str], labels: Sequence[int], tokenizer, max_length: int,
+                cache_dir: Optional[str] = None, batch_size: int = 1000) -> Dict[str, Any]:
+    """
+    Metinleri bir kez tokenize et ve (varsa) diskteki cache'ten yükle
+
+    Returns:
+        {"input_ids": düz int32 dizi, "offsets": örnek sınırları, "labels", "cache_hit", "seconds"}
+    """
+    started = time.perf_counter()
+    cache_path = None
+    if cache_dir:
+        cache_path = os.path.join(cache_dir, f"{_cache_key(tokenizer, texts, labels, max_length)}.npz")
+        if os.path.exists(cache_path):
+            with np.load(cache_path) as cached:
+                arrays = {name: cached[name] for name in ("input_ids", "offsets", "labels")}
+            return {**arrays, "cache_hit": True, "seconds": time.perf_counter() - started}
+
+    chunks = []
+    lengths = []
+    # Hızlı tokenizer'lar toplu çağrıda metinleri paralel işler
+    for start in range(0, len(texts), batch_size):
+        encoded = tokenizer(
+            list(texts[start:start + batch_size]),
+            truncation=True,
+            max_length=max_length,
+            padding=False,
+            return_attention_mask=False,
+            return_token_type_ids=False
+        )
+        for ids in encoded["input_ids"]:
+            chunks.append(np.asarray(ids, dtype=np.int32))
+            lengths.append(len(ids))
+
+    arrays = {
+        "input_ids": np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int32),
+        "offsets": np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64),
+        "labels": np.asarray(labels, dtype=np.int64)
+    }
+
+    if cache_path:
+        os.makedirs(cache_dir, exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp.npz"
+        np.savez(temp_path, **arrays)
+        os.replace(temp_path, cache_path)
+
+    return {**arrays, "cache_hit": False, "seconds": time.perf_counter() - started}
+
+
+def freeze_lower_layers(model, count: int) -> int:
+    """Embedding'leri ve ilk `count` encoder katmanını dondur, dondurulan katman sayısını döndür"""
+    if count <= 0:
+        return 0
+    base_model = getattr(model, "base_model", model)
+    embeddings = getattr(base_model, "embeddings", None)
+    if embeddings is not None:
+        for parameter in embeddings.parameters():
+            parameter.requires_grad = False
+
+    encoder = getattr(base_model, "encoder", None)
+    layers = getattr(encoder, "layer", None) or []
+    frozen = min(count, len(layers))
+    for layer in layers[:frozen]:
+        for parameter in layer.parameters():
+            parameter.requires_grad = False
+    return frozen
+
+
+def _compute_metrics(eval_prediction) -> Dict[str, float]:
+    logits, labels = eval_prediction
+    predictions = np.argmax(logits, axis=-1)
+    return {"accuracy": float((predictions == labels).mean())}
+
+
+def _training_arguments(options: TrainingOptions, evaluate: bool) -> TrainingArguments:
+    # transformers sürümleri arasında yeniden adlandırılan parametreler:
+    # evaluation_strategy → eval_strategy (4.41), warmup_ratio → oransal warmup_steps ve
+    # group_by_length → train_sampling_strategy (5.0)
+    parameters = inspect.signature(TrainingArguments.__init__).parameters
+    compat = {
+        "eval_strategy" if "eval_strategy" in parameters else "evaluation_strategy": "steps" if evaluate else "no",
+        "warmup_ratio" if "warmup_ratio" in parameters else "warmup_steps": options.warmup_ratio
+    }
+    if "group_by_length" in parameters:
+        compat["group_by_length"] = True
+    else:
+        compat["train_sampling_strategy"] = "group_by_length"
+
+    return TrainingArguments(
+        output_dir=options.output_dir,
+        num_train_epochs=options.epochs,
+        per_device_train_batch_size=options.batch_size,
+        per_device_eval_batch_size=options.batch_size * 2,
+        gradient_accumulation_steps=options.gradient_accumulation_steps,
+        learning_rate=options.learning_rate,
+        weight_decay=options.weight_decay,
+        logging_steps=10,
+        save_strategy="steps",
+        save_steps=options.save_steps,
+        save_total_limit=options.save_total_limit,
+        eval_steps=options.save_steps if evaluate else None,
+        load_best_model_at_end=evaluate,
+        metric_for_best_model="accuracy" if evaluate else None,
+        dataloader_num_workers=0,
+        report_to=[],
+        seed=options.seed,
+        **compat
+    )
+
+
+def train_classifier(model, tokenizer, texts: Sequence[str], labels: Sequence[int],
+                     options: Optional[TrainingOptions] = None) -> Dict[str, Any]:
+    """
+    Sınıflandırma modelini fine-tune et ve throughput raporu döndür
+
+    Args:
+        model: AutoModelForSequenceClassification
+        tokenizer: Modelin tokenizer'ı
+        texts: Eğitim metinleri
+        labels: Kategori indeksleri
+        options: Eğitim ayarları
+    """
+    options = options or TrainingOptions()
+    tokenized = pretokenize(texts, labels, tokenizer, options.max_length, options.cache_dir)
+    source = "cache'ten yüklendi" if tokenized["cache_hit"] else "tamamlandı"
+    print(f"🔄 Tokenizasyon {source}: {len(texts)} örnek, {tokenized['seconds']:.2f} sn")
+
+    indices = np.arange(len(texts))
+    evaluate = options.validation_split > 0 and len(texts) >= 10
+    if evaluate:
+        label_list = list(labels)
+        stratify = label_list if min(label_list.count(label) for label in set(label_list)) >= 2 else None
+        train_indices, val_indices = train_test_split(
+            indices, test_size=options.validation_split, random_state=options.seed, stratify=stratify
+        )
+    else:
+        train_indices, val_indices = indices, []
+
+    train_dataset = TokenizedDataset(tokenized["input_ids"], tokenized["offsets"], tokenized["labels"], train_indices)
+    val_dataset = TokenizedDataset(tokenized["input_ids"], tokenized["offsets"], tokenized["labels"], val_indices) if evaluate else None
+
+    frozen = freeze_lower_layers(model, options.freeze_layers)
+    trainable = sum(parameter.numel() for parameter in model.parameters() if parameter.requires_grad)
+    total = sum(parameter.numel() for parameter in model.parameters())
+
+    trainer = Trainer(
+        model=model,
+        args=_training_arguments(options, evaluate),
+        train_dataset=train_dataset,
+        eval_dataset=val_dataset,
+        # Batch en uzun örneğe göre pad'lenir; 8'in katları CPU matmul'larında daha verimli
+        data_collator=DataCollatorWithPadding(tokenizer, pad_to_multiple_of=8),
+        compute_metrics=_compute_metrics if evaluate else None
+    )
+
+    checkpoint = get_last_checkpoint(options.output_dir) if options.resume and os.path.isdir(options.output_dir) else None
+    if checkpoint:
+        print(f"🔄 Eğitim checkpoint'ten devam ediyor: {checkpoint}")
+
+    started = time.perf_counter()
+    train_output = trainer.train(resume_from_checkpoint=checkpoint)
+    train_seconds = time.perf_counter() - started
+
+    trainer.save_model(options.output_dir)
+    tokenizer.save_pretrained(options.output_dir)
+
+    lengths = np.diff(tokenized["offsets"])[train_indices]
+    epochs_run = train_output.metrics.get("epoch", options.epochs)
+    report = {
+        "created_at": datetime.now().isoformat(),
+        "samples": len(texts),
+        "train_samples": len(train_indices),
+        "validation_samples": len(val_indices),
+        "tokenization_seconds": round(tokenized["seconds"], 3),
+        "tokenization_cache_hit": tokenized["cache_hit"],
+        "mean_tokens": round(float(lengths.mean()), 1) if len(lengths) else 0.0,
+        "max_tokens": int(lengths.max()) if len(lengths) else 0,
+        "frozen_layers": frozen,
+        "trainable_parameters": trainable,
+        "total_parameters": total,
+        "resumed_from": checkpoint,
+        "train_seconds": round(train_seconds, 2),
+        "train_samples_per_second": train_output.metrics.get("train_samples_per_second"),
+        "train_tokens_per_second": round(float(lengths.sum()) * epochs_run / train_seconds, 1) if train_seconds else None,
+        "train_loss": train_output.metrics.get("train_loss"),
+        "effective_batch_size": options.batch_size * options.gradient_accumulation_steps,
+        "options": asdict(options),
+        "model_dir": options.output_dir
+    }
+    if evaluate:
+        report["validation"] = trainer.evaluate()
+
+    with open(os.path.join(options.output_dir, "training_report.json"), "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+    print(f"✅ Model eğitildi: {report['train_samples_per_second']} örnek/sn, {train_seconds:.1f} sn")
+    return report
+
+
+def main():
+    defaults = TrainingOptions()
+    parser = argparse.ArgumentParser(description="BERT e-posta sınıflandırıcısını fine-tune et")
+    parser.add_argument("--data", required=True, help='Etiketli veri (JSON/JSONL, {"text", "label"})')
+    parser.add_argument("--output", default=defaults.output_dir, help="Model ve checkpoint dizini")
+    parser.add_argument("--epochs", type=float, default=defaults.epochs)
+    parser.add_argument("--batch-size", type=int, default=defaults.batch_size)
+    parser.add_argument("--grad-accum", type=int, default=defaults.gradient_accumulation_steps)
+    parser.add_argument("--max-length", type=int, default=defaults.max_length)
+    parser.add_argument("--freeze-layers", type=int, default=defaults.freeze_layers, help="Dondurulacak alt encoder katmanı sayısı")
+    parser.add_argument("--warmup-ratio", type=float, default=defaults.warmup_ratio)
+    parser.add_argument("--resume", action="store_true", help="Son checkpoint'ten devam et")
+    parser.add_argument("--report", help="Raporun yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    from .advanced_email_classifier import advanced_email_classifier
+
+    options = TrainingOptions(
+        output_dir=args.output,
+        epochs=args.epochs,
+        batch_size=args.batch_size,
+        gradient_accumulation_steps=args.grad_accum,
+        max_length=args.max_length,
+        freeze_layers=args.freeze_layers,
+        warmup_ratio=args.warmup_ratio,
+        resume=args.resume
+    )
+    report = advanced_email_classifier.train_model(load_json_records(args.data), options=options)
+
+    output = json.dumps(report, ensure_ascii=False, indent=2, default=str)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,47 @@
-import chromadb
-from chromadb.config import Settings
 import os
 import json
-from typing import List, Dict, Optional, Any
+import hashlib
+from typing import List, Dict, Optional, Any, Sequence, Tuple, Union
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 import uuid
 from ..config.chroma_config import ChromaConfig
+from ..utils.metrics import CHROMA_OPERATION_DURATION, timed
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
 
 class ChromaService:
     """ChromaDB ile iş başvuru yönetimi için servis sınıfı"""
     
+    # Başvuru metadata alanı -> başvuru verisindeki kaynak alanlar (öncelik sırasıyla)
+    APPLICATION_METADATA_FIELDS = {
+        "company_name": ("sirket", "company_name"),
+        "position": ("baslik", "position"),
+        "application_status": ("durum", "application_status"),
+        "location": ("konum", "location"),
+        "field": ("alan",),
+        "duration": ("sure",),
+        "is_paid": ("ucretli",)
+    }
+    
+    # _prepare_text_for_embedding'in ürettiği doküman parçalarının etiketleri
+    DOCUMENT_LABELS = ("Pozisyon", "Şirket", "Konum", "Açıklama", "Gereksinimler", "Avantajlar", "Alan", "Süre", "Ücretli")
+    
+    # İndeksleme için başvurudan okunan alanlar (metadata + doküman); outbox olayları sadece bunları taşır
+    APPLICATION_INDEX_FIELDS = (
+        "id", "sirket", "company_name", "baslik", "position", "durum", "application_status", "konum", "location",
+        "aciklama", "description", "gereksinimler", "requirements", "avantajlar", "advantages", "alan", "sure",
+        "ucretli", "created_at", "updated_at"
+    )
+    
+    # E-posta analizi kaydı için analiz sonucundan okunan alanlar
+    EMAIL_ANALYSIS_INDEX_FIELDS = (
+        "email_id", "email_subject", "email_sender", "email_content", "email_date", "category", "email_type",
+        "status", "application_status", "company_name", "position", "confidence"
+    )
+    
     def __init__(self, persist_directory: str = None):
         """ChromaDB servisini başlat"""
         self.persist_directory = persist_directory or ChromaConfig.PERSIST_DIRECTORY
@@ -26,6 +58,10 @@ class ChromaService:
     def _create_chroma_client(self):
         """ChromaDB client'ını konfigürasyona göre oluştur"""
         try:
+            # chromadb ağır bir paket, sadece servis ilk kullanıldığında import edilir
+            import chromadb
+            from chromadb.config import Settings
+            
             config = ChromaConfig.get_chroma_client_config()
             
             if config.get("host"):
@@ -81,6 +117,25 @@ class ChromaService:
                 print(f"❌ Kritik hata: {e2}")
                 raise
     
+    @staticmethod
+    def application_document_id(application_id: Any, user_id: str) -> str:
+        """Başvurunun koleksiyondaki ID'si: UUID'ler olduğu gibi, kullanıcıya göre sıralı sayısal ID'ler kullanıcıyla birlikte"""
+        if isinstance(application_id, str):
+            return application_id
+        return f"{user_id}:{application_id}"
+    
+    def _application_metadata(self, application_data: Dict[str, Any], user_id: str, application_id: str) -> Dict[str, Any]:
+        """Başvuru metadata'sı - sadece string değerler"""
+        now = datetime.now().isoformat()
+        metadata = {"user_id": user_id, "application_id": application_id}
+        for key, sources in self.APPLICATION_METADATA_FIELDS.items():
+            value = next((application_data[source] for source in sources if application_data.get(source)), None)
+            metadata[key] = str(value if value is not None else (False if key == "is_paid" else ""))
+        metadata["created_at"] = str(application_data.get("created_at") or now)
+        metadata["updated_at"] = str(application_data.get("updated_at") or now)
+        return metadata
+    
+    @timed(CHROMA_OPERATION_DURATION, operation="add_application")
     def add_application(self, application_data: Dict[str, Any], user_id: str) -> str:
         """Yeni iş başvurusu ekle"""
         try:
@@ -88,19 +143,7 @@ class ChromaService:
             application_id = str(uuid.uuid4())
             
             # Metadata hazırla - sadece string değerler
-            metadata = {
-                "user_id": user_id,
-                "application_id": application_id,
-                "company_name": str(application_data.get("sirket") or application_data.get("company_name", "")),
-                "position": str(application_data.get("baslik") or application_data.get("position", "")),
-                "application_status": str(application_data.get("durum") or application_data.get("application_status", "")),
-                "location": str(application_data.get("konum") or application_data.get("location", "")),
-                "field": str(application_data.get("alan", "")),
-                "duration": str(application_data.get("sure", "")),
-                "is_paid": str(application_data.get("ucretli", False)),
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat()
-            }
+            metadata = self._application_metadata(application_data, user_id, application_id)
             
             # Vektör için metin hazırla
             text_for_embedding = self._prepare_text_for_embedding(application_data)
@@ -119,6 +162,48 @@ class ChromaService:
             print(f"❌ Başvuru ekleme hatası: {e}")
             raise
     
+    @timed(CHROMA_OPERATION_DURATION, operation="upsert_applications")
+    def upsert_applications(self, items: Sequence[Tuple[str, Dict[str, Any]]],
+                            batch_size: Optional[int] = None) -> List[str]:
+        """(kullanıcı, başvuru) çiftlerini başvurunun kendi ID'siyle batch'ler halinde upsert et"""
+        batch_size = batch_size or ChromaConfig.INDEX_BATCH_SIZE
+        records: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        for user_id, application_data in items:
+            application_id = application_data.get("id")
+            document_id = self.application_document_id(application_id, user_id)
+            records[document_id] = (
+                self._prepare_text_for_embedding(application_data),
+                self._application_metadata(application_data, user_id, str(application_id))
+            )
+        
+        ids = list(records)
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start:start + batch_size]
+            self.applications_collection.upsert(
+                ids=batch,
+                documents=[records[document_id][0] for document_id in batch],
+                metadatas=[records[document_id][1] for document_id in batch]
+            )
+        return ids
+    
+    @timed(CHROMA_OPERATION_DURATION, operation="delete_applications")
+    def delete_applications(self, items: Sequence[Tuple[str, Any]]) -> int:
+        """(kullanıcı, başvuru ID'si) çiftlerini sil; koleksiyonda olmayanlar yok sayılır"""
+        ids = list({self.application_document_id(application_id, user_id) for user_id, application_id in items})
+        if ids:
+            self.applications_collection.delete(ids=ids)
+        return len(ids)
+    
+    @timed(CHROMA_OPERATION_DURATION, operation="clear_applications")
+    def clear_applications(self, user_id: Optional[str] = None, batch_size: Optional[int] = None) -> int:
+        """Kullanıcının (verilmezse herkesin) başvuru dokümanlarını sil, silinen sayısını döndür"""
+        batch_size = batch_size or ChromaConfig.INDEX_BATCH_SIZE
+        where = {"user_id": user_id} if user_id else None
+        ids = self.applications_collection.get(where=where, include=[])["ids"]
+        for start in range(0, len(ids), batch_size):
+            self.applications_collection.delete(ids=ids[start:start + batch_size])
+        return len(ids)
+    
     def _prepare_text_for_embedding(self, application_data: Dict[str, Any]) -> str:
         """Vektör için metin hazırla"""
         try:
@@ -170,6 +255,72 @@ class ChromaService:
             print(f"⚠️ Metin hazırlama hatası: {e}")
             return "İş başvurusu"
     
+    def _document_parts(self, document: str) -> Dict[str, str]:
+        """Dokümanı etiket -> değer parçalarına ayır (değer içindeki " | " korunur)"""
+        parts: Dict[str, str] = {}
+        last_label = None
+        for piece in document.split(" | "):
+            label, separator, value = piece.partition(": ")
+            if separator and label in self.DOCUMENT_LABELS:
+                parts[label] = value
+                last_label = label
+            elif last_label:
+                parts[last_label] += " | " + piece
+        return parts
+    
+    def _merge_document(self, document: str, application_data: Dict[str, Any]) -> str:
+        """Mevcut dokümanda sadece güncellenen alanların parçalarını değiştir"""
+        parts = self._document_parts(document)
+        parts.update(self._document_parts(self._prepare_text_for_embedding(application_data)))
+        if not parts:
+            return document
+        return " | ".join(f"{label}: {value}" for label, value in parts.items())
+    
+    @timed(CHROMA_OPERATION_DURATION, operation="update_application")
+    def update_application(self, application_id: str, application_data: Dict[str, Any], user_id: str) -> bool:
+        """Başvuruyu silip yeniden eklemeden yerinde güncelle"""
+        try:
+            existing = self.applications_collection.get(
+                ids=[application_id],
+                where={"user_id": user_id},
+                include=["metadatas", "documents"]
+            )
+            
+            if not existing["ids"]:
+                return False
+            
+            metadata = dict(existing["metadatas"][0] or {})
+            for key, sources in self.APPLICATION_METADATA_FIELDS.items():
+                for source in sources:
+                    if application_data.get(source) is not None:
+                        metadata[key] = str(application_data[source])
+                        break
+            metadata["updated_at"] = datetime.now().isoformat()
+            
+            document = existing["documents"][0] or ""
+            updated_document = self._merge_document(document, application_data)
+            if updated_document != document:
+                # Metin değişti: aynı ID ile upsert, embedding yeniden hesaplanır
+                self.applications_collection.upsert(
+                    ids=[application_id],
+                    documents=[updated_document],
+                    metadatas=[metadata]
+                )
+            else:
+                # Sadece metadata değişti: embedding'e dokunulmaz
+                self.applications_collection.update(
+                    ids=[application_id],
+                    metadatas=[metadata]
+                )
+            
+            logger.debug("Başvuru güncellendi: %s", application_id)
+            return True
+            
+        except Exception as e:
+            logger.error("Başvuru güncelleme hatası (%s): %s", application_id, e)
+            return False
+    
+    @timed(CHROMA_OPERATION_DURATION, operation="search_applications")
     def search_applications(self, query: str, user_id: str, limit: int = 10) -> Dict[str, Any]:
         """İş başvurularında arama yap"""
         try:
@@ -200,6 +351,7 @@ class ChromaService:
                 "count": 0
             }
     
+    @timed(CHROMA_OPERATION_DURATION, operation="get_user_applications")
     def get_user_applications(self, user_id: str, limit: int = 50) -> Dict[str, Any]:
         """Kullanıcının tüm başvurularını getir"""
         try:
@@ -225,6 +377,7 @@ class ChromaService:
                 "count": 0
             }
     
+    @timed(CHROMA_OPERATION_DURATION, operation="delete_application")
     def delete_application(self, application_id: str, user_id: str) -> bool:
         """Başvuruyu sil"""
         try:
@@ -246,6 +399,183 @@ class ChromaService:
             print(f"❌ Başvuru silme hatası: {e}")
             return False
     
+    @staticmethod
+    def _timestamp(value: Any, end_of_day: bool = False) -> Optional[int]:
+        """ISO tarih, RFC 2822 e-posta tarihi ya da epoch değerini epoch saniyesine çevir"""
+        if value is None or value == "":
+            return None
+        if isinstance(value, (int, float)):
+            return int(value)
+        text = str(value).strip()
+        try:
+            parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            try:
+                parsed = parsedate_to_datetime(text)
+            except (TypeError, ValueError, IndexError):
+                return None
+        timestamp = int(parsed.timestamp())
+        # Sadece gün verilmişse (YYYY-MM-DD) bitiş sınırı günün sonudur
+        if end_of_day and len(text) == 10:
+            timestamp += 86399
+        return timestamp
+    
+    @staticmethod
+    def email_analysis_id(email_id: str, user_id: str) -> str:
+        """Aynı e-postanın tekrar analizi yeni kayıt açmaz, aynı ID'ye upsert edilir"""
+        if not email_id:
+            return str(uuid.uuid4())
+        return hashlib.blake2b(f"{user_id}\0{email_id}".encode("utf-8"), digest_size=16).hexdigest()
+    
+    @classmethod
+    def application_index_payload(cls, application_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Başvurunun indekste kullanılan alanları"""
+        return {field: application_data[field] for field in cls.APPLICATION_INDEX_FIELDS if field in application_data}
+    
+    @classmethod
+    def email_analysis_index_payload(cls, email_data: Dict[str, Any], analysis_result: Dict[str, Any],
+                                     user_id: str) -> Tuple[str, Dict[str, Any]]:
+        """E-posta analizinin ID'si ve kaydı üretmeye yetecek kadar kısaltılmış (e-posta, analiz) verisi"""
+        max_chars = ChromaConfig.EMAIL_DOCUMENT_MAX_CHARS
+        email = {key: email_data[key] for key in ("id", "subject", "sender", "date") if email_data.get(key) is not None}
+        if email_data.get("body"):
+            email["body"] = str(email_data["body"])[:max_chars]
+        analysis = {field: analysis_result[field] for field in cls.EMAIL_ANALYSIS_INDEX_FIELDS if field in analysis_result}
+        if analysis.get("email_content"):
+            analysis["email_content"] = str(analysis["email_content"])[:max_chars]
+        email_id = str(analysis_result.get("email_id") or email_data.get("id") or "")
+        analysis["analysis_id"] = analysis_result.get("analysis_id") or cls.email_analysis_id(email_id, user_id)
+        return analysis["analysis_id"], {"email": email, "analysis": analysis}
+    
+    def _email_analysis_record(self, email_data: Dict[str, Any], analysis_result: Dict[str, Any],
+                               user_id: str) -> Tuple[str, str, Dict[str, Any]]:
+        """E-posta analizi için (ID, doküman, metadata) üret"""
+        email_id = str(analysis_result.get("email_id") or email_data.get("id") or "")
+        analysis_id = analysis_result.get("analysis_id") or self.email_analysis_id(email_id, user_id)
+        subject = str(analysis_result.get("email_subject") or email_data.get("subject") or "")
+        sender = str(analysis_result.get("email_sender") or email_data.get("sender") or "")
+        body = str(email_data.get("body") or analysis_result.get("email_content") or "")
+        email_date = analysis_result.get("email_date") or email_data.get("date") or ""
+        category = str(analysis_result.get("category") or analysis_result.get("email_type") or "")
+        company_name = str(analysis_result.get("company_name") or "")
+        position = str(analysis_result.get("position") or "")
+        analyzed_at = datetime.now()
+        
+        # Metadata - ChromaDB sadece str/int/float/bool değerleri kabul eder
+        metadata = {
+            "user_id": user_id,
+            "analysis_id": analysis_id,
+            "email_id": email_id,
+            "category": category,
+            "status": str(analysis_result.get("status") or analysis_result.get("application_status") or ""),
+            "company_name": company_name,
+            "position": position,
+            "subject": subject[:500],
+            "sender": sender,
+            "confidence": float(analysis_result.get("confidence") or 0.0),
+            "email_date": str(email_date),
+            "analyzed_at": analyzed_at.isoformat(),
+            "analyzed_ts": int(analyzed_at.timestamp())
+        }
+        # Tarih filtresi sayısal alan üzerinden çalışır; tarihi çözülemeyen e-postalarda alan yoktur
+        email_ts = self._timestamp(email_date)
+        if email_ts is not None:
+            metadata["email_ts"] = email_ts
+        
+        text_parts = [f"Konu: {subject}"]
+        if company_name:
+            text_parts.append(f"Şirket: {company_name}")
+        if position:
+            text_parts.append(f"Pozisyon: {position}")
+        if category:
+            text_parts.append(f"Kategori: {category}")
+        if body:
+            text_parts.append(body[:ChromaConfig.EMAIL_DOCUMENT_MAX_CHARS])
+        return analysis_id, " | ".join(text_parts), metadata
+    
+    @timed(CHROMA_OPERATION_DURATION, operation="add_email_analyses")
+    def add_email_analyses(self, items: Sequence[Tuple[Dict[str, Any], Dict[str, Any]]], user_id: str,
+                           batch_size: Optional[int] = None) -> List[str]:
+        """(e-posta, analiz sonucu) çiftlerini batch'ler halinde upsert et, analiz ID'lerini döndür"""
+        try:
+            batch_size = batch_size or ChromaConfig.INDEX_BATCH_SIZE
+            analysis_ids = []
+            # Aynı batch'te tekrar eden ID upsert'i bozar; son analiz geçerli olur
+            records: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+            for email_data, analysis_result in items:
+                analysis_id, document, metadata = self._email_analysis_record(
+                    email_data or {}, analysis_result or {}, user_id
+                )
+                analysis_ids.append(analysis_id)
+                records[analysis_id] = (document, metadata)
+            
+            ids = list(records)
+            for start in range(0, len(ids), batch_size):
+                batch = ids[start:start + batch_size]
+                self.email_analysis_collection.upsert(
+                    ids=batch,
+                    documents=[records[record_id][0] for record_id in batch],
+                    metadatas=[records[record_id][1] for record_id in batch]
+                )
+            
+            return analysis_ids
+            
+        except Exception as e:
+            logger.error("E-posta analizi ekleme hatası: %s", e)
+            raise
+    
+    def add_email_analysis(self, email_data: Dict[str, Any], analysis_result: Dict[str, Any], user_id: str) -> str:
+        """Tek e-posta analizini kaydet"""
+        return self.add_email_analyses([(email_data, analysis_result)], user_id)[0]
+    
+    def _email_analysis_filter(self, user_id: str, category: Union[str, Sequence[str], None] = None,
+                               date_from: Any = None, date_to: Any = None) -> Dict[str, Any]:
+        """Kullanıcı, kategori ve e-posta tarihi için where filtresi"""
+        clauses: List[Dict[str, Any]] = [{"user_id": user_id}]
+        if category:
+            categories = [category] if isinstance(category, str) else list(category)
+            clauses.append({"category": categories[0]} if len(categories) == 1 else {"category": {"$in": categories}})
+        start = self._timestamp(date_from)
+        if start is not None:
+            clauses.append({"email_ts": {"$gte": start}})
+        end = self._timestamp(date_to, end_of_day=True)
+        if end is not None:
+            clauses.append({"email_ts": {"$lte": end}})
+        return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+    
+    @timed(CHROMA_OPERATION_DURATION, operation="search_email_analysis")
+    def search_email_analysis(self, query: str, user_id: str, limit: Optional[int] = None,
+                              category: Union[str, Sequence[str], None] = None,
+                              date_from: Any = None, date_to: Any = None) -> List[Dict[str, Any]]:
+        """E-posta analizlerinde kullanıcı/kategori/tarih filtreli top-k semantik arama"""
+        try:
+            limit = max(1, min(limit or ChromaConfig.DEFAULT_SEARCH_LIMIT, ChromaConfig.MAX_SEARCH_LIMIT))
+            results = self.email_analysis_collection.query(
+                query_texts=[query],
+                n_results=limit,
+                where=self._email_analysis_filter(user_id, category, date_from, date_to),
+                include=["documents", "metadatas", "distances"]
+            )
+            
+            ids = results["ids"][0] if results["ids"] else []
+            documents = results["documents"][0] if results.get("documents") else [None] * len(ids)
+            metadatas = results["metadatas"][0] if results.get("metadatas") else [None] * len(ids)
+            distances = results["distances"][0] if results.get("distances") else [None] * len(ids)
+            return [
+                {
+                    "id": analysis_id,
+                    "document": documents[index],
+                    "metadata": metadatas[index],
+                    "distance": distances[index]
+                }
+                for index, analysis_id in enumerate(ids)
+            ]
+            
+        except Exception as e:
+            logger.error("E-posta analizi arama hatası: %s", e)
+            raise
+    
+    @timed(CHROMA_OPERATION_DURATION, operation="get_collection_stats")
     def get_collection_stats(self) -> Dict[str, Any]:
         """Koleksiyon istatistikleri"""
         try:
@@ -254,6 +584,7 @@ class ChromaService:
                 "success": True,
                 "collection_name": "applications",
                 "total_documents": count,
+                "email_analysis_documents": self.email_analysis_collection.count(),
                 "embedding_model": "all-MiniLM-L6-v2",
                 "vector_space": "cosine"
             }
@@ -0,0 +1,149 @@
+"""
+Sınıflandırma backend'lerinin toplu değerlendirmesi
+
+Her backend test setinin tamamını aynı batch'lerle sınıflandırır; doğruluk, sınıf bazlı
+F1, karışıklık matrisi ile batch gecikmesi ve throughput aynı raporda karşılaştırılır.
+
+Kullanım:
+    python -m src.services.classifier_evaluation --data data/labeled_emails_test.jsonl --batch-size 32
+"""
+import json
+import time
+import argparse
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import numpy as np
+from sklearn.metrics import accuracy_score, confusion_matrix, precision_recall_fscore_support
+from ..utils.data_loading import load_json_records
+
+# texts -> kategori adları
+BatchPredictor = Callable[[List[str]], List[str]]
+
+
+def classification_metrics(true_labels: Sequence[str], predictions: Sequence[str],
+                           labels: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """Doğruluk, sınıf bazlı precision/recall/F1 ve karışıklık matrisi"""
+    labels = list(labels) if labels else sorted(set(true_labels) | set(predictions))
+    precision, recall, f1, support = precision_recall_fscore_support(
+        true_labels, predictions, labels=labels, zero_division=0
+    )
+    matrix = confusion_matrix(true_labels, predictions, labels=labels)
+    return {
+        "accuracy": round(float(accuracy_score(true_labels, predictions)), 4),
+        "macro_f1": round(float(f1[support > 0].mean()) if support.any() else 0.0, 4),
+        "per_class": {
+            label: {
+                "precision": round(float(precision[i]), 4),
+                "recall": round(float(recall[i]), 4),
+                "f1": round(float(f1[i]), 4),
+                "support": int(support[i])
+            }
+            for i, label in enumerate(labels)
+        },
+        # Satırlar gerçek, sütunlar tahmin edilen kategori
+        "confusion_matrix": {"labels": labels, "matrix": matrix.tolist()}
+    }
+
+
+def run_batched(predict: BatchPredictor, texts: Sequence[str], batch_size: int):
+    """Metinleri batch'ler halinde sınıflandır, tahminleri ve batch sürelerini döndür"""
+    predictions: List[str] = []
+    durations: List[float] = []
+    for start in range(0, len(texts), batch_size):
+        batch = list(texts[start:start + batch_size])
+        started = time.perf_counter()
+        predictions.extend(predict(batch))
+        durations.append(time.perf_counter() - started)
+    return predictions, durations
+
+
+def latency_report(durations: Sequence[float], samples: int, batch_size: int) -> Dict[str, Any]:
+    """Batch gecikmesi yüzdelikleri ve throughput"""
+    if not durations:
+        return {"batches": 0}
+    milliseconds = np.asarray(durations) * 1000
+    total = float(sum(durations))
+    return {
+        "batches": len(durations),
+        "batch_size": batch_size,
+        "total_seconds": round(total, 4),
+        "mean_batch_ms": round(float(milliseconds.mean()), 3),
+        "p50_batch_ms": round(float(np.percentile(milliseconds, 50)), 3),
+        "p95_batch_ms": round(float(np.percentile(milliseconds, 95)), 3),
+        "max_batch_ms": round(float(milliseconds.max()), 3),
+        "ms_per_sample": round(total * 1000 / samples, 4) if samples else None,
+        "samples_per_second": round(samples / total, 1) if total else None
+    }
+
+
+def evaluate_backends(predictors: Dict[str, BatchPredictor], texts: Sequence[str],
+                      true_labels: Sequence[str], batch_size: int = 32,
+                      labels: Optional[Sequence[str]] = None, warmup: bool = True) -> Dict[str, Any]:
+    """
+    Her backend'i aynı test seti üzerinde değerlendir
+
+    Args:
+        predictors: backend adı -> toplu tahmin fonksiyonu
+        texts: Test metinleri
+        true_labels: Gerçek kategoriler
+        batch_size: Batch boyutu
+        labels: Raporlanacak kategori sırası
+        warmup: İlk batch'in (lazy yükleme, JIT vb.) ölçüme girmemesi için önce bir kez çalıştır
+    """
+    backends: Dict[str, Any] = {}
+    for name, predict in predictors.items():
+        try:
+            if warmup and texts:
+                predict(list(texts[:batch_size]))
+            predictions, durations = run_batched(predict, texts, batch_size)
+            backends[name] = {
+                **classification_metrics(true_labels, predictions, labels),
+                "latency": latency_report(durations, len(texts), batch_size)
+            }
+        except Exception as e:
+            print(f"⚠️ {name} backend'i değerlendirilemedi: {e}")
+            backends[name] = {"error": str(e)}
+
+    ranked = [
+        {
+            "backend": name,
+            "accuracy": report["accuracy"],
+            "macro_f1": report["macro_f1"],
+            "samples_per_second": report["latency"].get("samples_per_second")
+        }
+        for name, report in backends.items() if "error" not in report
+    ]
+    ranked.sort(key=lambda row: (row["macro_f1"], row["samples_per_second"] or 0), reverse=True)
+
+    return {
+        "samples": len(texts),
+        "batch_size": batch_size,
+        "backends": backends,
+        "summary": ranked
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sınıflandırma backend'lerini toplu değerlendir")
+    parser.add_argument("--data", required=True, help='Etiketli test verisi (JSON/JSONL, {"text", "label"})')
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--backends", help="Virgülle ayrılmış backend listesi (varsayılan: mevcut olanların hepsi)")
+    parser.add_argument("--report", help="Raporun yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    from .advanced_email_classifier import advanced_email_classifier
+
+    report = advanced_email_classifier.evaluate_model(
+        load_json_records(args.data),
+        backends=args.backends.split(",") if args.backends else None,
+        batch_size=args.batch_size
+    )
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""
+BERT etiketleriyle hafif e-posta sınıflandırıcı eğitimi (distillation)
+
+Kullanım:
+    python -m src.services.distillation --corpus data/email_corpus.jsonl
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from typing import TYPE_CHECKING, List, Dict, Optional, Any, Sequence, Callable
+from datetime import datetime
+from ..config.classifier_config import ClassifierConfig
+from ..utils.data_loading import load_json_records
+
+if TYPE_CHECKING:
+    from sklearn.pipeline import Pipeline
+
+MANIFEST_FILE = "manifest.json"
+MODEL_FILE = "model.joblib"
+
+
+class DistilledEmailClassifier:
+    """
+    Hashing vectorizer + lojistik regresyon tabanlı kompakt sınıflandırıcı
+
+    BERT'in ürettiği etiketlerle eğitilir. Kelime dağarcığı tutmadığı için modeli küçüktür
+    ve CPU'da tek e-postayı mikro saniyeler mertebesinde sınıflandırır.
+    Her eğitim `v<numara>` dizinine model ve manifest olarak kaydedilir; en yeni
+    versiyon ilk kullanımda yüklenir.
+    """
+
+    def __init__(self, model_dir: Optional[str] = None):
+        self.model_dir = model_dir
+        self.pipeline: Optional["Pipeline"] = None
+        self.manifest: Dict[str, Any] = {}
+        self._load_attempted = False
+
+    def _ensure_loaded(self):
+        if self.pipeline is None and not self._load_attempted:
+            self._load_attempted = True
+            if self.model_dir:
+                self.load_latest(self.model_dir)
+
+    @property
+    def is_ready(self) -> bool:
+        self._ensure_loaded()
+        return self.pipeline is not None
+
+    @property
+    def version(self) -> Optional[int]:
+        self._ensure_loaded()
+        return self.manifest.get("version")
+
+    @staticmethod
+    def build_pipeline(n_features: int = 2 ** 18) -> "Pipeline":
+        from sklearn.feature_extraction.text import HashingVectorizer
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.pipeline import Pipeline
+
+        return Pipeline([
+            ("hashing", HashingVectorizer(
+                n_features=n_features,
+                ngram_range=(1, 2),
+                alternate_sign=False,
+                norm="l2",
+                lowercase=True
+            )),
+            ("clf", LogisticRegression(max_iter=1000, C=8.0))
+        ])
+
+    def classify(self, text: str) -> Optional[Dict[str, Any]]:
+        """E-postayı sınıflandır, model yoksa None döndür"""
+        if not self.is_ready:
+            return None
+        probabilities = self.pipeline.predict_proba([text])[0]
+        classes = self.pipeline.classes_
+        best = int(probabilities.argmax())
+        return {
+            "label": str(classes[best]),
+            "score": round(float(probabilities[best]), 4),
+            "distribution": {
+                str(label): round(float(probability), 4)
+                for label, probability in zip(classes, probabilities)
+            }
+        }
+
+    def predict(self, texts: Sequence[str]) -> List[str]:
+        """Toplu tahmin"""
+        if not self.is_ready:
+            raise ValueError("Distilled model yüklenmedi")
+        return [str(label) for label in self.pipeline.predict(list(texts))]
+
+    @staticmethod
+    def list_versions(model_dir: str) -> List[int]:
+        """Kayıtlı model versiyonlarını döndür"""
+        if not os.path.isdir(model_dir):
+            return []
+        versions = []
+        for name in os.listdir(model_dir):
+            if name.startswith("v") and name[1:].isdigit() and \
+                    os.path.exists(os.path.join(model_dir, name, MANIFEST_FILE)):
+                versions.append(int(name[1:]))
+        return sorted(versions)
+
+    def save(self, model_dir: str, manifest: Dict[str, Any]) -> str:
+        """Modeli bir sonraki versiyon olarak kaydet"""
+        if self.pipeline is None:
+            raise ValueError("Kaydedilecek eğitilmiş model yok")
+        versions = self.list_versions(model_dir)
+        version = (versions[-1] + 1) if versions else 1
+        version_dir = os.path.join(model_dir, f"v{version}")
+        os.makedirs(version_dir, exist_ok=True)
+
+        import joblib
+
+        joblib.dump(self.pipeline, os.path.join(version_dir, MODEL_FILE))
+        self.manifest = {**manifest, "version": version}
+        with open(os.path.join(version_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        return version_dir
+
+    def load(self, version_dir: str) -> bool:
+        """Belirli bir versiyonu yükle"""
+        try:
+            import joblib
+
+            with open(os.path.join(version_dir, MANIFEST_FILE), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            self.pipeline = joblib.load(os.path.join(version_dir, MODEL_FILE))
+            self.manifest = manifest
+            print(f"✅ Distilled sınıflandırıcı yüklendi: v{manifest.get('version')}")
+            return True
+        except Exception as e:
+            print(f"⚠️ Distilled sınıflandırıcı yüklenemedi: {e}")
+            return False
+
+    def load_latest(self, model_dir: str) -> bool:
+        """En yeni versiyonu yükle"""
+        versions = self.list_versions(model_dir)
+        if not versions:
+            return False
+        return self.load(os.path.join(model_dir, f"v{versions[-1]}"))
+
+
+def load_corpus(path: str) -> List[str]:
+    """
+    Geçmiş e-posta korpusunu yükle
+
+    JSON listesi ya da JSONL kabul edilir; her kayıt düz metin veya
+    subject/body (ya da content) alanları olan bir sözlük olabilir.
+    """
+    texts = []
+    for record in load_json_records(path):
+        if isinstance(record, str):
+            text = record
+        else:
+            body = record.get("body") or record.get("content") or record.get("text") or ""
+            text = f"{record.get('subject', '')} {body}".strip()
+        if text:
+            texts.append(text)
+    return texts
+
+
+def distill(texts: Sequence[str], teacher: Callable[[List[str]], List[str]],
+            model_dir: str, test_size: float = 0.2,
+            teacher_name: str = "bert", batch_size: int = 32,
+            categories: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """
+    Öğretmen modelin etiketleriyle kompakt modeli eğit ve kaydet
+
+    Args:
+        texts: Etiketsiz e-posta metinleri
+        teacher: Metin listesini kategorilere çeviren toplu öğretmen fonksiyonu (BERT)
+        model_dir: Versiyonların kaydedileceği dizin
+        test_size: Uyum raporu için ayrılan oran
+        batch_size: Öğretmene tek çağrıda verilen metin sayısı
+        categories: Geçerli kategori adları; verilirse dışındaki etiketler reddedilir
+
+    Returns:
+        Uyum ve hız raporu
+    """
+    from sklearn.model_selection import train_test_split
+
+    print(f"🔄 {len(texts)} e-posta öğretmen modelle etiketleniyor...")
+    started = time.perf_counter()
+    labels: List[str] = []
+    for start in range(0, len(texts), batch_size):
+        labels.extend(teacher(list(texts[start:start + batch_size])))
+    teacher_seconds = time.perf_counter() - started
+
+    if categories is not None:
+        unknown = sorted(set(labels) - set(categories))
+        if unknown:
+            # Ör. id2label'sız sınıflandırma başlığının LABEL_N çıktıları servis edilecek kategori olamaz
+            raise ValueError(f"Öğretmen model bilinmeyen kategoriler üretti: {', '.join(unknown[:5])}")
+
+    if len(set(labels)) < 2:
+        raise ValueError("Öğretmen model en az iki farklı kategori üretmeli")
+
+    stratify = labels if min(labels.count(label) for label in set(labels)) >= 2 else None
+    train_texts, test_texts, train_labels, test_labels = train_test_split(
+        list(texts), labels, test_size=test_size, random_state=42, stratify=stratify
+    )
+
+    student = DistilledEmailClassifier()
+    student.pipeline = DistilledEmailClassifier.build_pipeline()
+    student.pipeline.fit(train_texts, train_labels)
+
+    predictions = student.predict(test_texts)
+
+    # Öğrenci servis edildiği gibi tek tek e-posta üzerinden ölçülür (öğretmen süresi toplu etiketlemeden gelir)
+    timing_texts = test_texts[:200]
+    started = time.perf_counter()
+    for text in timing_texts:
+        student.classify(text)
+    student_seconds = time.perf_counter() - started
+
+    agreement = sum(1 for a, b in zip(predictions, test_labels) if a == b) / max(len(test_labels), 1)
+    per_class = {}
+    for label in sorted(set(test_labels)):
+        indices = [i for i, value in enumerate(test_labels) if value == label]
+        matched = sum(1 for i in indices if predictions[i] == label)
+        per_class[label] = {"support": len(indices), "agreement": round(matched / len(indices), 4)}
+
+    teacher_ms = teacher_seconds / max(len(texts), 1) * 1000
+    student_ms = student_seconds / max(len(timing_texts), 1) * 1000
+    report = {
+        "teacher_model": teacher_name,
+        "created_at": datetime.now().isoformat(),
+        "samples": len(texts),
+        "train_samples": len(train_texts),
+        "test_samples": len(test_texts),
+        "categories": sorted(set(labels)),
+        "agreement": round(agreement, 4),
+        "per_class_agreement": per_class,
+        "teacher_ms_per_email": round(teacher_ms, 4),
+        "student_ms_per_email": round(student_ms, 4),
+        "speedup": round(teacher_ms / student_ms, 1) if student_ms else None
+    }
+
+    version_dir = student.save(model_dir, report)
+    report["version"] = student.version
+    report["model_dir"] = version_dir
+    print(f"✅ Distilled model kaydedildi: {version_dir} (uyum: {agreement:.2%})")
+    return report
+
+
+# Global servis instance'ı
+distilled_email_classifier = DistilledEmailClassifier(ClassifierConfig.DISTILLED_MODEL_DIR)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BERT etiketleriyle kompakt e-posta sınıflandırıcı eğit")
+    parser.add_argument("--corpus", required=True, help="E-posta korpusu (JSON veya JSONL)")
+    parser.add_argument("--output", default=ClassifierConfig.DISTILLED_MODEL_DIR, help="Model dizini")
+    parser.add_argument("--test-size", type=float, default=0.2, help="Uyum raporu için ayrılan oran")
+    parser.add_argument("--batch-size", type=int, default=32, help="Öğretmen modele tek seferde verilen e-posta")
+    parser.add_argument("--report", help="Raporun yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    from .advanced_email_classifier import advanced_email_classifier
+
+    # Öğretmen BERT değilse _classify_with_bert kural etiketlerine düşer ve model kurallardan damıtılırdı
+    if not advanced_email_classifier._ensure_models():
+        print("❌ BERT modeli yüklenemedi (EMAIL_BERT_ENABLED, torch/transformers kurulumu); damıtma yapılmadı")
+        sys.exit(1)
+
+    texts = load_corpus(args.corpus)
+    report = distill(
+        texts,
+        # Pipeline çıktısı LABEL_N olur; toplu tahmin argmax'ı kategori adlarına çevirir
+        teacher=advanced_email_classifier._predict_bert_batch,
+        model_dir=args.output,
+        test_size=args.test_size,
+        teacher_name=advanced_email_classifier.model_name,
+        batch_size=args.batch_size,
+        categories=list(advanced_email_classifier.categories)
+    )
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
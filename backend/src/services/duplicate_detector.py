@@ -0,0 +1,257 @@
+import re
+import random
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
+from email.utils import parsedate_to_datetime
+from datetime import datetime
+from ..config.settings import settings
+
+# Analizörün bilgi bulunamadığında yazdığı değerler eşleştirmede boş sayılır
+PLACEHOLDER_VALUES = frozenset({
+    "bilinmeyen", "bilinmeyen şirket", "bilinmeyen pozisyon", "belirlenemedi", "pozisyon belirlenemedi",
+    "belirtilmemiş", "bilinmiyor", "unknown"
+})
+
+# Şirket adındaki hukuki ekler ve gönderen ekibi kelimeleri ("Acme A.Ş. İK" ile "Acme" aynı şirkettir)
+COMPANY_STOPWORDS = frozenset("""
+    inc ltd llc co corp corporation gmbh plc ag bv limited sti tic san ve as anonim sirketi
+    team ekibi careers kariyer recruiting recruitment talent hr ik insan kaynaklari
+""".split())
+
+POSITION_STOPWORDS = frozenset("pozisyonu pozisyon position role rolu for icin olarak".split())
+
+ASCII_FOLD = str.maketrans("çğıöşüâîû", "cgiosuaiu")
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+LINK_PATTERN = re.compile(r"https?://\S+|www\.\S+|\S+@\S+")
+DIGIT_PATTERN = re.compile(r"\d+")
+
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 16
+LSH_ROWS = MINHASH_PERMUTATIONS // LSH_BANDS
+BODY_MAX_CHARS = 1000  # şablon farkı gövdenin başında görülür
+
+# İmzalar sadece bellekteki indekste tutulur; özetler süreç içinde tutarlı olması yeterli olan hash() ile alınır.
+# MinHash permütasyonları özetin sabit maskelerle XOR'lanmasıyla elde edilir (min() C tarafında çalışır)
+_MASKS = [random.Random(20240501 + index).getrandbits(64) for index in range(MINHASH_PERMUTATIONS)]
+
+
+class Signature(NamedTuple):
+    """Başvurunun yakın kopya imzası"""
+    company: FrozenSet[str]
+    position: FrozenSet[str]
+    body: Optional[int]
+    minhash: Tuple[int, ...]
+    timestamp: float
+
+
+def normalize(text: str, drop_digits: bool = False) -> str:
+    """Küçük harf, Türkçe karakterleri ASCII'ye indir; noktalama, URL ve e-posta adreslerini at"""
+    text = LINK_PATTERN.sub(" ", str(text or "").replace("İ", "i").lower().translate(ASCII_FOLD))
+    if drop_digits:
+        # Gövdedeki tarih, saat ve referans numaraları e-postadan e-postaya değişir
+        text = DIGIT_PATTERN.sub(" ", text)
+    return " ".join(TOKEN_PATTERN.findall(text))
+
+
+def is_placeholder(value) -> bool:
+    """Boş ya da analizörün "bulunamadı" değeri mi"""
+    return not value or str(value).strip().lower() in PLACEHOLDER_VALUES
+
+
+def _hash64(feature: str) -> int:
+    return hash(feature) & 0xFFFFFFFFFFFFFFFF
+
+
+def _trigrams(tokens: List[str]) -> FrozenSet[str]:
+    if not tokens:
+        return frozenset()
+    text = f" {' '.join(tokens)} "
+    return frozenset(text[i:i + 3] for i in range(len(text) - 2))
+
+
+def minhash(features: Iterable[str]) -> Tuple[int, ...]:
+    """Özellik kümesinin MinHash imzası"""
+    hashes = [_hash64(feature) for feature in features]
+    if not hashes:
+        return ()
+    return tuple(min(map(mask.__xor__, hashes)) for mask in _MASKS)
+
+
+def simhash(tokens: List[str]) -> Optional[int]:
+    """Tekil kelime ikilileri üzerinden 64 bitlik SimHash"""
+    features = {f"{first} {second}" for first, second in zip(tokens, tokens[1:])} or set(tokens)
+    if not features:
+        return None
+    # Bit başına çoğunluk oylaması: özet bitleri sütunlara çevrilip C tarafında sayılır
+    bits = [format(_hash64(feature), "064b") for feature in features]
+    half = len(bits) / 2
+    return int("".join("1" if column.count("1") > half else "0" for column in zip(*bits)), 2)
+
+
+def jaccard(first: FrozenSet[str], second: FrozenSet[str]) -> float:
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+def hamming(first: int, second: int) -> int:
+    return bin(first ^ second).count("1")
+
+
+def _timestamp(value) -> float:
+    if not value:
+        return 0.0
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(str(value)).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return 0.0
+
+
+class DuplicateDetector:
+    """
+    Yakın kopya başvuru eşleştirme kuralları
+
+    Şirket adı 3-gram kümesinin MinHash imzası LSH bantlarına bölünerek aday bulmada kullanılır.
+    Adaylar kesin ölçülerle doğrulanır: şirket benzerliği eşiği geçmeli ve e-postalar zaman
+    penceresi içinde olmalı; iki tarafta da pozisyon varsa pozisyon benzerliğine, yoksa gövde
+    SimHash mesafesine bakılır. Birleştirme kaydın e-posta alanlarını ve durumunu değiştirdiği
+    için eşikler yanlış birleştirmeyi önleyecek kadar sıkıdır: pozisyonu bilinmeyen e-posta,
+    şirketin tek başvurusu olsa bile gövdesi benzemiyorsa bağlanmaz.
+    """
+
+    def __init__(self, company_threshold: float = None, position_threshold: float = None,
+                 body_max_distance: int = None, window_days: int = None):
+        self.company_threshold = settings.DUPLICATE_COMPANY_THRESHOLD if company_threshold is None else company_threshold
+        self.position_threshold = settings.DUPLICATE_POSITION_THRESHOLD if position_threshold is None else position_threshold
+        self.body_max_distance = settings.DUPLICATE_BODY_MAX_DISTANCE if body_max_distance is None else body_max_distance
+        window_days = settings.DUPLICATE_WINDOW_DAYS if window_days is None else window_days
+        self.window_seconds = window_days * 86400
+
+    def signature(self, app: Dict) -> Signature:
+        """Başvurunun şirket, pozisyon ve gövde imzası"""
+        company = app.get("company_name") or app.get("sirket")
+        position = app.get("position") or app.get("baslik")
+        company_tokens = [] if is_placeholder(company) else [
+            token for token in normalize(company).split() if len(token) > 1 and token not in COMPANY_STOPWORDS
+        ]
+        position_tokens = [] if is_placeholder(position) else [
+            token for token in normalize(position).split() if token not in POSITION_STOPWORDS
+        ]
+        body = app.get("email_content") or app.get("email_body") or ""
+        company_grams = _trigrams(company_tokens)
+        return Signature(
+            company=company_grams,
+            position=_trigrams(position_tokens),
+            body=simhash(normalize(str(body)[:BODY_MAX_CHARS], drop_digits=True).split()),
+            minhash=minhash(company_grams),
+            timestamp=_timestamp(app.get("email_date") or app.get("created_at"))
+        )
+
+    def same_company(self, signature: Signature, other: Signature) -> bool:
+        """Şirket eşleşiyor ve e-postalar zaman penceresi içinde mi"""
+        if jaccard(signature.company, other.company) < self.company_threshold:
+            return False
+        if signature.timestamp and other.timestamp and abs(signature.timestamp - other.timestamp) > self.window_seconds:
+            return False
+        return True
+
+    def score(self, signature: Signature, other: Signature) -> Optional[float]:
+        """Aynı şirket olduğu bilinen iki imzanın yakın kopya skoru; kopya değilse None"""
+        if signature.position and other.position:
+            position = jaccard(signature.position, other.position)
+            return position if position >= self.position_threshold else None
+        if signature.body is not None and other.body is not None:
+            distance = hamming(signature.body, other.body)
+            if distance <= self.body_max_distance:
+                return 1.0 - distance / 64
+        return None
+
+
+class DuplicateIndex:
+    """
+    Bir kullanıcının başvuruları için LSH indeksi
+
+    Kayıtlar depodaki dict nesnesinin kimliğiyle izlenir (ApplicationViews gibi); ekleme,
+    güncelleme ve silme sadece ilgili kovaları değiştirir.
+    """
+
+    def __init__(self, detector: DuplicateDetector):
+        self.detector = detector
+        self.entries: Dict[int, Tuple[Dict, Signature]] = {}
+        # find() ile hesaplanan son imza; kayıt hemen ardından eklenirse yeniden hesaplanmaz
+        self._last_signature: Optional[Tuple[int, Signature]] = None
+        self.buckets: List[Dict[Tuple[int, ...], Set[int]]] = [{} for _ in range(LSH_BANDS)]
+
+    @staticmethod
+    def _bands(signature: Signature) -> Iterable[Tuple[int, Tuple[int, ...]]]:
+        for band in range(LSH_BANDS if signature.minhash else 0):
+            yield band, signature.minhash[band * LSH_ROWS:(band + 1) * LSH_ROWS]
+
+    def _signature(self, app: Dict) -> Signature:
+        if self._last_signature is not None and self._last_signature[0] == id(app):
+            signature = self._last_signature[1]
+            self._last_signature = None
+            return signature
+        return self.detector.signature(app)
+
+    def add(self, app: Dict):
+        signature = self._signature(app)
+        if not signature.company:
+            # Şirketi bilinmeyen kayıt eşleştirmeye katılmaz
+            return
+        self.entries[id(app)] = (app, signature)
+        for band, key in self._bands(signature):
+            self.buckets[band].setdefault(key, set()).add(id(app))
+
+    def remove(self, app: Dict):
+        entry = self.entries.pop(id(app), None)
+        if entry is None:
+            return
+        for band, key in self._bands(entry[1]):
+            bucket = self.buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(id(app))
+                if not bucket:
+                    del self.buckets[band][key]
+
+    def update(self, app: Dict):
+        self.remove(app)
+        self._last_signature = None
+        self.add(app)
+
+    def rebuild(self, applications: List[Dict]):
+        self.entries.clear()
+        for buckets in self.buckets:
+            buckets.clear()
+        for app in applications:
+            self.add(app)
+
+    def find(self, app: Dict) -> Optional[Dict]:
+        """Başvurunun yakın kopyası olan mevcut kaydı döndür"""
+        signature = self.detector.signature(app)
+        self._last_signature = (id(app), signature)
+        if not signature.company:
+            return None
+        candidates: Set[int] = set()
+        for band, key in self._bands(signature):
+            candidates.update(self.buckets[band].get(key, ()))
+
+        best, best_score = None, None
+        for candidate in candidates:
+            existing, other = self.entries[candidate]
+            if existing is app or not self.detector.same_company(signature, other):
+                continue
+            score = self.detector.score(signature, other)
+            if score is not None and (best_score is None or score > best_score):
+                best, best_score = existing, score
+        return best
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+# Global servis instance'ı
+duplicate_detector = DuplicateDetector()
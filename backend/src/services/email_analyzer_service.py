@@ -3,13 +3,12 @@ import json
 import email
 from email.header import decode_header
 from typing import List, Dict, Optional
-from langdetect import detect
 import unicodedata
 from datetime import datetime
 from fastapi import HTTPException
 import httpx
-from bs4 import BeautifulSoup
 from ..config.settings import settings
+from ..utils.metrics import CLASSIFIER_BATCH_SIZE
 
 # Yeni gelişmiş sınıflandırıcıyı import et
 try:
@@ -114,6 +113,7 @@ class EmailAnalyzerService:
 
     async def _analyze_emails_legacy(self, emails: List[Dict]) -> Dict:
         """Eski TF-IDF tabanlı analiz sistemi"""
+        CLASSIFIER_BATCH_SIZE.observe(len(emails), analyzer="legacy")
         analyzed = []
         for email in emails:
             result = await self.analyze_single_email(email)
@@ -461,6 +461,8 @@ Cevap formatı (JSON):
         return html, images
 
     def extract_text_from_html(html):
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(html, "html.parser")
         return soup.get_text(separator="\n").strip()
 
@@ -1,14 +1,16 @@
 import re
 import json
 import email
+import asyncio
 from email.header import decode_header
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from fastapi import HTTPException
 import httpx
-from bs4 import BeautifulSoup
 from .advanced_email_classifier import advanced_email_classifier, EmailClassificationResult
+from .learning_store import learning_store
 from ..config.settings import settings
+from ..utils.metrics import CLASSIFIER_BATCH_SIZE
 
 class EnhancedEmailAnalyzer:
     """
@@ -41,19 +43,21 @@ class EnhancedEmailAnalyzer:
             "reddedildi": 9
         }
         
-        # Şirket bazlı öğrenme
-        self.company_learning = {}
-        
-        # E-posta türü bazlı öğrenme
-        self.email_type_learning = {}
+        # Şirket ve e-posta türü bazlı öğrenme sayaçları (kalıcı, worker'lar arası toplanır)
+        self.learning_store = learning_store
     
     async def analyze_emails(self, emails: List[Dict]) -> Dict:
         """E-postaları gelişmiş analiz ile işle"""
         if not emails:
             raise HTTPException(status_code=400, detail="Analiz edilecek e-posta yok")
 
+        CLASSIFIER_BATCH_SIZE.observe(len(emails), analyzer="enhanced")
         analyzed = []
         learning_data = []
+
+        # Öğrenme deposunun SQLite erişimleri event loop'u bloklamasın diye thread'de yapılır;
+        # e-posta başına tanıma kontrolleri bellekteki kümelerden cevaplanır
+        await asyncio.to_thread(self.learning_store.ensure_known)
         
         for email in emails:
             try:
@@ -73,7 +77,8 @@ class EnhancedEmailAnalyzer:
                     })
                     
                     # Durum tabanlı öğrenme güncelle
-                    self._update_learning_data(result)
+                    if self._update_learning_data(result):
+                        await asyncio.to_thread(self.learning_store.flush)
                 
             except Exception as e:
                 print(f"E-posta analiz hatası: {e}")
@@ -81,14 +86,17 @@ class EnhancedEmailAnalyzer:
         
         # Model öğrenmesini güncelle
         if learning_data:
+            # Bu istekte biriken sayaçlar tek transaction ile yazılır
+            await asyncio.to_thread(self.learning_store.flush)
             await self._update_model_learning(learning_data)
         
+        model_confidence = await asyncio.to_thread(self._calculate_model_confidence)
         return {
             "applications": analyzed,
             "totalFound": len(analyzed),
             "message": f"{len(analyzed)} adet başvuru e-postası bulundu",
             "learning_updated": len(learning_data) > 0,
-            "model_confidence": self._calculate_model_confidence()
+            "model_confidence": model_confidence
         }
     
     async def analyze_single_email_enhanced(self, email: Dict) -> Optional[Dict]:
@@ -151,13 +159,13 @@ class EnhancedEmailAnalyzer:
         try:
             # Şirket tanıdıklığı
             company_name = classification.extracted_info.get("sirket", "")
-            if company_name in self.company_learning:
+            if self.learning_store.knows_company(company_name):
                 context["company_familiarity"] = "familiar"
                 context["application_stage"] = self._predict_next_stage(company_name)
             
             # E-posta türü sıklığı
             email_type = classification.category
-            if email_type in self.email_type_learning:
+            if self.learning_store.knows_email_type(email_type):
                 context["email_type_frequency"] = "common"
             
             # Aciliyet seviyesi
@@ -559,38 +567,25 @@ class EnhancedEmailAnalyzer:
     
     def _predict_next_stage(self, company_name: str) -> str:
         """Sonraki aşamayı tahmin et"""
-        if company_name in self.company_learning:
-            company_data = self.company_learning[company_name]
+        if self.learning_store.knows_company(company_name):
             # Basit tahmin algoritması
             return "mulakat"  # Varsayılan olarak mülakat aşaması
         
         return "unknown"
     
-    def _update_learning_data(self, result: Dict[str, Any]):
-        """Öğrenme verilerini güncelle"""
+    def _update_learning_data(self, result: Dict[str, Any]) -> bool:
+        """Öğrenme verilerini güncelle, flush zamanı geldiyse True döndür"""
         try:
-            company_name = result.get("company_name", "")
-            if company_name:
-                if company_name not in self.company_learning:
-                    self.company_learning[company_name] = {
-                        "first_application": datetime.now().isoformat(),
-                        "application_count": 0,
-                        "stages": [],
-                        "response_time": []
-                    }
-                
-                self.company_learning[company_name]["application_count"] += 1
-                self.company_learning[company_name]["stages"].append(result.get("status", ""))
-            
-            # E-posta türü öğrenmesi
-            email_type = result.get("category", "")
-            if email_type:
-                if email_type not in self.email_type_learning:
-                    self.email_type_learning[email_type] = 0
-                self.email_type_learning[email_type] += 1
-                
+            # Yazma çağırana bırakılır; analyze_emails flush'ı thread'de yapar
+            return self.learning_store.record(
+                company=result.get("company_name", ""),
+                stage=result.get("status", ""),
+                email_type=result.get("category", ""),
+                autoflush=False
+            )
         except Exception as e:
             print(f"Öğrenme verisi güncelleme hatası: {e}")
+            return False
     
     async def _update_model_learning(self, learning_data: List[Dict[str, Any]]):
         """Model öğrenmesini güncelle"""
@@ -612,17 +607,18 @@ class EnhancedEmailAnalyzer:
         except Exception as e:
             print(f"Model öğrenme güncelleme hatası: {e}")
     
-    def _calculate_model_confidence(self) -> float:
+    def _calculate_model_confidence(self, email_type_counts: Optional[Dict[str, int]] = None) -> float:
         """Model güven skorunu hesapla"""
         try:
             # Basit güven hesaplama
-            total_emails = sum(self.email_type_learning.values())
+            email_type_counts = self.learning_store.email_type_counts() if email_type_counts is None else email_type_counts
+            total_emails = sum(email_type_counts.values())
             if total_emails == 0:
                 return 0.5
             
             # Başarılı sınıflandırma oranı
             successful_categories = ["etkinlik_daveti", "mulakat_daveti", "teknik_test", "basvuru_onayi"]
-            successful_count = sum(self.email_type_learning.get(cat, 0) for cat in successful_categories)
+            successful_count = sum(email_type_counts.get(cat, 0) for cat in successful_categories)
             
             return successful_count / total_emails
             
@@ -633,35 +629,21 @@ class EnhancedEmailAnalyzer:
     def get_learning_insights(self) -> Dict[str, Any]:
         """Öğrenme içgörülerini getir"""
         try:
-            insights = {
-                "total_companies": len(self.company_learning),
-                "total_email_types": len(self.email_type_learning),
-                "most_common_email_type": "",
-                "most_active_company": "",
-                "model_confidence": self._calculate_model_confidence(),
-                "learning_trends": {}
-            }
-            
-            # En yaygın e-posta türü
-            if self.email_type_learning:
-                insights["most_common_email_type"] = max(
-                    self.email_type_learning, 
-                    key=self.email_type_learning.get
-                )
+            summary = self.learning_store.summary()
+            email_types = summary["email_types"]
+            company_activity = summary["company_activity"]
             
-            # En aktif şirket
-            if self.company_learning:
-                insights["most_active_company"] = max(
-                    self.company_learning,
-                    key=lambda x: self.company_learning[x]["application_count"]
-                )
-            
-            # Öğrenme trendleri
-            insights["learning_trends"] = {
-                "email_type_distribution": self.email_type_learning,
-                "company_activity": {
-                    company: data["application_count"] 
-                    for company, data in self.company_learning.items()
+            insights = {
+                "total_companies": summary["total_companies"],
+                "total_email_types": len(email_types),
+                "most_common_email_type": max(email_types, key=email_types.get) if email_types else "",
+                # Şirketler başvuru sayısına göre azalan sırada gelir
+                "most_active_company": next(iter(company_activity), ""),
+                "model_confidence": self._calculate_model_confidence(email_types),
+                "learning_trends": {
+                    "email_type_distribution": email_types,
+                    "company_activity": company_activity,
+                    "company_stages": summary["company_stages"]
                 }
             }
             
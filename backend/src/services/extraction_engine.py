@@ -0,0 +1,264 @@
+import re
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+
+
+class LazyRule(NamedTuple):
+    """Birleşik tarayıcıya alınmayan, sadece ihtiyaç olduğunda aranan kural"""
+    pattern: str
+    flags: int = 0
+
+
+# Kural tanımı: sadece pattern, (pattern, flags) ikilisi ya da LazyRule
+RuleSpec = Union[str, Tuple[str, int], LazyRule]
+
+
+class ExtractionMatch(NamedTuple):
+    """Tek bir pattern eşleşmesi"""
+    start: int
+    text: str   # group(0)
+    value: str  # pattern'da grup varsa group(1), yoksa group(0)
+
+
+class ExtractionResult:
+    """
+    Tek geçişlik taramanın sonucu
+
+    Her alan için pattern öncelik sırası korunur: `candidates` önce ilk pattern'ın
+    ilk eşleşmesini, sonra ikinci pattern'ınkini döndürür (eski `re.search` döngüsü ile aynı).
+    Aynı pozisyonda başka bir alternatif kazandıysa o pattern ancak ihtiyaç olduğunda,
+    sadece o pozisyonlarda anchored `match` ile kontrol edilir.
+    """
+
+    def __init__(self, engine: "ExtractionEngine", text: str,
+                 hits: Dict[Tuple[str, int], ExtractionMatch], positions: List[int]):
+        self._engine = engine
+        self._text = text
+        self._hits = hits
+        self._positions = positions
+        self._resolved = set()
+
+    def _resolve(self, field: str, index: int) -> Optional[ExtractionMatch]:
+        key = (field, index)
+        hit = self._hits.get(key)
+        if key in self._resolved:
+            return hit
+        rule = self._engine._rules[field][index]
+        if rule.lazy:
+            # Çok geniş fallback pattern'lar taramaya katılmaz, burada ayrıca aranır
+            match = rule.pattern.search(self._text)
+            hit = rule.to_match(match, 0) if match else None
+            self._hits[key] = hit
+            self._resolved.add(key)
+            return hit
+        # Kaydedilen eşleşmeden önceki pozisyonlarda başka bir alternatif kazanmış olabilir
+        limit = hit.start if hit else len(self._text) + 1
+        for pos in self._positions:
+            if pos >= limit:
+                break
+            match = rule.pattern.match(self._text, pos)
+            if match:
+                hit = rule.to_match(match, 0)
+                break
+        self._hits[key] = hit
+        self._resolved.add(key)
+        return hit
+
+    def candidates(self, field: str) -> Iterator[ExtractionMatch]:
+        """Alan için eşleşmeleri pattern öncelik sırasıyla döndür"""
+        for index in range(len(self._engine._rules.get(field, []))):
+            hit = self._resolve(field, index)
+            if hit is not None:
+                yield hit
+
+    def first(self, field: str, validator: Optional[Callable[[ExtractionMatch], bool]] = None) -> Optional[ExtractionMatch]:
+        """Doğrulamayı geçen ilk eşleşmeyi döndür"""
+        for candidate in self.candidates(field):
+            if validator is None or validator(candidate):
+                return candidate
+        return None
+
+
+class _CompiledRule:
+    """Birleşik regex içindeki tek bir kuralın grup bilgileri"""
+
+    def __init__(self, field: str, index: int, pattern: "re.Pattern", group: int, lazy: bool = False):
+        self.field = field
+        self.index = index
+        self.pattern = pattern
+        self.group = group
+        self.lazy = lazy
+        self.has_value_group = pattern.groups > 0
+
+    def to_match(self, match: "re.Match", offset: int) -> ExtractionMatch:
+        text = match.group(offset) or ""
+        value = match.group(offset + 1) if self.has_value_group else text
+        return ExtractionMatch(match.start(), text, value or "")
+
+
+class ExtractionEngine:
+    """
+    Regex tabanlı bilgi çıkarım motoru
+
+    Tüm alanların pattern'larını bir kez compile eder ve isimli gruplarla tek bir
+    birleşik tarayıcıda toplar. Metin `finditer` ile tek geçişte taranır, her alanın
+    değerleri eşleşme akışından doldurulur. `LazyRule` ile işaretlenen geniş
+    fallback pattern'lar taramaya katılmaz, sadece öncekiler sonuç vermezse aranır.
+    """
+
+    def __init__(self, rules: Dict[str, List[RuleSpec]]):
+        self._rules: Dict[str, List[_CompiledRule]] = {}
+        self._by_group: Dict[str, _CompiledRule] = {}
+
+        boundary_alternatives = []
+        other_alternatives = []
+        for field_index, (field, specs) in enumerate(rules.items()):
+            compiled_rules = []
+            for index, spec in enumerate(specs):
+                lazy = isinstance(spec, LazyRule)
+                pattern, flags = (spec, 0) if isinstance(spec, str) else tuple(spec)
+                compiled = re.compile(pattern, flags)
+
+                if lazy:
+                    compiled_rules.append(_CompiledRule(field, index, compiled, 0, lazy=True))
+                    continue
+
+                group_name = f"r{field_index}_{index}"
+                rule = _CompiledRule(field, index, compiled, 0)
+
+                # Flag'ler her alternatife scoped olarak uygulanır
+                scope = "(?i:" if flags & re.IGNORECASE else "(?-i:"
+                # Baştaki \b ortak kontrole alınır; kelime ortasındaki pozisyonlar tek adımda elenir
+                if pattern.startswith(r"\b"):
+                    boundary_alternatives.append(f"(?P<{group_name}>{scope}{pattern[2:]}))")
+                else:
+                    other_alternatives.append(f"(?P<{group_name}>{scope}{pattern}))")
+
+                compiled_rules.append(rule)
+                self._by_group[group_name] = rule
+            self._rules[field] = compiled_rules
+
+        alternatives = list(other_alternatives)
+        if boundary_alternatives:
+            alternatives.insert(0, r"\b(?:" + "|".join(boundary_alternatives) + ")")
+        # Lookahead sayesinde eşleşmeler metni tüketmez, iç içe geçen alanlar da yakalanır
+        self._scanner = re.compile("(?=" + "|".join(alternatives) + ")") if alternatives else None
+        self._scanned_rule_count = len(self._by_group)
+        # Alternatifler yeniden sıralandığı için grup numaraları derlenmiş regex'ten alınır
+        if self._scanner is not None:
+            for group_name, rule in self._by_group.items():
+                rule.group = self._scanner.groupindex[group_name]
+
+    @property
+    def fields(self) -> List[str]:
+        return list(self._rules)
+
+    def patterns(self, field: str) -> List["re.Pattern"]:
+        """Alanın compile edilmiş pattern'larını döndür (geriye uyumluluk için)"""
+        return [rule.pattern for rule in self._rules.get(field, [])]
+
+    def scan(self, text: str) -> ExtractionResult:
+        """Metni tek geçişte tara"""
+        hits: Dict[Tuple[str, int], ExtractionMatch] = {}
+        positions: List[int] = []
+
+        if self._scanner is None:
+            return ExtractionResult(self, text or "", hits, positions)
+
+        for match in self._scanner.finditer(text or ""):
+            rule = self._by_group[match.lastgroup]
+            positions.append(match.start())
+            key = (rule.field, rule.index)
+            if key not in hits:
+                hits[key] = rule.to_match(match, rule.group)
+                # Tüm kurallar bulunduysa kalan metni taramaya gerek yok
+                if len(hits) == self._scanned_rule_count:
+                    break
+
+        return ExtractionResult(self, text or "", hits, positions)
+
+
+# =============================================================================
+# Ortak kural setleri
+# =============================================================================
+
+_TR_MONTHS = "Ocak|Şubat|Mart|Nisan|Mayıs|Haziran|Temmuz|Ağustos|Eylül|Ekim|Kasım|Aralık"
+_EN_MONTHS = "January|February|March|April|May|June|July|August|September|October|November|December"
+
+_POSITION_TITLES = (
+    r"\b(?:senior|junior|lead|principal)?\s*(?:software|backend|frontend|full.?stack|data|devops|mobile|web|ui|ux|qa|test|product|project|business|sales|marketing|hr|finance|legal|admin|support|customer|technical|system|network|security|cloud|ai|ml|machine.?learning|artificial.?intelligence|blockchain|game|embedded|firmware|hardware|robotics|automation|analytics|scientist|engineer|developer|architect|consultant|specialist|analyst|manager|director|coordinator|assistant|designer|researcher|instructor|trainer|writer|editor|translator|interpreter|accountant|auditor|lawyer|attorney|paralegal|nurse|doctor|physician|dentist|pharmacist|teacher|professor|lecturer|student|intern|trainee|apprentice|volunteer|freelancer|contractor|consultant|advisor|mentor|coach|counselor|therapist|psychologist|social.?worker|case.?worker|advocate|mediator|arbitrator|judge|magistrate|prosecutor|defense|attorney|public.?defender|district.?attorney|assistant.?district.?attorney|assistant.?attorney.?general|solicitor.?general|attorney.?general|chief.?justice|associate.?justice|justice|judge|magistrate|commissioner|referee|hearing.?officer|administrative.?law.?judge|tax.?court.?judge|bankruptcy.?judge|federal.?judge|state.?judge|county.?judge|municipal.?judge|justice.?of.?the.?peace|notary.?public|commissioner.?of.?oaths|justice.?of.?the.?peace|magistrate|judge|justice|commissioner|referee|hearing.?officer|administrative.?law.?judge|tax.?court.?judge|bankruptcy.?judge|federal.?judge|eyalet|yargıcı|ilçe|yargıcı|belediye|yargıcı|barış|yargıcı|noter|halk|komiseri|barış|yargıcı|komiser|yargıç|yargıç|komiser|hakem|dinleme|memuru|idari|hukuk|yargıcı|vergi|mahkemesi|yargıcı|iflas|yargıcı|federal|yargıç|eyalet|yargıcı|ilçe|yargıcı|belediye|yargıcı|barış|yargıcı|noter|halk|komiseri)\b"
+)
+
+# AdvancedEmailClassifier için e-posta bilgi çıkarım kuralları
+EMAIL_EXTRACTION_RULES: Dict[str, List[RuleSpec]] = {
+    "sirket": [
+        r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:Yazılım|Software|Teknoloji|Technology|Şirketi|Company|Ltd|Inc)\b",
+        r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:Grup|Group|Holding|Corporation|Corp)\b",
+        r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:A\.Ş\.|Şirketi|Company)\b"
+    ],
+    "etkinlik_adi_tirnak": [
+        r'"([^"]+)"',
+        r"'([^']+)'",
+        r"“([^”]+)”",
+        r"‘([^’]+)’"
+    ],
+    "etkinlik_adi_baslik": [
+        r"\b([A-Z][a-zA-Z\s]+(?:Ideathon|Hackathon|Case Study|Workshop|Webinar|Seminer|Konferans))\b",
+        r"\b([A-Z][a-zA-Z\s]+(?:Yarışması|Competition|Challenge|Contest))\b"
+    ],
+    "tarih": [
+        r"\b(\d{1,2}[./-]\d{1,2}[./-]\d{2,4})\b",
+        rf"\b(\d{{1,2}}\s+(?:{_TR_MONTHS})\s+\d{{2,4}})\b",
+        rf"\b(\d{{1,2}}\s+(?:{_EN_MONTHS})\s+\d{{2,4}})\b"
+    ],
+    "saat": [
+        r"\b(\d{1,2}:\d{2})\s*(?:AM|PM|am|pm)?\b",
+        r"\b(\d{1,2}:\d{2})\b"
+    ],
+    "platform": [
+        (r"\b(?:Zoom|Teams|Meet|Skype|Discord|Slack|Webex|BlueJeans|GoToMeeting)\b", re.IGNORECASE),
+        (r"\b(?:online|çevrimiçi|uzaktan|remote)\b", re.IGNORECASE)
+    ],
+    "etkinlik_turu": [
+        (r"\b(?:Ideathon|Hackathon|Case Study|Workshop|Webinar|Seminer|Konferans|Buluşma|Toplantı)\b", re.IGNORECASE),
+        (r"\b(?:ideathon|hackathon|case study|workshop|webinar|seminer|konferans|buluşma|toplantı)\b", re.IGNORECASE)
+    ],
+    "pozisyon": [
+        (r"\b(?:pozisyonu|position|role|job|iş|görev)\s+(?:olarak|as|for|in)\s+([a-zA-ZçğıöşüğÇĞIÖŞÜ\s]+)\b", re.IGNORECASE),
+        (r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:Developer|Engineer|Designer|Analyst|Manager|Specialist)\b", re.IGNORECASE),
+        LazyRule(_POSITION_TITLES, re.IGNORECASE)
+    ]
+}
+
+# ApplicationService için iş ilanı bilgi çıkarım kuralları
+JOB_POSTING_RULES: Dict[str, List[RuleSpec]] = {
+    "company_name": [
+        (r'(?:Google|Microsoft|Apple|Amazon|Meta|Netflix|Uber|Airbnb|Spotify|Slack|Zoom|Notion|Figma|Adobe|Oracle|IBM|Intel|AMD|NVIDIA|Tesla|SpaceX)', re.IGNORECASE),
+        (r'(?:şirket|company|firma|kurum)\s*[:\-]?\s*([A-ZÇĞIİÖŞÜ][a-zçğıiöşü\s&]+)', re.IGNORECASE),
+        (r'([A-ZÇĞIİÖŞÜ][a-zçğıiöşü\s&]+)\s*(?:arayan|aranıyor|istihdam)', re.IGNORECASE)
+    ],
+    "position": [
+        (r'(?:Frontend|Backend|Full Stack|DevOps|Data|AI|ML|UI|UX|Product|Project|QA|Test|Security|Cloud|Mobile|React|Angular|Vue|Node\.js|Python|Java|C\+\+|TypeScript|JavaScript)\s*(?:Developer|Engineer|Designer|Manager|Lead|Architect)?', re.IGNORECASE),
+        (r'(?:Senior|Junior|Lead|Principal|Staff)\s+([A-ZÇĞIİÖŞÜ][a-zçğıiöşü\s&]+)', re.IGNORECASE),
+        (r'(?:pozisyon|position|rol|role)\s*[:\-]?\s*([A-ZÇĞIİÖŞÜ][a-zçğıiöşü\s&]+)', re.IGNORECASE)
+    ],
+    "location": [
+        (r'(?:Remote|remote|Hibrit|hibrit|On-site|on-site|onsite)', re.IGNORECASE),
+        (r'(?:İstanbul|Ankara|İzmir|Bursa|Antalya)', re.IGNORECASE),
+        (r'(?:lokasyon|location|şehir|city)\s*[:\-]?\s*([A-ZÇĞIİÖŞÜ][a-zçğıiöşü\s&,]+)', re.IGNORECASE)
+    ],
+    "salary_info": [
+        (r'(\d{1,3}(?:\.\d{3})*\s*[-–]\s*\d{1,3}(?:\.\d{3})*\s*(?:TL|USD|EUR|₺|\$|€))', re.IGNORECASE),
+        (r'(\d{1,3}(?:\.\d{3})*\s*(?:TL|USD|EUR|₺|\$|€))', re.IGNORECASE),
+        (r'(\d{1,3}(?:\.\d{3})*\s*[-–]\s*\d{1,3}(?:\.\d{3})*\s*(?:bin|k|milyon|million))', re.IGNORECASE)
+    ],
+    "requirements": [
+        (r'(?:React|Angular|Vue|Node\.js|Python|Java|C\+\+|TypeScript|JavaScript|AWS|Azure|Docker|Kubernetes|MongoDB|PostgreSQL|MySQL|Redis|Elasticsearch|GraphQL|REST|API|Git|CI/CD|Agile|Scrum)', re.IGNORECASE),
+        (r'(\d+\s*\+\s*yıl\s*deneyim|\d+\s*\+\s*years?\s*experience)', re.IGNORECASE),
+        (r'(?:3\+|5\+|7\+)\s*(?:yıl|years?)\s*(?:deneyim|experience)', re.IGNORECASE)
+    ]
+}
+
+# Global motor instance'ları - pattern'lar import sırasında bir kez compile edilir
+email_extraction_engine = ExtractionEngine(EMAIL_EXTRACTION_RULES)
+job_posting_extraction_engine = ExtractionEngine(JOB_POSTING_RULES)
@@ -14,14 +14,19 @@ from typing import Dict, Optional
 from fastapi import HTTPException
 from urllib.parse import urlencode
 from ..config.settings import settings
-from bs4 import BeautifulSoup
+from ..utils.metrics import track_upstream
+from .token_store import create_token_store
+from .token_manager import TokenManager, TokenNotFoundError
 
 class GmailService:
     """Gmail entegrasyonu için servis sınıfı"""
     
     def __init__(self):
         self.gmail_api_base = "https://gmail.googleapis.com/gmail/v1/users/me"
-        self.gmail_tokens: Dict[str, Dict] = {}
+        # Token'lar worker'lar arasında paylaşılan depoda tutulur (varsayılan: şifreli SQLite)
+        self.token_store = create_token_store()
+        # Süresi yaklaşan token'lar arka planda yenilenir, eşzamanlı yenilemeler birleştirilir
+        self.token_manager = TokenManager(self.token_store, self.refresh_token)
         self.gmail_redirect_uri = os.getenv("GMAIL_REDIRECT_URI", "http://localhost:3000/api/google/gmail/callback")
         
         if not all([settings.GOOGLE_CLIENT_ID, settings.GOOGLE_CLIENT_SECRET]):
@@ -56,35 +61,35 @@ class GmailService:
 
         async with httpx.AsyncClient() as client:
             try:
-                resp = await client.post(token_url, data=token_data)
-                resp.raise_for_status()
-                token_info = resp.json()
+                with track_upstream("gmail", "oauth.token"):
+                    resp = await client.post(token_url, data=token_data)
+                    resp.raise_for_status()
+                    token_info = resp.json()
             except httpx.HTTPError as e:
                 raise HTTPException(status_code=500, detail=f"Token alma hatası: {str(e)}")
 
         user_id = state
         expires_in = token_info.get("expires_in", 3600)
-        self.gmail_tokens[user_id] = {
+        self.token_store.set(user_id, {
             "access_token": token_info.get("access_token"),
             "refresh_token": token_info.get("refresh_token"),
             "expires_at": datetime.utcnow() + timedelta(seconds=expires_in),
-        }
+        })
 
         return {"message": "Gmail bağlantısı başarılı", "userId": user_id}
     
     def disconnect_user(self, user_id: str) -> Dict:
         """Kullanıcının Gmail bağlantısını keser"""
-        if user_id in self.gmail_tokens:
-            del self.gmail_tokens[user_id]
+        self.token_store.delete(user_id)
         return {"message": "Gmail bağlantısı kesildi"}
     
     def is_connected(self, user_id: str) -> bool:
         """Kullanıcının Gmail bağlantısının durumunu kontrol eder"""
-        return user_id in self.gmail_tokens
+        return user_id in self.token_store
     
     async def refresh_token(self, user_id: str) -> None:
         """Access token'ı yeniler"""
-        token_info = self.gmail_tokens.get(user_id)
+        token_info = self.token_store.get(user_id)
         if not token_info:
             raise Exception("User token not found")
         
@@ -101,27 +106,46 @@ class GmailService:
         }
 
         async with httpx.AsyncClient() as client:
-            resp = await client.post(token_url, data=token_data)
-            resp.raise_for_status()
-            new_token_info = resp.json()
+            with track_upstream("gmail", "oauth.refresh"):
+                resp = await client.post(token_url, data=token_data)
+                resp.raise_for_status()
+                new_token_info = resp.json()
         
         expires_in = new_token_info.get("expires_in", 3600)
-        self.gmail_tokens[user_id].update({
-            "access_token": new_token_info.get("access_token"),
-            "expires_at": datetime.utcnow() + timedelta(seconds=expires_in)
-        })
+        self.token_store.update_access_token(
+            user_id,
+            new_token_info.get("access_token"),
+            datetime.utcnow() + timedelta(seconds=expires_in),
+            refresh_token=new_token_info.get("refresh_token")
+        )
+    
+    async def _authorized_get(self, client: httpx.AsyncClient, user_id: str, url: str,
+                              operation: str, params: Dict = None) -> httpx.Response:
+        """Gmail API GET isteği; tarama sırasında 401 gelirse token yenilenip bir kez tekrar denenir"""
+        access_token = await self.token_manager.get_access_token(user_id)
+        for attempt in range(2):
+            with track_upstream("gmail", operation):
+                resp = await client.get(
+                    url,
+                    headers={"Authorization": f"Bearer {access_token}", "Content-Type": "application/json"},
+                    params=params
+                )
+                if resp.status_code != 401 or attempt:
+                    resp.raise_for_status()
+                    return resp
+            # Eşzamanlı 401'ler tek bir yenilemede birleşir
+            await self.token_manager.refresh(user_id, stale_token=access_token)
+            access_token = await self.token_manager.get_access_token(user_id)
     
-    async def get_email_detail(self, message_id: str, headers: Dict) -> Optional[Dict]:
+    async def get_email_detail(self, client: httpx.AsyncClient, user_id: str, message_id: str) -> Optional[Dict]:
         """E-posta detaylarını alır - HTML desteği ile"""
         url = f"{self.gmail_api_base}/messages/{message_id}"
-        async with httpx.AsyncClient() as client:
-            try:
-                resp = await client.get(url, headers=headers)
-                resp.raise_for_status()
-                message_data = resp.json()
-            except httpx.HTTPError as e:
-                print(f"E-posta detay alma hatası: {e}")
-                return None
+        try:
+            resp = await self._authorized_get(client, user_id, url, "messages.get")
+            message_data = resp.json()
+        except httpx.HTTPError as e:
+            print(f"E-posta detay alma hatası: {e}")
+            return None
 
         payload = message_data.get("payload", {})
         headers_data = payload.get("headers", [])
@@ -192,6 +216,8 @@ class GmailService:
             return ""
         
         try:
+            from bs4 import BeautifulSoup
+            
             # BeautifulSoup ile HTML'i parse et
             soup = BeautifulSoup(html_content, 'html.parser')
             
@@ -227,20 +253,9 @@ class GmailService:
     
     async def scan_emails(self, user_id: str) -> Dict:
         """İş başvurusu e-postalarını tarar - Basit filtreleme sistemi"""
-        if user_id not in self.gmail_tokens:
+        if user_id not in self.token_store:
             raise HTTPException(status_code=400, detail="Gmail hesabı bağlı değil")
 
-        token_info = self.gmail_tokens[user_id]
-
-        if datetime.utcnow() > token_info["expires_at"]:
-            await self.refresh_token(user_id)
-            token_info = self.gmail_tokens[user_id]
-
-        headers = {
-            "Authorization": f"Bearer {token_info['access_token']}",
-            "Content-Type": "application/json"
-        }
-
         # Basit filtreleme stratejisi
         all_messages = []
         
@@ -264,50 +279,52 @@ class GmailService:
         
         print(f"E-posta tarama başlatılıyor...")
         
-        # Sorguları çalıştır
-        for i, query in enumerate(search_queries, 1):
-            print(f"Sorgu {i}: {query[:50]}...")
-            
-            search_url = f"{self.gmail_api_base}/messages"
-            params = {
-                "q": query,
-                "maxResults": 25
-            }
+        # Tarama boyunca tek bir client (bağlantı havuzu) kullanılır
+        async with httpx.AsyncClient() as client:
+            # Sorguları çalıştır
+            for i, query in enumerate(search_queries, 1):
+                print(f"Sorgu {i}: {query[:50]}...")
+                
+                search_url = f"{self.gmail_api_base}/messages"
+                params = {
+                    "q": query,
+                    "maxResults": 25
+                }
 
-            try:
-                async with httpx.AsyncClient() as client:
-                    resp = await client.get(search_url, headers=headers, params=params)
-                    resp.raise_for_status()
+                try:
+                    resp = await self._authorized_get(client, user_id, search_url, "messages.list", params=params)
                     messages_data = resp.json()
 
-                messages = messages_data.get("messages", [])
-                if messages:
-                    print(f"  Sorgu {i} sonucu: {len(messages)} e-posta bulundu")
-                    all_messages.extend(messages)
-                else:
-                    print(f"  Sorgu {i} sonucu: E-posta bulunamadı")
-                    
-            except Exception as e:
-                print(f"  Sorgu {i} hatası: {str(e)}")
-                continue
+                    messages = messages_data.get("messages", [])
+                    if messages:
+                        print(f"  Sorgu {i} sonucu: {len(messages)} e-posta bulundu")
+                        all_messages.extend(messages)
+                    else:
+                        print(f"  Sorgu {i} sonucu: E-posta bulunamadı")
+                        
+                except TokenNotFoundError:
+                    raise HTTPException(status_code=400, detail="Gmail hesabı bağlı değil")
+                except Exception as e:
+                    print(f"  Sorgu {i} hatası: {str(e)}")
+                    continue
 
-        # Tekrarlanan mesajları kaldır
-        unique_messages = []
-        seen_ids = set()
-        for message in all_messages:
-            if message.get("id") not in seen_ids:
-                unique_messages.append(message)
-                seen_ids.add(message.get("id"))
+            # Tekrarlanan mesajları kaldır
+            unique_messages = []
+            seen_ids = set()
+            for message in all_messages:
+                if message.get("id") not in seen_ids:
+                    unique_messages.append(message)
+                    seen_ids.add(message.get("id"))
 
-        print(f"Toplam benzersiz e-posta sayısı: {len(unique_messages)}")
-        
-        # E-posta detaylarını al
-        job_emails = []
-        for i, message in enumerate(unique_messages[:50]):  # En fazla 50 e-posta işle
-            print(f"E-posta {i+1}/{len(unique_messages)} detayları alınıyor...")
-            email_detail = await self.get_email_detail(message["id"], headers)
-            if email_detail:
-                job_emails.append(email_detail)
+            print(f"Toplam benzersiz e-posta sayısı: {len(unique_messages)}")
+            
+            # E-posta detaylarını al
+            job_emails = []
+            for i, message in enumerate(unique_messages[:50]):  # En fazla 50 e-posta işle
+                print(f"E-posta {i+1}/{len(unique_messages)} detayları alınıyor...")
+                email_detail = await self.get_email_detail(client, user_id, message["id"])
+                if email_detail:
+                    job_emails.append(email_detail)
 
         return {
             "emails": job_emails,
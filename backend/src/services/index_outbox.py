@@ -0,0 +1,289 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from ..config.settings import settings
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Olay türleri ve işlemleri
+APPLICATION = "application"
+EMAIL_ANALYSIS = "email_analysis"
+UPSERT = "upsert"
+DELETE = "delete"
+
+# (tür, işlem, kullanıcı, varlık ID'si, payload)
+IndexEvent = Tuple[str, str, str, str, Optional[Dict[str, Any]]]
+
+
+class IndexOutbox:
+    """
+    Vektör indeksi için kalıcı olay kuyruğu (transactional outbox)
+
+    Başvuru değişiklikleri ChromaDB'ye yazılmak yerine buraya tek bir INSERT ile eklenir;
+    arka plan indeksleyici olayları batch'ler halinde alır (`claim`), başarılı olanları siler
+    (`complete`), başarısız olanları üstel geri çekilme ile tekrar kuyruğa bırakır (`fail`).
+    Alınan olaylar kiralama süresi boyunca diğer worker'lara verilmez; süreç ölürse süre
+    dolunca olay yeniden alınır. Payload değişiklik anındaki kaydın indeks için gereken
+    alanlarını taşır, böylece indeksleyici hangi worker'da çalışırsa çalışsın aynı sonucu üretir.
+    """
+
+    SCHEMA = [
+        """
+        CREATE TABLE IF NOT EXISTS index_outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            op TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            entity_id TEXT NOT NULL,
+            payload TEXT,
+            created_at REAL NOT NULL,
+            available_at REAL NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT,
+            dead INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS index_outbox_ready ON index_outbox (dead, available_at, id)",
+        "CREATE INDEX IF NOT EXISTS index_outbox_entity ON index_outbox (kind, user_id, entity_id, id)",
+        # Kullanıcının indeksi her değiştiğinde artan sayaç; indeksten okunan yanıtların ETag'i buna bağlıdır
+        """
+        CREATE TABLE IF NOT EXISTS index_versions (
+            user_id TEXT PRIMARY KEY,
+            version INTEGER NOT NULL
+        )
+        """
+    ]
+
+    def __init__(self, path: Optional[str] = None, max_attempts: int = None, lease_seconds: float = None,
+                 retry_base: float = None, retry_max: float = None):
+        self.path = path or settings.INDEX_OUTBOX_PATH
+        self.max_attempts = settings.INDEXER_MAX_ATTEMPTS if max_attempts is None else max_attempts
+        self.lease_seconds = settings.INDEXER_LEASE_SECONDS if lease_seconds is None else lease_seconds
+        self.retry_base = settings.INDEXER_RETRY_BASE_SECONDS if retry_base is None else retry_base
+        self.retry_max = settings.INDEXER_RETRY_MAX_SECONDS if retry_max is None else retry_max
+        self._uri = False
+        self._local = threading.local()
+        # Yeni olay kaydedildiğinde çağrılacak dinleyiciler (indeksleyiciyi uyandırmak için)
+        self._listeners: List[Callable[[], None]] = []
+
+        # Veritabanı ilk kullanımda açılır; servisi import etmek diske dosya yazmaz
+        self._opened = False
+        self._open_lock = threading.Lock()
+
+    def _open(self):
+        """Veritabanı dosyasını ve tabloları ilk kullanımda hazırla"""
+        if self._opened:
+            return
+        with self._open_lock:
+            if self._opened:
+                return
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                self._initialize()
+            except (OSError, sqlite3.Error) as e:
+                # Dosya açılamazsa süreç içi paylaşımlı bellek veritabanı kullanılır (yeniden başlatmada kaybolur)
+                logger.warning("İndeks outbox'ı açılamadı, bellek içi veritabanı kullanılacak: %s", e)
+                self.path = "file:jobsy_index_outbox?mode=memory&cache=shared"
+                self._uri = True
+                self._local = threading.local()
+                self._initialize()
+            self._opened = True
+
+    def _initialize(self):
+        connection = self._thread_connection()
+        if not self._uri:
+            connection.execute("PRAGMA journal_mode=WAL")
+        for statement in self.SCHEMA:
+            connection.execute(statement)
+
+    def _thread_connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=10.0, isolation_level=None,
+                                         check_same_thread=False, uri=self._uri)
+            connection.execute("PRAGMA busy_timeout=10000")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _connect(self) -> sqlite3.Connection:
+        self._open()
+        return self._thread_connection()
+
+    def add_listener(self, listener: Callable[[], None]):
+        """Yeni olay kaydedildiğinde çağrılacak fonksiyonu ekle"""
+        self._listeners.append(listener)
+
+    def record(self, events: Iterable[IndexEvent]) -> int:
+        """Olayları tek transaction ile kuyruğa ekle, eklenen olay sayısını döndür"""
+        now = time.time()
+        rows = [
+            (kind, op, user_id, str(entity_id),
+             json.dumps(payload, ensure_ascii=False, default=str) if payload is not None else None, now, now)
+            for kind, op, user_id, entity_id, payload in events
+        ]
+        if not rows:
+            return 0
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.executemany(
+                """
+                INSERT INTO index_outbox (kind, op, user_id, entity_id, payload, created_at, available_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows
+            )
+            connection.execute("COMMIT")
+        except sqlite3.Error:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+
+        for listener in self._listeners:
+            try:
+                listener()
+            except Exception as e:
+                logger.error("Outbox dinleyicisi hatası: %s", e)
+        return len(rows)
+
+    def claim(self, limit: int) -> List[Dict[str, Any]]:
+        """Hazır olayları en eskiden başlayarak al ve kiralama süresi boyunca kilitle"""
+        now = time.time()
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            rows = connection.execute(
+                """
+                SELECT id, kind, op, user_id, entity_id, payload, attempts, created_at FROM index_outbox
+                WHERE dead = 0 AND available_at <= ? ORDER BY id LIMIT ?
+                """,
+                (now, limit)
+            ).fetchall()
+            if rows:
+                connection.executemany(
+                    "UPDATE index_outbox SET available_at = ? WHERE id = ?",
+                    [(now + self.lease_seconds, row[0]) for row in rows]
+                )
+            connection.execute("COMMIT")
+        except sqlite3.Error:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+
+        return [
+            {
+                "id": row[0],
+                "kind": row[1],
+                "op": row[2],
+                "user_id": row[3],
+                "entity_id": row[4],
+                "payload": json.loads(row[5]) if row[5] else None,
+                "attempts": row[6],
+                "created_at": row[7]
+            }
+            for row in rows
+        ]
+
+    def complete(self, events: Sequence[Dict[str, Any]]):
+        """
+        İndekslenen olayları kuyruktan sil
+
+        Aynı kayda ait daha eski olaylar da silinir: geri çekilmedeki (ya da dead) eski bir olay
+        sonradan tekrar denenirse yeni olayın yazdığı değerin üzerine eski payload'ı yazardı.
+        """
+        latest: Dict[Tuple[str, str, str], int] = {}
+        for event in events:
+            key = (event["kind"], event["user_id"], event["entity_id"])
+            latest[key] = max(latest.get(key, 0), event["id"])
+        if not latest:
+            return
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.executemany(
+                "DELETE FROM index_outbox WHERE kind = ? AND user_id = ? AND entity_id = ? AND id <= ?",
+                [(*key, event_id) for key, event_id in latest.items()]
+            )
+            self._bump_index_versions(connection, {key[1] for key in latest})
+            connection.execute("COMMIT")
+        except sqlite3.Error:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _bump_index_versions(connection: sqlite3.Connection, user_ids: Iterable[str]):
+        connection.executemany(
+            """
+            INSERT INTO index_versions (user_id, version) VALUES (?, 1)
+            ON CONFLICT (user_id) DO UPDATE SET version = version + 1
+            """,
+            [(user_id,) for user_id in user_ids]
+        )
+
+    def bump_index_version(self, user_ids: Iterable[str]):
+        """İndeks outbox dışında değiştiğinde (ör. yeniden oluşturma) kullanıcıların indeks versiyonunu artır"""
+        self._bump_index_versions(self._connect(), user_ids)
+
+    def index_version(self, user_id: str) -> int:
+        """Kullanıcının indekse yansımış değişiklik sayacı (worker'lar arası ortak)"""
+        row = self._connect().execute("SELECT version FROM index_versions WHERE user_id = ?", (user_id,)).fetchone()
+        return row[0] if row else 0
+
+    def retry_delay(self, attempts: int) -> float:
+        """`attempts` başarısız denemeden sonra beklenecek süre"""
+        return min(self.retry_max, self.retry_base * (2 ** max(0, attempts - 1)))
+
+    def fail(self, events: Sequence[Dict[str, Any]], error: str) -> int:
+        """Olayları geri çekilme süresi sonrasına ertele; deneme hakkı bitenleri "dead" işaretle"""
+        now = time.time()
+        dead = 0
+        updates = []
+        for event in events:
+            attempts = event["attempts"] + 1
+            is_dead = attempts >= self.max_attempts
+            dead += is_dead
+            updates.append((attempts, now + self.retry_delay(attempts), error[:1000], int(is_dead), event["id"]))
+        self._connect().executemany(
+            "UPDATE index_outbox SET attempts = ?, available_at = ?, last_error = ?, dead = ? WHERE id = ?",
+            updates
+        )
+        return dead
+
+    def retry_dead(self) -> int:
+        """Deneme hakkı biten olayları sıfırlayıp tekrar kuyruğa al"""
+        return self._connect().execute(
+            "UPDATE index_outbox SET dead = 0, attempts = 0, available_at = ? WHERE dead = 1", (time.time(),)
+        ).rowcount
+
+    def lag(self) -> Dict[str, Any]:
+        """Bekleyen/dead olay sayısı ve bekleyen en eski olayın yaşı (saniye)"""
+        pending, dead, oldest = self._connect().execute(
+            """
+            SELECT COALESCE(SUM(dead = 0), 0), COALESCE(SUM(dead = 1), 0), MIN(CASE WHEN dead = 0 THEN created_at END)
+            FROM index_outbox
+            """
+        ).fetchone()
+        return {
+            "pending": pending,
+            "dead": dead,
+            "lag_seconds": round(max(0.0, time.time() - oldest), 3) if oldest is not None else 0.0
+        }
+
+    def dead_events(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Son hatalarıyla birlikte dead olaylar"""
+        rows = self._connect().execute(
+            "SELECT id, kind, op, user_id, entity_id, attempts, last_error FROM index_outbox WHERE dead = 1 ORDER BY id LIMIT ?",
+            (limit,)
+        ).fetchall()
+        keys = ("id", "kind", "op", "user_id", "entity_id", "attempts", "last_error")
+        return [dict(zip(keys, row)) for row in rows]
+
+
+# Global servis instance'ı
+index_outbox = IndexOutbox()
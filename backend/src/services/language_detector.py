@@ -0,0 +1,111 @@
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+from ..config.classifier_config import ClassifierConfig
+
+TURKISH = "Turkish"
+ENGLISH = "English"
+UNKNOWN = "Unknown"
+
+TURKISH_LETTERS = frozenset("çğıöşü")
+
+# Sık geçen, diğer dilde kelime olarak bulunmayan kısa kelimeler
+TURKISH_WORDS = frozenset("""
+    ve bir bu için ile de da ki mi mı mu mü olarak olan gibi daha çok en sonra önce kadar
+    ama fakat veya ya ise değil var yok her tüm size sizi sizin bize bizim biz siz ben sen
+    merhaba teşekkür teşekkürler ederiz ederim lütfen saygılarımızla tebrikler maalesef
+    başvuru başvurunuz başvurunuzu pozisyon pozisyonu tarihinde saat üzerinden şirket
+    iş hakkında bilgi ekibimiz aşağıdaki aşama süreç süreci davet mülakat görüşme
+""".split())
+
+ENGLISH_WORDS = frozenset("""
+    the and of to in for on with at by from is are was were be been this that these those
+    it its you your we our us they their he she his her not no yes or but if as an a will
+    would can could should have has had do does did please thank thanks regards dear hi
+    hello best kind team application position role interview offer next step
+""".split())
+
+# Türkçe ek ve İngilizce son ek kalıpları: Türkçe karakter kullanılmadan yazılmış metinler için
+TURKISH_SUFFIXES = re.compile(r"(?:lar|ler|ımız|imiz|umuz|ümüz|niz|nız|nuz|nüz|dir|dır|tir|tır|mek|mak|yor|acak|ecek)$")
+ENGLISH_SUFFIXES = re.compile(r"(?:ing|tion|ment|ness|ly|ed|ould)$")
+
+WORD_PATTERN = re.compile(r"[a-zçğıöşüâîû]+")
+
+
+class LanguageDetector:
+    """
+    TR/EN için hızlı ve deterministik dil tespiti
+
+    Sadece metnin ilk `prefix_chars` karakteri incelenir. Skor Türkçe'ye özgü harfler,
+    iki dilin sık kelimeleri ve tipik ekler üzerinden hesaplanır; rastgelelik yoktur.
+    Sonuçlar metin önekinin özetiyle (blake2b) sınırlı bir LRU'da saklanır.
+    """
+
+    def __init__(self, prefix_chars: Optional[int] = None, cache_size: Optional[int] = None):
+        self.prefix_chars = prefix_chars or ClassifierConfig.LANGUAGE_PREFIX_CHARS
+        self.cache_size = ClassifierConfig.LANGUAGE_CACHE_SIZE if cache_size is None else cache_size
+        self._cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def _lower(text: str) -> str:
+        # "İ".lower() birleşik nokta üretir; "I" → "ı" dönüşümü ise İngilizce büyük harfleri Türkçe gösterirdi
+        return text.replace("İ", "i").lower()
+
+    def scores(self, text: str) -> Dict[str, float]:
+        """Önek için Türkçe ve İngilizce skorları"""
+        prefix = self._lower(text[:self.prefix_chars])
+        turkish = english = 0.0
+        for word in WORD_PATTERN.findall(prefix):
+            if not TURKISH_LETTERS.isdisjoint(word):
+                turkish += 1.0
+            if word in TURKISH_WORDS:
+                turkish += 1.0
+            elif word in ENGLISH_WORDS:
+                english += 1.0
+            elif len(word) > 4:
+                if TURKISH_SUFFIXES.search(word):
+                    turkish += 0.5
+                elif ENGLISH_SUFFIXES.search(word):
+                    english += 0.5
+        return {TURKISH: turkish, ENGLISH: english}
+
+    def _classify(self, text: str) -> str:
+        scores = self.scores(text)
+        if scores[TURKISH] == scores[ENGLISH]:
+            return UNKNOWN
+        return TURKISH if scores[TURKISH] > scores[ENGLISH] else ENGLISH
+
+    def detect(self, text: str) -> str:
+        """Metnin dilini döndür: Turkish, English veya Unknown"""
+        if not text or not text.strip():
+            return UNKNOWN
+        if not self.cache_size:
+            return self._classify(text)
+
+        key = hashlib.blake2b(text[:self.prefix_chars].encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._lock:
+            language = self._cache.get(key)
+            if language is not None:
+                self._cache.move_to_end(key)
+                self.stats["hits"] += 1
+                return language
+
+        language = self._classify(text)
+        with self._lock:
+            self.stats["misses"] += 1
+            self._cache[key] = language
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return language
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+
+
+# Global servis instance'ı
+language_detector = LanguageDetector()
@@ -0,0 +1,280 @@
+import os
+import time
+import atexit
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from ..config.settings import settings
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class LearningStore:
+    """
+    Şirket ve e-posta türü öğrenme sayaçları
+
+    Her olay bellekte sadece bir sayaç farkı (delta) olarak birikir; farklar belirli sayıda
+    olay, anahtar ya da süre dolduğunda tek bir transaction ile SQLite'a eklenir
+    (`count = count + delta`). Böylece bellek kullanımı sınırlı kalır ve aynı dosyayı
+    kullanan tüm worker'ların sayaçları toplanır. Aşama geçmişi liste yerine
+    şirket başına aşama histogramı olarak tutulur.
+    """
+
+    SCHEMA = [
+        """
+        CREATE TABLE IF NOT EXISTS company_stats (
+            company TEXT PRIMARY KEY,
+            application_count INTEGER NOT NULL,
+            first_seen REAL NOT NULL,
+            last_seen REAL NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS company_stages (
+            company TEXT NOT NULL,
+            stage TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (company, stage)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS email_type_stats (
+            email_type TEXT PRIMARY KEY,
+            count INTEGER NOT NULL
+        )
+        """
+    ]
+
+    def __init__(self, path: Optional[str] = None, flush_every: int = None,
+                 flush_interval: float = None, max_pending_keys: int = None):
+        self.path = path or settings.LEARNING_STORE_PATH
+        self.flush_every = settings.LEARNING_FLUSH_EVERY if flush_every is None else flush_every
+        self.flush_interval = settings.LEARNING_FLUSH_INTERVAL_SECONDS if flush_interval is None else flush_interval
+        self.max_pending_keys = settings.LEARNING_MAX_PENDING_KEYS if max_pending_keys is None else max_pending_keys
+        self._uri = False
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._reset_pending()
+        self._last_flush = time.monotonic()
+        self.stats = {"events": 0, "flushes": 0, "flushed_rows": 0}
+        # Tanınan şirket/tür kümeleri: ilk kullanımda ve her flush'ta veritabanından yenilenir,
+        # böylece e-posta başına tanıma kontrolü SQLite'a gitmez
+        self._known_companies: Optional[set] = None
+        self._known_types: Optional[set] = None
+
+        # Veritabanı ilk kullanımda açılır; servisi import etmek diske dosya yazmaz
+        self._opened = False
+        self._open_lock = threading.Lock()
+
+        atexit.register(self.flush)
+
+    def _open(self):
+        """Veritabanı dosyasını ve tabloları ilk kullanımda hazırla"""
+        if self._opened:
+            return
+        with self._open_lock:
+            if self._opened:
+                return
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                self._initialize()
+            except (OSError, sqlite3.Error) as e:
+                # Dosya açılamazsa süreç içi paylaşımlı bellek veritabanı kullanılır (worker'lar arası toplanmaz)
+                logger.warning("Öğrenme deposu açılamadı, bellek içi veritabanı kullanılacak: %s", e)
+                self.path = "file:jobsy_learning?mode=memory&cache=shared"
+                self._uri = True
+                self._local = threading.local()
+                self._initialize()
+            self._opened = True
+
+    def _initialize(self):
+        connection = self._thread_connection()
+        if not self._uri:
+            connection.execute("PRAGMA journal_mode=WAL")
+        for statement in self.SCHEMA:
+            connection.execute(statement)
+
+    def _thread_connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=10.0, isolation_level=None,
+                                         check_same_thread=False, uri=self._uri)
+            connection.execute("PRAGMA busy_timeout=10000")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _connect(self) -> sqlite3.Connection:
+        self._open()
+        return self._thread_connection()
+
+    def _reset_pending(self):
+        # company -> [başvuru sayısı, ilk görülme, son görülme]
+        self._company_deltas: Dict[str, List[float]] = {}
+        self._stage_deltas: Dict[Tuple[str, str], int] = {}
+        self._type_deltas: Dict[str, int] = {}
+        self._pending_events = 0
+
+    def _pending_keys(self) -> int:
+        return len(self._company_deltas) + len(self._stage_deltas) + len(self._type_deltas)
+
+    def record(self, company: Optional[str], stage: Optional[str], email_type: Optional[str],
+               autoflush: bool = True) -> bool:
+        """
+        Bir başvuru e-postasını sayaçlara ekle
+
+        Flush zamanı geldiyse True döner; `autoflush=False` ile yazma çağırana bırakılır
+        (ör. event loop'u bloklamamak için ayrı bir thread'de).
+        """
+        now = time.time()
+        with self._lock:
+            if company:
+                delta = self._company_deltas.get(company)
+                if delta is None:
+                    self._company_deltas[company] = [1, now, now]
+                else:
+                    delta[0] += 1
+                    delta[2] = now
+                if stage:
+                    self._stage_deltas[(company, stage)] = self._stage_deltas.get((company, stage), 0) + 1
+            if email_type:
+                self._type_deltas[email_type] = self._type_deltas.get(email_type, 0) + 1
+            self._pending_events += 1
+            self.stats["events"] += 1
+            should_flush = (
+                self._pending_events >= self.flush_every
+                or self._pending_keys() >= self.max_pending_keys
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+        if should_flush and autoflush:
+            self.flush()
+        return should_flush
+
+    def flush(self) -> int:
+        """Biriken farkları tek transaction ile veritabanına yaz, yazılan satır sayısını döndür"""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            nothing_pending = not self._pending_events
+            companies = [(company, int(count), first, last) for company, (count, first, last) in self._company_deltas.items()]
+            stages = [(company, stage, count) for (company, stage), count in self._stage_deltas.items()]
+            types = list(self._type_deltas.items())
+            self._reset_pending()
+
+        if nothing_pending:
+            # Yazılacak fark yok; kümeler yüklendiyse diğer worker'ların yazdıkları için yenilenir
+            if self._known_companies is not None:
+                self.load_known()
+            return 0
+
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.executemany(
+                """
+                INSERT INTO company_stats (company, application_count, first_seen, last_seen)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(company) DO UPDATE SET
+                    application_count = application_count + excluded.application_count,
+                    first_seen = MIN(first_seen, excluded.first_seen),
+                    last_seen = MAX(last_seen, excluded.last_seen)
+                """,
+                companies
+            )
+            connection.executemany(
+                """
+                INSERT INTO company_stages (company, stage, count) VALUES (?, ?, ?)
+                ON CONFLICT(company, stage) DO UPDATE SET count = count + excluded.count
+                """,
+                stages
+            )
+            connection.executemany(
+                """
+                INSERT INTO email_type_stats (email_type, count) VALUES (?, ?)
+                ON CONFLICT(email_type) DO UPDATE SET count = count + excluded.count
+                """,
+                types
+            )
+            connection.execute("COMMIT")
+        except sqlite3.Error as e:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            logger.error("Öğrenme verisi yazılamadı, %d satır kaybedildi: %s",
+                         len(companies) + len(stages) + len(types), e)
+            return 0
+
+        rows = len(companies) + len(stages) + len(types)
+        self.stats["flushes"] += 1
+        self.stats["flushed_rows"] += rows
+        # Diğer worker'ların yazdıkları da tanınsın diye kümeler veritabanından yenilenir
+        self.load_known()
+        return rows
+
+    def load_known(self):
+        """Tanınan şirket ve e-posta türü kümelerini veritabanından yükle"""
+        connection = self._connect()
+        companies = {row[0] for row in connection.execute("SELECT company FROM company_stats")}
+        types = {row[0] for row in connection.execute("SELECT email_type FROM email_type_stats")}
+        self._known_companies, self._known_types = companies, types
+
+    def ensure_known(self):
+        """Tanıma kümeleri henüz yüklenmediyse yükle"""
+        if self._known_companies is None or self._known_types is None:
+            self.load_known()
+
+    def knows_company(self, company: str) -> bool:
+        """Şirket daha önce görüldü mü"""
+        if not company:
+            return False
+        if company in self._company_deltas:
+            return True
+        self.ensure_known()
+        return company in self._known_companies
+
+    def knows_email_type(self, email_type: str) -> bool:
+        """E-posta türü daha önce görüldü mü"""
+        if not email_type:
+            return False
+        if email_type in self._type_deltas:
+            return True
+        self.ensure_known()
+        return email_type in self._known_types
+
+    def email_type_counts(self) -> Dict[str, int]:
+        """Tüm worker'ların toplam e-posta türü sayaçları (bekleyen farklar dahil)"""
+        counts = dict(self._connect().execute("SELECT email_type, count FROM email_type_stats"))
+        with self._lock:
+            for email_type, delta in self._type_deltas.items():
+                counts[email_type] = counts.get(email_type, 0) + delta
+        return counts
+
+    def company_stages(self, company: str) -> Dict[str, int]:
+        """Şirketin aşama histogramı"""
+        return dict(self._connect().execute(
+            "SELECT stage, count FROM company_stages WHERE company = ? ORDER BY count DESC", (company,)
+        ))
+
+    def company_activity(self, limit: int = 50) -> Dict[str, int]:
+        """En çok başvuru yapılan şirketler"""
+        return dict(self._connect().execute(
+            "SELECT company, application_count FROM company_stats ORDER BY application_count DESC, company LIMIT ?",
+            (limit,)
+        ))
+
+    def company_count(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM company_stats").fetchone()[0]
+
+    def summary(self, limit: int = 50) -> Dict[str, Any]:
+        """Bekleyen farkları yazıp toplu özet döndür"""
+        self.flush()
+        activity = self.company_activity(limit)
+        return {
+            "total_companies": self.company_count(),
+            "email_types": self.email_type_counts(),
+            "company_activity": activity,
+            "company_stages": {company: self.company_stages(company) for company in list(activity)[:10]}
+        }
+
+
+# Global servis instance'ı
+learning_store = LearningStore()
@@ -0,0 +1,118 @@
+import os
+from typing import TYPE_CHECKING, List, Dict, Optional, Any, Sequence
+from ..config.classifier_config import ClassifierConfig
+
+if TYPE_CHECKING:
+    from sklearn.pipeline import Pipeline
+
+
+class LinearEmailClassifier:
+    """
+    TF-IDF + lojistik regresyon tabanlı hafif e-posta sınıflandırıcı
+
+    Kural katmanından emin çıkmayan e-postalar BERT'e gitmeden önce bu modelden geçer.
+    Model diskte saklanır ve ilk kullanımda yüklenir (sklearn de o zaman import edilir).
+    """
+
+    def __init__(self, model_path: Optional[str] = None):
+        self.model_path = model_path
+        self.pipeline: Optional["Pipeline"] = None
+        self._load_attempted = False
+
+    def _ensure_loaded(self):
+        if self.pipeline is None and not self._load_attempted:
+            self._load_attempted = True
+            if self.model_path and os.path.exists(self.model_path):
+                self.load(self.model_path)
+
+    @property
+    def is_ready(self) -> bool:
+        self._ensure_loaded()
+        return self.pipeline is not None
+
+    def _build_pipeline(self) -> "Pipeline":
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.pipeline import Pipeline
+
+        return Pipeline([
+            ("tfidf", TfidfVectorizer(
+                lowercase=True,
+                ngram_range=(1, 2),
+                min_df=1,
+                max_features=50000,
+                sublinear_tf=True
+            )),
+            ("clf", LogisticRegression(max_iter=1000, C=4.0))
+        ])
+
+    def fit(self, texts: Sequence[str], labels: Sequence[str]) -> "LinearEmailClassifier":
+        """Modeli etiketli e-postalarla eğit"""
+        pipeline = self._build_pipeline()
+        pipeline.fit(list(texts), list(labels))
+        self.pipeline = pipeline
+        return self
+
+    def classify(self, text: str) -> Optional[Dict[str, Any]]:
+        """E-postayı sınıflandır, model yoksa None döndür"""
+        if not self.is_ready:
+            return None
+        probabilities = self.pipeline.predict_proba([text])[0]
+        classes = self.pipeline.classes_
+        best = int(probabilities.argmax())
+        return {
+            "label": str(classes[best]),
+            "score": round(float(probabilities[best]), 4),
+            "distribution": {
+                str(label): round(float(probability), 4)
+                for label, probability in zip(classes, probabilities)
+            }
+        }
+
+    def classify_many(self, texts: Sequence[str]) -> List[Optional[Dict[str, Any]]]:
+        """Birden fazla e-postayı tek seferde sınıflandır"""
+        if not self.is_ready:
+            return [None for _ in texts]
+        probabilities = self.pipeline.predict_proba(list(texts))
+        classes = self.pipeline.classes_
+        results = []
+        for row in probabilities:
+            best = int(row.argmax())
+            results.append({
+                "label": str(classes[best]),
+                "score": round(float(row[best]), 4),
+                "distribution": {
+                    str(label): round(float(probability), 4)
+                    for label, probability in zip(classes, row)
+                }
+            })
+        return results
+
+    def save(self, path: Optional[str] = None) -> str:
+        """Modeli diske kaydet"""
+        path = path or self.model_path
+        if self.pipeline is None or not path:
+            raise ValueError("Kaydedilecek eğitilmiş model yok")
+        import joblib
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        joblib.dump(self.pipeline, path)
+        return path
+
+    def load(self, path: Optional[str] = None) -> bool:
+        """Modeli diskten yükle"""
+        path = path or self.model_path
+        try:
+            import joblib
+
+            self.pipeline = joblib.load(path)
+            print(f"✅ Lineer sınıflandırıcı yüklendi: {path}")
+            return True
+        except Exception as e:
+            print(f"⚠️ Lineer sınıflandırıcı yüklenemedi: {e}")
+            self.pipeline = None
+            return False
+
+
+# Global servis instance'ı
+linear_email_classifier = LinearEmailClassifier(ClassifierConfig.LINEAR_MODEL_PATH)
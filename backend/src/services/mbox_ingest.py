@@ -0,0 +1,421 @@
+"""
+Çevrimdışı mbox/EML toplu içe aktarma
+
+Google Takeout `.mbox` dosyaları bellek eşlemeli (mmap) okunur ve `From ` satırlarından
+mesajlara bölünür; tek `.eml` dosyası ya da `.eml` dizinleri de desteklenir. Mesajlar
+parça parça ayrıştırılıp sınıflandırıcının toplu analiz yolundan ve başvuru servisinin
+toplu kayıt yolundan geçirilir. Her parçadan sonra kaynak içindeki konum kaydedilir;
+yarıda kalan içe aktarma aynı konumdan devam eder.
+
+Kullanım:
+    python -m src.services.mbox_ingest --path Takeout/Mail/All.mbox --user-id user@example.com
+    python -m src.services.mbox_ingest --path eml_klasoru/ --user-id user@example.com --chunk-size 128 --no-resume
+"""
+import os
+import re
+import json
+import mmap
+import time
+import uuid
+import asyncio
+import hashlib
+import argparse
+from datetime import datetime
+from email import message_from_bytes
+from email.header import decode_header, make_header
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from .email_analyzer_service import email_analyzer_service
+from .application_service import application_service
+from ..config.settings import settings
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MBOX_SEPARATOR = b"\nFrom "
+# Zarf satırı "From <gönderen> <tarih>" biçimindedir; kaçırılmamış gövde satırlarını ayraç sanmamak için saat aranır
+ENVELOPE_LINE = re.compile(rb"From \S+ [^\n]*\d{1,2}:\d{2}")
+# mboxrd: gövdedeki "From " satırları yazılırken ">" ile kaçırılır
+MBOXRD_ESCAPE = re.compile(rb"^>(>*From )", re.MULTILINE)
+FINGERPRINT_BYTES = 64 * 1024
+
+# (başlangıç konumu, bitiş konumu, ham mesaj)
+RawMessage = Tuple[int, int, bytes]
+
+
+def _is_eml_source(path: str) -> bool:
+    return os.path.isdir(path) or path.lower().endswith(".eml")
+
+
+def _eml_files(path: str) -> List[str]:
+    if os.path.isfile(path):
+        return [path]
+    return sorted(
+        os.path.join(root, name)
+        for root, _, names in os.walk(path)
+        for name in names if name.lower().endswith(".eml")
+    )
+
+
+def _next_boundary(mm: mmap.mmap, position: int, size: int) -> int:
+    while True:
+        boundary = mm.find(MBOX_SEPARATOR, position)
+        if boundary < 0:
+            return size
+        line_end = mm.find(b"\n", boundary + 1)
+        if ENVELOPE_LINE.match(mm[boundary + 1:size if line_end < 0 else line_end]):
+            return boundary + 1
+        position = boundary + 1
+
+
+def iter_mbox(path: str, start_offset: int = 0) -> Iterator[RawMessage]:
+    """mbox dosyasını mmap ile oku, mesajları bayt konumlarıyla sırayla döndür"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            size = len(mm)
+            start = start_offset
+            if start == 0 and mm[:5] != b"From ":
+                # Dosya başındaki ayraçsız çöp atlanır
+                start = _next_boundary(mm, 0, size)
+            while start < size:
+                end = _next_boundary(mm, start + 5, size)
+                # Sadece bu mesajın baytları kopyalanır; sayfaları işletim sistemi yönetir
+                yield start, end, mm[start:end]
+                start = end
+
+
+def iter_eml(path: str, start_index: int = 0) -> Iterator[RawMessage]:
+    """`.eml` dosyasını ya da dizinini oku, konum olarak dosya sırasını kullan"""
+    files = _eml_files(path)
+    for index in range(start_index, len(files)):
+        with open(files[index], "rb") as f:
+            yield index, index + 1, f.read()
+
+
+def iter_messages(path: str, start_offset: int = 0) -> Iterator[RawMessage]:
+    """Kaynağın türüne göre ham mesajları döndür"""
+    if _is_eml_source(path):
+        return iter_eml(path, start_offset)
+    return iter_mbox(path, start_offset)
+
+
+def source_fingerprint(path: str) -> str:
+    """Devam noktasının aynı kaynağa ait olduğunu doğrulamak için parmak izi"""
+    digest = hashlib.blake2b(digest_size=16)
+    if os.path.isdir(path):
+        for name in _eml_files(path):
+            digest.update(os.path.relpath(name, path).encode("utf-8", "surrogateescape") + b"\0")
+    else:
+        digest.update(str(os.path.getsize(path)).encode())
+        with open(path, "rb") as f:
+            digest.update(f.read(FINGERPRINT_BYTES))
+    return digest.hexdigest()
+
+
+def _decode_header_value(value: Any) -> str:
+    if not value:
+        return ""
+    try:
+        return str(make_header(decode_header(str(value)))).strip()
+    except Exception:
+        return str(value).strip()
+
+
+def _decode_payload(part) -> str:
+    payload = part.get_payload(decode=True) or b""
+    charset = part.get_content_charset() or "utf-8"
+    try:
+        return payload.decode(charset, errors="replace")
+    except LookupError:
+        return payload.decode("utf-8", errors="replace")
+
+
+def _html_to_text(html: str) -> str:
+    if not html:
+        return ""
+    try:
+        from bs4 import BeautifulSoup
+    except ImportError:
+        return re.sub(r"\s+", " ", re.sub(r"<[^>]+>", " ", html)).strip()
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(["script", "style"]):
+        tag.decompose()
+    return " ".join(soup.get_text(separator=" ").split())
+
+
+def parse_message(raw: bytes, fallback_id: str, max_body_chars: int = None) -> Optional[Dict]:
+    """
+    Ham mesajı Gmail taramasının ürettiği e-posta sözlüğüne çevir
+
+    Ekler çözülmez; düz metin gövde tercih edilir, yoksa HTML metne çevrilir.
+    Gövde `max_body_chars` ile sınırlanır.
+    """
+    max_body_chars = settings.MBOX_MAX_BODY_CHARS if max_body_chars is None else max_body_chars
+    if raw.startswith(b"From "):
+        # mbox zarf satırı mesajın parçası değil
+        raw = raw.split(b"\n", 1)[1] if b"\n" in raw else b""
+        raw = MBOXRD_ESCAPE.sub(rb"\1", raw)
+    if not raw.strip():
+        return None
+
+    message = message_from_bytes(raw)
+    plain, html = None, None
+    for part in message.walk():
+        if part.is_multipart():
+            continue
+        if "attachment" in str(part.get("Content-Disposition", "")).lower():
+            continue
+        content_type = part.get_content_type()
+        if content_type == "text/plain" and plain is None:
+            plain = _decode_payload(part)
+        elif content_type == "text/html" and html is None:
+            html = _decode_payload(part)
+        if plain is not None and html is not None:
+            break
+
+    body = plain if plain and plain.strip() else _html_to_text(html)
+    body = body[:max_body_chars]
+    message_id = str(message.get("Message-ID", "")).strip().strip("<>")
+
+    return {
+        "id": message_id or fallback_id,
+        "subject": _decode_header_value(message.get("Subject")),
+        "sender": _decode_header_value(message.get("From")),
+        "date": str(message.get("Date", "")),
+        "body": body,
+        # Çok büyük HTML gövdeleri saklanmaz, sınıflandırma düz metinle yapılır
+        "html_body": html if html and len(html) <= max_body_chars * 4 else "",
+        "snippet": body[:200]
+    }
+
+
+class MboxIngestService:
+    """
+    mbox/EML içe aktarma servisi
+
+    Bellekte aynı anda en fazla bir parça (chunk_size e-posta) tutulur. Her parça
+    `email_analyzer_service.analyze_emails` ile sınıflandırılır, başvurular tek
+    `save_applications` çağrısıyla kaydedilir ve ardından devam noktası yazılır.
+    """
+
+    def __init__(self, state_dir: str = None, chunk_size: int = None):
+        self.state_dir = state_dir or settings.MBOX_INGEST_STATE_DIR
+        self.chunk_size = chunk_size or settings.MBOX_INGEST_CHUNK_SIZE
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._active_sources: Dict[str, str] = {}
+
+    def _state_path(self, path: str, user_id: str) -> str:
+        key = hashlib.blake2b(f"{path}\0{user_id}".encode("utf-8", "surrogateescape"), digest_size=16).hexdigest()
+        return os.path.join(self.state_dir, f"{key}.json")
+
+    def _load_state(self, state_path: str) -> Optional[Dict]:
+        try:
+            with open(state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_state(self, state_path: str, state: Dict):
+        state["updated_at"] = datetime.now().isoformat()
+        try:
+            os.makedirs(self.state_dir, exist_ok=True)
+            # Yarım yazılmış devam noktası okunmasın diye geçici dosya + os.replace
+            temp_path = f"{state_path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False)
+            os.replace(temp_path, state_path)
+        except OSError as e:
+            logger.warning("İçe aktarma devam noktası yazılamadı (%s): %s", state_path, e)
+
+    @staticmethod
+    def _parse_chunk(raws: List[RawMessage], fingerprint: str, max_body_chars: int) -> Tuple[List[Dict], int]:
+        emails, errors = [], 0
+        for start, _, raw in raws:
+            try:
+                parsed = parse_message(raw, f"mbox:{fingerprint[:8]}:{start}", max_body_chars)
+            except Exception as e:
+                logger.debug("Mesaj ayrıştırılamadı (konum %d): %s", start, e)
+                parsed = None
+            if parsed is None:
+                errors += 1
+            else:
+                emails.append(parsed)
+        return emails, errors
+
+    async def _process_chunk(self, emails: List[Dict], user_id: str) -> Tuple[int, int]:
+        """Parçayı sınıflandır ve başvuruları toplu kaydet: (başvuru, yeni kayıt)"""
+        if not emails:
+            return 0, 0
+        result = await email_analyzer_service.analyze_emails(emails)
+        applications = result.get("applications", [])
+        if not applications:
+            return 0, 0
+        for application in applications:
+            application["is_job_application"] = True
+            application.setdefault("application_status", application.get("status", ""))
+            application["source"] = "mbox"
+        saved = application_service.save_applications(applications, user_id)
+        try:
+            # Analizler de aynı parça halinde e-posta indeksi kuyruğuna alınır
+            await asyncio.to_thread(application_service.save_email_analyses_to_chroma, applications, user_id, emails)
+        except Exception as e:
+            logger.warning("Parça e-posta indeksine yazılamadı: %s", e)
+        return len(applications), saved.get("saved_count", 0)
+
+    async def ingest(self, path: str, user_id: str, chunk_size: int = None, resume: bool = True,
+                     limit: Optional[int] = None,
+                     progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Kaynaktaki e-postaları içe aktar
+
+        Args:
+            path: `.mbox` dosyası, `.eml` dosyası ya da `.eml` dizini
+            user_id: Başvuruların kaydedileceği kullanıcı
+            chunk_size: Bir seferde sınıflandırılıp kaydedilecek e-posta sayısı
+            resume: Kayıtlı devam noktasından sürdür
+            limit: Bu çalıştırmada işlenecek en fazla mesaj sayısı
+            progress: Her parçadan sonra ilerleme sözlüğüyle çağrılır
+        """
+        path = os.path.abspath(path)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Kaynak bulunamadı: {path}")
+        if not user_id:
+            raise ValueError("User ID gerekli")
+        chunk_size = max(1, chunk_size or self.chunk_size)
+        max_body_chars = settings.MBOX_MAX_BODY_CHARS
+
+        fingerprint = source_fingerprint(path)
+        state_path = self._state_path(path, user_id)
+        state = self._load_state(state_path) if resume else None
+        if not state or state.get("fingerprint") != fingerprint:
+            state = {
+                "source": path, "user_id": user_id, "fingerprint": fingerprint, "offset": 0,
+                "messages": 0, "parse_errors": 0, "applications": 0, "saved": 0, "completed": False
+            }
+        resumed_from = state["offset"]
+
+        run = {"messages": 0, "parse_errors": 0, "applications": 0, "saved": 0, "chunks": 0}
+        started = time.perf_counter()
+
+        async def flush(raws: List[RawMessage]):
+            emails, errors = await asyncio.to_thread(self._parse_chunk, raws, fingerprint, max_body_chars)
+            applications, saved = await self._process_chunk(emails, user_id)
+            for key, value in (("messages", len(raws)), ("parse_errors", errors),
+                               ("applications", applications), ("saved", saved)):
+                run[key] += value
+                state[key] += value
+            run["chunks"] += 1
+            # Konum sadece parça kaydedildikten sonra ilerler
+            state["offset"] = raws[-1][1]
+            self._save_state(state_path, state)
+            if progress:
+                progress({**run, "offset": state["offset"]})
+
+        finished = state.get("completed", False)
+        if not finished:
+            pending: List[RawMessage] = []
+            finished = True
+            for raw_message in iter_messages(path, state["offset"]):
+                pending.append(raw_message)
+                if len(pending) >= chunk_size:
+                    await flush(pending)
+                    pending = []
+                if limit and run["messages"] + len(pending) >= limit:
+                    finished = False
+                    break
+            if pending:
+                await flush(pending)
+            state["completed"] = finished
+            self._save_state(state_path, state)
+
+        elapsed = time.perf_counter() - started
+        logger.info("İçe aktarma: %s - %d mesaj, %d başvuru, %d yeni kayıt (%.1f sn)",
+                    path, run["messages"], run["applications"], run["saved"], elapsed)
+        return {
+            "success": True,
+            "source": path,
+            "user_id": user_id,
+            "resumed_from": resumed_from,
+            "offset": state["offset"],
+            "completed": state["completed"],
+            "run": {
+                **run,
+                "seconds": round(elapsed, 3),
+                "messages_per_second": round(run["messages"] / elapsed, 1) if elapsed and run["messages"] else None
+            },
+            "totals": {key: state[key] for key in ("messages", "parse_errors", "applications", "saved")}
+        }
+
+    def start_job(self, path: str, user_id: str, **options) -> Dict[str, Any]:
+        """İçe aktarmayı arka planda başlat; aynı kaynak zaten işleniyorsa o işi döndür"""
+        source_key = self._state_path(os.path.abspath(path), user_id)
+        active_job = self._active_sources.get(source_key)
+        if active_job:
+            return self.get_job(active_job)
+
+        job_id = uuid.uuid4().hex[:12]
+        job = {
+            "job_id": job_id,
+            "status": "running",
+            "source": os.path.abspath(path),
+            "user_id": user_id,
+            "started_at": datetime.now().isoformat(),
+            "finished_at": None,
+            "progress": {},
+            "result": None,
+            "error": None
+        }
+        self.jobs[job_id] = job
+        self._active_sources[source_key] = job_id
+
+        async def run():
+            try:
+                job["result"] = await self.ingest(path, user_id, progress=job["progress"].update, **options)
+                job["status"] = "completed"
+            except Exception as e:
+                logger.error("İçe aktarma başarısız (%s): %s", path, e)
+                job["status"] = "failed"
+                job["error"] = str(e)
+            finally:
+                job["finished_at"] = datetime.now().isoformat()
+                self._active_sources.pop(source_key, None)
+                self._tasks.pop(job_id, None)
+
+        self._tasks[job_id] = asyncio.get_running_loop().create_task(run())
+        return dict(job)
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self.jobs.get(job_id)
+        return dict(job) if job else None
+
+
+# Global servis instance'ı
+mbox_ingest_service = MboxIngestService()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="mbox/EML dosyalarını toplu içe aktar")
+    parser.add_argument("--path", required=True, help=".mbox dosyası, .eml dosyası ya da .eml dizini")
+    parser.add_argument("--user-id", required=True, help="Başvuruların kaydedileceği kullanıcı")
+    parser.add_argument("--chunk-size", type=int, default=settings.MBOX_INGEST_CHUNK_SIZE)
+    parser.add_argument("--limit", type=int, help="Bu çalıştırmada işlenecek en fazla mesaj")
+    parser.add_argument("--no-resume", action="store_true", help="Devam noktasını yok say, baştan başla")
+    args = parser.parse_args()
+
+    def show_progress(progress: Dict[str, Any]):
+        print(f"📬 {progress['messages']} mesaj, {progress['applications']} başvuru, "
+              f"{progress['saved']} yeni kayıt (konum {progress['offset']})")
+
+    report = asyncio.run(mbox_ingest_service.ingest(
+        args.path, args.user_id, chunk_size=args.chunk_size,
+        resume=not args.no_resume, limit=args.limit, progress=show_progress
+    ))
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+import os
+import json
+import time
+import asyncio
+import hashlib
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+import httpx
+from ..config.settings import settings
+from ..utils.metrics import record_cache
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+)
+
+
+class PageFetchError(Exception):
+    """Sayfa çekilemedi ve cache'te kullanılabilir kopya yok"""
+
+
+class PageFetcher:
+    """
+    İş ilanı sayfaları için async, cache'li indirici
+
+    - Tek bir bağlantı havuzu (httpx.AsyncClient) tüm isteklerde paylaşılır.
+    - Gövde akış olarak okunur, `max_bytes` aşıldığında okuma kesilir.
+    - Sayfalar URL'e göre diskte saklanır; `fresh_seconds` içinde ağa çıkılmaz, sonrasında
+      ETag/Last-Modified ile koşullu istek atılır ve 304'te cache'teki kopya kullanılır.
+    - Aynı host'a eşzamanlı istek sayısı sınırlanır, aynı URL için eşzamanlı istekler birleştirilir.
+    """
+
+    def __init__(self, cache_dir: str = None, max_bytes: int = None, per_host: int = None,
+                 timeout: float = None, fresh_seconds: float = None):
+        self.cache_dir = cache_dir or settings.PAGE_CACHE_DIR
+        self.max_bytes = settings.PAGE_FETCH_MAX_BYTES if max_bytes is None else max_bytes
+        self.per_host = settings.PAGE_FETCH_PER_HOST if per_host is None else per_host
+        self.timeout = settings.PAGE_FETCH_TIMEOUT if timeout is None else timeout
+        self.fresh_seconds = settings.PAGE_CACHE_FRESH_SECONDS if fresh_seconds is None else fresh_seconds
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.stats = {"fetched": 0, "revalidated": 0, "fresh_hits": 0, "truncated": 0, "errors": 0}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers={"User-Agent": USER_AGENT},
+                timeout=httpx.Timeout(self.timeout, connect=min(self.timeout, 3.0)),
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+                follow_redirects=True
+            )
+        return self._client
+
+    async def aclose(self):
+        """Bağlantı havuzunu kapat"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _cache_paths(self, url: str):
+        digest = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+        base = os.path.join(self.cache_dir, digest[:2], digest)
+        return base + ".json", base + ".body"
+
+    def _read_cache(self, url: str) -> Optional[Dict]:
+        meta_path, body_path = self._cache_paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                meta["content"] = f.read()
+        except (OSError, ValueError):
+            return None
+        # Hash çakışmasına karşı URL doğrulanır
+        return meta if meta.get("url") == url else None
+
+    def _write_cache(self, url: str, meta: Dict, content: Optional[bytes]):
+        meta_path, body_path = self._cache_paths(url)
+        try:
+            os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+            # Yarım yazılmış dosya okunmasın diye geçici dosya + os.replace
+            if content is not None:
+                temp_path = f"{body_path}.{os.getpid()}.tmp"
+                with open(temp_path, "wb") as f:
+                    f.write(content)
+                os.replace(temp_path, body_path)
+            temp_path = f"{meta_path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(temp_path, meta_path)
+        except OSError as e:
+            logger.warning("Sayfa cache'e yazılamadı (%s): %s", url, e)
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc.lower()
+        semaphore = self._host_limits.get(host)
+        if semaphore is None:
+            semaphore = self._host_limits[host] = asyncio.Semaphore(self.per_host)
+        return semaphore
+
+    async def fetch(self, url: str) -> Dict:
+        """
+        Sayfayı getir: {"url", "content" (bytes), "encoding", "truncated", "source"}
+
+        source: "fresh" (ağa çıkılmadı), "revalidated" (304), "network" (yeni indirildi)
+        veya "stale" (ağ hatası, eski kopya kullanıldı).
+        """
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(url))
+            self._inflight[url] = task
+            task.add_done_callback(lambda _: self._inflight.pop(url, None))
+        return await asyncio.shield(task)
+
+    async def _fetch(self, url: str) -> Dict:
+        cached = await asyncio.to_thread(self._read_cache, url)
+        if cached is not None and time.time() - cached.get("checked_at", 0) < self.fresh_seconds:
+            self.stats["fresh_hits"] += 1
+            record_cache("page_fetch", True)
+            return {**cached, "source": "fresh"}
+
+        headers = {}
+        if cached is not None:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        try:
+            async with self._host_limit(url):
+                async with self.client.stream("GET", url, headers=headers) as response:
+                    if response.status_code == 304 and cached is not None:
+                        cached["checked_at"] = time.time()
+                        content = cached.pop("content")
+                        await asyncio.to_thread(self._write_cache, url, cached, None)
+                        self.stats["revalidated"] += 1
+                        record_cache("page_fetch", True)
+                        return {**cached, "content": content, "source": "revalidated"}
+
+                    response.raise_for_status()
+                    content, truncated = await self._read_limited(response)
+                    meta = {
+                        "url": url,
+                        "etag": response.headers.get("etag"),
+                        "last_modified": response.headers.get("last-modified"),
+                        "encoding": response.charset_encoding,
+                        "truncated": truncated,
+                        "checked_at": time.time()
+                    }
+        except httpx.HTTPError as e:
+            self.stats["errors"] += 1
+            if cached is not None:
+                logger.warning("Sayfa yenilenemedi, cache'teki kopya kullanılıyor (%s): %s", url, e)
+                return {**cached, "source": "stale"}
+            raise PageFetchError(f"{url}: {e}") from e
+
+        record_cache("page_fetch", False)
+        self.stats["fetched"] += 1
+        if truncated:
+            self.stats["truncated"] += 1
+        await asyncio.to_thread(self._write_cache, url, meta, content)
+        return {**meta, "content": content, "source": "network"}
+
+    async def _read_limited(self, response: httpx.Response):
+        """Gövdeyi en fazla max_bytes kadar oku; sınır aşılırsa bağlantıyı bırak"""
+        chunks = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            if size + len(chunk) > self.max_bytes:
+                # Kalan gövde indirilmez, stream bağlamından çıkınca bağlantı kapatılır
+                chunks.append(chunk[:self.max_bytes - size])
+                return b"".join(chunks), True
+            chunks.append(chunk)
+            size += len(chunk)
+        return b"".join(chunks), False
+
+
+# Global servis instance'ı
+page_fetcher = PageFetcher()
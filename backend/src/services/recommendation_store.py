@@ -0,0 +1,110 @@
+import time
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, Optional
+from .application_service import application_service
+from .analytics_service import analytics_service
+from .search_service import search_service
+from ..config.settings import settings
+from ..utils.metrics import record_cache
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RecommendationStore:
+    """
+    Kullanıcı başına öneri cache'i (stale-while-revalidate)
+
+    İstekler her zaman cache'teki sonucu hemen alır. Başvurular değiştiğinde kayıt
+    eskimiş sayılır ve arka planda, son değişiklikten `debounce_seconds` sonra
+    yeniden hesaplanır; toplu kayıtlar tek bir hesaplamaya düşer. Gemini çağrısı
+    sadece bu arka plan görevinde yapılır.
+    """
+
+    def __init__(self, debounce_seconds: float = None):
+        self.debounce_seconds = settings.RECOMMENDATION_DEBOUNCE_SECONDS if debounce_seconds is None else debounce_seconds
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._profiles: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._last_change: Dict[str, float] = {}
+        application_service.add_change_listener(self.invalidate)
+
+    def invalidate(self, user_id: str):
+        """Başvurular değişti: kaydı eskit ve ertelenmiş yeniden hesaplama planla"""
+        self._last_change[user_id] = time.monotonic()
+        # Hiç görüntülenmemiş kullanıcılar için (ör. toplu içe aktarma) hesaplama yapılmaz
+        if user_id in self._entries:
+            self._schedule(user_id, debounce=True)
+
+    def _schedule(self, user_id: str, debounce: bool):
+        if user_id in self._tasks:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Event loop dışında (CLI, script) sadece eskimiş olarak kalır, sonraki istekte yenilenir
+            return
+        task = loop.create_task(self._refresh(user_id, debounce))
+        self._tasks[user_id] = task
+
+    async def _refresh(self, user_id: str, debounce: bool):
+        try:
+            if debounce:
+                # Son değişiklikten bu yana debounce süresi dolana kadar bekle
+                while True:
+                    remaining = self._last_change.get(user_id, 0.0) + self.debounce_seconds - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    await asyncio.sleep(remaining)
+            await self._compute(user_id, self._profiles.get(user_id))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Öneri yeniden hesaplama hatası (%s): %s", user_id, e)
+        finally:
+            self._tasks.pop(user_id, None)
+
+    async def _compute(self, user_id: str, user_profile: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        version = application_service.get_data_version(user_id)
+        recommendations = await search_service.generate_ai_recommendations(
+            application_service.get_application_records(user_id),
+            user_profile,
+            analytics=analytics_service.get_user_analytics(user_id)
+        )
+        entry = {
+            "recommendations": recommendations,
+            "data_version": version,
+            "generated_at": datetime.now().isoformat(),
+            "personalized": bool(user_profile)
+        }
+        self._entries[user_id] = entry
+        logger.debug("Öneriler hesaplandı: %s (versiyon %d)", user_id, version)
+        return entry
+
+    async def get(self, user_id: str, user_profile: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Önerileri beklemeden döndür; gerekiyorsa arka planda yenile"""
+        self._profiles[user_id] = user_profile
+        entry = self._entries.get(user_id)
+
+        if entry is None:
+            # İlk istek: LLM'siz sezgisel öneriler hemen hesaplanır, kişiselleştirme arka planda eklenir
+            record_cache("recommendations", False)
+            entry = await self._compute(user_id, None)
+            if user_profile:
+                self._schedule(user_id, debounce=False)
+        else:
+            stale = entry["data_version"] != application_service.get_data_version(user_id)
+            record_cache("recommendations", not stale)
+            if stale:
+                self._schedule(user_id, debounce=True)
+
+        return {
+            **entry,
+            "stale": entry["data_version"] != application_service.get_data_version(user_id),
+            "refreshing": user_id in self._tasks
+        }
+
+
+# Global servis instance'ı
+recommendation_store = RecommendationStore()
@@ -0,0 +1,201 @@
+import re
+import json
+import math
+from typing import List, Dict, Optional, Any, Iterable, Sequence, Tuple
+from ..config.classifier_config import ClassifierConfig
+
+
+class _Rule:
+    """Derlenmiş tek bir sınıflandırma kuralı"""
+
+    def __init__(self, rule_id: str, pattern: str, weights: List[tuple]):
+        self.rule_id = rule_id
+        self.pattern = pattern
+        self.weights = weights  # (kategori index'i, ağırlık) ikilileri
+
+
+class RuleClassifier:
+    """
+    Kural tabanlı e-posta sınıflandırıcı
+
+    Kurallar bildirimsel bir JSON dosyasından bir kez yüklenir ve tek bir birleşik
+    regex'te derlenir. Metin lookahead tarayıcıyla taranır, eşleşen her kural ağırlıklarını
+    ilgili kategorilere ekler ve skorlar sıcaklıklı softmax ile olasılık dağılımına
+    çevrilir. BERT yokken veya yüklenirken kullanılan hızlı yoldur.
+    """
+
+    # Kalan kural kümelerine göre derlenen tarayıcıların üst sınırı
+    MAX_CACHED_SCANNERS = 256
+
+    def __init__(self, config: Dict[str, Any], temperature: Optional[float] = None):
+        self.version = config.get("version", 1)
+        self.default_category = config.get("default_category", "genel_bilgilendirme")
+
+        priors = config.get("priors", {})
+        categories = list(priors)
+        for rule in config.get("rules", []):
+            for category in rule.get("weights", {}):
+                if category not in categories:
+                    categories.append(category)
+        if self.default_category not in categories:
+            categories.append(self.default_category)
+
+        self.categories: List[str] = categories
+        self._category_index = {category: index for index, category in enumerate(categories)}
+        self.priors: List[float] = [float(priors.get(category, 0.0)) for category in categories]
+        self.temperature = float(temperature or config.get("temperature", 1.0))
+
+        self.rules: List[_Rule] = []
+        for index, rule in enumerate(config.get("rules", [])):
+            rule_id = rule.get("id", f"rule_{index}")
+            weights = [
+                (self._category_index[category], float(weight))
+                for category, weight in rule.get("weights", {}).items()
+            ]
+            # Her kural tek başına da derlenir: hatalı pattern hemen burada yakalanır
+            re.compile(rule["pattern"])
+            self.rules.append(_Rule(rule_id, rule["pattern"], weights))
+
+        # Kural kümesi -> birleşik tarayıcı (tarama tüm kurallarla, gölge kontrolü kalanlarla yapılır)
+        self._scanners: Dict[Tuple[int, ...], "re.Pattern"] = {}
+        self._all_rules = tuple(range(len(self.rules)))
+
+    @classmethod
+    def from_file(cls, path: str, temperature: Optional[float] = None) -> "RuleClassifier":
+        """Kural dosyasından sınıflandırıcı oluştur"""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f), temperature=temperature)
+
+    def _scanner_for(self, indices: Tuple[int, ...]) -> "re.Pattern":
+        """
+        Verilen kuralların birleşik tarayıcısı
+
+        Her kural kendi isimli grubuyla zero-width lookahead alternasyonunda yer alır. Eşleşmeler
+        metni tüketmediği için iç içe geçen anahtar kelimeler ("coding challenge" içindeki "challenge")
+        ayrı pozisyonlarda yakalanır.
+        """
+        scanner = self._scanners.get(indices)
+        if scanner is None:
+            alternatives = "|".join(f"(?P<r{index}>{self.rules[index].pattern})" for index in indices)
+            scanner = re.compile(r"(?=\b(?:" + alternatives + r")\b)")
+            if len(self._scanners) >= self.MAX_CACHED_SCANNERS:
+                self._scanners.clear()
+            self._scanners[indices] = scanner
+        return scanner
+
+    def match_rules(self, text: str) -> List[int]:
+        """
+        Metinde eşleşen kuralların index'lerini döndür (her kural bir kez sayılır)
+
+        Sonuç her kuralın metinde kelime sınırlarıyla ayrı ayrı aranmasıyla aynıdır. Bir pozisyonda
+        alternasyondaki ilk kural kazandığı için aynı yerden başlayan sonraki kurallar ("test" ve
+        "test link") gölgede kalabilir; bu yüzden eşleşme bulunan pozisyonlar henüz bulunmamış
+        kurallarla yeniden denenir. Diğer pozisyonlarda hiçbir kural eşleşmediği için metnin
+        geri kalanının tekrar taranmasına gerek yoktur.
+        """
+        if not text or not self.rules:
+            return []
+        lowered = text.lower()
+        matched = []
+        seen = set()
+        positions = []
+        for match in self._scanner_for(self._all_rules).finditer(lowered):
+            positions.append(match.start())
+            index = int(match.lastgroup[1:])
+            if index not in seen:
+                seen.add(index)
+                matched.append(index)
+                # Tüm kurallar bulunduysa kalan metni taramaya gerek yok
+                if len(seen) == len(self.rules):
+                    return matched
+
+        remaining = tuple(index for index in self._all_rules if index not in seen)
+        scanner = self._scanner_for(remaining) if remaining else None
+        for position in positions:
+            while scanner is not None:
+                match = scanner.match(lowered, position)
+                if match is None:
+                    break
+                index = int(match.lastgroup[1:])
+                matched.append(index)
+                remaining = tuple(other for other in remaining if other != index)
+                scanner = self._scanner_for(remaining) if remaining else None
+            if scanner is None:
+                break
+        return matched
+
+    def _scores_for(self, matched: List[int]) -> List[float]:
+        scores = list(self.priors)
+        for index in matched:
+            for category_index, weight in self.rules[index].weights:
+                scores[category_index] += weight
+        return scores
+
+    def score(self, text: str) -> List[float]:
+        """Kategori başına ham skorları hesapla"""
+        return self._scores_for(self.match_rules(text))
+
+    def _softmax(self, scores: Sequence[float], temperature: float) -> List[float]:
+        top = max(scores)
+        exps = [math.exp((value - top) / temperature) for value in scores]
+        total = sum(exps)
+        return [value / total for value in exps]
+
+    def classify(self, text: str) -> Dict[str, Any]:
+        """E-postayı sınıflandır ve kalibre edilmiş dağılımı döndür"""
+        matched = self.match_rules(text)
+        probabilities = self._softmax(self._scores_for(matched), self.temperature)
+        best = max(range(len(probabilities)), key=probabilities.__getitem__)
+        if not matched:
+            best = self._category_index[self.default_category]
+
+        return {
+            "label": self.categories[best],
+            "score": round(probabilities[best], 4),
+            "distribution": {
+                category: round(probability, 4)
+                for category, probability in zip(self.categories, probabilities)
+            },
+            "matched_rules": [self.rules[index].rule_id for index in matched]
+        }
+
+    def classify_many(self, texts: Iterable[str]) -> List[Dict[str, Any]]:
+        """Birden fazla e-postayı sınıflandır"""
+        return [self.classify(text) for text in texts]
+
+    def fit_temperature(self, texts: Sequence[str], labels: Sequence[str],
+                        candidates: Optional[Sequence[float]] = None) -> float:
+        """
+        Etiketli örneklerle softmax sıcaklığını kalibre et
+
+        Negatif log-likelihood'u en düşük yapan sıcaklık seçilir ve sınıflandırıcıya atanır.
+        """
+        candidates = candidates or [0.2, 0.3, 0.4, 0.5, 0.6, 0.8, 1.0, 1.25, 1.5, 2.0, 3.0]
+        samples = [
+            (self.score(text), self._category_index[label])
+            for text, label in zip(texts, labels)
+            if label in self._category_index
+        ]
+        if not samples:
+            return self.temperature
+
+        best_temperature = self.temperature
+        best_loss = float("inf")
+        for temperature in candidates:
+            loss = 0.0
+            for scores, label_index in samples:
+                probabilities = self._softmax(scores, temperature)
+                loss -= math.log(max(probabilities[label_index], 1e-12))
+            if loss < best_loss:
+                best_loss = loss
+                best_temperature = temperature
+
+        self.temperature = best_temperature
+        return best_temperature
+
+
+# Global servis instance'ı
+rule_classifier = RuleClassifier.from_file(
+    ClassifierConfig.RULES_PATH,
+    temperature=ClassifierConfig.RULES_TEMPERATURE or None
+)
@@ -1,13 +1,21 @@
 import re
+import asyncio
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime
 from .ai_service import AIService
-from ..models.schemas import ApplicationData as Application
-import logging
+from .analytics_service import build_frame, compute_analytics
+from ..utils.logger import get_logger
 
-# Logging ayarla
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+# Metin aramasında bakılan alanlar: (alan, puan, eşleşme nedeni)
+SEARCH_FIELDS = [
+    ("company_name", 10, "Şirket adı eşleşmesi"),
+    ("position", 8, "Pozisyon eşleşmesi"),
+    ("requirements", 6, "Gereksinim eşleşmesi"),
+    ("description", 5, "Açıklama eşleşmesi"),
+    ("location", 4, "Konum eşleşmesi"),
+]
 
 class SearchService:
     """Gelişmiş arama ve öneri servisi"""
@@ -23,7 +31,7 @@ class SearchService:
         
     async def search_applications(
         self, 
-        applications: List[Application], 
+        applications: List[Dict], 
         query: str,
         filters: Dict[str, Any] = None
     ) -> Dict[str, Any]:
@@ -46,33 +54,11 @@ class SearchService:
             
             # Metin arama
             if query_lower:
-                # Şirket adı arama
-                if hasattr(app, 'company_name') and app.company_name and query_lower in app.company_name.lower():
-                    score += 10
-                    match_reasons.append("Şirket adı eşleşmesi")
-                
-                # Pozisyon arama
-                if hasattr(app, 'position') and app.position and query_lower in app.position.lower():
-                    score += 8
-                    match_reasons.append("Pozisyon eşleşmesi")
-                
-                # Açıklama arama
-                if hasattr(app, 'description') and app.description:
-                    if query_lower in app.description.lower():
-                        score += 5
-                        match_reasons.append("Açıklama eşleşmesi")
-                
-                # Gereksinimler arama
-                if hasattr(app, 'requirements') and app.requirements:
-                    if query_lower in app.requirements.lower():
-                        score += 6
-                        match_reasons.append("Gereksinim eşleşmesi")
-                
-                # Konum arama
-                if hasattr(app, 'location') and app.location:
-                    if query_lower in app.location.lower():
-                        score += 4
-                        match_reasons.append("Konum eşleşmesi")
+                for field, weight, reason in SEARCH_FIELDS:
+                    value = app.get(field)
+                    if value and query_lower in str(value).lower():
+                        score += weight
+                        match_reasons.append(reason)
             
             # Filtreler
             if filters:
@@ -80,13 +66,10 @@ class SearchService:
                     continue
             
             if score > 0 or not query_lower:
-                app_with_score = app.copy() if hasattr(app, 'copy') else app
-                app_with_score.search_score = score
-                app_with_score.match_reasons = match_reasons
-                results.append(app_with_score)
+                results.append({**app, "search_score": score, "match_reasons": match_reasons})
         
         # Skora göre sırala
-        results.sort(key=lambda x: getattr(x, 'search_score', 0), reverse=True)
+        results.sort(key=lambda x: x["search_score"], reverse=True)
         
         return {
             "results": results,
@@ -99,67 +82,68 @@ class SearchService:
             }
         }
     
-    def _apply_filters(self, app: Application, filters: Dict[str, Any]) -> bool:
+    def _apply_filters(self, app: Dict, filters: Dict[str, Any]) -> bool:
         """Filtreleri uygula"""
         
         # Durum filtresi
-        if 'status' in filters and filters['status']:
-            if not hasattr(app, 'application_status') or app.application_status not in filters['status']:
+        if filters.get('status'):
+            if app.get('application_status') not in filters['status']:
                 return False
         
         # Aşama filtresi
-        if 'stage' in filters and filters['stage']:
-            if not hasattr(app, 'next_action') or app.next_action not in filters['stage']:
+        if filters.get('stage'):
+            if app.get('next_action') not in filters['stage']:
                 return False
         
         # Tarih aralığı filtresi
-        if 'date_range' in filters and filters['date_range']:
+        if filters.get('date_range'):
             start_date = filters['date_range'].get('start')
             end_date = filters['date_range'].get('end')
+            email_date = app.get('email_date')
             
-            if start_date and (not hasattr(app, 'email_date') or not app.email_date or app.email_date < start_date):
+            if start_date and (not email_date or email_date < start_date):
                 return False
-            if end_date and (not hasattr(app, 'email_date') or not app.email_date or app.email_date > end_date):
+            if end_date and (not email_date or email_date > end_date):
                 return False
         
         # Şirket filtresi
-        if 'company' in filters and filters['company']:
-            if not hasattr(app, 'company_name') or not app.company_name or filters['company'].lower() not in app.company_name.lower():
+        if filters.get('company'):
+            company_name = app.get('company_name')
+            if not company_name or filters['company'].lower() not in company_name.lower():
                 return False
         
         # Pozisyon filtresi
-        if 'position' in filters and filters['position']:
-            if not hasattr(app, 'position') or not app.position or filters['position'].lower() not in app.position.lower():
+        if filters.get('position'):
+            position = app.get('position')
+            if not position or filters['position'].lower() not in position.lower():
                 return False
         
         return True
     
     async def generate_ai_recommendations(
         self, 
-        applications: List[Application],
-        user_profile: Dict[str, Any] = None
+        applications: List[Dict],
+        user_profile: Dict[str, Any] = None,
+        analytics: Dict[str, Any] = None
     ) -> List[Dict[str, Any]]:
         """AI tabanlı kişiselleştirilmiş öneriler oluştur"""
         
         recommendations = []
         
-        # Başvuru durumu analizi
-        active_apps = [app for app in applications if hasattr(app, 'application_status') and app.application_status in ['active', 'pending']]
-        finished_apps = [app for app in applications if hasattr(app, 'application_status') and app.application_status in ['finished', 'rejected', 'accepted']]
-        
-        # Başarı oranı hesapla
-        success_rate = len([app for app in finished_apps if hasattr(app, 'application_status') and app.application_status == 'accepted']) / len(finished_apps) if finished_apps else 0
+        # Aşama, şirket ve trend analizleri tek bir analitik özetten okunur
+        if analytics is None:
+            analytics = compute_analytics(build_frame(applications))
         
         # Aşama bazlı öneriler
-        stage_recommendations = await self._analyze_stages(active_apps)
+        stage_recommendations = await self._analyze_stages(analytics)
         recommendations.extend(stage_recommendations)
         
         # Şirket bazlı öneriler
-        company_recommendations = await self._analyze_companies(applications)
+        company_recommendations = await self._analyze_companies(analytics)
         recommendations.extend(company_recommendations)
         
         # Trend bazlı öneriler
-        trend_recommendations = await self._analyze_trends(applications)
+        trend_recommendations = await self._analyze_trends(analytics)
         recommendations.extend(trend_recommendations)
         
         # AI tabanlı kişiselleştirilmiş öneriler
@@ -186,18 +170,13 @@ class SearchService:
         """Mevcut timestamp'i ISO formatında döndür"""
         return datetime.now().isoformat()
     
-    async def _analyze_stages(self, active_apps: List[Application]) -> List[Dict[str, Any]]:
+    async def _analyze_stages(self, analytics: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Aşama bazlı analiz ve öneriler"""
         
         recommendations = []
-        stage_counts = {}
-        
-        for app in active_apps:
-            stage = getattr(app, 'next_action', 'Bilinmiyor')
-            stage_counts[stage] = stage_counts.get(stage, 0) + 1
         
         # En çok başvuru olan aşamalar için öneriler
-        for stage, count in stage_counts.items():
+        for stage, count in analytics["active_next_actions"].items():
             if count > 1:
                 if 'Mülakat' in stage:
                     recommendations.append({
@@ -222,32 +201,13 @@ class SearchService:
         
         return recommendations
     
-    async def _analyze_companies(self, applications: List[Application]) -> List[Dict[str, Any]]:
+    async def _analyze_companies(self, analytics: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Şirket bazlı analiz ve öneriler"""
         
         recommendations = []
-        company_stats = {}
-        
-        for app in applications:
-            company = getattr(app, 'company_name', 'Bilinmiyor')
-            if company not in company_stats:
-                company_stats[company] = {
-                    'total': 0,
-                    'active': 0,
-                    'accepted': 0,
-                    'rejected': 0
-                }
-            
-            company_stats[company]['total'] += 1
-            if hasattr(app, 'application_status') and app.application_status in ['active', 'pending']:
-                company_stats[company]['active'] += 1
-            elif hasattr(app, 'application_status') and app.application_status == 'accepted':
-                company_stats[company]['accepted'] += 1
-            elif hasattr(app, 'application_status') and app.application_status == 'rejected':
-                company_stats[company]['rejected'] += 1
         
         # Şirket bazlı öneriler
-        for company, stats in company_stats.items():
+        for company, stats in analytics["company_stats"].items():
             if stats['total'] >= 2:
                 if stats['rejected'] > stats['accepted']:
                     recommendations.append({
@@ -262,20 +222,19 @@ class SearchService:
         
         return recommendations
     
-    async def _analyze_trends(self, applications: List[Application]) -> List[Dict[str, Any]]:
+    async def _analyze_trends(self, analytics: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Trend analizi ve öneriler"""
         
         recommendations = []
         
         # Son 30 günlük başvuru trendi
-        thirty_days_ago = datetime.now() - timedelta(days=30)
-        recent_apps = [app for app in applications if hasattr(app, 'email_date') and app.email_date and app.email_date >= thirty_days_ago.strftime('%Y-%m-%d')]
+        recent_count = analytics["recent_applications"]
         
-        if len(recent_apps) < 5:
+        if recent_count < 5:
             recommendations.append({
                 'type': 'trend_optimization',
                 'title': 'Başvuru Aktivitesi Düşük',
-                'description': 'Son 30 günde sadece {len(recent_apps)} başvuru. Daha aktif olun.',
+                'description': f'Son 30 günde sadece {recent_count} başvuru. Daha aktif olun.',
                 'priority_score': 6,
                 'icon': '📈',
                 'action': 'basvuru_artir',
@@ -286,7 +245,7 @@ class SearchService:
     
     async def _generate_personalized_recommendations(
         self, 
-        applications: List[Application], 
+        applications: List[Dict], 
         user_profile: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
         """AI tabanlı kişiselleştirilmiş öneriler"""
@@ -324,7 +283,8 @@ class SearchService:
                 logger.warning("AI Service kullanılamıyor")
                 return recommendations
             
-            ai_response = await self.ai_service.generate_ai_response(prompt)
+            # generate_ai_response senkron HTTP çağrısı yapar, event loop'u bloklamaması için thread'de çalışır
+            ai_response = await asyncio.to_thread(self.ai_service.generate_ai_response, prompt)
             
             # AI yanıtını parse et ve önerilere dönüştür
             if ai_response and 'candidates' in ai_response:
@@ -375,7 +335,7 @@ class SearchService:
         
         return None
     
-    def _generate_fallback_recommendations(self, applications: List[Application]) -> List[Dict[str, Any]]:
+    def _generate_fallback_recommendations(self, applications: List[Dict]) -> List[Dict[str, Any]]:
         """AI çalışmasa bile temel öneriler oluştur"""
         
         recommendations = []
@@ -412,3 +372,6 @@ class SearchService:
         })
         
         return recommendations
+
+# Global servis instance'ı
+search_service = SearchService()
@@ -0,0 +1,131 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Optional
+from .token_store import TokenStore
+from ..config.settings import settings
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TokenNotFoundError(Exception):
+    """Kullanıcının bağlı Gmail hesabı yok"""
+
+
+class TokenManager:
+    """
+    OAuth access token yaşam döngüsü
+
+    - Süresi dolmak üzere olan token'lar arka planda, süre dolmadan yenilenir; istekler
+      geçerli token ile beklemeden devam eder.
+    - Aynı kullanıcı için eşzamanlı yenileme istekleri tek bir çağrıda birleştirilir.
+    - Başka bir worker token'ı zaten yenilediyse (paylaşılan depo) tekrar yenilenmez.
+    """
+
+    def __init__(self, store: TokenStore, refresher: Callable[[str], Awaitable[None]],
+                 refresh_margin: float = None, check_interval: float = None):
+        self.store = store
+        self.refresher = refresher
+        self.refresh_margin = timedelta(
+            seconds=settings.TOKEN_REFRESH_MARGIN_SECONDS if refresh_margin is None else refresh_margin
+        )
+        self.check_interval = settings.TOKEN_REFRESH_CHECK_INTERVAL if check_interval is None else check_interval
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._scheduler: Optional[asyncio.Task] = None
+        self.stats = {"refreshes": 0, "coalesced": 0, "skipped": 0, "failures": 0}
+
+    def _needs_refresh(self, token_info: Dict) -> bool:
+        expires_at = token_info.get("expires_at")
+        return expires_at is None or datetime.utcnow() + self.refresh_margin >= expires_at
+
+    async def get_access_token(self, user_id: str) -> str:
+        """Geçerli access token'ı döndür; sadece süresi gerçekten dolmuşsa yenilemeyi bekle"""
+        token_info = self.store.get(user_id)
+        if token_info is None:
+            raise TokenNotFoundError(user_id)
+
+        if self._needs_refresh(token_info):
+            stale_token = token_info.get("access_token")
+            expires_at = token_info.get("expires_at")
+            if expires_at is None or datetime.utcnow() >= expires_at:
+                await self.refresh(user_id, stale_token=stale_token)
+                token_info = self.store.get(user_id) or token_info
+            else:
+                # Token hâlâ geçerli: yenileme arka planda sürer, istek beklemez
+                asyncio.ensure_future(self._refresh_quietly(user_id, stale_token))
+        return token_info["access_token"]
+
+    async def _refresh_quietly(self, user_id: str, stale_token: Optional[str]):
+        try:
+            await self.refresh(user_id, stale_token=stale_token)
+        except Exception:
+            # Hata _do_refresh içinde loglandı; token süresi dolduğunda istek yolunda tekrar denenir
+            pass
+
+    async def refresh(self, user_id: str, stale_token: Optional[str] = None):
+        """
+        Token'ı yenile (eşzamanlı çağrılar aynı yenilemeyi bekler)
+
+        stale_token verilirse ve depodaki token artık farklıysa (başka bir istek ya da
+        worker yeniledi) yeni çağrı yapılmaz.
+        """
+        task = self._inflight.get(user_id)
+        if task is not None:
+            self.stats["coalesced"] += 1
+            await asyncio.shield(task)
+            return
+
+        if stale_token is not None:
+            current = self.store.get(user_id)
+            if current and current.get("access_token") != stale_token:
+                self.stats["skipped"] += 1
+                return
+
+        task = asyncio.ensure_future(self._do_refresh(user_id))
+        self._inflight[user_id] = task
+        await asyncio.shield(task)
+
+    async def _do_refresh(self, user_id: str):
+        try:
+            await self.refresher(user_id)
+            self.stats["refreshes"] += 1
+        except Exception as e:
+            self.stats["failures"] += 1
+            logger.error("Token yenileme hatası (%s): %s", user_id, e)
+            raise
+        finally:
+            self._inflight.pop(user_id, None)
+
+    async def refresh_expiring(self):
+        """Süresi yaklaşan tüm token'ları yenile"""
+        for user_id in self.store.users():
+            token_info = self.store.get(user_id)
+            if token_info and token_info.get("refresh_token") and self._needs_refresh(token_info):
+                try:
+                    await self.refresh(user_id, stale_token=token_info.get("access_token"))
+                except Exception:
+                    # Hata loglandı, diğer kullanıcılarla devam edilir
+                    pass
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh_expiring()
+            except Exception as e:
+                logger.error("Token yenileme zamanlayıcısı hatası: %s", e)
+            await asyncio.sleep(self.check_interval)
+
+    def start(self):
+        """Arka plan yenileme döngüsünü başlat (event loop içinde çağrılmalı)"""
+        if self._scheduler is None or self._scheduler.done():
+            self._scheduler = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Arka plan döngüsünü durdur"""
+        if self._scheduler is not None:
+            self._scheduler.cancel()
+            try:
+                await self._scheduler
+            except asyncio.CancelledError:
+                pass
+            self._scheduler = None
@@ -0,0 +1,262 @@
+import os
+import time
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from ..config.settings import settings
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+    CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    CRYPTOGRAPHY_AVAILABLE = False
+
+
+def _to_timestamp(value: datetime) -> float:
+    # Servis expires_at değerlerini naive UTC datetime olarak tutar
+    return (value - datetime(1970, 1, 1)).total_seconds()
+
+
+def _from_timestamp(value: Optional[float]) -> Optional[datetime]:
+    return datetime(1970, 1, 1) + timedelta(seconds=value) if value is not None else None
+
+
+class TokenStore(ABC):
+    """
+    Gmail OAuth token deposu arayüzü
+
+    Kayıtlar {"access_token", "refresh_token", "expires_at"} biçimindedir;
+    expires_at naive UTC datetime'dır.
+    """
+
+    @abstractmethod
+    def get(self, user_id: str) -> Optional[Dict]:
+        """Kullanıcının token kaydı (yoksa None)"""
+
+    @abstractmethod
+    def set(self, user_id: str, token_info: Dict):
+        """Kullanıcının token kaydını yaz (varsa üzerine)"""
+
+    @abstractmethod
+    def update_access_token(self, user_id: str, access_token: str, expires_at: datetime,
+                            refresh_token: Optional[str] = None):
+        """Yenilenen access token'ı ve süresini kaydet"""
+
+    @abstractmethod
+    def delete(self, user_id: str):
+        """Kullanıcının token kaydını sil"""
+
+    @abstractmethod
+    def users(self) -> List[str]:
+        """Token'ı kayıtlı kullanıcılar"""
+
+    def __contains__(self, user_id: str) -> bool:
+        return self.get(user_id) is not None
+
+
+class MemoryTokenStore(TokenStore):
+    """Süreç içi token deposu (tek worker, testler ve benchmark için)"""
+
+    def __init__(self):
+        self._tokens: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str) -> Optional[Dict]:
+        with self._lock:
+            token_info = self._tokens.get(user_id)
+            return dict(token_info) if token_info else None
+
+    def set(self, user_id: str, token_info: Dict):
+        with self._lock:
+            self._tokens[user_id] = {
+                "access_token": token_info.get("access_token"),
+                "refresh_token": token_info.get("refresh_token"),
+                "expires_at": token_info.get("expires_at")
+            }
+
+    def update_access_token(self, user_id: str, access_token: str, expires_at: datetime,
+                            refresh_token: Optional[str] = None):
+        with self._lock:
+            token_info = self._tokens.get(user_id)
+            if token_info is None:
+                return
+            token_info["access_token"] = access_token
+            token_info["expires_at"] = expires_at
+            if refresh_token:
+                token_info["refresh_token"] = refresh_token
+
+    def delete(self, user_id: str):
+        with self._lock:
+            self._tokens.pop(user_id, None)
+
+    def users(self) -> List[str]:
+        with self._lock:
+            return list(self._tokens)
+
+
+class SQLiteTokenStore(TokenStore):
+    """
+    SQLite tabanlı, şifreli token deposu
+
+    Aynı makinedeki tüm uvicorn worker'ları aynı dosyayı paylaşır. WAL modu okuyucuların
+    yazıcıları beklememesini sağlar, busy_timeout eşzamanlı yazıları sıraya sokar.
+    Token'lar Fernet ile şifrelenerek saklanır. Dosya, tablo ve (verilmediyse) anahtar ilk
+    kullanımda oluşturulur; modülü import etmek diske bir şey yazmaz.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS gmail_tokens (
+            user_id TEXT PRIMARY KEY,
+            access_token BLOB,
+            refresh_token BLOB,
+            expires_at REAL,
+            updated_at REAL NOT NULL
+        )
+    """
+
+    def __init__(self, path: str, encryption_key: Optional[str] = None):
+        if not CRYPTOGRAPHY_AVAILABLE:
+            raise RuntimeError("cryptography paketi bulunamadı, token'lar şifrelenemez")
+
+        self.path = path
+        self._encryption_key = encryption_key
+        self._fernet: Optional[Fernet] = None
+        self._local = threading.local()
+        self._open_lock = threading.Lock()
+
+    def _open(self):
+        """Veritabanını ve şifreleme anahtarını ilk kullanımda hazırla"""
+        if self._fernet is not None:
+            return
+        with self._open_lock:
+            if self._fernet is not None:
+                return
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            connection = self._thread_connection()
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(self.SCHEMA)
+            self._fernet = Fernet(self._encryption_key or self._load_or_create_key(self.path + ".key"))
+
+    def _load_or_create_key(self, key_path: str) -> bytes:
+        """Anahtar verilmediyse dosyadan oku, yoksa oluştur (sadece sahibi okuyabilir)"""
+        if not os.path.exists(key_path):
+            # Aynı anda başlayan worker'lardan sadece birinin anahtarı kalır: os.link atomik olarak
+            # mevcut dosyanın üzerine yazmayı reddeder
+            temp_path = f"{key_path}.{os.getpid()}.tmp"
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(Fernet.generate_key())
+            try:
+                os.link(temp_path, key_path)
+                logger.warning("TOKEN_ENCRYPTION_KEY tanımlı değil, anahtar oluşturuldu: %s", key_path)
+            except FileExistsError:
+                pass
+            finally:
+                os.unlink(temp_path)
+        with open(key_path, "rb") as f:
+            return f.read().strip()
+
+    def _thread_connection(self) -> sqlite3.Connection:
+        # Her thread kendi bağlantısını kullanır
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=10.0, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA busy_timeout=10000")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _connect(self) -> sqlite3.Connection:
+        self._open()
+        return self._thread_connection()
+
+    def _encrypt(self, value: Optional[str]) -> Optional[bytes]:
+        self._open()
+        return self._fernet.encrypt(value.encode("utf-8")) if value else None
+
+    def _decrypt(self, value: Optional[bytes]) -> Optional[str]:
+        if not value:
+            return None
+        self._open()
+        try:
+            return self._fernet.decrypt(value).decode("utf-8")
+        except InvalidToken:
+            logger.error("Token çözülemedi, şifreleme anahtarı değişmiş olabilir")
+            return None
+
+    def get(self, user_id: str) -> Optional[Dict]:
+        row = self._connect().execute(
+            "SELECT access_token, refresh_token, expires_at FROM gmail_tokens WHERE user_id = ?",
+            (user_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            "access_token": self._decrypt(row[0]),
+            "refresh_token": self._decrypt(row[1]),
+            "expires_at": _from_timestamp(row[2])
+        }
+
+    def set(self, user_id: str, token_info: Dict):
+        expires_at = token_info.get("expires_at")
+        self._connect().execute(
+            """
+            INSERT INTO gmail_tokens (user_id, access_token, refresh_token, expires_at, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(user_id) DO UPDATE SET
+                access_token = excluded.access_token,
+                refresh_token = excluded.refresh_token,
+                expires_at = excluded.expires_at,
+                updated_at = excluded.updated_at
+            """,
+            (
+                user_id,
+                self._encrypt(token_info.get("access_token")),
+                self._encrypt(token_info.get("refresh_token")),
+                _to_timestamp(expires_at) if expires_at else None,
+                time.time()
+            )
+        )
+
+    def update_access_token(self, user_id: str, access_token: str, expires_at: datetime,
+                            refresh_token: Optional[str] = None):
+        # Refresh yanıtında yeni refresh token yoksa mevcut olan korunur
+        self._connect().execute(
+            """
+            UPDATE gmail_tokens
+            SET access_token = ?, expires_at = ?, updated_at = ?,
+                refresh_token = COALESCE(?, refresh_token)
+            WHERE user_id = ?
+            """,
+            (
+                self._encrypt(access_token),
+                _to_timestamp(expires_at),
+                time.time(),
+                self._encrypt(refresh_token),
+                user_id
+            )
+        )
+
+    def delete(self, user_id: str):
+        self._connect().execute("DELETE FROM gmail_tokens WHERE user_id = ?", (user_id,))
+
+    def users(self) -> List[str]:
+        return [row[0] for row in self._connect().execute("SELECT user_id FROM gmail_tokens")]
+
+
+def create_token_store() -> TokenStore:
+    """TOKEN_STORE_BACKEND ayarına göre token deposunu oluştur"""
+    backend = settings.TOKEN_STORE_BACKEND.lower()
+    if backend == "sqlite":
+        try:
+            store = SQLiteTokenStore(settings.TOKEN_STORE_PATH, settings.TOKEN_ENCRYPTION_KEY)
+            logger.info("SQLite token deposu kullanılıyor: %s", settings.TOKEN_STORE_PATH)
+            return store
+        except Exception as e:
+            logger.warning("SQLite token deposu açılamadı, bellek içi depo kullanılacak: %s", e)
+    return MemoryTokenStore()
@@ -0,0 +1,258 @@
+"""
+Arka plan vektör indeksleyici
+
+Başvuru servisinin yazma yolları ChromaDB'ye doğrudan yazmaz, değişikliği indeks outbox'ına
+kaydeder. Bu modüldeki indeksleyici outbox'ı batch'ler halinde boşaltır: aynı kayda ait
+olaylardan sadece en sonuncusu uygulanır, başvuru upsert/silmeleri ve e-posta analizleri
+toplu çağrılarla yazılır, hata alan gruplar geri çekilme ile tekrar denenir. Böylece yazma
+yolu embedding hesaplamasını beklemez ve indeks birincil depoya yakınsar.
+
+Kullanım:
+    python -m src.services.vector_indexer status
+    python -m src.services.vector_indexer drain
+    python -m src.services.vector_indexer rebuild --user-id user@example.com
+    python -m src.services.vector_indexer retry-dead
+"""
+import json
+import time
+import asyncio
+import argparse
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .application_service import application_service
+from .chroma_service import ChromaService
+from .index_outbox import IndexOutbox, index_outbox, APPLICATION, EMAIL_ANALYSIS, UPSERT, DELETE
+from ..config.settings import settings
+from ..utils.logger import get_logger
+from ..utils.metrics import INDEX_EVENTS_TOTAL, INDEX_OUTBOX_LAG, INDEX_OUTBOX_PENDING
+
+logger = get_logger(__name__)
+
+
+class VectorIndexer:
+    """Outbox olaylarını ChromaDB'ye aktaran arka plan servisi"""
+
+    def __init__(self, outbox: Optional[IndexOutbox] = None, batch_size: int = None, poll_interval: float = None):
+        self.outbox = outbox or index_outbox
+        self.batch_size = batch_size or settings.INDEXER_BATCH_SIZE
+        self.poll_interval = settings.INDEXER_POLL_INTERVAL_SECONDS if poll_interval is None else poll_interval
+        self.stats = {"batches": 0, "indexed": 0, "coalesced": 0, "retried": 0, "dead": 0}
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self.outbox.add_listener(self._notify)
+
+    def _notify(self):
+        # Olay hangi thread'den kaydedilirse kaydedilsin döngü beklemeden uyandırılır
+        if self._loop is not None and self._wake is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def update_metrics(self) -> Dict[str, Any]:
+        """Outbox gecikmesini oku ve metriklere yaz"""
+        lag = self.outbox.lag()
+        INDEX_OUTBOX_PENDING.set(lag["pending"], state="pending")
+        INDEX_OUTBOX_PENDING.set(lag["dead"], state="dead")
+        INDEX_OUTBOX_LAG.set(lag["lag_seconds"])
+        return lag
+
+    def _groups(self, events: List[Dict[str, Any]]) -> List[Tuple[str, List[Dict[str, Any]], Callable[[], Any]]]:
+        """Olayları kayıt bazında birleştir ve toplu yazma gruplarına ayır: (tür, olaylar, yazma fonksiyonu)"""
+        latest: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        related: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+        for event in events:
+            key = (event["kind"], event["user_id"], event["entity_id"])
+            # Olaylar ID sırasıyla gelir; aynı kayıt için son olay geçerlidir
+            latest[key] = event
+            related.setdefault(key, []).append(event)
+        self.stats["coalesced"] += len(events) - len(latest)
+
+        upserts, deletes, analyses, unknown = [], [], {}, []
+        for key, event in latest.items():
+            if event["kind"] == APPLICATION and event["op"] == UPSERT:
+                upserts.append(key)
+            elif event["kind"] == APPLICATION and event["op"] == DELETE:
+                deletes.append(key)
+            elif event["kind"] == EMAIL_ANALYSIS and event["op"] == UPSERT:
+                analyses.setdefault(event["user_id"], []).append(key)
+            else:
+                unknown.append(key)
+
+        def payload(key) -> Dict[str, Any]:
+            return latest[key]["payload"] or {}
+
+        def events_of(keys) -> List[Dict[str, Any]]:
+            return [event for key in keys for event in related[key]]
+
+        def unsupported():
+            raise ValueError("Bilinmeyen indeks olayı")
+
+        def chroma() -> ChromaService:
+            # İlk erişimde bağlantı açılır; açılamazsa grup hatası olarak tekrar denenir
+            return application_service.chroma_service
+
+        groups = []
+        if upserts:
+            items = [(key[1], payload(key)) for key in upserts]
+            groups.append((APPLICATION, events_of(upserts), lambda: chroma().upsert_applications(items)))
+        if deletes:
+            # Sayısal ID'lerin türü payload'da korunur, koleksiyon ID'si buna göre üretilir
+            targets = [(key[1], payload(key).get("id", key[2])) for key in deletes]
+            groups.append((APPLICATION, events_of(deletes), lambda: chroma().delete_applications(targets)))
+        for user_id, keys in analyses.items():
+            pairs = [(payload(key).get("email"), payload(key).get("analysis")) for key in keys]
+            groups.append((EMAIL_ANALYSIS, events_of(keys),
+                           lambda pairs=pairs, user_id=user_id: chroma().add_email_analyses(pairs, user_id)))
+        if unknown:
+            groups.append(("unknown", events_of(unknown), unsupported))
+        return groups
+
+    def drain_once(self) -> Dict[str, int]:
+        """Bir batch olayı al ve uygula; başarısız gruplar tekrar denenmek üzere ertelenir"""
+        events = self.outbox.claim(self.batch_size)
+        result = {"claimed": len(events), "indexed": 0, "retried": 0, "dead": 0}
+        if events:
+            self.stats["batches"] += 1
+            for kind, group_events, write in self._groups(events):
+                try:
+                    write()
+                except Exception as e:
+                    dead = self.outbox.fail(group_events, str(e))
+                    retried = len(group_events) - dead
+                    logger.warning("İndeksleme başarısız (%s, %d olay, %d dead): %s", kind, len(group_events), dead, e)
+                    result["retried"] += retried
+                    result["dead"] += dead
+                    INDEX_EVENTS_TOTAL.inc(retried, kind=kind, outcome="retried")
+                    INDEX_EVENTS_TOTAL.inc(dead, kind=kind, outcome="dead")
+                    continue
+                self.outbox.complete(group_events)
+                result["indexed"] += len(group_events)
+                INDEX_EVENTS_TOTAL.inc(len(group_events), kind=kind, outcome="indexed")
+            for key in ("indexed", "retried", "dead"):
+                self.stats[key] += result[key]
+        self.update_metrics()
+        return result
+
+    def drain(self, max_batches: Optional[int] = None) -> Dict[str, int]:
+        """Hazır olay kalmayana kadar boşalt (geri çekilmedeki olaylar beklenmez)"""
+        totals = {"batches": 0, "claimed": 0, "indexed": 0, "retried": 0, "dead": 0}
+        while max_batches is None or totals["batches"] < max_batches:
+            result = self.drain_once()
+            if not result["claimed"]:
+                break
+            totals["batches"] += 1
+            for key in ("claimed", "indexed", "retried", "dead"):
+                totals[key] += result[key]
+        return totals
+
+    def rebuild(self, user_id: Optional[str] = None, reset: bool = True) -> Dict[str, Any]:
+        """
+        İndeksi birincil depodan yeniden oluştur
+
+        Args:
+            user_id: Sadece bu kullanıcı (verilmezse tüm kullanıcılar)
+            reset: Önce başvuru koleksiyonundaki eski dokümanları sil (depoda olmayanlar da temizlenir)
+        """
+        started = time.time()
+        cleared = application_service.chroma_service.clear_applications(user_id) if reset else 0
+        users = [user_id] if user_id else list(application_service.applications_storage)
+        applications = analyses = 0
+        for user in users:
+            records = application_service.get_application_records(user)
+            events = [
+                (APPLICATION, UPSERT, user, app.get("id"), ChromaService.application_index_payload(app))
+                for app in records
+            ]
+            applications += len(events)
+            for app in records:
+                # E-postadan gelen başvurular aynı zamanda e-posta analizi kaydıdır
+                if app.get("email_id") and not app.get("is_manual"):
+                    analysis_id, payload = ChromaService.email_analysis_index_payload({}, app, user)
+                    events.append((EMAIL_ANALYSIS, UPSERT, user, analysis_id, payload))
+                    analyses += 1
+            self.outbox.record(events)
+        if cleared:
+            # Kuyruğa alınacak kaydı olmayan kullanıcıların da silinen dokümanları okunmuş olabilir
+            self.outbox.bump_index_version(users)
+        return {
+            "users": len(users),
+            "cleared_documents": cleared,
+            "queued_applications": applications,
+            "queued_email_analyses": analyses,
+            "seconds": round(time.time() - started, 3)
+        }
+
+    def status(self) -> Dict[str, Any]:
+        """Kuyruk gecikmesi, sayaçlar ve son dead olaylar"""
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "outbox": self.update_metrics(),
+            "stats": dict(self.stats),
+            "dead_events": self.outbox.dead_events()
+        }
+
+    async def _run(self):
+        while True:
+            self._wake.clear()
+            try:
+                result = await asyncio.to_thread(self.drain_once)
+            except Exception as e:
+                logger.error("Vektör indeksleyici hatası: %s", e)
+                result = None
+            if result and result["claimed"] >= self.batch_size:
+                # Birikmiş olay var, beklemeden devam edilir
+                continue
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self):
+        """Arka plan indeksleme döngüsünü başlat (event loop içinde çağrılmalı)"""
+        if self._task is None or self._task.done():
+            self._loop = asyncio.get_running_loop()
+            self._wake = asyncio.Event()
+            self._task = self._loop.create_task(self._run())
+
+    async def stop(self):
+        """Arka plan döngüsünü durdur; kalan olaylar outbox'ta bekler"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._loop = None
+
+
+# Global servis instance'ı
+vector_indexer = VectorIndexer()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vektör indeksi outbox'ını yönet")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("status", help="Kuyruk gecikmesi ve dead olaylar")
+    drain_parser = subparsers.add_parser("drain", help="Bekleyen olayları şimdi indeksle")
+    drain_parser.add_argument("--max-batches", type=int)
+    rebuild_parser = subparsers.add_parser("rebuild", help="İndeksi birincil depodan yeniden oluştur")
+    rebuild_parser.add_argument("--user-id", help="Sadece bu kullanıcı")
+    rebuild_parser.add_argument("--no-reset", action="store_true", help="Eski dokümanları silmeden sadece upsert et")
+    rebuild_parser.add_argument("--no-drain", action="store_true", help="Olayları kuyruğa al, indekslemeyi sunucuya bırak")
+    subparsers.add_parser("retry-dead", help="Deneme hakkı biten olayları tekrar kuyruğa al")
+    args = parser.parse_args()
+
+    if args.command == "status":
+        report = vector_indexer.status()
+    elif args.command == "drain":
+        report = vector_indexer.drain(args.max_batches)
+    elif args.command == "rebuild":
+        report = vector_indexer.rebuild(args.user_id, reset=not args.no_reset)
+        if not args.no_drain:
+            report["drain"] = vector_indexer.drain()
+    else:
+        report = {"requeued": index_outbox.retry_dead()}
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
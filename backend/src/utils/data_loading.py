@@ -0,0 +1,20 @@
+import json
+from typing import Any, List
+
+
+def load_json_records(path: str) -> List[Any]:
+    """
+    JSON listesi veya JSONL (satır başına bir kayıt) dosyasını yükler
+
+    Eğitim, değerlendirme ve damıtma CLI'ları aynı etiketli veri/korpus dosyalarını okur.
+
+    Args:
+        path: Dosya yolu (.jsonl uzantılıysa satır satır okunur)
+
+    Returns:
+        Kayıt listesi
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            return [json.loads(line) for line in f if line.strip()]
+        return json.load(f)
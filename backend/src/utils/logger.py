@@ -0,0 +1,123 @@
+import re
+import sys
+import queue
+import atexit
+import logging
+import logging.handlers
+from typing import Callable, Iterable, Optional
+
+ROOT_LOGGER_NAME = "jobsy"
+LOG_FORMAT = "%(asctime)s %(levelname)-7s [%(name)s] %(message)s"
+
+# Gizli bilgi içerebilecek kalıplar: URL'deki key parametresi, Bearer token'lar, Google API key/OAuth token'ları
+_REDACTION_PATTERNS = [
+    (re.compile(r"([?&](?:key|api_key|access_token|token)=)[^&\s\"']+", re.IGNORECASE), r"\1***"),
+    (re.compile(r"(Bearer\s+)[A-Za-z0-9\-._~+/]+=*", re.IGNORECASE), r"\1***"),
+    (re.compile(r"((?:access_token|refresh_token|client_secret|api_key)[\"']?\s*[:=]\s*[\"']?)[^\"',\s}]+", re.IGNORECASE), r"\1***"),
+    (re.compile(r"AIza[0-9A-Za-z\-_]{20,}"), "AIza***"),
+    (re.compile(r"ya29\.[0-9A-Za-z\-_]+"), "ya29.***"),
+]
+
+_traceback_formatter = logging.Formatter()
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class RedactingFilter(logging.Filter):
+    """Log mesajlarındaki API key, token ve bilinen gizli değerleri maskeler"""
+
+    def __init__(self, secrets: Iterable[Optional[str]] = ()):
+        super().__init__()
+        self.secrets = [secret for secret in secrets if secret and len(secret) >= 6]
+
+    def redact(self, message: str) -> str:
+        for secret in self.secrets:
+            if secret in message:
+                message = message.replace(secret, "***")
+        for pattern, replacement in _REDACTION_PATTERNS:
+            message = pattern.sub(replacement, message)
+        return message
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Mesaj sadece gerçekten yazılacak kayıtlar için (seviye kontrolünden sonra) oluşturulur
+        message = record.getMessage()
+        if record.exc_info:
+            # Exception metinleri de URL/token içerebilir, traceback mesaja eklenip maskelenir
+            message = f"{message}\n{_traceback_formatter.formatException(record.exc_info)}"
+            record.exc_info = None
+            record.exc_text = None
+        record.msg = self.redact(message)
+        record.args = None
+        return True
+
+
+class _Lazy:
+    """Sadece log yazılırken hesaplanan değer"""
+
+    __slots__ = ("func",)
+
+    def __init__(self, func: Callable[[], object]):
+        self.func = func
+
+    def __str__(self) -> str:
+        return str(self.func())
+
+    __repr__ = __str__
+
+
+def lazy(func: Callable[[], object]) -> _Lazy:
+    """Pahalı log argümanlarını ertele: logger.debug("liste: %s", lazy(lambda: dump(x)))"""
+    return _Lazy(func)
+
+
+def _parse_level(level: str) -> int:
+    value = logging.getLevelName(str(level).upper())
+    return value if isinstance(value, int) else logging.INFO
+
+
+def setup_logging(level: str = "info", secrets: Iterable[Optional[str]] = (), stream=None) -> logging.Logger:
+    """
+    Uygulama logger'ını kur
+
+    Kayıtlar bir kuyruğa yazılır ve ayrı bir thread'de çıktıya aktarılır; istek işleyen
+    kod I/O beklemez. Tekrar çağrılırsa önceki listener durdurulup yenisi kurulur.
+    """
+    global _listener
+
+    logger = logging.getLogger(ROOT_LOGGER_NAME)
+    logger.setLevel(_parse_level(level))
+    logger.propagate = False
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(RedactingFilter(secrets))
+    logger.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    return logger
+
+
+def shutdown_logging():
+    """Kuyruktaki kayıtları yaz ve listener'ı durdur"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Modül logger'ını döndür (jobsy.<name>)"""
+    short_name = name.rsplit(".", 1)[-1]
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{short_name}")
+
+
+atexit.register(shutdown_logging)
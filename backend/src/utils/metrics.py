@@ -0,0 +1,288 @@
+import time
+import threading
+import functools
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple, Sequence
+
+# Varsayılan histogram sınırları (saniye)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    """Etiketli metriklerin ortak altyapısı"""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], object] = {}
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} etiketleri {self.labelnames} olmalı, gelen: {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abstractmethod
+    def _samples(self) -> List[str]:
+        """Metriğin exposition formatındaki örnek satırları"""
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}"
+        ]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Sadece artan sayaç"""
+
+    metric_type = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(Counter):
+    """Artıp azalabilen anlık değer"""
+
+    metric_type = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    @contextmanager
+    def track_inprogress(self, **labels):
+        """Blok süresince değeri bir artır"""
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+
+class Histogram(_Metric):
+    """Kümülatif bucket'lı dağılım"""
+
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [bucket sayıları..., toplam, adet]
+                state = [0] * len(self.buckets) + [0.0, 0]
+                self._values[key] = state
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[index] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Blok süresini saniye olarak gözlemle"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = [(key, list(state)) for key, state in self._values.items()]
+        lines = []
+        for key, state in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, ('le', _format_value(bound)))} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, ('le', '+Inf'))} {state[-1]}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {state[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """Uygulamadaki tüm metriklerin kaydı ve text exposition çıktısı"""
+
+    CONTENT_TYPE = "text/plain; version=0.0.4"
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, documentation, labelnames, **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, cls):
+                raise ValueError(f"{name} farklı bir tiple zaten kayıtlı")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+# Global registry instance'ı
+metrics_registry = MetricsRegistry()
+
+# =============================================================================
+# Ortak metrikler
+# =============================================================================
+
+HTTP_REQUEST_DURATION = metrics_registry.histogram(
+    "jobsy_http_request_duration_seconds", "HTTP istek süresi (route şablonu bazında)",
+    ["method", "route", "status"]
+)
+HTTP_REQUESTS_IN_FLIGHT = metrics_registry.gauge(
+    "jobsy_http_requests_in_flight", "İşlenmekte olan HTTP istekleri", ["method"]
+)
+
+CLASSIFIER_INFERENCE_DURATION = metrics_registry.histogram(
+    "jobsy_classifier_inference_seconds", "E-posta sınıflandırma süresi", ["backend", "stage"]
+)
+CLASSIFIER_STAGE_TOTAL = metrics_registry.counter(
+    "jobsy_classifier_stage_total", "Sınıflandırmayı sonuçlandıran kaskad aşaması", ["stage"]
+)
+CLASSIFIER_BATCH_SIZE = metrics_registry.histogram(
+    "jobsy_classifier_batch_size", "Analiz çağrısı başına e-posta sayısı", ["analyzer"],
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500)
+)
+
+UPSTREAM_REQUEST_DURATION = metrics_registry.histogram(
+    "jobsy_upstream_request_duration_seconds", "Dış servis çağrı süresi", ["service", "operation"]
+)
+UPSTREAM_REQUESTS_TOTAL = metrics_registry.counter(
+    "jobsy_upstream_requests_total", "Dış servis çağrıları (sonuca göre)", ["service", "operation", "outcome"]
+)
+
+CACHE_REQUESTS_TOTAL = metrics_registry.counter(
+    "jobsy_cache_requests_total", "Cache erişimleri", ["cache", "result"]
+)
+CACHE_HIT_RATIO = metrics_registry.gauge(
+    "jobsy_cache_hit_ratio", "Cache isabet oranı", ["cache"]
+)
+
+CACHE_EVICTIONS_TOTAL = metrics_registry.counter(
+    "jobsy_cache_evictions_total", "Cache'ten çıkarılan kayıt sayısı", ["cache", "reason"]
+)
+
+CHROMA_OPERATION_DURATION = metrics_registry.histogram(
+    "jobsy_chroma_operation_seconds", "ChromaDB işlem süresi", ["operation"]
+)
+
+INDEX_OUTBOX_PENDING = metrics_registry.gauge(
+    "jobsy_index_outbox_pending", "İndekslenmeyi bekleyen outbox olayları", ["state"]
+)
+INDEX_OUTBOX_LAG = metrics_registry.gauge(
+    "jobsy_index_outbox_lag_seconds", "Bekleyen en eski outbox olayının yaşı"
+)
+INDEX_EVENTS_TOTAL = metrics_registry.counter(
+    "jobsy_index_events_total", "İşlenen outbox olayları (sonuca göre)", ["kind", "outcome"]
+)
+
+
+def record_upstream(service: str, operation: str, seconds: float, success: bool):
+    """Dış servis çağrısının süresini ve sonucunu kaydet"""
+    UPSTREAM_REQUEST_DURATION.observe(seconds, service=service, operation=operation)
+    UPSTREAM_REQUESTS_TOTAL.inc(service=service, operation=operation, outcome="success" if success else "error")
+
+
+@contextmanager
+def track_upstream(service: str, operation: str):
+    """Blok içindeki dış servis çağrısını ölç; istisna hata olarak sayılır"""
+    started = time.perf_counter()
+    success = False
+    try:
+        yield
+        success = True
+    finally:
+        record_upstream(service, operation, time.perf_counter() - started, success)
+
+
+def record_cache(cache: str, hit: bool):
+    """Cache isabetini kaydet ve oranı güncelle"""
+    CACHE_REQUESTS_TOTAL.inc(cache=cache, result="hit" if hit else "miss")
+    hits = CACHE_REQUESTS_TOTAL.value(cache=cache, result="hit")
+    misses = CACHE_REQUESTS_TOTAL.value(cache=cache, result="miss")
+    CACHE_HIT_RATIO.set(hits / (hits + misses), cache=cache)
+
+
+def record_cache_eviction(cache: str, reason: str, count: int = 1):
+    """Cache'ten çıkarılan kayıtları kaydet (reason: "size" veya "expired")"""
+    CACHE_EVICTIONS_TOTAL.inc(count, cache=cache, reason=reason)
+
+
+def timed(histogram: Histogram, **labels):
+    """Fonksiyon süresini histograma yazan dekoratör"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with histogram.time(**labels):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,14 @@
+import os
+import sys
+import tempfile
+
+# Servis modülleri import edilirken ayarlar okunur; kalıcı dosyalar depodaki data/ yerine geçici dizine yazılır
+_data_dir = tempfile.mkdtemp(prefix="jobsy-tests-")
+os.environ.setdefault("INDEX_OUTBOX_PATH", os.path.join(_data_dir, "index_outbox.db"))
+os.environ.setdefault("LEARNING_STORE_PATH", os.path.join(_data_dir, "learning.db"))
+os.environ.setdefault("ANALYSIS_CACHE_DISK_PATH", os.path.join(_data_dir, "analysis_cache.db"))
+os.environ.setdefault("TOKEN_STORE_PATH", os.path.join(_data_dir, "tokens.db"))
+os.environ.setdefault("CHROMA_PERSIST_DIRECTORY", os.path.join(_data_dir, "chroma"))
+os.environ.setdefault("EMAIL_BERT_ENABLED", "false")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,53 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routes import application_routes
+from src.services.application_service import application_service
+
+USER_ID = "etag-test@example.com"
+
+app = FastAPI()
+app.include_router(application_routes.router, prefix="/applications")
+client = TestClient(app)
+
+
+def _store(*applications):
+    application_service.applications_storage[USER_ID] = list(applications)
+    application_service._bump_version(USER_ID)
+
+
+def test_unchanged_listing_returns_304_without_body():
+    _store({"id": 1, "company_name": "Acme", "position": "Backend Developer", "application_status": "Başvuruldu"})
+
+    first = client.get(f"/applications/{USER_ID}")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.json()["data"]["active_applications"][0]["company_name"] == "Acme"
+
+    cached = client.get(f"/applications/{USER_ID}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    # Sıkıştırma katmanının zayıflattığı ETag de eşleşir
+    weak = client.get(f"/applications/{USER_ID}", headers={"If-None-Match": f"W/{etag}"})
+    assert weak.status_code == 304
+
+
+def test_change_invalidates_etag():
+    _store({"id": 1, "company_name": "Acme", "position": "Backend Developer", "application_status": "Başvuruldu"})
+    etag = client.get(f"/applications/{USER_ID}").headers["etag"]
+
+    _store({"id": 1, "company_name": "Acme", "position": "Backend Developer", "application_status": "Red"})
+    response = client.get(f"/applications/{USER_ID}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["data"]["finished_applications"][0]["application_status"] == "Red"
+
+
+def test_views_have_distinct_etags():
+    _store({"id": 1, "company_name": "Acme", "position": "Backend Developer"})
+    listing = client.get(f"/applications/{USER_ID}").headers["etag"]
+    debug = client.get(f"/applications/debug/{USER_ID}", headers={"If-None-Match": listing})
+    assert debug.status_code == 200
+    assert debug.headers["etag"] != listing
@@ -0,0 +1,53 @@
+import json
+import sys
+
+import pytest
+
+from src.services import distillation
+from src.services.advanced_email_classifier import advanced_email_classifier
+from src.services.distillation import DistilledEmailClassifier
+
+CORPUS = [
+    {"subject": "Mülakat daveti", "body": "Sizi teknik mülakat için görüşmeye davet ediyoruz."},
+    {"subject": "Görüşme", "body": "Mülakat randevunuz için uygun saatinizi iletin."},
+    {"subject": "Başvurunuz alındı", "body": "Başvurunuz bize ulaştı, teşekkür ederiz."},
+    {"subject": "Başvuru onayı", "body": "Başvurunuzu aldık, değerlendirme sürecindeyiz."},
+    {"subject": "Hackathon daveti", "body": "Hafta sonu düzenlenecek hackathon etkinliğine davetlisiniz."},
+    {"subject": "Etkinlik", "body": "Ideathon etkinliğimize katılmak için kayıt olun."},
+    {"subject": "Sonuç", "body": "Maalesef başvurunuz olumlu sonuçlanmadı."},
+    {"subject": "Değerlendirme sonucu", "body": "Üzgünüz, sizinle devam edemeyeceğiz."},
+] * 3
+
+
+def test_distilled_classes_are_classifier_categories(tmp_path, monkeypatch):
+    corpus_path = tmp_path / "corpus.jsonl"
+    corpus_path.write_text("\n".join(json.dumps(record, ensure_ascii=False) for record in CORPUS), encoding="utf-8")
+    model_dir = tmp_path / "distilled"
+
+    batches = []
+
+    def predict_bert_batch(texts):
+        # BERT yerine kurallar; toplu tahminin kategori adı döndürme sözleşmesi korunur
+        batches.append(len(texts))
+        return [advanced_email_classifier.rule_classifier.classify(text)["label"] for text in texts]
+
+    monkeypatch.setattr(advanced_email_classifier, "_ensure_models", lambda: True)
+    monkeypatch.setattr(advanced_email_classifier, "_predict_bert_batch", predict_bert_batch)
+    monkeypatch.setattr(sys, "argv", [
+        "distillation", "--corpus", str(corpus_path), "--output", str(model_dir), "--batch-size", "10"
+    ])
+    distillation.main()
+
+    assert batches == [10, 10, 4]
+    student = DistilledEmailClassifier(str(model_dir))
+    assert student.is_ready
+    assert set(student.pipeline.classes_) <= set(advanced_email_classifier.categories)
+
+
+def test_teacher_labels_outside_categories_are_rejected(tmp_path):
+    texts = [record["body"] for record in CORPUS]
+    with pytest.raises(ValueError, match="LABEL_"):
+        distillation.distill(
+            texts, teacher=lambda batch: [f"LABEL_{len(text) % 2}" for text in batch],
+            model_dir=str(tmp_path), categories=list(advanced_email_classifier.categories)
+        )
@@ -0,0 +1,92 @@
+from src.services.duplicate_detector import DuplicateDetector, DuplicateIndex
+from src.services.application_service import application_service
+
+CONFIRMATION = (
+    "Merhaba, Acme Yazılım A.Ş. bünyesindeki başvurunuz için teşekkür ederiz. Başvurunuz insan kaynakları "
+    "ekibimize ulaşmıştır ve değerlendirme süreci başlamıştır. Süreç hakkında en kısa sürede size dönüş "
+    "yapacağız. Başvuru numaranız {ref}, tarih {date}. Saygılarımızla, Acme Kariyer Ekibi"
+)
+INTERVIEW = (
+    "Merhaba, teknik mülakat için sizinle görüşmek istiyoruz. Lütfen ekteki bağlantıdan uygun olduğunuz "
+    "bir zaman dilimini seçin. Görüşme yaklaşık bir saat sürecek ve canlı kodlama bölümü içerecektir."
+)
+
+
+def _app(email_id, position, body, date="2024-05-01T10:00:00", company="Acme Yazılım A.Ş.", status="Başvuruldu"):
+    return {
+        "email_id": email_id,
+        "company_name": company,
+        "position": position,
+        "email_body": body,
+        "email_subject": f"{company} - {position}",
+        "email_date": date,
+        "application_status": status
+    }
+
+
+def _index(*applications):
+    index = DuplicateIndex(DuplicateDetector())
+    for app in applications:
+        index.add(app)
+    return index
+
+
+def test_same_position_is_merged():
+    existing = _app("e1", "Backend Developer", CONFIRMATION.format(ref=1001, date="01.05.2024"))
+    index = _index(existing)
+    reminder = _app("e2", "Backend Developer Pozisyonu", INTERVIEW, date="2024-05-10T10:00:00")
+    assert index.find(reminder) is existing
+
+
+def test_unknown_position_with_same_template_is_merged():
+    existing = _app("e1", "Backend Developer", CONFIRMATION.format(ref=1001, date="01.05.2024"))
+    index = _index(existing)
+    resend = _app("e2", "Bilinmeyen Pozisyon", CONFIRMATION.format(ref=2002, date="03.05.2024"))
+    assert index.find(resend) is existing
+
+
+def test_senior_position_is_not_merged_into_junior_role():
+    existing = _app("e1", "Backend Developer", CONFIRMATION.format(ref=1001, date="01.05.2024"))
+    index = _index(existing)
+    senior = _app("e2", "Senior Backend Developer", CONFIRMATION.format(ref=1002, date="02.05.2024"))
+    assert index.find(senior) is None
+
+
+def test_unknown_position_with_different_body_is_not_merged():
+    # Şirketin pencere içinde tek başvurusu olsa bile gövde benzemiyorsa yeni başvurudur
+    existing = _app("e1", "Backend Developer", CONFIRMATION.format(ref=1001, date="01.05.2024"))
+    index = _index(existing)
+    other = _app("e2", "", INTERVIEW)
+    assert index.find(other) is None
+
+
+def test_other_company_and_old_email_are_not_merged():
+    existing = _app("e1", "Backend Developer", CONFIRMATION.format(ref=1001, date="01.05.2024"))
+    index = _index(existing)
+    assert index.find(_app("e2", "Backend Developer", CONFIRMATION.format(ref=1, date="-"),
+                           company="Globex Teknoloji")) is None
+    assert index.find(_app("e3", "Backend Developer", CONFIRMATION.format(ref=1, date="-"),
+                           date="2023-01-01T10:00:00")) is None
+
+
+def test_merge_keeps_email_history_and_takes_newer_status():
+    target = _app("e1", "Backend Developer", CONFIRMATION.format(ref=1001, date="01.05.2024"))
+    newer = _app("e2", "Backend Developer", INTERVIEW, date="2024-05-10T10:00:00", status="Mülakat")
+    application_service._merge_duplicate(target, newer)
+
+    assert target["email_id"] == "e2"
+    assert target["application_status"] == "Mülakat"
+    assert [email["email_id"] for email in target["related_emails"]] == ["e1", "e2"]
+    assert target["related_emails"][0]["application_status"] == "Başvuruldu"
+
+
+def test_merge_of_older_email_only_fills_missing_fields():
+    target = _app("e2", "Backend Developer", INTERVIEW, date="2024-05-10T10:00:00", status="Mülakat")
+    target["location"] = ""
+    older = _app("e1", "Backend Developer", CONFIRMATION.format(ref=1001, date="01.05.2024"))
+    older["location"] = "İstanbul"
+    application_service._merge_duplicate(target, older)
+
+    assert target["email_id"] == "e2"
+    assert target["application_status"] == "Mülakat"
+    assert target["location"] == "İstanbul"
@@ -0,0 +1,46 @@
+import pytest
+
+from src.services.extraction_engine import email_extraction_engine, job_posting_extraction_engine
+
+EMAILS = [
+    "Merhaba, Acme Yazılım A.Ş. olarak \"Yapay Zeka Ideathon\" etkinliğimize davetlisiniz. "
+    "Etkinlik 15 Mart 2024 tarihinde saat 14:30'da Zoom üzerinden online olarak yapılacaktır.",
+    "Dear candidate, Globex Technology invites you to the Data Science Hackathon on 03/04/2024 at 10:00 AM. "
+    "Join us on Teams. We are hiring a Senior Backend Developer for this role.",
+    "Beta Holding bünyesindeki başvurunuz için teşekkürler. Pozisyonu olarak Frontend Developer "
+    "rolünü değerlendiriyoruz. Görüşme 12.05.2024 saat 09:15, çevrimiçi Meet bağlantısı ektedir.",
+    "Sayın aday, 'Cloud Workshop' 7 April 2024 tarihinde remote olarak yapılacak. "
+    "Katılım için toplantı linki: https://meet.example.com. Saat: 18:00",
+    "Google şirket: Google Türkiye arıyor. Position: Senior Python Engineer, lokasyon: İstanbul, Hibrit. "
+    "Maaş 45.000 - 60.000 TL. Gereksinimler: 5+ yıl deneyim, React, Docker, Kubernetes, AWS.",
+    "Firma: Delta Teknoloji arayan ekibine QA Engineer arıyor. Remote çalışma, 3+ years experience, "
+    "maaş 80 - 120 bin. Location: Ankara, Türkiye",
+    "Kısa bir not, içinde hiçbir alan yok.",
+    "",
+]
+
+
+def _per_pattern_search(engine, field, text):
+    """Eski davranış: alanın pattern'ları sırayla `re.search` ile aranır"""
+    results = []
+    for pattern in engine.patterns(field):
+        match = pattern.search(text)
+        if match:
+            value = match.group(1) if pattern.groups else match.group(0)
+            results.append((match.start(), match.group(0), value or ""))
+    return results
+
+
+@pytest.mark.parametrize("engine", [email_extraction_engine, job_posting_extraction_engine],
+                         ids=["email", "job_posting"])
+@pytest.mark.parametrize("text", EMAILS)
+def test_fields_match_per_pattern_search(engine, text):
+    result = engine.scan(text)
+    for field in engine.fields:
+        assert list(result.candidates(field)) == _per_pattern_search(engine, field, text), field
+
+
+def test_first_applies_validator_in_priority_order():
+    result = email_extraction_engine.scan("Toplantı 15 Mart 2024 tarihinde, yedek tarih 03/04/2024")
+    assert result.first("tarih").value == "03/04/2024"
+    assert result.first("tarih", lambda match: "Mart" in match.value).value == "15 Mart 2024"
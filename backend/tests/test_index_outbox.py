@@ -0,0 +1,91 @@
+from src.services.index_outbox import IndexOutbox, APPLICATION, UPSERT
+from src.services.vector_indexer import VectorIndexer
+from src.services.application_service import application_service
+
+
+class FakeChroma:
+    """Başvuru upsert'lerini bellekte tutan, istenirse hata veren ChromaService yerine geçen sınıf"""
+
+    def __init__(self):
+        self.documents = {}
+        self.failing = False
+
+    def upsert_applications(self, items):
+        if self.failing:
+            raise RuntimeError("chroma erişilemiyor")
+        for user_id, application in items:
+            self.documents[(user_id, application["id"])] = application
+        return [application["id"] for _, application in items]
+
+
+def _indexer(tmp_path, monkeypatch):
+    chroma = FakeChroma()
+    monkeypatch.setattr(application_service, "_chroma_service", chroma)
+    outbox = IndexOutbox(path=str(tmp_path / "outbox.db"), retry_base=60.0, max_attempts=1)
+    return VectorIndexer(outbox=outbox, batch_size=10, poll_interval=0), outbox, chroma
+
+
+def _upsert(outbox, position):
+    outbox.record([(APPLICATION, UPSERT, "user@example.com", "app-1", {"id": "app-1", "position": position})])
+
+
+def test_failed_older_event_does_not_overwrite_newer(tmp_path, monkeypatch):
+    indexer, outbox, chroma = _indexer(tmp_path, monkeypatch)
+
+    chroma.failing = True
+    _upsert(outbox, "Eski Pozisyon")
+    assert indexer.drain_once()["dead"] == 1
+
+    chroma.failing = False
+    _upsert(outbox, "Yeni Pozisyon")
+    assert indexer.drain_once()["indexed"] == 1
+
+    # Tamamlanan yeni olay aynı kaydın eski (dead) olayını da kuyruktan siler
+    outbox.retry_dead()
+    assert indexer.drain_once()["claimed"] == 0
+    assert outbox.lag() == {"pending": 0, "dead": 0, "lag_seconds": 0.0}
+    assert chroma.documents[("user@example.com", "app-1")]["position"] == "Yeni Pozisyon"
+
+
+def test_backed_off_older_event_is_dropped_after_newer_completes(tmp_path, monkeypatch):
+    indexer, outbox, chroma = _indexer(tmp_path, monkeypatch)
+    outbox.max_attempts = 5
+
+    chroma.failing = True
+    _upsert(outbox, "Eski Pozisyon")
+    assert indexer.drain_once()["retried"] == 1
+
+    chroma.failing = False
+    _upsert(outbox, "Yeni Pozisyon")
+    assert indexer.drain_once()["indexed"] == 1
+
+    # Geri çekilme süresi dolmuş gibi tüm olayları hazır yap
+    outbox._connect().execute("UPDATE index_outbox SET available_at = 0")
+    assert indexer.drain_once()["claimed"] == 0
+    assert chroma.documents[("user@example.com", "app-1")]["position"] == "Yeni Pozisyon"
+
+
+def test_completion_keeps_newer_pending_events(tmp_path, monkeypatch):
+    indexer, outbox, chroma = _indexer(tmp_path, monkeypatch)
+
+    _upsert(outbox, "Birinci")
+    events = outbox.claim(10)
+    _upsert(outbox, "İkinci")
+    outbox.complete(events)
+
+    assert outbox.lag()["pending"] == 1
+    indexer.drain_once()
+    assert chroma.documents[("user@example.com", "app-1")]["position"] == "İkinci"
+
+
+def test_index_etag_changes_when_indexer_completes(tmp_path, monkeypatch):
+    indexer, outbox, chroma = _indexer(tmp_path, monkeypatch)
+    monkeypatch.setattr("src.services.application_service.index_outbox", outbox)
+
+    _upsert(outbox, "Backend Developer")
+    before = application_service.get_index_etag("user@example.com")
+    indexer.drain_once()
+
+    assert application_service.get_index_etag("user@example.com") != before
+    assert outbox.index_version("user@example.com") == 1
+    assert outbox.index_version("other@example.com") == 0
@@ -0,0 +1,51 @@
+import re
+
+import pytest
+
+from src.services.rule_classifier import RuleClassifier, rule_classifier
+
+# İç içe ve aynı pozisyonda başlayan anahtar kelimeler bilerek bulunduruluyor
+CORPUS = [
+    "Teknik test link: https://example.com/assessment adresinden teste başlayabilirsiniz.",
+    "HackerRank üzerinden coding challenge gönderildi; challenge 48 saat açık.",
+    "Coding challenge linkiniz hazır, değerlendirme sonrası dönüş yapılacak.",
+    "Mülakat davetiyesi: görüşmeniz 12.05.2024 tarihinde planlandı, meeting linki ektedir.",
+    "Başvurunuz alındı. Your application has been received, başvurunuz için teşekkür ederiz.",
+    "Maalesef bu pozisyon için other candidates ile ilerlemeye karar verdik.",
+    "Kampanya bülteni: indirim fırsatlarını kaçırmayın! Unsubscribe için tıklayın.",
+    "Ideathon etkinliğine davetlisiniz, yarışmaya katılım ücretsizdir.",
+    "We are pleased to offer you the position, offer letter ektedir.",
+    "Merhaba, haftalık ekip toplantısı notları ektedir.",
+    "",
+]
+
+
+def _per_rule_matches(classifier, text):
+    """Eski davranış: her kural metinde ayrı ayrı aranır"""
+    lowered = text.lower()
+    return {
+        index for index, rule in enumerate(classifier.rules)
+        if re.search(r"\b(?:" + rule.pattern + r")\b", lowered)
+    }
+
+
+@pytest.mark.parametrize("text", CORPUS)
+def test_scores_match_per_rule_search(text):
+    assert set(rule_classifier.match_rules(text)) == _per_rule_matches(rule_classifier, text)
+    expected = rule_classifier._scores_for(sorted(_per_rule_matches(rule_classifier, text)))
+    assert rule_classifier.score(text) == pytest.approx(expected)
+
+
+def test_nested_keywords_are_not_lost():
+    classifier = RuleClassifier({
+        "priors": {"teknik_test": 0.0, "genel_bilgilendirme": 0.0},
+        "rules": [
+            {"id": "teknik_test", "pattern": "teknik test", "weights": {"teknik_test": 1.0}},
+            {"id": "test_link", "pattern": "test link", "weights": {"teknik_test": 0.5}},
+            {"id": "test", "pattern": "test", "weights": {"teknik_test": 0.25}}
+        ]
+    })
+    result = classifier.classify("Teknik test link gönderildi")
+    assert sorted(result["matched_rules"]) == ["teknik_test", "test", "test_link"]
+    assert classifier.score("Teknik test link gönderildi")[0] == pytest.approx(1.75)
+
@@ -0,0 +1,85 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.services.token_manager import TokenManager
+from src.services.token_store import MemoryTokenStore
+
+USER_ID = "user@example.com"
+
+
+def _manager(expires_in: float, refresher_delay: float = 0.01, fail: bool = False):
+    store = MemoryTokenStore()
+    store.set(USER_ID, {
+        "access_token": "old",
+        "refresh_token": "refresh",
+        "expires_at": datetime.utcnow() + timedelta(seconds=expires_in)
+    })
+    calls = []
+
+    async def refresher(user_id):
+        calls.append(user_id)
+        await asyncio.sleep(refresher_delay)
+        if fail:
+            raise RuntimeError("invalid_grant")
+        store.update_access_token(user_id, f"new-{len(calls)}", datetime.utcnow() + timedelta(hours=1))
+
+    return TokenManager(store, refresher, refresh_margin=300, check_interval=60), store, calls
+
+
+def test_concurrent_requests_share_one_refresh():
+    manager, _, calls = _manager(expires_in=-1)
+
+    async def scenario():
+        return await asyncio.gather(*(manager.get_access_token(USER_ID) for _ in range(10)))
+
+    tokens = asyncio.run(scenario())
+    assert calls == [USER_ID]
+    assert tokens == ["new-1"] * 10
+    assert manager.stats["refreshes"] == 1
+    assert manager.stats["coalesced"] == 9
+
+
+def test_token_refreshed_elsewhere_is_not_refreshed_again():
+    manager, store, calls = _manager(expires_in=-1)
+    # Başka bir worker token'ı yeniledi; elimizdeki eski token ile gelen istek yeni çağrı yapmaz
+    store.update_access_token(USER_ID, "from-other-worker", datetime.utcnow() + timedelta(hours=1))
+
+    asyncio.run(manager.refresh(USER_ID, stale_token="old"))
+    assert calls == []
+    assert manager.stats["skipped"] == 1
+
+
+def test_expiring_token_is_served_while_refreshing_in_background():
+    manager, store, calls = _manager(expires_in=60)
+
+    async def scenario():
+        token = await manager.get_access_token(USER_ID)
+        # İkinci istek de beklemeden eski token'ı alır, yenileme tek kez yapılır
+        second = await manager.get_access_token(USER_ID)
+        await asyncio.sleep(0.05)
+        return token, second
+
+    token, second = asyncio.run(scenario())
+    assert (token, second) == ("old", "old")
+    assert calls == [USER_ID]
+    assert store.get(USER_ID)["access_token"] == "new-1"
+
+
+def test_failed_refresh_reaches_every_waiter_and_is_retried():
+    manager, _, calls = _manager(expires_in=-1, fail=True)
+
+    async def scenario():
+        return await asyncio.gather(
+            *(manager.get_access_token(USER_ID) for _ in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert calls == [USER_ID]
+    assert manager._inflight == {}
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(manager.get_access_token(USER_ID))
+    assert len(calls) == 2
@@ -0,0 +1,50 @@
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("cryptography")
+
+from src.services.token_store import SQLiteTokenStore
+
+EXPIRES_AT = datetime(2024, 5, 1, 12, 30)
+
+
+def _token(access="access-1", refresh="refresh-1"):
+    return {"access_token": access, "refresh_token": refresh, "expires_at": EXPIRES_AT}
+
+
+def test_tokens_are_encrypted_at_rest_and_round_trip(tmp_path):
+    path = str(tmp_path / "tokens.db")
+    store = SQLiteTokenStore(path)
+    assert not (tmp_path / "tokens.db").exists()
+
+    store.set("user@example.com", _token())
+    assert store.get("user@example.com") == _token()
+
+    row = sqlite3.connect(path).execute("SELECT access_token, refresh_token FROM gmail_tokens").fetchone()
+    assert b"access-1" not in row[0] and b"refresh-1" not in row[1]
+
+    # Diğer worker aynı dosya ve anahtar dosyasıyla token'ı çözebilir
+    assert SQLiteTokenStore(path).get("user@example.com") == _token()
+
+
+def test_refresh_keeps_refresh_token_when_response_omits_it(tmp_path):
+    store = SQLiteTokenStore(str(tmp_path / "tokens.db"))
+    store.set("user@example.com", _token())
+
+    later = EXPIRES_AT + timedelta(hours=1)
+    store.update_access_token("user@example.com", "access-2", later)
+    assert store.get("user@example.com") == {"access_token": "access-2", "refresh_token": "refresh-1", "expires_at": later}
+
+    store.update_access_token("user@example.com", "access-3", later, refresh_token="refresh-2")
+    assert store.get("user@example.com")["refresh_token"] == "refresh-2"
+
+
+def test_wrong_key_does_not_decrypt(tmp_path):
+    from cryptography.fernet import Fernet
+
+    path = str(tmp_path / "tokens.db")
+    SQLiteTokenStore(path, Fernet.generate_key().decode()).set("user@example.com", _token())
+    token = SQLiteTokenStore(path, Fernet.generate_key().decode()).get("user@example.com")
+    assert token["access_token"] is None and token["refresh_token"] is None